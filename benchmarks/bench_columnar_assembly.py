@@ -0,0 +1,98 @@
+"""
+Benchmark: serialization of a ChEMBL activity page into flat records.
+
+Сравнивает прежнюю схему (``ActivityModel(**record).model_dump()`` на каждую
+запись) с колоночной сборкой ``assemble_columns``; результат обоих путей
+совпадает и проверяется перед замером.
+
+Usage:
+    python benchmarks/bench_columnar_assembly.py [--rows 10000] [--repeat 3]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+os.environ.setdefault("DISABLE_PANDERA_IMPORT_WARNING", "True")
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+
+from bioetl.domain.schemas.chembl.models import ActivityModel  # noqa: E402
+from bioetl.domain.transform.columnar_records import assemble_columns  # noqa: E402
+
+
+def make_records(rows: int) -> list[dict[str, Any]]:
+    """Записи в форме ответа ChEMBL /activity."""
+    return [
+        {
+            "activity_id": i,
+            "assay_chembl_id": f"CHEMBL{1000 + i % 97}",
+            "molecule_chembl_id": f"CHEMBL{i}",
+            "standard_type": "IC50",
+            "standard_value": str(i % 1000 / 10),
+            "standard_units": "nM",
+            "pchembl_value": None,
+            "activity_properties": (
+                [{"type": "Ratio", "value": str(i % 7)}] if i % 3 == 0 else []
+            ),
+            "ligand_efficiency": (
+                {"bei": "12.1", "le": "0.3", "lle": None, "sei": "8.2"}
+                if i % 2
+                else None
+            ),
+            "molecule_structures": None,
+        }
+        for i in range(rows)
+    ]
+
+
+def _measure(func: Callable[[], Any], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    records = make_records(args.rows)
+
+    def _legacy() -> list[dict[str, Any]]:
+        return [ActivityModel(**record).model_dump() for record in records]
+
+    def _columnar() -> list[dict[str, Any]]:
+        return assemble_columns(ActivityModel, records).to_records()
+
+    if _legacy() != _columnar():
+        raise SystemExit("columnar assembly differs from model_dump output")
+
+    legacy = _measure(_legacy, args.repeat)
+    columnar = _measure(_columnar, args.repeat)
+    print(
+        json.dumps(
+            {
+                "benchmark": "chembl_page_serialization",
+                "rows": args.rows,
+                "model_dump_ms": round(legacy * 1e3, 2),
+                "columnar_ms": round(columnar * 1e3, 2),
+                "speedup": round(legacy / columnar, 2),
+            }
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Benchmark: row-wise vs columnar hashing (hash_version v1_blake2b_256).
+
+Usage:
+    python benchmarks/bench_hashing.py [--rows 100000] [--repeat 3]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from bioetl.domain.transform import columnar_hash  # noqa: E402
+from bioetl.infrastructure.transform.impl.hasher import HasherImpl  # noqa: E402
+
+
+def build_frame(rows: int, seed: int = 0) -> pd.DataFrame:
+    """Синтетический чанк, похожий на нормализованные записи ChEMBL."""
+    rng = np.random.default_rng(seed)
+    labels = np.array(
+        ["Aspirin", "Ибупрофен", "Café", "Paracetamol", None], dtype=object
+    )
+    return pd.DataFrame(
+        {
+            "molecule_chembl_id": [f"CHEMBL{i}" for i in range(rows)],
+            "pref_name": labels[rng.integers(0, len(labels), rows)],
+            "standard_value": rng.random(rows) * 1000,
+            "standard_units": np.where(rng.random(rows) > 0.5, "nM", "uM"),
+            "assay_id": rng.integers(0, 10**9, rows),
+            "is_active": rng.random(rows) > 0.3,
+        }
+    )
+
+
+def _rowwise(df: pd.DataFrame) -> pd.Series:
+    return df.apply(HasherImpl().hash_row, axis=1)
+
+
+def _measure(
+    func: Callable[[pd.DataFrame], pd.Series], df: pd.DataFrame, repeat: int
+) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(df)
+        best = min(best, time.perf_counter() - started)
+    return len(df) / best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    df = build_frame(args.rows)
+    if not _rowwise(df).equals(columnar_hash.hash_rows(df)):
+        raise SystemExit("columnar digests differ from row-wise digests")
+
+    rowwise = _measure(_rowwise, df, args.repeat)
+    columnar = _measure(columnar_hash.hash_rows, df, args.repeat)
+    print(
+        json.dumps(
+            {
+                "benchmark": "hash_rows",
+                "rows": args.rows,
+                "rowwise_rows_per_sec": round(rowwise),
+                "columnar_rows_per_sec": round(columnar),
+                "speedup": round(columnar / rowwise, 2),
+            }
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+"""
+Benchmark: extractor + transformer normalization of an activity-sized chunk.
+
+Сравнивает прежнюю схему (normalize_batch в extractor и повторный
+normalize_dataframe в transformer, лишние coerce_numeric_columns) с
+текущей, где повторный проход пропускается по маркеру чанка, а также
+поэлементную нормализацию скалярных и ID-полей с векторной.
+
+Usage:
+    python benchmarks/bench_normalization.py [--rows 10000] [--repeat 3]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+import numpy as np
+import pandas as pd
+import yaml
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+
+from bioetl.domain.transform.contracts import NormalizationConfig  # noqa: E402
+from bioetl.domain.transform.normalization_marker import (  # noqa: E402
+    unmark_normalized,
+)
+from bioetl.infrastructure.transform.factories import (  # noqa: E402
+    default_normalization_service,
+)
+from bioetl.infrastructure.transform.impl.normalization_service_impl import (  # noqa: E402
+    NormalizationServiceImpl,
+)
+
+ACTIVITY_CONFIG = ROOT / "configs" / "pipelines" / "chembl" / "activity.yaml"
+
+
+class _Config:
+    def __init__(self, fields: list[dict[str, Any]]) -> None:
+        self.fields = fields
+        self.normalization = NormalizationConfig()
+
+
+class _PerCellService(NormalizationServiceImpl):
+    """Сервис без векторного пути: каждое значение через _normalize_value."""
+
+    def _normalize_scalar_column(self, *args: Any, **kwargs: Any) -> None:
+        return None
+
+
+def load_fields() -> list[dict[str, Any]]:
+    """Поля пайплайна activity из конфигурации."""
+    with ACTIVITY_CONFIG.open(encoding="utf-8") as handle:
+        raw = yaml.safe_load(handle)
+    return [
+        {"name": item["name"], "data_type": item.get("data_type")}
+        for item in raw["fields"]
+    ]
+
+
+def build_records(
+    fields: list[dict[str, Any]], rows: int, seed: int = 0
+) -> list[dict[str, Any]]:
+    """Синтетические записи в форме ответа ChEMBL /activity."""
+    rng = np.random.default_rng(seed)
+    columns: dict[str, list[Any]] = {}
+    for field_cfg in fields:
+        name, dtype = field_cfg["name"], field_cfg["data_type"]
+        if dtype == "integer":
+            columns[name] = rng.integers(0, 10**6, rows).tolist()
+        elif dtype == "number":
+            columns[name] = (rng.random(rows) * 10).tolist()
+        elif dtype == "boolean":
+            columns[name] = (rng.random(rows) > 0.5).tolist()
+        elif dtype == "array":
+            columns[name] = [
+                [{"type": "Ratio", "value": f"{i % 7}"}] for i in range(rows)
+            ]
+        elif dtype == "object":
+            columns[name] = [{"bei": f"{i % 13}.5", "le": None} for i in range(rows)]
+        elif name.endswith("chembl_id"):
+            columns[name] = [f"chembl{i % 5000}" for i in range(rows)]
+        elif name.startswith("bao_"):
+            columns[name] = [f"bao_{i % 50:07d}" for i in range(rows)]
+        else:
+            # Строки из пробелов и пропуски проверяют обработку пустых значений.
+            columns[name] = [
+                "   " if i % 31 == 0 else None if i % 37 == 0 else f"  Value {i % 97} "
+                for i in range(rows)
+            ]
+    return [{name: values[i] for name, values in columns.items()} for i in range(rows)]
+
+
+def _legacy(service: Any, records: list[dict[str, Any]]) -> pd.DataFrame:
+    # Прежнее поведение: normalize_batch = normalize_dataframe + coerce,
+    # затем transformer нормализует тот же чанк еще раз.
+    chunk = service.normalize_dataframe(pd.DataFrame(records))
+    unmark_normalized(chunk)
+    chunk = service.coerce_numeric_columns(chunk)
+    return service.normalize_dataframe(chunk)
+
+
+def _current(service: Any, records: list[dict[str, Any]]) -> pd.DataFrame:
+    chunk = service.normalize_batch(pd.DataFrame(records))
+    return service.normalize_dataframe(chunk)
+
+
+def _assert_same(left: pd.DataFrame, right: pd.DataFrame) -> None:
+    """assert_frame_equal не различает None и pd.NA — сверяем и типы значений."""
+    pd.testing.assert_frame_equal(left, right)
+    for name in left.columns:
+        if left[name].dtype == object:
+            assert left[name].map(type).equals(right[name].map(type)), name
+
+
+def _measure(
+    func: Callable[[Any, list[dict[str, Any]]], pd.DataFrame],
+    service: Any,
+    records: list[dict[str, Any]],
+    repeat: int,
+) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(service, records)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    fields = load_fields()
+    service = default_normalization_service(_Config(fields))
+    records = build_records(fields, args.rows)
+
+    legacy_df = _legacy(service, records)
+    current_df = _current(service, records)
+    _assert_same(legacy_df, current_df)
+
+    legacy = _measure(_legacy, service, records, args.repeat)
+    current = _measure(_current, service, records, args.repeat)
+
+    per_cell_service = _PerCellService(_Config(fields))
+    _assert_same(_current(per_cell_service, records), current_df)
+    per_cell = _measure(_current, per_cell_service, records, args.repeat)
+    print(
+        json.dumps(
+            {
+                "benchmark": "normalize_chunk",
+                "rows": args.rows,
+                "fields": len(fields),
+                "double_pass_sec": round(legacy, 4),
+                "single_pass_sec": round(current, 4),
+                "speedup": round(legacy / current, 2),
+                "per_cell_sec": round(per_cell, 4),
+                "vectorized_speedup": round(per_cell / current, 2),
+            }
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,313 @@
+"""
+Benchmark: ChEMBL pipeline stages against a local stub API.
+
+Поднимает ``StubChemblServer`` с синтетическими записями, собирает пайплайн
+из ``configs/pipelines/chembl/<entity>.yaml`` с ``base_url`` заглушки и
+замеряет стадии по отдельности: extract (HTTP, пагинация или ``__in``-батчи,
+сборка записей), normalize (``normalize_batch`` extractor'а и transformer),
+hash (пост-трансформеры с ``hash_row``/``hash_business_key``), validate
+(Pandera) и write (CSV/Parquet с метаданными). Результат — JSON, который
+можно сравнивать между коммитами.
+
+Usage:
+    python benchmarks/bench_pipeline_stages.py \\
+        [--entities activity assay testitem] [--rows 10000 100000] \\
+        [--mode api|id_only] [--latency 0.0] [--format csv|parquet] \\
+        [--batch-size 1000] [--concurrency 1] \\
+        [--output benchmarks/results/pipeline_stages.json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+os.environ.setdefault("DISABLE_PANDERA_IMPORT_WARNING", "True")
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+
+import pandas as pd  # noqa: E402
+import synthetic_chembl  # noqa: E402
+from stub_chembl_server import StubChemblServer  # noqa: E402
+
+from bioetl.application.config.runtime import build_runtime_config  # noqa: E402
+from bioetl.application.container import build_pipeline_dependencies  # noqa: E402
+from bioetl.application.orchestrator import PipelineOrchestrator  # noqa: E402
+from bioetl.domain.models import RunContext  # noqa: E402
+from bioetl.domain.record_source import as_record_batch  # noqa: E402
+from bioetl.infrastructure.clients.provider_registry_loader import (  # noqa: E402
+    create_provider_loader,
+)
+
+STAGES = ("extract", "normalize", "hash", "validate", "write")
+DEFAULT_OUTPUT = ROOT / "benchmarks" / "results" / "pipeline_stages.json"
+
+
+class StageTimer:
+    """Суммирует время стадий; ``extract`` учитывается без времени потребителя."""
+
+    def __init__(self) -> None:
+        self.seconds = {stage: 0.0 for stage in STAGES}
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.seconds[name] += time.perf_counter() - started
+
+    def timed_iter(self, name: str, iterable: Any) -> Iterator[Any]:
+        iterator = iter(iterable)
+        while True:
+            with self.stage(name):
+                item = next(iterator, None)
+            if item is None:
+                return
+            yield item
+
+
+def build_config(
+    entity: str,
+    *,
+    base_url: str,
+    rows: int,
+    mode: str,
+    output_format: str,
+    batch_size: int,
+    concurrency: int,
+    workdir: Path,
+) -> Any:
+    """Конфигурация пайплайна сущности, направленная на заглушку."""
+    cli_overrides: dict[str, Any] = {
+        "output_path": str(workdir / "output"),
+        # API-режим — auto_detect без входного файла.
+        "input_mode": "id_only" if mode == "id_only" else "auto_detect",
+        "output": {"format": output_format},
+        "batch_size": batch_size,
+    }
+    if mode == "id_only":
+        endpoint = synthetic_chembl.ENTITY_ENDPOINTS[entity]
+        id_field = synthetic_chembl.ENDPOINTS[endpoint][2]
+        input_path = workdir / f"{entity}_ids.csv"
+        pd.DataFrame({id_field: synthetic_chembl.record_ids(endpoint, rows)}).to_csv(
+            input_path, index=False
+        )
+        cli_overrides["input_path"] = str(input_path)
+    else:
+        cli_overrides["input_path"] = None
+
+    config = build_runtime_config(
+        pipeline_id=f"chembl.{entity}",
+        configs_root=ROOT / "configs",
+        cli_overrides=cli_overrides,
+    )
+    provider_config = type(config.provider_config).model_validate(
+        {
+            **config.provider_config.model_dump(),
+            "base_url": base_url,
+            "batch_size": batch_size,
+            "max_concurrent_requests": concurrency,
+            "rate_limit_per_sec": 10_000.0,
+        }
+    )
+    return config.model_copy(update={"provider_config": provider_config})
+
+
+def run_entity(
+    entity: str,
+    *,
+    rows: int,
+    base_url: str,
+    mode: str,
+    output_format: str,
+    batch_size: int,
+    concurrency: int,
+) -> dict[str, Any]:
+    """Прогоняет стадии одной сущности и возвращает замеры."""
+    with tempfile.TemporaryDirectory(prefix="bioetl-bench-") as tmp:
+        workdir = Path(tmp)
+        config = build_config(
+            entity,
+            base_url=base_url,
+            rows=rows,
+            mode=mode,
+            output_format=output_format,
+            batch_size=batch_size,
+            concurrency=concurrency,
+            workdir=workdir,
+        )
+        registry = create_provider_loader(
+            config_path=ROOT / "configs" / "providers.yaml"
+        ).load_registry()
+        container = build_pipeline_dependencies(config, provider_registry=registry)
+        pipeline = PipelineOrchestrator(
+            f"{entity}_chembl",
+            config,
+            provider_registry=registry,
+            container_factory=lambda *args, **kwargs: container,
+        ).build_pipeline(limit=rows)
+
+        extraction_service = container.get_extraction_service()
+        record_source = container.get_record_source(extraction_service, limit=rows)
+        normalization = container.get_normalization_service()
+        post_transformer = container.get_post_transformer(
+            version_provider=lambda: "bench"
+        )
+        context = RunContext(
+            entity_name=entity, provider="chembl", config=config.model_dump()
+        )
+        timer = StageTimer()
+
+        frames: list[pd.DataFrame] = []
+        chunks = 0
+        for records in timer.timed_iter("extract", record_source.iter_records()):
+            chunks += 1
+            with timer.stage("extract"):
+                df = as_record_batch(records).to_frame()
+            with timer.stage("normalize"):
+                df = pipeline.transform(normalization.normalize_batch(df))
+            with timer.stage("hash"):
+                df = post_transformer.apply(df, context)
+            with timer.stage("validate"):
+                df = pipeline.validate(df)
+            frames.append(df)
+
+        result = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+        with timer.stage("write"):
+            pipeline.write(result, Path(config.output_path), context)
+
+    return {
+        "entity": entity,
+        "rows": len(result),
+        "chunks": chunks,
+        "stages": {
+            stage: {
+                "seconds": round(seconds, 4),
+                "rows_per_sec": round(len(result) / seconds, 1) if seconds else None,
+            }
+            for stage, seconds in timer.seconds.items()
+        },
+        "total_seconds": round(sum(timer.seconds.values()), 4),
+    }
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_suite(
+    entities: list[str],
+    sizes: list[int],
+    *,
+    mode: str,
+    latency: float,
+    output_format: str,
+    batch_size: int = 1000,
+    concurrency: int = 1,
+    progress: Callable[[str], None] = print,
+) -> dict[str, Any]:
+    """Запускает все сочетания сущностей и размеров на одной заглушке."""
+    results = []
+    with StubChemblServer(max(sizes), latency=latency) as stub:
+        for rows in sizes:
+            for entity in entities:
+                progress(f"{entity}: {rows} rows ({mode})")
+                started = stub.requests
+                measurement = run_entity(
+                    entity,
+                    rows=rows,
+                    base_url=stub.base_url,
+                    mode=mode,
+                    output_format=output_format,
+                    batch_size=batch_size,
+                    concurrency=concurrency,
+                )
+                measurement["requested_rows"] = rows
+                measurement["http_requests"] = stub.requests - started
+                results.append(measurement)
+    return {
+        "benchmark": "pipeline_stages",
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "mode": mode,
+        "latency_sec": latency,
+        "output_format": output_format,
+        "batch_size": batch_size,
+        "concurrency": concurrency,
+        "results": results,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "--entities",
+        nargs="+",
+        default=list(synthetic_chembl.ENTITY_ENDPOINTS),
+        choices=list(synthetic_chembl.ENTITY_ENDPOINTS),
+    )
+    parser.add_argument("--rows", nargs="+", type=int, default=[10_000])
+    parser.add_argument("--mode", choices=("api", "id_only"), default="api")
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="Задержка ответа заглушки, с"
+    )
+    parser.add_argument("--format", choices=("csv", "parquet"), default="csv")
+    parser.add_argument(
+        "--batch-size", type=int, default=1000, help="Размер страницы/батча ID"
+    )
+    parser.add_argument(
+        "--concurrency", type=int, default=1, help="max_concurrent_requests"
+    )
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT)
+    args = parser.parse_args()
+
+    report = run_suite(
+        args.entities,
+        args.rows,
+        mode=args.mode,
+        latency=args.latency,
+        output_format=args.format,
+        batch_size=args.batch_size,
+        concurrency=args.concurrency,
+        progress=lambda message: print(message, file=sys.stderr),
+    )
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    # stdout занят логами пайплайна — сводка идет в stderr.
+    for item in report["results"]:
+        stages = " ".join(
+            f"{stage}={timing['seconds']:.3f}s"
+            for stage, timing in item["stages"].items()
+        )
+        print(f"{item['entity']:>9} {item['rows']:>8} rows  {stages}", file=sys.stderr)
+    print(f"Results written to {args.output}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
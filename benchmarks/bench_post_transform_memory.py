@@ -0,0 +1,176 @@
+"""
+Benchmark: peak memory of the post-transformer chain per chunk.
+
+Сравнивает цепочку ``default_post_transformer`` (hash_business_key/hash_row,
+index, database_version, extracted_at) в двух режимах на синтетических
+чанках activity:
+
+- ``copying`` — каждый шаг вызывается через ``apply`` и копирует чанк, как
+  цепочка работала раньше (4 полные копии на чанк);
+- ``owned`` — ``TransformerChain.apply``: одна поверхностная копия входа,
+  шаги добавляют колонки в нее через ``apply_inplace``.
+
+Пик аллокаций на чанк и память, которую удерживает результат при живом
+входном чанке, снимаются tracemalloc (учитывает и буферы numpy), время —
+отдельным прогоном без трассировки. Результаты режимов сверяются.
+``--without-hash`` убирает шаг хеширования, пик которого (канонический JSON
+строк) скрывает копии чанка.
+
+Usage:
+    python benchmarks/bench_post_transform_memory.py \\
+        [--rows 20000] [--chunks 5] [--without-hash]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+
+import synthetic_chembl  # noqa: E402
+
+from bioetl.domain.schemas.chembl.models import ActivityModel  # noqa: E402
+from bioetl.domain.transform.columnar_records import assemble_columns  # noqa: E402
+from bioetl.domain.transform.factories import default_post_transformer  # noqa: E402
+from bioetl.domain.transform.hash_service import HashService  # noqa: E402
+from bioetl.domain.transform.transformers import (  # noqa: E402
+    HashColumnsTransformer,
+    TransformerChain,
+)
+
+BUSINESS_KEY = ["activity_id", "molecule_chembl_id", "target_chembl_id"]
+_NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def build_chunks(rows: int, chunks: int) -> list[pd.DataFrame]:
+    """Чанки activity в том виде, в каком они приходят из extract."""
+    return [
+        assemble_columns(
+            ActivityModel,
+            synthetic_chembl.records(
+                "activity", range(number * rows, (number + 1) * rows)
+            ),
+        ).to_frame()
+        for number in range(chunks)
+    ]
+
+
+def _chain(with_hash: bool = True) -> TransformerChain:
+    chain = default_post_transformer(
+        hash_service=HashService(now_provider=lambda: _NOW),
+        business_key_fields=BUSINESS_KEY,
+        version_provider=lambda: "ChEMBL_BENCH",
+    )
+    assert isinstance(chain, TransformerChain)
+    if with_hash:
+        return chain
+    return TransformerChain(
+        [
+            step
+            for step in chain._transformers
+            if not isinstance(step, HashColumnsTransformer)
+        ]
+    )
+
+
+def _copying(chain: TransformerChain) -> Callable[[pd.DataFrame], pd.DataFrame]:
+    def run(df: pd.DataFrame) -> pd.DataFrame:
+        for transformer in chain._transformers:
+            df = transformer.apply(df)
+        return df
+
+    return run
+
+
+def _owned(chain: TransformerChain) -> Callable[[pd.DataFrame], pd.DataFrame]:
+    return chain.apply
+
+
+MODES = {"copying": _copying, "owned": _owned}
+
+
+def measure(
+    mode: str, chunks: list[pd.DataFrame], *, with_hash: bool
+) -> dict[str, object]:
+    """Пик аллокаций, удерживаемая память и время на чанк для ``mode``."""
+    run = MODES[mode](_chain(with_hash))
+    peaks, retained = [], []
+    tracemalloc.start()
+    try:
+        for chunk in chunks:
+            tracemalloc.reset_peak()
+            baseline = tracemalloc.get_traced_memory()[0]
+            result = run(chunk)
+            current, peak = tracemalloc.get_traced_memory()
+            peaks.append(peak - baseline)
+            retained.append(current - baseline)
+            del result
+    finally:
+        tracemalloc.stop()
+
+    run = MODES[mode](_chain(with_hash))
+    started = time.perf_counter()
+    for chunk in chunks:
+        run(chunk)
+    seconds = time.perf_counter() - started
+    return {
+        "peak_bytes_per_chunk": max(peaks),
+        "retained_bytes_per_chunk": max(retained),
+        "seconds_per_chunk": round(seconds / len(chunks), 4),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--rows", type=int, default=20_000, help="Строк в чанке")
+    parser.add_argument("--chunks", type=int, default=5)
+    parser.add_argument(
+        "--without-hash", action="store_true", help="Цепочка без хеширования"
+    )
+    args = parser.parse_args()
+    with_hash = not args.without_hash
+
+    chunks = build_chunks(args.rows, args.chunks)
+    copying, owned = _copying(_chain(with_hash)), _owned(_chain(with_hash))
+    for chunk in chunks:
+        before = chunk.copy()
+        pd.testing.assert_frame_equal(copying(chunk), owned(chunk))
+        pd.testing.assert_frame_equal(chunk, before)
+
+    results = {mode: measure(mode, chunks, with_hash=with_hash) for mode in MODES}
+    chunk_bytes = int(chunks[0].memory_usage(deep=False).sum())
+    print(
+        json.dumps(
+            {
+                "benchmark": "post_transform_memory",
+                "rows_per_chunk": args.rows,
+                "hash": with_hash,
+                "columns": len(chunks[0].columns),
+                "chunk_bytes": chunk_bytes,
+                **results,
+                "peak_reduction": round(
+                    1
+                    - results["owned"]["peak_bytes_per_chunk"]  # type: ignore[operator]
+                    / results["copying"]["peak_bytes_per_chunk"],
+                    3,
+                ),
+            },
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Benchmark: per-chunk schema overhead of transform + validate stages.
+
+Сравнивает прежнюю схему (``create_validator`` и разбор ``to_schema()``
+на каждый чанк) с текущей, где валидатор кэшируется в ``ValidationService``,
+а transformer берет обязательные колонки и порядок колонок из плана схемы.
+Измеряются только накладные расходы, без самой проверки Pandera.
+
+Usage:
+    python benchmarks/bench_validation.py [--chunks 10000] [--schema activity_output]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Callable
+
+os.environ.setdefault("DISABLE_PANDERA_IMPORT_WARNING", "True")
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+
+from bioetl.domain.schemas import register_schemas  # noqa: E402
+from bioetl.domain.schemas.registry import SchemaRegistry  # noqa: E402
+from bioetl.domain.validation.plan import build_schema_plan  # noqa: E402
+from bioetl.domain.validation.service import ValidationService  # noqa: E402
+from bioetl.infrastructure.validation.factories import (  # noqa: E402
+    default_validator_factory,
+)
+
+
+def _legacy_chunk(registry: SchemaRegistry, name: str) -> None:
+    factory = default_validator_factory()
+    factory.create_validator(registry.get_schema(name))
+    registry.get_schema_columns(name)
+    schema = registry.get_schema(name).to_schema()
+    [col_name for col_name, col in schema.columns.items() if not col.nullable]
+
+
+def _measure(func: Callable[[], None], chunks: int) -> float:
+    started = time.perf_counter()
+    for _ in range(chunks):
+        func()
+    return (time.perf_counter() - started) / chunks
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--chunks", type=int, default=10_000)
+    parser.add_argument("--schema", default="activity_output")
+    args = parser.parse_args()
+
+    registry = SchemaRegistry()
+    register_schemas(registry)
+    service = ValidationService(
+        schema_provider=registry, validator_factory=default_validator_factory()
+    )
+    name = args.schema
+
+    plan = build_schema_plan(
+        name, registry.get_schema(name), registry.get_schema_columns(name)
+    )
+
+    def _current_chunk() -> None:
+        service.get_validator(name)
+        list(plan.columns)
+        list(plan.required)
+
+    legacy = _measure(lambda: _legacy_chunk(registry, name), args.chunks)
+    current = _measure(_current_chunk, args.chunks)
+    print(
+        json.dumps(
+            {
+                "benchmark": "schema_overhead_per_chunk",
+                "schema": name,
+                "chunks": args.chunks,
+                "columns": len(plan.columns),
+                "uncached_us": round(legacy * 1e6, 2),
+                "cached_us": round(current * 1e6, 2),
+                "speedup": round(legacy / current, 2),
+            }
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
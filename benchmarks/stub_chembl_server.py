@@ -0,0 +1,173 @@
+"""
+Local stub of the ChEMBL REST API for benchmarks.
+
+Отдает синтетические записи (``synthetic_chembl``) по путям
+``/chembl/api/data/<endpoint>.json`` с пагинацией ``offset``/``limit``
+(``page_meta`` как у ChEMBL, ``limit`` не больше 1000), фильтрами
+``<id>__in`` и ``/status.json`` с версией релиза. ``latency`` добавляет
+задержку к каждому ответу.
+
+Usage:
+    python benchmarks/stub_chembl_server.py [--rows 10000] [--latency 0.05]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import threading
+import time
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import parse_qs, urlparse
+
+import synthetic_chembl
+
+API_PREFIX = "/chembl/api/data"
+MAX_PAGE_SIZE = 1000
+DEFAULT_PAGE_SIZE = 20
+RELEASE = "ChEMBL_BENCH"
+
+
+class StubChemblServer:
+    """
+    Потоковый HTTP-сервер с синтетическим ChEMBL API.
+
+    Используется как контекстный менеджер; ``base_url`` указывает на
+    ``.../chembl/api/data`` и подставляется в ``sources.chembl.base_url``.
+    """
+
+    def __init__(
+        self,
+        rows: int,
+        *,
+        latency: float = 0.0,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        self.rows = rows
+        self.latency = latency
+        self.requests = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), _handler_for(self))
+        self._server.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}{API_PREFIX}"
+
+    def start(self) -> "StubChemblServer":
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="stub-chembl", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "StubChemblServer":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def respond(self, path: str, query: dict[str, list[str]]) -> dict[str, Any] | None:
+        """Тело ответа для пути и query-параметров; ``None`` — 404."""
+        with self._lock:
+            self.requests += 1
+        if not path.startswith(API_PREFIX + "/") or not path.endswith(".json"):
+            return None
+        endpoint = path[len(API_PREFIX) + 1 : -len(".json")]
+        if endpoint == "status":
+            return {"chembl_db_version": RELEASE, "status": "UP"}
+        if endpoint not in synthetic_chembl.ENDPOINTS:
+            return None
+        return self._page(endpoint, {key: values[-1] for key, values in query.items()})
+
+    def _page(self, endpoint: str, params: dict[str, str]) -> dict[str, Any]:
+        list_key, _, id_field, _ = synthetic_chembl.ENDPOINTS[endpoint]
+        id_filter = params.get(f"{id_field}__in")
+        if id_filter is not None:
+            matched = [
+                index
+                for value in id_filter.split(",")
+                if (index := synthetic_chembl.index_from_id(endpoint, value))
+                is not None
+                and index < self.rows
+            ]
+            total = len(matched)
+        else:
+            matched = None
+            total = self.rows
+
+        offset = int(params.get("offset", 0))
+        limit = min(int(params.get("limit", DEFAULT_PAGE_SIZE)), MAX_PAGE_SIZE)
+        stop = min(offset + limit, total)
+        if matched is None:
+            indices: Any = range(offset, stop)
+        else:
+            indices = matched[offset:stop]
+        return {
+            list_key: synthetic_chembl.records(endpoint, indices),
+            "page_meta": {
+                "limit": limit,
+                "offset": offset,
+                "total_count": total,
+                "next": (
+                    f"{API_PREFIX}/{endpoint}.json?limit={limit}&offset={stop}"
+                    if stop < total
+                    else None
+                ),
+                "previous": None,
+            },
+        }
+
+
+def _handler_for(server: StubChemblServer) -> type[BaseHTTPRequestHandler]:
+    class _Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self) -> None:  # noqa: N802 - имя задано BaseHTTPRequestHandler
+            parsed = urlparse(self.path)
+            if server.latency:
+                time.sleep(server.latency)
+            body = server.respond(parsed.path, parse_qs(parsed.query))
+            status = HTTPStatus.OK if body is not None else HTTPStatus.NOT_FOUND
+            payload = json.dumps(body if body is not None else {}).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+            return
+
+    return _Handler
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    with StubChemblServer(args.rows, latency=args.latency, port=args.port) as stub:
+        print(f"Serving {args.rows} synthetic rows at {stub.base_url}", flush=True)
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
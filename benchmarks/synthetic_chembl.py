@@ -0,0 +1,256 @@
+"""
+Synthetic ChEMBL payloads for benchmarks.
+
+Записи строятся детерминированно по номеру строки, поэтому страницу любого
+offset можно получить без материализации всего набора (1M строк не
+держатся в памяти). Форма записей повторяет ответы ChEMBL API
+(``/activity``, ``/assay``, ``/molecule``): вложенные объекты, списки,
+пропуски и повторяющиеся категориальные значения.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from typing import Any
+
+ASSAY_ID_BASE = 100_000
+MOLECULE_ID_BASE = 200_000
+TARGET_ID_BASE = 300_000
+DOCUMENT_ID_BASE = 400_000
+
+_STANDARD_TYPES = ("IC50", "Ki", "EC50", "Kd", "Inhibition", "Potency")
+_UNITS = ("nM", "uM", "%", None)
+_RELATIONS = ("=", "=", "=", ">", "<", "~")
+_ASSAY_TYPES = ("B", "F", "A", "T", "P", "U")
+_ORGANISMS = (
+    ("Homo sapiens", 9606),
+    ("Rattus norvegicus", 10116),
+    ("Mus musculus", 10090),
+    (None, None),
+)
+_JOURNALS = ("J. Med. Chem.", "Bioorg. Med. Chem. Lett.", "Eur. J. Med. Chem.")
+_SMILES = (
+    "CC(=O)Oc1ccccc1C(=O)O",
+    "CN1CCC[C@H]1c1cccnc1",
+    "CC(C)Cc1ccc(cc1)[C@@H](C)C(=O)O",
+    None,
+)
+_MOLECULE_TYPES = ("Small molecule", "Protein", "Antibody", "Unknown")
+
+
+def chembl_id(base: int, index: int) -> str:
+    """ChEMBL ID записи ``index`` в диапазоне ``base``."""
+    return f"CHEMBL{base + index}"
+
+
+def index_from_chembl_id(base: int, value: str) -> int | None:
+    """Обратное к ``chembl_id``; ``None`` для чужих или неверных ID."""
+    if not value.startswith("CHEMBL"):
+        return None
+    try:
+        index = int(value[len("CHEMBL") :]) - base
+    except ValueError:
+        return None
+    return index if index >= 0 else None
+
+
+def activity_record(index: int) -> dict[str, Any]:
+    """Запись ``/activity`` номер ``index`` (``activity_id = index + 1``)."""
+    organism, tax_id = _ORGANISMS[index % len(_ORGANISMS)]
+    units = _UNITS[index % len(_UNITS)]
+    value = round((index * 7919) % 100_000 / 100, 3)
+    has_value = index % 11 != 0
+    return {
+        "action_type": (
+            {"action_type": "INHIBITOR", "description": "Negatively effects"}
+            if index % 5 == 0
+            else None
+        ),
+        "activity_comment": "Not Active" if index % 13 == 0 else None,
+        "activity_id": index + 1,
+        "activity_properties": (
+            [{"type": "Ratio", "value": str(index % 7), "relation": "="}]
+            if index % 3 == 0
+            else []
+        ),
+        "assay_chembl_id": chembl_id(ASSAY_ID_BASE, index % 5_000),
+        "assay_description": f"Inhibition of target {index % 997} in assay",
+        "assay_type": _ASSAY_TYPES[index % len(_ASSAY_TYPES)],
+        "assay_variant_accession": None,
+        "assay_variant_mutation": None,
+        "bao_endpoint": "BAO_0000190",
+        "bao_format": "BAO_0000357" if index % 2 else "BAO_0000219",
+        "bao_label": "single protein format" if index % 2 else "cell-based format",
+        "canonical_smiles": _SMILES[index % len(_SMILES)],
+        "data_validity_comment": None,
+        "data_validity_description": None,
+        "document_chembl_id": chembl_id(DOCUMENT_ID_BASE, index % 2_000),
+        "document_journal": _JOURNALS[index % len(_JOURNALS)],
+        "document_year": 1990 + index % 35,
+        "ligand_efficiency": (
+            {"bei": "12.1", "le": "0.3", "lle": None, "sei": "8.2"}
+            if index % 2
+            else None
+        ),
+        "molecule_chembl_id": chembl_id(MOLECULE_ID_BASE, index % 50_000),
+        "molecule_pref_name": f"COMPOUND-{index % 50_000}" if index % 4 else None,
+        "parent_molecule_chembl_id": chembl_id(MOLECULE_ID_BASE, index % 50_000),
+        "pchembl_value": str(round(4 + (index % 60) / 10, 2)) if has_value else None,
+        "potential_duplicate": index % 17 == 0,
+        "qudt_units": "http://www.openphacts.org/units/Nanomolar",
+        "record_id": 1_000_000 + index,
+        "relation": _RELATIONS[index % len(_RELATIONS)],
+        "src_id": 1 + index % 50,
+        "standard_flag": bool(index % 9),
+        "standard_relation": _RELATIONS[index % len(_RELATIONS)],
+        "standard_text_value": None,
+        "standard_type": _STANDARD_TYPES[index % len(_STANDARD_TYPES)],
+        "standard_units": units,
+        "standard_upper_value": None,
+        "standard_value": str(value) if has_value else None,
+        "target_chembl_id": chembl_id(TARGET_ID_BASE, index % 3_000),
+        "target_organism": organism,
+        "target_pref_name": f"Target protein {index % 3_000}",
+        "target_tax_id": str(tax_id) if tax_id is not None else None,
+        "text_value": None,
+        "toid": None,
+        "type": _STANDARD_TYPES[index % len(_STANDARD_TYPES)],
+        "units": units,
+        "uo_units": "UO_0000065" if units == "nM" else None,
+        "upper_value": None,
+        "value": str(value) if has_value else None,
+    }
+
+
+def assay_record(index: int) -> dict[str, Any]:
+    """Запись ``/assay`` с ``assay_chembl_id = CHEMBL<100000 + index>``."""
+    organism, tax_id = _ORGANISMS[index % len(_ORGANISMS)]
+    return {
+        "aidx": f"cld{index % 10}",
+        "assay_category": "screening" if index % 4 == 0 else None,
+        "assay_cell_type": "HEK293" if index % 6 == 0 else None,
+        "assay_chembl_id": chembl_id(ASSAY_ID_BASE, index),
+        "assay_classifications": [],
+        "assay_group": None,
+        "assay_organism": organism,
+        "assay_parameters": (
+            [{"type": "TEMPERATURE", "value": 37, "units": "C"}] if index % 3 else []
+        ),
+        "assay_strain": None,
+        "assay_subcellular_fraction": "membrane" if index % 5 == 0 else None,
+        "assay_tax_id": tax_id,
+        "assay_test_type": None,
+        "assay_tissue": "liver" if index % 7 == 0 else None,
+        "assay_type": _ASSAY_TYPES[index % len(_ASSAY_TYPES)],
+        "assay_type_description": "Binding",
+        "bao_format": "BAO_0000357",
+        "bao_label": "single protein format",
+        "cell_chembl_id": None,
+        "confidence_description": "Direct single protein target assigned",
+        "confidence_score": index % 10,
+        "description": f"Displacement of radioligand from target {index % 997}",
+        "document_chembl_id": chembl_id(DOCUMENT_ID_BASE, index % 2_000),
+        "relationship_description": "Direct protein target assigned",
+        "relationship_type": "D",
+        "score": None,
+        "src_assay_id": None,
+        "src_id": 1 + index % 50,
+        "target_chembl_id": chembl_id(TARGET_ID_BASE, index % 3_000),
+        "tissue_chembl_id": None,
+        "variant_sequence": None,
+    }
+
+
+def molecule_record(index: int) -> dict[str, Any]:
+    """Запись ``/molecule`` с ``molecule_chembl_id = CHEMBL<200000 + index>``."""
+    smiles = _SMILES[index % len(_SMILES)]
+    return {
+        "molecule_chembl_id": chembl_id(MOLECULE_ID_BASE, index),
+        "pref_name": f"COMPOUND-{index}" if index % 4 else None,
+        "molecule_type": _MOLECULE_TYPES[index % len(_MOLECULE_TYPES)],
+        "max_phase": str(index % 5) if index % 3 else None,
+        "structure_type": "MOL" if smiles else "NONE",
+        "molecule_properties": {
+            "alogp": str(round((index % 80) / 10 - 2, 2)),
+            "full_mwt": str(150 + index % 500),
+            "hba": index % 10,
+            "hbd": index % 5,
+            "num_ro5_violations": index % 3,
+        },
+        "molecule_structures": (
+            {
+                "canonical_smiles": smiles,
+                "standard_inchi_key": f"KEY{index:010d}-UHFFFAOYSA-N",
+            }
+            if smiles
+            else None
+        ),
+        "molecule_hierarchy": {
+            "molecule_chembl_id": chembl_id(MOLECULE_ID_BASE, index),
+            "parent_chembl_id": chembl_id(MOLECULE_ID_BASE, index),
+        },
+        "atc_classifications": ["N02BA01"] if index % 10 == 0 else [],
+        "molecule_synonyms": [
+            {"molecule_synonym": f"Synonym {index}", "syn_type": "TRADE_NAME"}
+        ],
+        "cross_references": [],
+        "pubchem_cid": None,
+        "helm_notation": None,
+    }
+
+
+RecordFactory = Callable[[int], dict[str, Any]]
+
+# endpoint -> (ключ списка в ответе, фабрика записи, фильтр по ID, база ID)
+ENDPOINTS: dict[str, tuple[str, RecordFactory, str, int | None]] = {
+    "activity": ("activities", activity_record, "activity_id", None),
+    "assay": ("assays", assay_record, "assay_chembl_id", ASSAY_ID_BASE),
+    "molecule": (
+        "molecules",
+        molecule_record,
+        "molecule_chembl_id",
+        MOLECULE_ID_BASE,
+    ),
+}
+
+# Сущность пайплайна -> endpoint ChEMBL.
+ENTITY_ENDPOINTS = {"activity": "activity", "assay": "assay", "testitem": "molecule"}
+
+
+def record_ids(endpoint: str, rows: int) -> list[str]:
+    """Значения ID-фильтра для первых ``rows`` записей endpoint'а."""
+    _, _, _, base = ENDPOINTS[endpoint]
+    if base is None:
+        return [str(index + 1) for index in range(rows)]
+    return [chembl_id(base, index) for index in range(rows)]
+
+
+def index_from_id(endpoint: str, value: str) -> int | None:
+    """Номер строки по значению ID-фильтра ``endpoint``."""
+    _, _, _, base = ENDPOINTS[endpoint]
+    if base is not None:
+        return index_from_chembl_id(base, value)
+    try:
+        index = int(value) - 1
+    except ValueError:
+        return None
+    return index if index >= 0 else None
+
+
+def records(endpoint: str, indices: Iterable[int]) -> list[dict[str, Any]]:
+    """Записи ``endpoint`` для номеров строк ``indices``."""
+    factory = ENDPOINTS[endpoint][1]
+    return [factory(index) for index in indices]
+
+
+__all__ = [
+    "ENDPOINTS",
+    "ENTITY_ENDPOINTS",
+    "activity_record",
+    "assay_record",
+    "chembl_id",
+    "index_from_id",
+    "molecule_record",
+    "record_ids",
+    "records",
+]
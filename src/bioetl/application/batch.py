@@ -0,0 +1,312 @@
+"""
+Пакетный запуск пайплайнов по графу зависимостей.
+
+Независимые пайплайны выполняются одновременно в пуле процессов. Общий
+бюджет воркеров ограничивает суммарное число процессов: пайплайн с
+``workers: N`` занимает N слотов. Лимит запросов провайдера делится между
+пайплайнами, которые могут работать одновременно, чтобы их суммарная частота
+запросов не превышала лимит источника.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable, Mapping, Sequence
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor
+from concurrent.futures import wait as wait_futures
+from dataclasses import dataclass
+from typing import Any
+
+from bioetl.application.orchestrator import PipelineOrchestrator
+from bioetl.domain.configs import PipelineConfig
+from bioetl.domain.models import BatchRunReport, PipelineRunReport, RunResult
+from bioetl.domain.provider_loader import ProviderLoaderProtocol
+
+# Порядок и зависимости ChEMBL-пайплайнов: activity запускается после assay,
+# остальные независимы.
+CHEMBL_PIPELINE_GRAPH: dict[str, tuple[str, ...]] = {
+    "assay_chembl": (),
+    "activity_chembl": ("assay_chembl",),
+    "target_chembl": (),
+    "document_chembl": (),
+    "testitem_chembl": (),
+}
+
+STATUS_SUCCESS = "success"
+STATUS_FAILED = "failed"
+STATUS_SKIPPED = "skipped"
+
+# (name, config_payload, dry_run, limit, use_provider_loader_port,
+#  provider_loader_factory) -> RunResult; выполняется в процессе пула.
+PipelineRunner = Callable[..., RunResult]
+
+
+@dataclass(frozen=True)
+class PipelineSpec:
+    """Пайплайн в графе пакетного запуска."""
+
+    name: str
+    config: PipelineConfig
+    depends_on: tuple[str, ...] = ()
+
+
+@dataclass
+class _Running:
+    spec: PipelineSpec
+    cost: int
+    rate_limit: float | None
+    started: float
+
+
+class PipelineBatchOrchestrator:
+    """Запускает граф пайплайнов с общим бюджетом воркеров и лимитом запросов."""
+
+    def __init__(
+        self,
+        specs: Sequence[PipelineSpec],
+        *,
+        max_workers: int = 1,
+        provider_rate_limits: Mapping[str, float] | None = None,
+        provider_loader_factory: Callable[[], ProviderLoaderProtocol] | None = None,
+        use_provider_loader_port: bool = False,
+        executor_factory: Callable[[int], Executor] | None = None,
+        runner: PipelineRunner | None = None,
+    ) -> None:
+        if max_workers < 1:
+            raise ValueError("max_workers must be >= 1")
+        self._specs = _topological_order(specs)
+        self._max_workers = max_workers
+        self._rate_limits = split_provider_rate_limits(
+            self._specs,
+            max_workers=max_workers,
+            budgets=provider_rate_limits,
+        )
+        self._provider_loader_factory = provider_loader_factory
+        self._use_provider_loader_port = use_provider_loader_port
+        self._executor_factory = executor_factory or _process_pool
+        self._runner = runner or PipelineOrchestrator._execute_in_subprocess
+
+    @property
+    def rate_limits(self) -> dict[str, float]:
+        """Лимит запросов в секунду для каждого пайплайна."""
+        return dict(self._rate_limits)
+
+    def run(self, *, dry_run: bool = False, limit: int | None = None) -> BatchRunReport:
+        """
+        Выполняет граф и возвращает сводный отчет.
+
+        Пайплайны, зависящие от упавшего, не запускаются (статус ``skipped``);
+        независимые ветви выполняются до конца.
+        """
+        started = time.perf_counter()
+        reports: dict[str, PipelineRunReport] = {}
+        pending = list(self._specs)
+        running: dict[Future[RunResult], _Running] = {}
+        used = 0
+
+        with self._executor_factory(self._max_workers) as executor:
+            while pending or running:
+                for spec in list(pending):
+                    blocked = [
+                        dep
+                        for dep in spec.depends_on
+                        if dep in reports and reports[dep].status != STATUS_SUCCESS
+                    ]
+                    if blocked:
+                        pending.remove(spec)
+                        reports[spec.name] = PipelineRunReport(
+                            name=spec.name,
+                            status=STATUS_SKIPPED,
+                            errors=[
+                                f"Dependency did not succeed: {', '.join(blocked)}"
+                            ],
+                        )
+                        continue
+                    if any(dep not in reports for dep in spec.depends_on):
+                        continue
+                    cost = self._cost(spec)
+                    if used + cost > self._max_workers:
+                        # Строгий порядок: следующие не обгоняют ждущий пайплайн.
+                        break
+                    pending.remove(spec)
+                    used += cost
+                    running[self._submit(executor, spec, dry_run, limit)] = _Running(
+                        spec=spec,
+                        cost=cost,
+                        rate_limit=self._rate_limits.get(spec.name),
+                        started=time.perf_counter(),
+                    )
+
+                if not running:
+                    if pending:  # pragma: no cover - граф проверен в __init__
+                        raise RuntimeError("Batch scheduler made no progress")
+                    break
+
+                done, _ = wait_futures(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    entry = running.pop(future)
+                    used -= entry.cost
+                    reports[entry.spec.name] = _report(future, entry)
+
+        ordered = [reports[spec.name] for spec in self._specs]
+        return BatchRunReport(
+            success=all(report.status == STATUS_SUCCESS for report in ordered),
+            duration_sec=time.perf_counter() - started,
+            max_workers=self._max_workers,
+            pipelines=ordered,
+        )
+
+    def _cost(self, spec: PipelineSpec) -> int:
+        return min(spec.config.workers, self._max_workers)
+
+    def _submit(
+        self,
+        executor: Executor,
+        spec: PipelineSpec,
+        dry_run: bool,
+        limit: int | None,
+    ) -> Future[RunResult]:
+        config = with_rate_limit(spec.config, self._rate_limits.get(spec.name))
+        return executor.submit(
+            self._runner,
+            spec.name,
+            config.model_dump(),
+            dry_run,
+            limit,
+            self._use_provider_loader_port,
+            self._provider_loader_factory,
+        )
+
+
+def split_provider_rate_limits(
+    specs: Sequence[PipelineSpec],
+    *,
+    max_workers: int,
+    budgets: Mapping[str, float] | None = None,
+) -> dict[str, float]:
+    """
+    Делит лимит каждого провайдера между его одновременно возможными пайплайнами.
+
+    Лимит провайдера берется из ``budgets``, иначе — минимальный
+    ``rate_limit_per_sec`` среди конфигураций его пайплайнов. Число
+    одновременных пайплайнов — сколько самых «дешевых» по воркерам
+    помещается в бюджет.
+    """
+    by_provider: dict[str, list[PipelineSpec]] = {}
+    for spec in specs:
+        by_provider.setdefault(spec.config.provider, []).append(spec)
+
+    rates: dict[str, float] = {}
+    for provider, provider_specs in by_provider.items():
+        budget = (budgets or {}).get(provider)
+        if budget is None:
+            budget = min(_configured_rate(spec.config) for spec in provider_specs)
+        concurrent = 0
+        used = 0
+        for cost in sorted(min(s.config.workers, max_workers) for s in provider_specs):
+            if used + cost > max_workers:
+                break
+            used += cost
+            concurrent += 1
+        share = budget / max(concurrent, 1)
+        for spec in provider_specs:
+            rates[spec.name] = share
+    return rates
+
+
+def with_rate_limit(config: PipelineConfig, rate: float | None) -> PipelineConfig:
+    """
+    Копия конфигурации с лимитом запросов провайдера и клиента ``rate``.
+
+    Адаптивный лимитер (``adaptive_rate_limit``) поднимает скорость до
+    ``max_rate_per_sec``; потолок тоже ограничивается долей ``rate``, иначе
+    суммарная скорость пайплайнов превысила бы лимит провайдера.
+    """
+    if rate is None:
+        return config
+    update: dict[str, Any] = {"rate_limit_per_sec": rate}
+    adaptive = getattr(config.provider_config, "adaptive_rate_limit", None)
+    if adaptive is not None:
+        ceiling = adaptive.max_rate_per_sec
+        update["adaptive_rate_limit"] = adaptive.model_copy(
+            update={"max_rate_per_sec": rate if ceiling is None else min(ceiling, rate)}
+        )
+    provider_config = config.provider_config.model_copy(update=update)
+    return config.model_copy(
+        update={
+            "provider_config": provider_config,
+            "client": config.client.model_copy(update={"rate_limit": rate}),
+        }
+    )
+
+
+def _configured_rate(config: PipelineConfig) -> float:
+    return config.provider_config.rate_limit_per_sec or config.client.rate_limit
+
+
+def _report(future: Future[RunResult], entry: _Running) -> PipelineRunReport:
+    elapsed = time.perf_counter() - entry.started
+    try:
+        result = future.result()
+    except Exception as exc:  # noqa: BLE001 - ошибка пайплайна попадает в отчет
+        return PipelineRunReport(
+            name=entry.spec.name,
+            status=STATUS_FAILED,
+            duration_sec=elapsed,
+            rate_limit=entry.rate_limit,
+            errors=[f"{type(exc).__name__}: {exc}"],
+        )
+    return PipelineRunReport(
+        name=entry.spec.name,
+        status=STATUS_SUCCESS if result.success else STATUS_FAILED,
+        duration_sec=result.duration_sec,
+        run_id=result.run_id,
+        row_count=result.row_count,
+        output_path=result.output_path,
+        rate_limit=entry.rate_limit,
+        errors=list(result.errors),
+    )
+
+
+def _topological_order(specs: Sequence[PipelineSpec]) -> list[PipelineSpec]:
+    """Стабильная топологическая сортировка; ошибки графа — ``ValueError``."""
+    by_name: dict[str, PipelineSpec] = {}
+    for spec in specs:
+        if spec.name in by_name:
+            raise ValueError(f"Duplicate pipeline in batch: {spec.name}")
+        by_name[spec.name] = spec
+    for spec in specs:
+        unknown = [dep for dep in spec.depends_on if dep not in by_name]
+        if unknown:
+            raise ValueError(
+                f"Pipeline '{spec.name}' depends on unknown pipelines: {unknown}"
+            )
+
+    ordered: list[PipelineSpec] = []
+    placed: set[str] = set()
+    remaining = list(specs)
+    while remaining:
+        ready = [
+            spec for spec in remaining if all(dep in placed for dep in spec.depends_on)
+        ]
+        if not ready:
+            cycle = sorted(spec.name for spec in remaining)
+            raise ValueError(f"Dependency cycle between pipelines: {cycle}")
+        for spec in ready:
+            ordered.append(spec)
+            placed.add(spec.name)
+            remaining.remove(spec)
+    return ordered
+
+
+def _process_pool(max_workers: int) -> Executor:
+    return ProcessPoolExecutor(max_workers=max_workers)
+
+
+__all__ = [
+    "CHEMBL_PIPELINE_GRAPH",
+    "PipelineBatchOrchestrator",
+    "PipelineSpec",
+    "split_provider_rate_limits",
+    "with_rate_limit",
+]
@@ -9,6 +9,7 @@ from bioetl.application.pipelines.hooks_impl import (
     LoggingPipelineHookImpl,
     MetricsPipelineHookImpl,
 )
+from bioetl.application.pipelines.profiling import ProfilingPipelineHookImpl
 from bioetl.domain.clients.base.output.contracts import (
     MetadataWriterABC,
     OutputWriterABC,
@@ -16,7 +17,11 @@ from bioetl.domain.clients.base.output.contracts import (
     WriterABC,
 )
 from bioetl.domain.configs import PipelineConfig
-from bioetl.domain.pipelines.contracts import ErrorPolicyABC, PipelineHookABC
+from bioetl.domain.pipelines.contracts import (
+    CheckpointStoreABC,
+    ErrorPolicyABC,
+    PipelineHookABC,
+)
 from bioetl.domain.observability import LoggingPort
 from bioetl.domain.provider_registry import ProviderRegistryABC
 from bioetl.domain.providers import ProviderDefinition, ProviderId
@@ -33,6 +38,7 @@ from bioetl.infrastructure.files.csv_record_source import (
     CsvRecordSourceImpl,
     IdListRecordSourceImpl,
 )
+from bioetl.infrastructure.files.factories import default_checkpoint_store
 from bioetl.infrastructure.observability.factories import default_logging_port
 from bioetl.infrastructure.output.factories import (
     default_metadata_writer,
@@ -71,7 +77,7 @@ class PipelineContainer(PipelineContainerABC):
             validator_factory or self._default_validator_factory()
         )
         self._logger: LoggingPort = logger or default_logging_port()
-        self._writer: WriterABC = writer or default_writer()
+        self._writer: WriterABC = writer or default_writer(self._config.output)
         self._metadata_writer: MetadataWriterABC = (
             metadata_writer or default_metadata_writer()
         )
@@ -94,6 +100,8 @@ class PipelineContainer(PipelineContainerABC):
             writer=self._writer,
             metadata_writer=self._metadata_writer,
             quality_reporter=self._quality_reporter,
+            temp_dir=Path(self._config.storage.temp_path),
+            file_format=self._config.output.format,
         )
         register_schemas(self._schema_provider)
 
@@ -152,11 +160,14 @@ class PipelineContainer(PipelineContainerABC):
         if mode == "csv":
             if path is None:
                 raise ValueError("input_path is required for CSV mode")
+            csv_options = self._config.csv_options
             return CsvRecordSourceImpl(
                 input_path=Path(path),
-                csv_options=self._config.csv_options,
+                csv_options=csv_options,
                 limit=limit,
                 logger=effective_logger,
+                chunk_size=self._config.batch_size,
+                usecols=csv_options.resolve_usecols(self._config.fields),
             )
 
         if mode == "id_only":
@@ -202,7 +213,7 @@ class PipelineContainer(PipelineContainerABC):
         definition = self._get_provider_definition()
         source_config = self._resolve_provider_config(definition)
 
-        client = definition.components.create_client(source_config)
+        client = self._create_client(definition, source_config)
         return definition.components.create_extraction_service(
             source_config, client=client
         )
@@ -236,6 +247,14 @@ class PipelineContainer(PipelineContainerABC):
                     entity_name=self._config.entity_name,
                 ),
             ]
+            if self._config.profiling.enabled:
+                self._hooks.append(
+                    ProfilingPipelineHookImpl(
+                        self._config.profiling,
+                        output_dir=Path(self._config.output_path),
+                        logger=self.get_logger(),
+                    )
+                )
         return list(self._hooks)
 
     def get_error_policy(self) -> ErrorPolicyABC:
@@ -244,6 +263,10 @@ class PipelineContainer(PipelineContainerABC):
             self._error_policy = FailFastErrorPolicyImpl()
         return self._error_policy
 
+    def get_checkpoint_store(self) -> CheckpointStoreABC | None:
+        """Возвращает хранилище чекпоинтов (None, если они выключены)."""
+        return default_checkpoint_store(self._config.storage)
+
     def _resolve_primary_key(self) -> str:
         pk = self._config.primary_key
         if not pk and self._config.pipeline and "primary_key" in self._config.pipeline:
@@ -256,6 +279,13 @@ class PipelineContainer(PipelineContainerABC):
             )
         return pk
 
+    def _create_client(self, definition: ProviderDefinition, source_config: Any) -> Any:
+        storage = self._config.storage
+        if storage.response_cache.enabled:
+            # Кэш ответов поддерживают провайдеры, принимающие storage.
+            return definition.components.create_client(source_config, storage=storage)
+        return definition.components.create_client(source_config)
+
     def _get_provider_definition(self) -> ProviderDefinition:
         return self._get_provider_registry().get_provider(self._provider_id)
 
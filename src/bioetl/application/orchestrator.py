@@ -85,17 +85,23 @@ class PipelineOrchestrator:
 
         pipeline.add_hooks(hooks)
         pipeline.set_error_policy(error_policy)
+        pipeline.set_checkpoint_store(container.get_checkpoint_store())
 
         return pipeline
 
     def run_pipeline(
-        self, *, dry_run: bool = False, limit: int | None = None
+        self,
+        *,
+        dry_run: bool = False,
+        limit: int | None = None,
+        resume: str | None = None,
     ) -> RunResult:
-        """Запускает пайплайн в текущем процессе."""
+        """Запускает пайплайн в текущем процессе (``resume`` — run_id чекпоинта)."""
         pipeline = self.build_pipeline(limit=limit)
         return pipeline.run(
             output_path=Path(self._config.output_path),
             dry_run=dry_run,
+            resume=resume,
             limit=limit,
         )
 
@@ -105,6 +111,7 @@ class PipelineOrchestrator:
         dry_run: bool = False,
         limit: int | None = None,
         executor: ProcessPoolExecutor | None = None,
+        resume: str | None = None,
     ) -> Future[RunResult]:
         """Запускает пайплайн в отдельном процессе."""
         executor_to_use = executor or ProcessPoolExecutor(max_workers=1)
@@ -117,6 +124,7 @@ class PipelineOrchestrator:
             limit,
             self._use_provider_loader_port,
             self._provider_loader_factory,
+            resume,
         )
 
         if created_executor:
@@ -132,6 +140,7 @@ class PipelineOrchestrator:
         limit: int | None,
         use_provider_loader_port: bool,
         provider_loader_factory: Callable[[], ProviderLoaderProtocol] | None,
+        resume: str | None = None,
     ) -> RunResult:
         config = PipelineConfig(**config_payload)
         if provider_loader_factory is None:
@@ -152,7 +161,7 @@ class PipelineOrchestrator:
             provider_loader_factory=provider_loader_factory,
             use_provider_loader_port=use_provider_loader_port,
         )
-        return orchestrator.run_pipeline(dry_run=dry_run, limit=limit)
+        return orchestrator.run_pipeline(dry_run=dry_run, limit=limit, resume=resume)
 
     def _get_provider_registry(self) -> ProviderRegistryABC:
         if self._provider_registry is not None:
@@ -3,6 +3,7 @@
 """
 
 from abc import ABC
+from collections import deque
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Callable, Iterable
@@ -12,13 +13,25 @@ import pandas as pd
 from bioetl.application.pipelines.contracts import ExtractorABC
 from bioetl.application.pipelines.error_policy_manager import ErrorPolicyManager
 from bioetl.application.pipelines.hooks_manager import HooksManager
-from bioetl.application.pipelines.stage_runner import StageRunner
+from bioetl.application.pipelines.parallel import (
+    ChunkOutcome,
+    OrderedChunkPool,
+    ReplayedChunkStages,
+    parallel_processing_supported,
+    run_chunk_stages,
+)
+from bioetl.application.pipelines.stage_runner import ChunkSink, StageRunner
 from bioetl.domain.clients.base.output.contracts import WriteResult
 from bioetl.domain.configs import PipelineConfig
 from bioetl.domain.errors import PipelineStageError
 from bioetl.domain.models import RunContext, RunResult, StageResult
 from bioetl.domain.observability import LoggingPort
-from bioetl.domain.pipelines.contracts import ErrorPolicyABC, PipelineHookABC
+from bioetl.domain.pipelines.checkpoint import Checkpoint, CheckpointChunk, pop_cursor
+from bioetl.domain.pipelines.contracts import (
+    CheckpointStoreABC,
+    ErrorPolicyABC,
+    PipelineHookABC,
+)
 from bioetl.domain.providers import ProviderId
 from bioetl.domain.schemas.pipeline_contracts import get_pipeline_contract
 from bioetl.domain.transform.contracts import HashServiceABC
@@ -31,7 +44,10 @@ from bioetl.infrastructure.output.metadata import (
 )
 
 if TYPE_CHECKING:
-    from bioetl.domain.clients.base.output.contracts import OutputWriterABC
+    from bioetl.domain.clients.base.output.contracts import (
+        OutputStreamABC,
+        OutputWriterABC,
+    )
 
 
 class PipelineBase(ABC):
@@ -70,6 +86,7 @@ class PipelineBase(ABC):
         self._extractor = extractor
         self._transformer = transformer
         self._post_transformer = post_transformer
+        self._checkpoint_store: CheckpointStoreABC | None = None
         if self._post_transformer is None:
             self._post_transformer = default_post_transformer(
                 hash_service=self._hash_service,
@@ -114,17 +131,25 @@ class PipelineBase(ABC):
         output_path: Path,
         *,
         dry_run: bool = False,
+        resume: str | None = None,
         **kwargs: Any,
     ) -> RunResult:
         """
         Запускает полный цикл ETL-пайплайна.
+
+        ``resume`` — run_id прерванного запуска: обработанные чанки берутся
+        из чекпоинта, извлечение продолжается с сохраненного курсора.
         """
         self._hooks_manager.reset()
         self._error_policy_manager.reset()
         if hasattr(self._hash_service, "reset_state"):
             self._hash_service.reset_state()
 
+        checkpoint = self._load_checkpoint(resume, dry_run)
         context = self._build_context(dry_run)
+        if checkpoint is not None:
+            context.run_id = checkpoint.run_id
+            self._hash_service.restore_state(checkpoint.state)
         self._logger = self._logger.bind(run_id=context.run_id)
         self._hooks_manager.set_logger(self._logger)
         self._error_policy_manager.set_logger(self._logger)
@@ -132,11 +157,29 @@ class PipelineBase(ABC):
         stages_results: list[StageResult] = []
         counters = self._init_stage_counters()
         validated_chunks: list[pd.DataFrame] = []
+        stream_sink: _StreamingChunkSink | None = None
+        if not dry_run and self._config.output.streaming:
+            stream_sink = self._open_stream_sink(context, output_path)
+        sink: ChunkSink = stream_sink if stream_sink is not None else validated_chunks
+        checkpointer: _ChunkCheckpointer | None = None
+        if self._checkpoint_store is not None and not dry_run:
+            checkpointer = _ChunkCheckpointer(
+                self._checkpoint_store,
+                checkpoint
+                or Checkpoint(run_id=context.run_id, pipeline_id=self._config.id),
+                sink,
+                state_provider=self._hash_service.export_state,
+            )
 
         try:
             self._hooks_manager.notify_stage_start("extract", context)
-            counters, validated_chunks = self._process_extract_stage(
-                context, counters, validated_chunks, dry_run, kwargs
+            self._process_extract_stage(
+                context,
+                counters,
+                checkpointer if checkpointer is not None else sink,
+                dry_run,
+                kwargs,
+                checkpointer=checkpointer,
             )
 
             self._append_stage_result(
@@ -161,7 +204,16 @@ class PipelineBase(ABC):
             )
 
             write_result: WriteResult | None = None
-            if not dry_run:
+            if stream_sink is not None:
+                write_result, counters = self._perform_streaming_write_stage(
+                    context, stream_sink, counters, stages_results
+                )
+                if write_result is None:
+                    run_result = self._stage_runner.handle_stage_failure(
+                        "write", stages_results, context
+                    )
+                    return run_result
+            elif not dry_run:
                 write_result, counters = self._perform_write_stage(
                     context, validated_chunks, output_path, counters, stages_results
                 )
@@ -176,6 +228,8 @@ class PipelineBase(ABC):
                 if write_result
                 else build_dry_run_metadata(context, counters["validate_count"])
             )
+            if checkpointer is not None:
+                checkpointer.clear()
 
             return RunResult(
                 run_id=context.run_id,
@@ -189,6 +243,8 @@ class PipelineBase(ABC):
                 meta=meta,
             )
         except PipelineStageError as error:
+            if stream_sink is not None:
+                stream_sink.abort()
             stage_result = self._stage_runner.make_stage_result(
                 error.stage,
                 0,
@@ -205,7 +261,36 @@ class PipelineBase(ABC):
                 run_id=error.run_id,
                 error=str(error.cause) if error.cause else str(error),
             )
+            if checkpointer is not None:
+                self._logger.info(
+                    "Checkpoint kept; rerun with --resume to continue",
+                    run_id=context.run_id,
+                    chunks=checkpointer.chunk_count,
+                )
+            raise
+        except BaseException:
+            if stream_sink is not None:
+                stream_sink.abort()
             raise
+        finally:
+            self._hooks_manager.notify_run_end(context)
+
+    def _load_checkpoint(self, resume: str | None, dry_run: bool) -> Checkpoint | None:
+        if resume is None:
+            return None
+        if dry_run:
+            raise ValueError("Resume cannot be combined with dry run")
+        if self._checkpoint_store is None:
+            raise ValueError("Resume requires storage.checkpoints.enabled")
+        checkpoint = self._checkpoint_store.load(resume)
+        if checkpoint is None:
+            raise ValueError(f"No checkpoint found for run '{resume}'")
+        if checkpoint.pipeline_id != self._config.id:
+            raise ValueError(
+                f"Checkpoint '{resume}' belongs to pipeline "
+                f"'{checkpoint.pipeline_id}', not '{self._config.id}'"
+            )
+        return checkpoint
 
     def _build_context(self, dry_run: bool) -> RunContext:
         context = RunContext(
@@ -233,39 +318,53 @@ class PipelineBase(ABC):
         self,
         context: RunContext,
         counters: dict[str, int],
-        validated_chunks: list[pd.DataFrame],
+        validated_chunks: ChunkSink,
         dry_run: bool,
         kwargs: dict[str, Any],
-    ) -> tuple[dict[str, int], list[pd.DataFrame]]:
+        *,
+        checkpointer: "_ChunkCheckpointer | None" = None,
+    ) -> tuple[dict[str, int], ChunkSink]:
         chunk_iterator: Iterable[pd.DataFrame] | None = None
         transform_started = False
         validate_started = False
+        # Курсор последнего извлеченного чанка: ретрай и --resume продолжают
+        # с него, а не перечитывают источник с начала.
+        cursor: dict[str, Any] | None = None
+        # Курсоры и счетчики extract чанков, отправленных в обработку,
+        # но еще не обработанных (в параллельном режиме их несколько).
+        pending: deque[tuple[dict[str, Any] | None, int, int]] = deque()
+
+        if checkpointer is not None:
+            cursor = checkpointer.replay(counters)
 
         def reset_iterator() -> None:
             nonlocal chunk_iterator
-            chunk_iterator = self._create_chunk_iterator(context, **kwargs)
-
-        reset_iterator()
-        while True:
-            try:
-                raw_chunk_obj = self._error_policy_manager.execute(
-                    "extract",
-                    context,
-                    lambda: next(chunk_iterator),  # type: ignore
-                    on_retry=reset_iterator,
+            resume_kwargs = (
+                kwargs if cursor is None else {**kwargs, "resume_from": cursor}
+            )
+            chunk_iterator = self._create_chunk_iterator(context, **resume_kwargs)
+
+        def commit_checkpoint() -> None:
+            chunk_cursor, extract_count, extract_chunks = pending.popleft()
+            if checkpointer is not None and chunk_cursor is not None:
+                checkpointer.commit(
+                    chunk_cursor,
+                    {
+                        **counters,
+                        "extract_count": extract_count,
+                        "extract_chunks": extract_chunks,
+                    },
                 )
-            except StopIteration:
-                break
-
-            counters["extract_chunks"] += 1
-            if raw_chunk_obj is None:
-                raw_chunk: pd.DataFrame = pd.DataFrame()
-            elif isinstance(raw_chunk_obj, pd.DataFrame):
-                raw_chunk = raw_chunk_obj
-            else:
-                raise TypeError("Extractor must yield pandas DataFrame chunks.")
-            counters["extract_count"] += len(raw_chunk)
 
+        def process(
+            raw_chunk: pd.DataFrame,
+            transform_fn: Callable[[pd.DataFrame], pd.DataFrame],
+            apply_transformers: Callable[[pd.DataFrame, RunContext], pd.DataFrame],
+            validate_fn: Callable[[pd.DataFrame], pd.DataFrame],
+        ) -> None:
+            nonlocal transform_started, validate_started
+            if checkpointer is not None:
+                checkpointer.start_chunk(pending[0][0])
             (
                 transform_started,
                 counters["transform_chunks"],
@@ -284,37 +383,127 @@ class PipelineBase(ABC):
                 validate_count=counters["validate_count"],
                 validated_chunks=validated_chunks,
                 dry_run=dry_run,
-                transform_fn=self.transform,
-                apply_transformers=self._apply_transformers,
-                validate_fn=self.validate,
+                transform_fn=transform_fn,
+                apply_transformers=apply_transformers,
+                validate_fn=validate_fn,
             )
 
+        def process_serial(raw_chunk: pd.DataFrame) -> None:
+            process(raw_chunk, self.transform, self._apply_transformers, self.validate)
+
+        def process_outcomes(ready: list[tuple[pd.DataFrame, ChunkOutcome]]) -> None:
+            for raw_chunk, outcome in ready:
+                replay = self._replay_chunk_outcome(outcome, context)
+                process(
+                    raw_chunk,
+                    replay.transform,
+                    replay.apply_transformers,
+                    replay.validate,
+                )
+                commit_checkpoint()
+
+        pool = self._open_chunk_pool(context)
+        try:
+            reset_iterator()
+            while True:
+                self._hooks_manager.notify_chunk_start("extract", context)
+                raw_chunk_obj = None
+                try:
+                    raw_chunk_obj = self._error_policy_manager.execute(
+                        "extract",
+                        context,
+                        lambda: next(chunk_iterator),  # type: ignore
+                        on_retry=reset_iterator,
+                    )
+                except StopIteration:
+                    break
+                finally:
+                    self._hooks_manager.notify_chunk_end(
+                        "extract",
+                        len(raw_chunk_obj) if raw_chunk_obj is not None else 0,
+                    )
+
+                counters["extract_chunks"] += 1
+                if raw_chunk_obj is None:
+                    raw_chunk: pd.DataFrame = pd.DataFrame()
+                elif isinstance(raw_chunk_obj, pd.DataFrame):
+                    raw_chunk = raw_chunk_obj
+                else:
+                    raise TypeError("Extractor must yield pandas DataFrame chunks.")
+                counters["extract_count"] += len(raw_chunk)
+                chunk_cursor = pop_cursor(raw_chunk)
+                if chunk_cursor is not None:
+                    cursor = chunk_cursor
+                pending.append(
+                    (
+                        chunk_cursor,
+                        counters["extract_count"],
+                        counters["extract_chunks"],
+                    )
+                )
+
+                if pool is None:
+                    process_serial(raw_chunk)
+                    commit_checkpoint()
+                else:
+                    process_outcomes(pool.submit(raw_chunk))
+
+            if pool is not None:
+                process_outcomes(pool.drain())
+        except PipelineStageError as error:
+            if error.stage == "extract" and pool is not None and checkpointer:
+                # Уже извлеченные чанки попадают в чекпоинт до выхода с ошибкой.
+                process_outcomes(pool.drain())
+            raise
+        finally:
+            if pool is not None:
+                pool.shutdown()
+
         if not transform_started:
-            (
-                transform_started,
-                counters["transform_chunks"],
-                counters["transform_count"],
-                validate_started,
-                counters["validate_chunks"],
-                counters["validate_count"],
-            ) = self._stage_runner.process_chunk(
-                pd.DataFrame(),
-                context,
-                transform_started=transform_started,
-                transform_chunks=counters["transform_chunks"],
-                transform_count=counters["transform_count"],
-                validate_started=validate_started,
-                validate_chunks=counters["validate_chunks"],
-                validate_count=counters["validate_count"],
-                validated_chunks=validated_chunks,
-                dry_run=dry_run,
-                transform_fn=self.transform,
-                apply_transformers=self._apply_transformers,
-                validate_fn=self.validate,
-            )
+            process_serial(pd.DataFrame())
 
         return counters, validated_chunks
 
+    def _open_chunk_pool(self, context: RunContext) -> OrderedChunkPool | None:
+        workers = self._config.workers
+        if workers <= 1:
+            return None
+        if not parallel_processing_supported():
+            self._logger.warning(
+                "Parallel chunk processing requires fork start method; "
+                "falling back to serial processing",
+                workers=workers,
+            )
+            return None
+
+        def stages(raw_chunk: pd.DataFrame) -> ChunkOutcome:
+            return run_chunk_stages(
+                raw_chunk,
+                transform=lambda df: self._apply_transformers(
+                    self.transform(df), context
+                ),
+                validate=self.validate,
+            )
+
+        return OrderedChunkPool(stages, workers=workers)
+
+    def _replay_chunk_outcome(
+        self, outcome: ChunkOutcome, context: RunContext
+    ) -> ReplayedChunkStages:
+        resequence = (
+            self._post_transformer.order_dependent_part()
+            if self._post_transformer is not None
+            else None
+        )
+        return ReplayedChunkStages(
+            outcome,
+            context,
+            transform_fn=self.transform,
+            apply_transformers=self._apply_transformers,
+            validate_fn=self.validate,
+            resequence=resequence,
+        )
+
     def _append_stage_result(
         self,
         stages_results: list[StageResult],
@@ -342,29 +531,96 @@ class PipelineBase(ABC):
         if not self._hooks_manager.get_stage_start("write"):
             self._hooks_manager.notify_stage_start("write", context)
 
-        df_to_write = (
-            pd.concat(validated_chunks, ignore_index=True)
-            if validated_chunks
-            else pd.DataFrame()
-        )
+        self._hooks_manager.notify_chunk_start("write", context)
+        write_result_obj = None
+        try:
+            df_to_write = (
+                pd.concat(validated_chunks, ignore_index=True)
+                if validated_chunks
+                else pd.DataFrame()
+            )
+
+            write_result_obj = self._error_policy_manager.execute(
+                "write",
+                context,
+                lambda: self.write(
+                    df_to_write,
+                    output_path,
+                    context,
+                ),
+            )
+        finally:
+            self._hooks_manager.notify_chunk_end(
+                "write",
+                (
+                    write_result_obj.row_count
+                    if isinstance(write_result_obj, WriteResult)
+                    else 0
+                ),
+            )
+        if write_result_obj is None:
+            return None, counters
+        if not isinstance(write_result_obj, WriteResult):
+            raise TypeError("Writer must return WriteResult or None.")
+        write_result = write_result_obj
 
-        write_result_obj = self._error_policy_manager.execute(
+        counters["write_count"] = write_result.row_count
+        counters["write_chunks"] = max(counters["validate_chunks"], 1)
+
+        self._append_stage_result(
+            stages_results,
             "write",
+            write_result.row_count,
+            counters["write_chunks"],
+        )
+        return write_result, counters
+
+    def _open_stream_sink(
+        self, context: RunContext, output_path: Path
+    ) -> "_StreamingChunkSink":
+        output_schema_name = self._schema_contract.get_output_schema()
+        stream = self._output_writer.open_stream(
+            output_path,
+            self._config.entity_name,
             context,
-            lambda: self.write(
-                df_to_write,
-                output_path,
-                context,
+            column_order=self._validation_service.get_schema_columns(
+                output_schema_name
             ),
         )
+        return _StreamingChunkSink(
+            stream,
+            context,
+            hooks_manager=self._hooks_manager,
+            error_policy_manager=self._error_policy_manager,
+        )
+
+    def _perform_streaming_write_stage(
+        self,
+        context: RunContext,
+        stream_sink: "_StreamingChunkSink",
+        counters: dict[str, int],
+        stages_results: list[StageResult],
+    ) -> tuple[WriteResult | None, dict[str, int]]:
+        if not self._hooks_manager.get_stage_start("write"):
+            self._hooks_manager.notify_stage_start("write", context)
+
+        self._hooks_manager.notify_chunk_start("write", context)
+        write_result_obj = None
+        try:
+            write_result_obj = self._error_policy_manager.execute(
+                "write", context, stream_sink.close
+            )
+        finally:
+            self._hooks_manager.notify_chunk_end("write", 0)
         if write_result_obj is None:
+            stream_sink.abort()
             return None, counters
         if not isinstance(write_result_obj, WriteResult):
             raise TypeError("Writer must return WriteResult or None.")
         write_result = write_result_obj
 
         counters["write_count"] = write_result.row_count
-        counters["write_chunks"] = max(counters["validate_chunks"], 1)
+        counters["write_chunks"] = max(stream_sink.chunk_count, 1)
 
         self._append_stage_result(
             stages_results,
@@ -485,6 +741,10 @@ class PipelineBase(ABC):
         """Позволяет заменить пост-обработчик трансформации."""
         self._post_transformer = transformer
 
+    def set_checkpoint_store(self, store: CheckpointStoreABC | None) -> None:
+        """Включает чекпоинты извлечения (None — выключает)."""
+        self._checkpoint_store = store
+
     # === Internal Methods ===
     def _calculate_duration(self, context: RunContext) -> float:
         return (datetime.now(timezone.utc) - context.started_at).total_seconds()
@@ -591,3 +851,111 @@ class PipelineBase(ABC):
         """
         Хук для обогащения контекста (например, добавления версии релиза).
         """
+
+
+class _StreamingChunkSink:
+    """
+    Приемник чанков для потокового режима записи.
+
+    Каждый валидированный чанк сразу дописывается в выходной файл
+    под политикой ошибок стадии ``write``, поэтому пайплайн не держит
+    в памяти весь датасет.
+    """
+
+    def __init__(
+        self,
+        stream: "OutputStreamABC",
+        context: RunContext,
+        *,
+        hooks_manager: HooksManager,
+        error_policy_manager: ErrorPolicyManager,
+    ) -> None:
+        self._stream = stream
+        self._context = context
+        self._hooks_manager = hooks_manager
+        self._error_policy_manager = error_policy_manager
+        self.chunk_count = 0
+
+    def append(self, df: pd.DataFrame, /) -> None:
+        if not self._hooks_manager.get_stage_start("write"):
+            self._hooks_manager.notify_stage_start("write", self._context)
+        self._hooks_manager.notify_chunk_start("write", self._context)
+        try:
+            self._error_policy_manager.execute(
+                "write", self._context, lambda: self._stream.write_chunk(df)
+            )
+        finally:
+            self._hooks_manager.notify_chunk_end("write", len(df))
+        self.chunk_count += 1
+
+    def close(self) -> WriteResult:
+        return self._stream.close()
+
+    def abort(self) -> None:
+        self._stream.abort()
+
+
+class _ChunkCheckpointer:
+    """
+    Приемник чанков, фиксирующий чекпоинт после каждого сырого чанка.
+
+    Валидированные чанки передаются в исходный приемник и копятся до
+    ``commit``: тот сохраняет их в хранилище и атомарно обновляет манифест
+    курсором обработанного чанка, счетчиками и состоянием hash service.
+    Чанки без курсора (источник без resume) не копятся: чекпоинт для них
+    не фиксируется, а буфер съел бы память потоковой записи.
+    """
+
+    def __init__(
+        self,
+        store: CheckpointStoreABC,
+        checkpoint: Checkpoint,
+        sink: ChunkSink,
+        *,
+        state_provider: Callable[[], dict[str, Any]],
+    ) -> None:
+        self._store = store
+        self._checkpoint = checkpoint
+        self._sink = sink
+        self._state_provider = state_provider
+        self._pending: list[pd.DataFrame] = []
+        self._buffering = True
+
+    @property
+    def chunk_count(self) -> int:
+        return len(self._checkpoint.chunks)
+
+    def replay(self, counters: dict[str, int]) -> dict[str, Any] | None:
+        """Передает в приемник сохраненные чанки и возвращает курсор."""
+        for chunk in self._checkpoint.chunks:
+            self._sink.append(
+                self._store.load_chunk(self._checkpoint.run_id, chunk.ref)
+            )
+        counters.update(self._checkpoint.counters)
+        return self._checkpoint.cursor
+
+    def start_chunk(self, cursor: dict[str, Any] | None) -> None:
+        """Готовит прием результатов сырого чанка с курсором ``cursor``."""
+        self._buffering = cursor is not None
+
+    def append(self, df: pd.DataFrame, /) -> None:
+        self._sink.append(df)
+        if self._buffering:
+            self._pending.append(df)
+
+    def commit(self, cursor: dict[str, Any], counters: dict[str, int]) -> None:
+        run_id = self._checkpoint.run_id
+        for df in self._pending:
+            index = len(self._checkpoint.chunks)
+            ref = self._store.save_chunk(run_id, index, df)
+            self._checkpoint.chunks.append(
+                CheckpointChunk(index=index, rows=len(df), ref=ref)
+            )
+        self._pending.clear()
+        self._checkpoint.cursor = cursor
+        self._checkpoint.counters = dict(counters)
+        self._checkpoint.state = self._state_provider()
+        self._store.commit(self._checkpoint)
+
+    def clear(self) -> None:
+        self._store.clear(self._checkpoint.run_id)
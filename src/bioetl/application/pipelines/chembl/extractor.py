@@ -12,7 +12,13 @@ from bioetl.application.pipelines.contracts import ExtractorABC
 from bioetl.domain.configs import PipelineConfig
 from bioetl.domain.contracts import ExtractionServiceABC
 from bioetl.domain.observability import LoggingPort
-from bioetl.domain.record_source import ApiRecordSource, RecordSource
+from bioetl.domain.pipelines.checkpoint import attach_cursor
+from bioetl.domain.record_source import (
+    ApiRecordSource,
+    RecordSource,
+    ResumableRecordSource,
+    as_record_batch,
+)
 from bioetl.domain.transform.contracts import NormalizationServiceABC
 from bioetl.infrastructure.config.models import ChemblSourceConfig, CsvInputOptions
 from bioetl.infrastructure.files.csv_record_source import (
@@ -43,29 +49,51 @@ class ChemblExtractorImpl(ExtractorABC):
     def extract(self, **kwargs: Any) -> Iterable[pd.DataFrame]:
         """
         Yields chunks of normalized data.
+
+        For resumable sources each chunk carries the extract cursor in
+        ``attrs``; passing it back as ``resume_from`` continues after that
+        chunk without re-reading earlier pages.
         """
         limit = kwargs.pop("limit", None)
+        resume_from = kwargs.pop("resume_from", None)
 
-        remaining = limit
         record_source = self.record_source or self._resolve_record_source(limit=limit)
+        resumable = isinstance(record_source, ResumableRecordSource)
+        emitted = 0
+        if resume_from is not None:
+            if not resumable:
+                raise ValueError(
+                    f"Record source {type(record_source).__name__} "
+                    "does not support resume"
+                )
+            emitted = int(resume_from.get("rows", 0))
+            record_source.seek(resume_from["source"])
+        remaining = None if limit is None else limit - emitted
 
         for raw_chunk in record_source.iter_records():
             if remaining is not None and remaining <= 0:
                 break
 
-            chunk_records = raw_chunk
+            # RecordBatch, DataFrame или список записей — к одному виду.
+            batch = as_record_batch(raw_chunk)
             if remaining is not None:
-                chunk_records = raw_chunk[:remaining]
-
-            working_chunk = pd.DataFrame(chunk_records)
+                batch = batch.head(remaining)
 
-            normalized_chunk = self.normalization_service.normalize_batch(working_chunk)
+            normalized_chunk = self.normalization_service.normalize_batch(
+                batch.to_frame()
+            )
+            emitted += len(batch)
 
             if not normalized_chunk.empty:
+                if resumable:
+                    attach_cursor(
+                        normalized_chunk,
+                        {"rows": emitted, "source": record_source.cursor},
+                    )
                 yield normalized_chunk
 
             if remaining is not None:
-                remaining -= len(chunk_records)
+                remaining -= len(batch)
                 if remaining <= 0:
                     break
 
@@ -120,6 +148,14 @@ class ChemblExtractorImpl(ExtractorABC):
     def _resolve_csv_options(self) -> dict[str, Any] | CsvInputOptions:
         return getattr(self.config, "csv_options", None) or {}
 
+    def _resolve_csv_usecols(
+        self, csv_options: dict[str, Any] | CsvInputOptions
+    ) -> list[str] | None:
+        """Колонки CSV: явные ``usecols`` или поля схемы из ``fields``."""
+        if not isinstance(csv_options, CsvInputOptions):
+            csv_options = CsvInputOptions(**csv_options)
+        return csv_options.resolve_usecols(getattr(self.config, "fields", None))
+
     def _resolve_batch_size(self) -> int | None:
         raw_batch_size = getattr(self.config, "batch_size", None)
         if isinstance(raw_batch_size, (int, float)) and raw_batch_size > 0:
@@ -142,6 +178,7 @@ class ChemblExtractorImpl(ExtractorABC):
             limit=limit,
             chunk_size=chunk_size,
             logger=self.logger,
+            usecols=self._resolve_csv_usecols(csv_options),
         )
 
     def _build_id_list_source(
@@ -9,6 +9,7 @@ from bioetl.domain.observability import LoggingPort
 from bioetl.domain.schemas.pipeline_contracts import PipelineSchemaContract
 from bioetl.domain.transform.contracts import NormalizationServiceABC
 from bioetl.domain.transform.transformers import TransformerABC
+from bioetl.domain.validation.plan import SchemaPlan, build_schema_plan
 from bioetl.domain.validation.service import ValidationService
 
 
@@ -18,6 +19,13 @@ class ChemblTransformerImpl(TransformerABC):
 
     Chain:
     pre_transform -> do_transform -> normalize -> enforce_schema -> drop nulls
+
+    Колонки, нормализованные в extractor, отмечены в ``df.attrs`` и повторно
+    не нормализуются; хуки, перезаписывающие такие колонки, снимают отметку
+    через ``unmark_normalized``.
+
+    План выходной схемы (порядок колонок, обязательные колонки) строится
+    один раз при первом чанке и переиспользуется.
     """
 
     def __init__(
@@ -31,6 +39,7 @@ class ChemblTransformerImpl(TransformerABC):
         self.schema_contract = schema_contract
         self.normalization_service = normalization_service
         self.logger = logger
+        self._schema_plan: SchemaPlan | None = None
 
     def apply(
         self, df: pd.DataFrame, context: RunContext | None = None
@@ -50,12 +59,21 @@ class ChemblTransformerImpl(TransformerABC):
         """Main transformation logic."""
         return df
 
+    def _get_schema_plan(self) -> SchemaPlan:
+        if self._schema_plan is None:
+            schema_name = self.schema_contract.schema_out
+            self._schema_plan = build_schema_plan(
+                schema_name,
+                self.validation_service.get_schema(schema_name),
+                self.validation_service.get_schema_columns(schema_name),
+            )
+        return self._schema_plan
+
     def _enforce_schema(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Ensures DataFrame matches the output schema columns.
         """
-        schema_name = self.schema_contract.schema_out
-        schema_columns = self.validation_service.get_schema_columns(schema_name)
+        schema_columns = list(self._get_schema_plan().columns)
 
         for col in schema_columns:
             if col not in df.columns:
@@ -67,9 +85,7 @@ class ChemblTransformerImpl(TransformerABC):
         """
         Drops rows with nulls in required columns.
         """
-        schema_name = self.schema_contract.schema_out
-        schema_cls = self.validation_service.get_schema(schema_name)
-        schema = schema_cls.to_schema()
+        plan = self._get_schema_plan()
 
         ignored_cols = {
             "hash_row",
@@ -81,8 +97,8 @@ class ChemblTransformerImpl(TransformerABC):
 
         required_cols = [
             name
-            for name, col in schema.columns.items()
-            if not col.nullable and name in df.columns and name not in ignored_cols
+            for name in plan.required
+            if name in df.columns and name not in ignored_cols
         ]
 
         if not required_cols:
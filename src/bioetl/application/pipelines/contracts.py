@@ -9,7 +9,11 @@ import pandas as pd
 
 from bioetl.domain.clients.base.output.contracts import OutputWriterABC
 from bioetl.domain.configs import PipelineConfig
-from bioetl.domain.pipelines.contracts import ErrorPolicyABC, PipelineHookABC
+from bioetl.domain.pipelines.contracts import (
+    CheckpointStoreABC,
+    ErrorPolicyABC,
+    PipelineHookABC,
+)
 from bioetl.domain.observability import LoggingPort
 from bioetl.domain.record_source import RecordSource
 from bioetl.domain.transform.contracts import HashServiceABC, NormalizationServiceABC
@@ -47,7 +51,7 @@ class PipelineContainerABC(ABC):
 
     Provides factories for core pipeline services, including logging, validation,
     extraction, normalization, record sourcing, hashing, post-transformation,
-    hooks, and error handling.
+    hooks, error handling, and extraction checkpoints.
     """
 
     @property
@@ -103,6 +107,10 @@ class PipelineContainerABC(ABC):
     def get_error_policy(self) -> ErrorPolicyABC:
         """Return error handling policy for pipeline stages."""
 
+    @abstractmethod
+    def get_checkpoint_store(self) -> CheckpointStoreABC | None:
+        """Return extraction checkpoint store, or None when disabled."""
+
 
 __all__ = [
     "ExtractorABC",
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import time
 from typing import Any
 
 from bioetl.domain.enums import ErrorAction
@@ -10,6 +11,7 @@ from bioetl.domain.models import StageResult
 from bioetl.domain.pipelines.contracts import ErrorPolicyABC, PipelineHookABC
 from bioetl.domain.observability import LoggingPort
 from bioetl.infrastructure.observability import metrics
+from bioetl.infrastructure.observability.process import peak_rss_bytes
 
 
 class LoggingPipelineHookImpl(PipelineHookABC):
@@ -84,12 +86,18 @@ __all__ = [
 
 
 class MetricsPipelineHookImpl(PipelineHookABC):
-    """Хук, фиксирующий метрики завершения стадий."""
+    """
+    Хук, фиксирующий метрики стадий.
+
+    Кроме длительности стадий публикует по каждому чанку число строк,
+    пропускную способность (строк/с) и пиковый RSS процесса.
+    """
 
     def __init__(self, *, pipeline_id: str, provider: str, entity_name: str) -> None:
         self._pipeline_id = pipeline_id
         self._provider = provider
         self._entity_name = entity_name
+        self._chunk_starts: dict[str, float] = {}
 
     def on_stage_start(self, stage: str, context: Any) -> None:  # noqa: ARG002
         """Хук старта стадии не требует метрик."""
@@ -113,3 +121,27 @@ class MetricsPipelineHookImpl(PipelineHookABC):
 
     def on_error(self, stage: str, error: PipelineStageError) -> None:  # noqa: ARG002
         """Метрики фиксируются в on_stage_end, поэтому обработка не требуется."""
+
+    def on_chunk_start(self, stage: str, context: Any) -> None:  # noqa: ARG002
+        self._chunk_starts[stage] = time.perf_counter()
+
+    def on_chunk_end(self, stage: str, rows: int) -> None:
+        started = self._chunk_starts.pop(stage, None)
+        labels = {
+            "pipeline": self._pipeline_id,
+            "provider": self._provider,
+            "entity": self._entity_name,
+            "stage": stage,
+        }
+        metrics.STAGE_ROWS_TOTAL.labels(**labels).inc(rows)
+        peak_rss = peak_rss_bytes()
+        if peak_rss is not None:
+            metrics.PROCESS_MAX_RSS_BYTES.set(peak_rss)
+        if rows <= 0:
+            # Пустой чанк (например, исчерпание источника) не меняет gauge.
+            return
+        metrics.STAGE_CHUNK_ROWS.labels(**labels).set(rows)
+        if started is not None:
+            elapsed = time.perf_counter() - started
+            if elapsed > 0:
+                metrics.STAGE_ROWS_PER_SECOND.labels(**labels).set(rows / elapsed)
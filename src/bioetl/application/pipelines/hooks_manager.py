@@ -42,8 +42,10 @@ class HooksManager:
         self._current_run_id = None
 
     def add_hook(self, hook: PipelineHookABC) -> None:
-        """Добавляет хук выполнения."""
+        """Добавляет хук выполнения (повторная регистрация игнорируется)."""
 
+        if any(existing is hook for existing in self._hooks):
+            return
         self._hooks.append(hook)
 
     def add_hooks(self, hooks: Iterable[PipelineHookABC]) -> None:
@@ -85,6 +87,24 @@ class HooksManager:
         for hook in self._hooks:
             hook.on_stage_end(stage, result)
 
+    def notify_chunk_start(self, stage: str, context: RunContext) -> None:
+        """Уведомляет хуки о начале обработки чанка стадией."""
+
+        for hook in self._hooks:
+            hook.on_chunk_start(stage, context)
+
+    def notify_chunk_end(self, stage: str, rows: int) -> None:
+        """Уведомляет хуки о завершении обработки чанка стадией."""
+
+        for hook in self._hooks:
+            hook.on_chunk_end(stage, rows)
+
+    def notify_run_end(self, context: RunContext) -> None:
+        """Уведомляет хуки о завершении запуска."""
+
+        for hook in self._hooks:
+            hook.on_run_end(context)
+
     def get_stage_start(self, stage: str) -> datetime | None:
         """Возвращает время старта указанной стадии, если оно зафиксировано."""
 
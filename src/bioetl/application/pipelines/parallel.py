@@ -0,0 +1,206 @@
+"""Параллельная обработка чанков (transform + validate) в пуле процессов."""
+
+from __future__ import annotations
+
+import multiprocessing
+import pickle
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+
+import pandas as pd
+
+from bioetl.domain.models import RunContext
+from bioetl.domain.transform.transformers import TransformerABC
+
+__all__ = [
+    "ChunkOutcome",
+    "OrderedChunkPool",
+    "ReplayedChunkStages",
+    "parallel_processing_supported",
+    "run_chunk_stages",
+]
+
+ChunkStages = Callable[[pd.DataFrame], "ChunkOutcome"]
+
+_WORKER_STAGES: ChunkStages | None = None
+
+
+@dataclass(frozen=True)
+class ChunkOutcome:
+    """Результат обработки чанка в воркере."""
+
+    validated: pd.DataFrame | None = None
+    transformed: pd.DataFrame | None = None
+    failed_stage: str | None = None
+    error: Exception | None = None
+
+
+def parallel_processing_supported() -> bool:
+    """Пул требует fork: состояние пайплайна наследуется воркерами без pickle."""
+    return "fork" in multiprocessing.get_all_start_methods()
+
+
+def run_chunk_stages(
+    raw_chunk: pd.DataFrame,
+    *,
+    transform: Callable[[pd.DataFrame], pd.DataFrame],
+    validate: Callable[[pd.DataFrame], pd.DataFrame],
+) -> ChunkOutcome:
+    """Выполняет transform и validate, превращая ошибку стадии в результат."""
+    try:
+        transformed = transform(raw_chunk)
+    except Exception as exc:  # pylint: disable=broad-except
+        return ChunkOutcome(failed_stage="transform", error=_picklable(exc))
+    try:
+        validated = validate(transformed)
+    except Exception as exc:  # pylint: disable=broad-except
+        return ChunkOutcome(
+            transformed=transformed, failed_stage="validate", error=_picklable(exc)
+        )
+    return ChunkOutcome(validated=validated)
+
+
+class OrderedChunkPool:
+    """
+    Пул процессов, возвращающий результаты в порядке отправки чанков.
+
+    Число чанков в работе ограничено ``max_pending``, поэтому экстракция
+    не убегает вперед обработки и память остается ограниченной.
+
+    Воркеры форкаются сразу в конструкторе, до старта экстракции: потоки
+    prefetch, HTTP-пулы и экспортер метрик еще не запущены, и дочерние
+    процессы не наследуют захваченные ими блокировки.
+    """
+
+    def __init__(
+        self, stages: ChunkStages, *, workers: int, max_pending: int | None = None
+    ) -> None:
+        self._executor = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("fork"),
+            initializer=_init_worker,
+            initargs=(stages,),
+        )
+        self._max_pending = max_pending or workers * 2
+        self._pending: deque[tuple[pd.DataFrame, Future[ChunkOutcome]]] = deque()
+        # С fork ProcessPoolExecutor запускает все воркеры на первом submit.
+        self._executor.submit(_ping).result()
+
+    def submit(
+        self, raw_chunk: pd.DataFrame
+    ) -> list[tuple[pd.DataFrame, ChunkOutcome]]:
+        """Ставит чанк в очередь; возвращает готовые результаты сверх лимита."""
+        self._pending.append(
+            (raw_chunk, self._executor.submit(_run_in_worker, raw_chunk))
+        )
+        ready = []
+        while len(self._pending) > self._max_pending:
+            ready.append(self._pop())
+        return ready
+
+    def drain(self) -> list[tuple[pd.DataFrame, ChunkOutcome]]:
+        """Дожидается всех оставшихся чанков в порядке отправки."""
+        return [self._pop() for _ in range(len(self._pending))]
+
+    def shutdown(self) -> None:
+        """Останавливает воркеры, отменяя необработанные чанки."""
+        for _, future in self._pending:
+            future.cancel()
+        self._pending.clear()
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def _pop(self) -> tuple[pd.DataFrame, ChunkOutcome]:
+        raw_chunk, future = self._pending.popleft()
+        return raw_chunk, future.result()
+
+
+class ReplayedChunkStages:
+    """
+    Подставляет результат воркера в стадии StageRunner.
+
+    Первая попытка стадии возвращает (или пробрасывает) результат воркера,
+    повторные попытки политики ошибок пересчитываются в основном процессе.
+    К результату воркера заново применяются order-dependent трансформеры,
+    чтобы сквозной индекс и общие колонки шли в порядке поступления чанков.
+    """
+
+    def __init__(
+        self,
+        outcome: ChunkOutcome,
+        context: RunContext,
+        *,
+        transform_fn: Callable[[pd.DataFrame], pd.DataFrame],
+        apply_transformers: Callable[[pd.DataFrame, RunContext], pd.DataFrame],
+        validate_fn: Callable[[pd.DataFrame], pd.DataFrame],
+        resequence: TransformerABC | None,
+    ) -> None:
+        self._outcome = outcome
+        self._context = context
+        self._transform_fn = transform_fn
+        self._apply_transformers = apply_transformers
+        self._validate_fn = validate_fn
+        self._resequence = resequence
+        self._transform_replayed = False
+        self._validate_replayed = False
+        self._from_worker = False
+
+    def transform(self, raw_chunk: pd.DataFrame) -> pd.DataFrame:
+        if self._transform_replayed:
+            self._from_worker = False
+            return self._apply_transformers(
+                self._transform_fn(raw_chunk), self._context
+            )
+        self._transform_replayed = True
+        outcome = self._outcome
+        if outcome.failed_stage == "transform" and outcome.error is not None:
+            raise outcome.error
+        self._from_worker = True
+        frame = (
+            outcome.transformed
+            if outcome.transformed is not None
+            else outcome.validated
+        )
+        return frame if frame is not None else pd.DataFrame()
+
+    @staticmethod
+    def apply_transformers(df: pd.DataFrame, _context: RunContext) -> pd.DataFrame:
+        # Пост-трансформеры уже применены в transform().
+        return df
+
+    def validate(self, df: pd.DataFrame) -> pd.DataFrame:
+        if self._from_worker and not self._validate_replayed:
+            self._validate_replayed = True
+            outcome = self._outcome
+            if outcome.failed_stage == "validate" and outcome.error is not None:
+                raise outcome.error
+            validated = outcome.validated if outcome.validated is not None else df
+        else:
+            validated = self._validate_fn(df)
+        if self._from_worker and self._resequence is not None:
+            return self._resequence.apply(validated, self._context)
+        return validated
+
+
+def _init_worker(stages: ChunkStages) -> None:
+    global _WORKER_STAGES  # pylint: disable=global-statement
+    _WORKER_STAGES = stages
+
+
+def _ping() -> None:
+    """Пустая задача, форкающая воркеры пула."""
+
+
+def _run_in_worker(raw_chunk: pd.DataFrame) -> ChunkOutcome:
+    if _WORKER_STAGES is None:  # pragma: no cover - defensive
+        raise RuntimeError("Chunk worker is not initialized")
+    return _WORKER_STAGES(raw_chunk)
+
+
+def _picklable(exc: Exception) -> Exception:
+    try:
+        pickle.dumps(exc)
+    except Exception:  # pylint: disable=broad-except
+        return RuntimeError(f"{type(exc).__name__}: {exc}")
+    return exc
@@ -0,0 +1,304 @@
+"""
+Профилирование стадий пайплайна (``bioetl run --profile-stages``).
+
+``ProfilingPipelineHookImpl`` замеряет каждый чанк каждой стадии (extract,
+transform, validate, write): wall-clock и CPU-время процесса, пиковый RSS и
+пик памяти Python из tracemalloc. На выборке чанков (первый и каждый
+``sample_every_n_chunks``-й) снимаются top аллокаторы tracemalloc — прирост
+памяти, оставшейся после чанка, — и, если включено, cProfile. По завершении
+запуска в каталог результата рядом с ``meta.yaml`` пишутся ``profile.json``
+и ``profile.<stage>.pstats``.
+
+При ``workers > 1`` transform и validate выполняются в дочерних процессах:
+замеры этих стадий отражают только работу основного процесса.
+"""
+
+from __future__ import annotations
+
+import cProfile
+import json
+import pstats
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+from bioetl.domain.configs import ProfilingConfig
+from bioetl.domain.errors import PipelineStageError
+from bioetl.domain.models import StageResult
+from bioetl.domain.observability import LoggingPort
+from bioetl.domain.pipelines.contracts import PipelineHookABC
+from bioetl.infrastructure.observability.process import peak_rss_bytes
+
+PROFILE_REPORT_NAME = "profile.json"
+
+
+@dataclass
+class ChunkProfile:
+    """Замер одного чанка стадии."""
+
+    stage: str
+    index: int
+    rows: int
+    wall_sec: float
+    cpu_sec: float
+    py_peak_bytes: int | None
+    rss_peak_bytes: int | None
+    sampled: bool
+
+
+@dataclass
+class StageProfile:
+    """Сводка стадии по всем ее чанкам."""
+
+    chunks: int = 0
+    rows: int = 0
+    wall_sec: float = 0.0
+    cpu_sec: float = 0.0
+    py_peak_bytes: int | None = None
+    rss_peak_bytes: int | None = None
+    allocations: dict[str, list[int]] = field(default_factory=dict)
+
+    def add(self, chunk: ChunkProfile) -> None:
+        self.chunks += 1
+        self.rows += chunk.rows
+        self.wall_sec += chunk.wall_sec
+        self.cpu_sec += chunk.cpu_sec
+        self.py_peak_bytes = _max(self.py_peak_bytes, chunk.py_peak_bytes)
+        self.rss_peak_bytes = _max(self.rss_peak_bytes, chunk.rss_peak_bytes)
+
+    def add_allocations(self, diff: list[tracemalloc.StatisticDiff]) -> None:
+        for stat in diff:
+            if stat.size_diff <= 0:
+                continue
+            frame = stat.traceback[0]
+            totals = self.allocations.setdefault(
+                f"{frame.filename}:{frame.lineno}", [0, 0]
+            )
+            totals[0] += stat.size_diff
+            totals[1] += max(stat.count_diff, 0)
+
+    def top_allocators(self, limit: int) -> list[dict[str, Any]]:
+        ranked = sorted(
+            self.allocations.items(), key=lambda item: item[1][0], reverse=True
+        )
+        return [
+            {"location": location, "size_bytes": size, "count": count}
+            for location, (size, count) in ranked[:limit]
+        ]
+
+
+@dataclass
+class _OpenChunk:
+    stage: str
+    index: int
+    wall_start: float
+    cpu_start: float
+    snapshot: tracemalloc.Snapshot | None
+    profiler: cProfile.Profile | None
+
+
+def _take_snapshot() -> tracemalloc.Snapshot:
+    """Снимок tracemalloc без собственных аллокаций профилировщика."""
+    return tracemalloc.take_snapshot().filter_traces(
+        (
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, cProfile.__file__),
+            tracemalloc.Filter(False, pstats.__file__),
+            tracemalloc.Filter(False, __file__),
+        )
+    )
+
+
+def _max(left: int | None, right: int | None) -> int | None:
+    if left is None:
+        return right
+    if right is None:
+        return left
+    return max(left, right)
+
+
+class ProfilingPipelineHookImpl(PipelineHookABC):
+    """Хук, профилирующий CPU и память по стадиям и чанкам."""
+
+    def __init__(
+        self,
+        config: ProfilingConfig,
+        *,
+        output_dir: Path,
+        logger: LoggingPort | None = None,
+    ) -> None:
+        self._config = config
+        self._output_dir = output_dir
+        self._logger = logger
+        self._reset()
+
+    def _reset(self) -> None:
+        self._stages: dict[str, StageProfile] = {}
+        self._chunks: list[ChunkProfile] = []
+        self._stats: dict[str, pstats.Stats] = {}
+        self._open: _OpenChunk | None = None
+        self._started_tracemalloc = False
+
+    @property
+    def stages(self) -> dict[str, StageProfile]:
+        """Накопленные сводки стадий текущего запуска."""
+        return self._stages
+
+    @property
+    def chunks(self) -> list[ChunkProfile]:
+        """Замеры чанков текущего запуска в порядке обработки."""
+        return self._chunks
+
+    def on_stage_start(self, stage: str, context: Any) -> None:  # noqa: ARG002
+        if self._config.tracemalloc and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+
+    def on_stage_end(self, stage: str, result: StageResult) -> None:  # noqa: ARG002
+        """Сводка стадии считается по чанкам, отдельный замер не нужен."""
+
+    def on_error(self, stage: str, error: PipelineStageError) -> None:  # noqa: ARG002
+        """Чанк с ошибкой закрывается в on_chunk_end."""
+
+    def on_chunk_start(self, stage: str, context: Any) -> None:  # noqa: ARG002
+        index = self._stages.get(stage, StageProfile()).chunks
+        sampled = index % self._config.sample_every_n_chunks == 0
+        snapshot = None
+        if tracemalloc.is_tracing():
+            if sampled:
+                snapshot = _take_snapshot()
+            tracemalloc.reset_peak()
+        profiler = None
+        if sampled and self._config.cprofile:
+            profiler = cProfile.Profile()
+            try:
+                profiler.enable()
+            except ValueError:
+                # Уже активен другой профайлер (например, внешний cProfile).
+                profiler = None
+        self._open = _OpenChunk(
+            stage=stage,
+            index=index,
+            wall_start=time.perf_counter(),
+            cpu_start=time.process_time(),
+            snapshot=snapshot,
+            profiler=profiler,
+        )
+
+    def on_chunk_end(self, stage: str, rows: int) -> None:
+        opened = self._open
+        if opened is None or opened.stage != stage:
+            return
+        self._open = None
+        wall_sec = time.perf_counter() - opened.wall_start
+        cpu_sec = time.process_time() - opened.cpu_start
+        if opened.profiler is not None:
+            opened.profiler.disable()
+        if stage == "extract" and rows <= 0:
+            # Исчерпание источника (последний next()) — не чанк извлечения.
+            return
+        if opened.profiler is not None:
+            self._add_stats(stage, opened.profiler)
+
+        py_peak = None
+        summary = self._stages.setdefault(stage, StageProfile())
+        if tracemalloc.is_tracing():
+            py_peak = tracemalloc.get_traced_memory()[1]
+            if opened.snapshot is not None:
+                summary.add_allocations(
+                    _take_snapshot().compare_to(opened.snapshot, "lineno")
+                )
+        chunk = ChunkProfile(
+            stage=stage,
+            index=opened.index,
+            rows=rows,
+            wall_sec=wall_sec,
+            cpu_sec=cpu_sec,
+            py_peak_bytes=py_peak,
+            rss_peak_bytes=peak_rss_bytes(),
+            sampled=opened.snapshot is not None or opened.profiler is not None,
+        )
+        summary.add(chunk)
+        self._chunks.append(chunk)
+
+    def on_run_end(self, context: Any) -> None:
+        try:
+            self.write_report(getattr(context, "run_id", None))
+        finally:
+            if self._started_tracemalloc:
+                tracemalloc.stop()
+            self._reset()
+
+    def build_report(self, run_id: str | None = None) -> dict[str, Any]:
+        """Отчет профилирования текущего запуска."""
+        limit = self._config.top_allocators
+        return {
+            "run_id": run_id,
+            "tracemalloc": self._config.tracemalloc,
+            "sample_every_n_chunks": self._config.sample_every_n_chunks,
+            "peak_rss_bytes": peak_rss_bytes(),
+            "stages": {
+                stage: {
+                    "chunks": summary.chunks,
+                    "rows": summary.rows,
+                    "wall_sec": round(summary.wall_sec, 6),
+                    "cpu_sec": round(summary.cpu_sec, 6),
+                    "py_peak_bytes": summary.py_peak_bytes,
+                    "rss_peak_bytes": summary.rss_peak_bytes,
+                    "top_allocators": summary.top_allocators(limit),
+                    "pstats": (
+                        self._pstats_name(stage) if stage in self._stats else None
+                    ),
+                }
+                for stage, summary in self._stages.items()
+            },
+            "chunks": [
+                {
+                    **asdict(chunk),
+                    "wall_sec": round(chunk.wall_sec, 6),
+                    "cpu_sec": round(chunk.cpu_sec, 6),
+                }
+                for chunk in self._chunks
+            ],
+        }
+
+    def write_report(self, run_id: str | None = None) -> Path:
+        """Пишет ``profile.json`` и pstats-дампы в каталог результата."""
+        self._output_dir.mkdir(parents=True, exist_ok=True)
+        for stage, stats in self._stats.items():
+            stats.dump_stats(str(self._output_dir / self._pstats_name(stage)))
+        report_path = self._output_dir / PROFILE_REPORT_NAME
+        report_path.write_text(
+            json.dumps(self.build_report(run_id), indent=2) + "\n", encoding="utf-8"
+        )
+        if self._logger is not None:
+            self._logger.info(
+                "Profiling report written",
+                path=str(report_path),
+                stages={
+                    stage: round(summary.cpu_sec, 3)
+                    for stage, summary in self._stages.items()
+                },
+            )
+        return report_path
+
+    def _add_stats(self, stage: str, profiler: cProfile.Profile) -> None:
+        stats = self._stats.get(stage)
+        if stats is None:
+            self._stats[stage] = pstats.Stats(profiler)
+        else:
+            stats.add(profiler)
+
+    @staticmethod
+    def _pstats_name(stage: str) -> str:
+        return f"profile.{stage}.pstats"
+
+
+__all__ = [
+    "PROFILE_REPORT_NAME",
+    "ChunkProfile",
+    "ProfilingPipelineHookImpl",
+    "StageProfile",
+]
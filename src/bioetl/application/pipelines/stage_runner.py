@@ -2,6 +2,7 @@
 
 from collections.abc import Callable
 from datetime import datetime, timezone
+from typing import Protocol
 
 import pandas as pd
 
@@ -12,6 +13,13 @@ from bioetl.domain.models import RunContext, RunResult, StageResult
 from bioetl.domain.providers import ProviderId
 
 
+class ChunkSink(Protocol):
+    """Приемник валидированных чанков (список или потоковая запись)."""
+
+    def append(self, df: pd.DataFrame, /) -> None:
+        """Принимает очередной валидированный чанк."""
+
+
 class StageRunner:
     """Оркеструет обработку чанков и сбор результатов стадий."""
 
@@ -39,7 +47,7 @@ class StageRunner:
         validate_started: bool,
         validate_chunks: int,
         validate_count: int,
-        validated_chunks: list[pd.DataFrame],
+        validated_chunks: ChunkSink,
         dry_run: bool,
         transform_fn: Callable[[pd.DataFrame], pd.DataFrame],
         apply_transformers: Callable[[pd.DataFrame, RunContext], pd.DataFrame],
@@ -94,13 +102,20 @@ class StageRunner:
         chunks: int,
         count: int,
         dry_run: bool = False,
-        validated_chunks: list[pd.DataFrame] | None = None,
+        validated_chunks: ChunkSink | None = None,
     ) -> tuple[bool, int, int, pd.DataFrame]:
         if not started:
             self._hooks_manager.notify_stage_start(stage, context)
             started = True
 
-        df_result = self._error_policy_manager.execute(stage, context, action)
+        self._hooks_manager.notify_chunk_start(stage, context)
+        df_result = None
+        try:
+            df_result = self._error_policy_manager.execute(stage, context, action)
+        finally:
+            self._hooks_manager.notify_chunk_end(
+                stage, len(df_result) if df_result is not None else 0
+            )
         if df_result is None:
             raise PipelineStageError(
                 provider=self._provider_id.value,
@@ -1,6 +1,8 @@
 """Base contracts for data source clients."""
 
 from bioetl.domain.clients.base.contracts import (
+    AdaptiveRateLimiterABC,
+    AsyncRateLimiterABC,
     CacheABC,
     PaginatorABC,
     RateLimiterABC,
@@ -13,6 +15,8 @@ from bioetl.domain.clients.base.contracts import (
 )
 
 __all__ = [
+    "AdaptiveRateLimiterABC",
+    "AsyncRateLimiterABC",
     "CacheABC",
     "PaginatorABC",
     "RateLimiterABC",
@@ -76,6 +76,30 @@ class RateLimiterABC(ABC):
         """Ожидает, если лимит исчерпан."""
 
 
+class AdaptiveRateLimiterABC(RateLimiterABC):
+    """
+    Лимитер, подстраивающий частоту запросов по ответам сервера.
+    """
+
+    @abstractmethod
+    def on_success(self, latency: float) -> None:
+        """Учитывает успешный ответ с задержкой ``latency`` секунд."""
+
+    @abstractmethod
+    def on_throttle(self, retry_after: float | None = None) -> None:
+        """Учитывает троттлинг сервера (429/503, ``Retry-After``)."""
+
+
+class AsyncRateLimiterABC(ABC):
+    """
+    Ограничение частоты запросов для asyncio-клиентов.
+    """
+
+    @abstractmethod
+    async def acquire(self) -> None:
+        """Ожидает разрешения на запрос, не блокируя event loop."""
+
+
 class RetryPolicyABC(ABC):
     """
     Политика повторных попыток.
@@ -1,13 +1,19 @@
 from bioetl.domain.clients.base.output.contracts import (
+    ChunkWriterABC,
+    DeltaResult,
     MetadataWriterABC,
+    OutputStreamABC,
     QualityReportABC,
     WriterABC,
     WriteResult,
 )
 
 __all__ = [
+    "DeltaResult",
     "WriteResult",
+    "ChunkWriterABC",
     "WriterABC",
     "MetadataWriterABC",
     "QualityReportABC",
+    "OutputStreamABC",
 ]
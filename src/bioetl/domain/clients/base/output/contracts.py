@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections.abc import Callable
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
@@ -6,6 +7,26 @@ from typing import Any
 import pandas as pd
 
 
+@dataclass
+class DeltaResult:
+    """
+    Итог delta-режима: изменения относительно предыдущего запуска.
+
+    ``path`` — файл с добавленными, измененными и удаленными строками,
+    ``index_path`` — индекс ``hash_business_key`` → ``hash_row`` текущего
+    снимка, с которым сравнится следующий запуск.
+    """
+
+    path: Path
+    index_path: Path
+    added: int
+    changed: int
+    removed: int
+    unchanged: int
+    base_run_id: str | None = None
+    checksum: str | None = None
+
+
 @dataclass
 class WriteResult:
     """Результат записи."""
@@ -14,6 +35,27 @@ class WriteResult:
     row_count: int
     duration_sec: float
     checksum: str | None = None
+    delta: DeltaResult | None = None
+
+
+class ChunkWriterABC(ABC):
+    """
+    Потоковая запись DataFrame-чанков в один файл.
+
+    Экземпляры создаются через ``WriterABC.open_chunk_writer``.
+    """
+
+    @abstractmethod
+    def write_chunk(self, df: pd.DataFrame) -> None:
+        """Дописывает очередной чанк в файл."""
+
+    @abstractmethod
+    def close(self) -> WriteResult:
+        """Завершает запись и возвращает итог по всем чанкам."""
+
+    @abstractmethod
+    def abort(self) -> None:
+        """Прерывает запись, освобождая ресурсы."""
 
 
 class WriterABC(ABC):
@@ -43,6 +85,20 @@ class WriterABC(ABC):
     def supports_format(self, fmt: str) -> bool:
         """Поддерживает ли формат (csv, parquet)."""
 
+    def open_chunk_writer(
+        self,
+        path: Path,
+        *,
+        column_order: list[str] | None = None,
+    ) -> ChunkWriterABC:
+        """
+        Открывает потоковую запись чанков в ``path``.
+
+        По умолчанию чанки накапливаются в памяти и пишутся одним ``write``
+        при ``close``; писатели с настоящей потоковой записью переопределяют.
+        """
+        return _BufferedChunkWriter(self, path, column_order=column_order)
+
 
 class MetadataWriterABC(ABC):
     """
@@ -104,11 +160,134 @@ class OutputWriterABC(ABC):
         возвращая сведения о записи.
         """
 
+    def open_stream(
+        self,
+        output_path: Path,
+        entity_name: str,
+        run_context: Any,
+        *,
+        column_order: list[str] | None = None,
+    ) -> "OutputStreamABC":
+        """
+        Открывает потоковую запись результата по чанкам.
+
+        По умолчанию чанки накапливаются в памяти и при ``close`` передаются
+        в ``write_result`` одним DataFrame.
+        """
+        return _BufferedOutputStream(
+            lambda df: self.write_result(
+                df, output_path, entity_name, run_context, column_order=column_order
+            ),
+            column_order=column_order,
+        )
+
+
+class OutputStreamABC(ABC):
+    """
+    Сессия потоковой записи результата пайплайна.
+
+    Создается через ``OutputWriterABC.open_stream``; ``close`` пишет
+    сопутствующие артефакты (QC, meta.yaml) так же, как ``write_result``.
+    """
+
+    @abstractmethod
+    def write_chunk(self, df: pd.DataFrame) -> None:
+        """Дописывает валидированный чанк."""
+
+    @abstractmethod
+    def close(self) -> WriteResult:
+        """Фиксирует файл данных и артефакты, возвращая итог записи."""
+
+    @abstractmethod
+    def abort(self) -> None:
+        """Отменяет запись и удаляет временные файлы."""
+
+
+class _ChunkBuffer:
+    """Накопитель чанков для буферизующих реализаций по умолчанию."""
+
+    def __init__(self, column_order: list[str] | None) -> None:
+        self._column_order = column_order
+        self._chunks: list[pd.DataFrame] = []
+        self._closed = False
+
+    def append(self, df: pd.DataFrame) -> None:
+        self._check_open()
+        self._chunks.append(df)
+
+    def drain(self) -> pd.DataFrame:
+        self._check_open()
+        self._closed = True
+        chunks, self._chunks = self._chunks, []
+        if not chunks:
+            return pd.DataFrame(columns=list(self._column_order or []))
+        return pd.concat(chunks, ignore_index=True)
+
+    def discard(self) -> None:
+        self._closed = True
+        self._chunks = []
+
+    def _check_open(self) -> None:
+        if self._closed:
+            raise RuntimeError("Chunked write is already closed")
+
+
+class _BufferedChunkWriter(ChunkWriterABC):
+    """Потоковая запись поверх ``WriterABC.write`` для писателей без нее."""
+
+    def __init__(
+        self,
+        writer: WriterABC,
+        path: Path,
+        *,
+        column_order: list[str] | None = None,
+    ) -> None:
+        self._writer = writer
+        self._path = path
+        self._column_order = column_order
+        self._buffer = _ChunkBuffer(column_order)
+
+    def write_chunk(self, df: pd.DataFrame) -> None:
+        self._buffer.append(df)
+
+    def close(self) -> WriteResult:
+        return self._writer.write(
+            self._buffer.drain(), self._path, column_order=self._column_order
+        )
+
+    def abort(self) -> None:
+        self._buffer.discard()
+
+
+class _BufferedOutputStream(OutputStreamABC):
+    """Потоковая запись результата поверх ``OutputWriterABC.write_result``."""
+
+    def __init__(
+        self,
+        write_result: Callable[[pd.DataFrame], WriteResult],
+        *,
+        column_order: list[str] | None = None,
+    ) -> None:
+        self._write_result = write_result
+        self._buffer = _ChunkBuffer(column_order)
+
+    def write_chunk(self, df: pd.DataFrame) -> None:
+        self._buffer.append(df)
+
+    def close(self) -> WriteResult:
+        return self._write_result(self._buffer.drain())
+
+    def abort(self) -> None:
+        self._buffer.discard()
+
 
 __all__ = [
+    "DeltaResult",
     "WriteResult",
+    "ChunkWriterABC",
     "WriterABC",
     "MetadataWriterABC",
     "QualityReportABC",
     "OutputWriterABC",
+    "OutputStreamABC",
 ]
@@ -1,9 +1,11 @@
 """Domain configuration models (pure, without I/O)."""
 
 from bioetl.domain.configs.base import (
+    AdaptiveRateLimitConfig,
     BaseProviderConfig,
     BusinessKeyConfig,
     CanonicalizationConfig,
+    CheckpointConfig,
     ChemblSourceConfig,
     ClientConfig,
     CsvInputOptions,
@@ -14,18 +16,24 @@ from bioetl.domain.configs.base import (
     LoggingConfig,
     MetricsConfig,
     NormalizationConfig,
+    OutputConfig,
     PaginationConfig,
+    ParquetOutputConfig,
+    ProfilingConfig,
     ProviderConfigUnion,
     QcConfig,
+    ResponseCacheConfig,
     StorageConfig,
 )
 from bioetl.domain.configs.pipeline import PipelineConfig
 from bioetl.domain.configs.profile import ProfileConfig
 
 __all__ = [
+    "AdaptiveRateLimitConfig",
     "BaseProviderConfig",
     "BusinessKeyConfig",
     "CanonicalizationConfig",
+    "CheckpointConfig",
     "ChemblSourceConfig",
     "ClientConfig",
     "CsvInputOptions",
@@ -36,10 +44,14 @@ __all__ = [
     "LoggingConfig",
     "MetricsConfig",
     "NormalizationConfig",
+    "OutputConfig",
     "PaginationConfig",
+    "ParquetOutputConfig",
     "ProfileConfig",
+    "ProfilingConfig",
     "ProviderConfigUnion",
     "QcConfig",
+    "ResponseCacheConfig",
     "StorageConfig",
     "PipelineConfig",
 ]
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Annotated, Literal
+from typing import Annotated, Any, Literal
 
 from pydantic import (
     AnyHttpUrl,
@@ -37,6 +37,39 @@ class ClientConfig(BaseModel):
     backoff_factor: float = 2.0
     circuit_breaker_threshold: int = 5
     circuit_breaker_recovery_time: float = 60.0
+    max_connections: int = 10
+
+    model_config = ConfigDict(extra="forbid")
+
+
+class AdaptiveRateLimitConfig(BaseModel):
+    """AIMD-подстройка лимита запросов по ответам источника (429/503, Retry-After)."""
+
+    enabled: bool = False
+    min_rate_per_sec: PositiveFloat = 1.0
+    max_rate_per_sec: PositiveFloat | None = None
+    increase_step: PositiveFloat = 1.0
+    decrease_factor: float = Field(default=0.5, gt=0, lt=1)
+    latency_threshold_sec: PositiveFloat | None = 2.0
+
+    model_config = ConfigDict(extra="forbid")
+
+
+class ResponseCacheConfig(BaseModel):
+    """Кэш HTTP-ответов в ``storage.cache_path`` (ключ: URL + релиз источника)."""
+
+    enabled: bool = False
+    ttl_sec: PositiveInt | None = 30 * 24 * 3600
+    max_size_mb: PositiveInt = 1024
+
+    model_config = ConfigDict(extra="forbid")
+
+
+class CheckpointConfig(BaseModel):
+    """Чекпоинты извлечения для ``--resume`` (путь: ``<temp_path>/checkpoints``)."""
+
+    enabled: bool = False
+    path: str | None = None
 
     model_config = ConfigDict(extra="forbid")
 
@@ -47,6 +80,8 @@ class StorageConfig(BaseModel):
     output_path: str = "./data/output"
     cache_path: str = "./data/cache"
     temp_path: str = "./data/temp"
+    response_cache: ResponseCacheConfig = Field(default_factory=ResponseCacheConfig)
+    checkpoints: CheckpointConfig = Field(default_factory=CheckpointConfig)
 
     model_config = ConfigDict(extra="forbid")
 
@@ -78,6 +113,23 @@ class MetricsConfig(BaseModel):
         return value
 
 
+class ProfilingConfig(BaseModel):
+    """
+    Профилирование стадий и чанков (``bioetl run --profile-stages``).
+
+    ``sample_every_n_chunks`` задает выборку чанков стадии для снимков
+    tracemalloc и cProfile: первый чанк и далее каждый N-й.
+    """
+
+    enabled: bool = False
+    tracemalloc: bool = True
+    top_allocators: PositiveInt = 10
+    cprofile: bool = False
+    sample_every_n_chunks: PositiveInt = 10
+
+    model_config = ConfigDict(extra="forbid")
+
+
 class DeterminismConfig(BaseModel):
     """Конфигурация детерминизма."""
 
@@ -99,6 +151,30 @@ class QcConfig(BaseModel):
     model_config = ConfigDict(extra="forbid")
 
 
+class ParquetOutputConfig(BaseModel):
+    """Параметры записи Parquet."""
+
+    compression: Literal["snappy", "zstd", "gzip", "none"] = "snappy"
+    row_group_size: PositiveInt = 100_000
+    # Низкокардинальные колонки: остальные пишутся без dictionary encoding.
+    dictionary_columns: list[str] = Field(
+        default_factory=lambda: ["assay_type", "standard_units", "target_organism"]
+    )
+
+    model_config = ConfigDict(extra="forbid")
+
+
+class OutputConfig(BaseModel):
+    """Конфигурация записи результатов."""
+
+    format: Literal["csv", "parquet"] = "csv"
+    streaming: bool = False
+    delta: bool = False
+    parquet: ParquetOutputConfig = Field(default_factory=ParquetOutputConfig)
+
+    model_config = ConfigDict(extra="forbid")
+
+
 class CanonicalizationConfig(BaseModel):
     """Конфигурация канонизации для хеширования."""
 
@@ -167,6 +243,10 @@ class CsvInputOptions(BaseModel):
 
     delimiter: str = ","
     header: bool = True
+    # Читать только эти колонки (по заголовку); отсутствующие в файле пропускаются.
+    usecols: list[str] | None = None
+    # Читать только колонки из ``fields`` конфига пайплайна.
+    schema_fields_only: bool = False
 
     model_config = ConfigDict(extra="forbid")
 
@@ -177,6 +257,13 @@ class CsvInputOptions(BaseModel):
             raise ValueError("CSV delimiter must be a non-empty string")
         return value
 
+    def resolve_usecols(self, fields: list[dict[str, Any]] | None) -> list[str] | None:
+        """Колонки для чтения: ``usecols`` или имена ``fields`` схемы."""
+        if self.usecols is not None or not self.schema_fields_only:
+            return self.usecols
+        names = [field["name"] for field in fields or [] if field.get("name")]
+        return names or None
+
 
 class BaseProviderConfig(BaseModel):
     """Базовая строгая конфигурация провайдера."""
@@ -206,6 +293,12 @@ class ChemblSourceConfig(BaseProviderConfig):
     max_url_length: PositiveInt | None = None
     page_size: PositiveInt | None = None
     batch_size: PositiveInt | None = None
+    # Верхняя граница ID в батче id_only при упаковке по max_url_length.
+    max_ids_per_request: PositiveInt | None = None
+    max_concurrent_requests: PositiveInt = 1
+    adaptive_rate_limit: AdaptiveRateLimitConfig = Field(
+        default_factory=AdaptiveRateLimitConfig
+    )
 
     model_config = ConfigDict(extra="forbid")
 
@@ -23,7 +23,9 @@ from bioetl.domain.configs.base import (
     LoggingConfig,
     MetricsConfig,
     NormalizationConfig,
+    OutputConfig,
     PaginationConfig,
+    ProfilingConfig,
     ProviderConfigUnion,
     QcConfig,
     StorageConfig,
@@ -42,6 +44,7 @@ class PipelineConfig(BaseModel):
     input_path: str | None
     output_path: str
     batch_size: PositiveInt
+    workers: PositiveInt = 1
     dry_run: bool = False
     provider_config: ProviderConfigUnion
 
@@ -51,8 +54,10 @@ class PipelineConfig(BaseModel):
     storage: StorageConfig = Field(default_factory=StorageConfig)
     logging: LoggingConfig = Field(default_factory=LoggingConfig)
     metrics: MetricsConfig = Field(default_factory=MetricsConfig)
+    profiling: ProfilingConfig = Field(default_factory=ProfilingConfig)
     determinism: DeterminismConfig = Field(default_factory=DeterminismConfig)
     qc: QcConfig = Field(default_factory=QcConfig)
+    output: OutputConfig = Field(default_factory=OutputConfig)
     hashing: HashingConfig = Field(default_factory=HashingConfig)
     normalization: NormalizationConfig = Field(default_factory=NormalizationConfig)
     features: InterfaceFeaturesConfig = Field(default_factory=InterfaceFeaturesConfig)
@@ -119,5 +124,13 @@ class PipelineConfig(BaseModel):
 
         return self
 
+    @model_validator(mode="after")
+    def validate_delta_mode(self) -> PipelineConfig:
+        if self.output.delta and not self.hashing.business_key_fields:
+            raise ValueError(
+                "hashing.business_key_fields must be set when output.delta is enabled"
+            )
+        return self
+
 
 __all__ = ["PipelineConfig"]
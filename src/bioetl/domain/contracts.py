@@ -13,7 +13,7 @@ from collections.abc import Iterable
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:  # pragma: no cover
-    from bioetl.domain.record_source import RawRecord
+    from bioetl.domain.record_source import RawRecord, RecordBatch
 
 
 class ExtractionServiceABC(ABC):
@@ -62,6 +62,26 @@ class ExtractionServiceABC(ABC):
             Iterable of raw record lists
         """
 
+    def iter_extract_batches(
+        self, entity: str, *, chunk_size: int | None = None, **filters: Any
+    ) -> Iterable[RecordBatch | list[RawRecord]]:
+        """
+        Stream records for an entity in columnar batches.
+
+        Services that assemble pages column by column override this to yield
+        ``RecordBatch`` without building per-row dicts. The default delegates
+        to ``iter_extract``.
+
+        Args:
+            entity: Entity name to extract (e.g., 'activity', 'assay')
+            chunk_size: Preferred chunk size for each page/batch
+            **filters: Provider-specific filters (e.g., limit, offset)
+
+        Returns:
+            Iterable of record batches
+        """
+        return self.iter_extract(entity, chunk_size=chunk_size, **filters)
+
     @abstractmethod
     def request_batch(
         self,
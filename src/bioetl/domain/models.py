@@ -54,6 +54,31 @@ class RunResult:
     meta: dict[str, Any]
 
 
+@dataclass
+class PipelineRunReport:
+    """Итог одного пайплайна в пакетном запуске."""
+
+    name: str
+    # success | failed | skipped (не запускался из-за упавшей зависимости)
+    status: str
+    duration_sec: float = 0.0
+    run_id: str | None = None
+    row_count: int = 0
+    output_path: Path | None = None
+    rate_limit: float | None = None
+    errors: list[str] = field(default_factory=list)
+
+
+@dataclass
+class BatchRunReport:
+    """Сводный отчет пакетного запуска пайплайнов."""
+
+    success: bool
+    duration_sec: float
+    max_workers: int
+    pipelines: list[PipelineRunReport]
+
+
 @dataclass
 class StageDescriptor:
     """
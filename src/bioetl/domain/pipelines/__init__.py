@@ -4,9 +4,17 @@ __all__ = [
     "StageABC",
     "PipelineHookABC",
     "ErrorPolicyABC",
+    "CheckpointStoreABC",
+    "Checkpoint",
+    "CheckpointChunk",
 ]
 
+from bioetl.domain.pipelines.checkpoint import (  # noqa: E402,F401
+    Checkpoint,
+    CheckpointChunk,
+)
 from bioetl.domain.pipelines.contracts import (  # noqa: E402,F401
+    CheckpointStoreABC,
     ErrorPolicyABC,
     PipelineHookABC,
     StageABC,
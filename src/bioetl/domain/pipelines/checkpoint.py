@@ -0,0 +1,82 @@
+"""
+Чекпоинты извлечения.
+
+Возобновляемый источник записей сообщает курсор — позицию, с которой
+чтение можно продолжить (offset API или номер ID-батча). Extractor кладет
+курсор в ``df.attrs`` каждого чанка: пайплайн по нему пересоздает итератор
+после ретрая, не перечитывая уже полученные страницы, и сохраняет его в
+манифест чекпоинта вместе с обработанными чанками для ``--resume <run_id>``.
+"""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass, field
+from typing import Any
+
+import pandas as pd
+
+EXTRACT_CURSOR_ATTR = "bioetl.extract_cursor"
+
+
+def attach_cursor(df: pd.DataFrame, cursor: dict[str, Any]) -> pd.DataFrame:
+    """Запоминает курсор источника в ``attrs`` чанка (in-place)."""
+    df.attrs[EXTRACT_CURSOR_ATTR] = cursor
+    return df
+
+
+def pop_cursor(df: pd.DataFrame) -> dict[str, Any] | None:
+    """Снимает курсор с чанка, чтобы он не уходил дальше по стадиям."""
+    cursor = df.attrs.pop(EXTRACT_CURSOR_ATTR, None)
+    return dict(cursor) if cursor is not None else None
+
+
+@dataclass
+class CheckpointChunk:
+    """Обработанный чанк, сохраненный в хранилище чекпоинтов."""
+
+    index: int
+    rows: int
+    ref: str
+
+
+@dataclass
+class Checkpoint:
+    """
+    Манифест чекпоинта запуска.
+
+    ``cursor`` — позиция источника после последнего обработанного чанка,
+    ``counters`` — счетчики стадий, ``state`` — состояние hash service
+    (сквозной индекс, метка extracted_at).
+    """
+
+    run_id: str
+    pipeline_id: str
+    cursor: dict[str, Any] | None = None
+    counters: dict[str, int] = field(default_factory=dict)
+    state: dict[str, Any] = field(default_factory=dict)
+    chunks: list[CheckpointChunk] = field(default_factory=list)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Сериализует манифест в JSON-совместимый словарь."""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, payload: dict[str, Any]) -> "Checkpoint":
+        """Восстанавливает манифест из словаря ``to_dict``."""
+        return cls(
+            run_id=payload["run_id"],
+            pipeline_id=payload["pipeline_id"],
+            cursor=payload.get("cursor"),
+            counters=dict(payload.get("counters") or {}),
+            state=dict(payload.get("state") or {}),
+            chunks=[CheckpointChunk(**item) for item in payload.get("chunks") or []],
+        )
+
+
+__all__ = [
+    "EXTRACT_CURSOR_ATTR",
+    "Checkpoint",
+    "CheckpointChunk",
+    "attach_cursor",
+    "pop_cursor",
+]
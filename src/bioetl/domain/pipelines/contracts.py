@@ -3,11 +3,14 @@
 from abc import ABC, abstractmethod
 from typing import Any
 
+import pandas as pd
+
 from bioetl.domain.enums import ErrorAction
 from bioetl.domain.errors import PipelineStageError
 from bioetl.domain.models import StageResult
+from bioetl.domain.pipelines.checkpoint import Checkpoint
 
-__all__ = ["StageABC", "PipelineHookABC", "ErrorPolicyABC"]
+__all__ = ["StageABC", "PipelineHookABC", "ErrorPolicyABC", "CheckpointStoreABC"]
 
 
 class StageABC(ABC):
@@ -37,6 +40,15 @@ class PipelineHookABC(ABC):
     def on_error(self, stage: str, error: PipelineStageError) -> None:
         """Вызывается при ошибке."""
 
+    def on_chunk_start(self, stage: str, context: Any) -> None:
+        """Вызывается перед обработкой чанка стадией (по умолчанию ничего)."""
+
+    def on_chunk_end(self, stage: str, rows: int) -> None:
+        """Вызывается после обработки чанка; ``rows`` — строк на выходе."""
+
+    def on_run_end(self, context: Any) -> None:
+        """Вызывается по завершении запуска, в том числе при ошибке."""
+
 
 class ErrorPolicyABC(ABC):
     """Политика обработки ошибок."""
@@ -48,3 +60,27 @@ class ErrorPolicyABC(ABC):
     @abstractmethod
     def should_retry(self, error: PipelineStageError) -> bool:
         """Проверяет, стоит ли повторять операцию."""
+
+
+class CheckpointStoreABC(ABC):
+    """Хранилище чекпоинтов: манифест запуска и обработанные чанки."""
+
+    @abstractmethod
+    def load(self, run_id: str) -> Checkpoint | None:
+        """Возвращает последний зафиксированный манифест или None."""
+
+    @abstractmethod
+    def save_chunk(self, run_id: str, index: int, df: pd.DataFrame) -> str:
+        """Сохраняет обработанный чанк и возвращает ссылку на него."""
+
+    @abstractmethod
+    def load_chunk(self, run_id: str, ref: str) -> pd.DataFrame:
+        """Читает чанк, сохраненный через ``save_chunk``."""
+
+    @abstractmethod
+    def commit(self, checkpoint: Checkpoint) -> None:
+        """Атомарно фиксирует манифест (курсор, счетчики, список чанков)."""
+
+    @abstractmethod
+    def clear(self, run_id: str) -> None:
+        """Удаляет чекпоинт успешно завершенного запуска."""
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterable
-from typing import Any, Protocol, TypedDict, cast
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass, field
+from typing import Any, Protocol, TypedDict, cast, runtime_checkable
 
+import numpy as np
 import pandas as pd
 
 from bioetl.domain.contracts import ExtractionServiceABC
@@ -17,11 +19,108 @@ class RawRecord(TypedDict, total=False):
     ...
 
 
+@dataclass(frozen=True)
+class RecordBatch:
+    """
+    Columnar batch of raw records: column name -> values by row.
+
+    Each column holds ``num_rows`` values (list, ndarray or Series), so
+    ``to_frame`` builds a DataFrame without per-row dicts. A batch made by
+    ``from_frame`` keeps the source DataFrame and returns it as is.
+    """
+
+    columns: Mapping[str, Sequence[Any]]
+    num_rows: int
+    frame: pd.DataFrame | None = field(default=None, repr=False, compare=False)
+
+    def __len__(self) -> int:
+        return self.num_rows
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> RecordBatch:
+        """Wrap a DataFrame chunk without copying it."""
+        return cls(columns=dict(df.items()), num_rows=len(df), frame=df)
+
+    @classmethod
+    def from_records(cls, records: Sequence[Mapping[str, Any]]) -> RecordBatch:
+        """
+        Adapter for list-of-dict batches.
+
+        Columns follow the order of first appearance; keys missing in a
+        record become NaN, as in ``pd.DataFrame(records)``.
+        """
+        names: dict[str, None] = {}
+        for record in records:
+            names.update(dict.fromkeys(record))
+        columns = {
+            name: [record.get(name, np.nan) for record in records] for name in names
+        }
+        return cls(columns=columns, num_rows=len(records))
+
+    def head(self, rows: int) -> RecordBatch:
+        """First ``rows`` rows of the batch."""
+        if rows >= self.num_rows:
+            return self
+        rows = max(rows, 0)
+        if self.frame is not None:
+            return RecordBatch.from_frame(self.frame.iloc[:rows])
+        return RecordBatch(
+            columns={name: values[:rows] for name, values in self.columns.items()},
+            num_rows=rows,
+        )
+
+    def to_frame(self) -> pd.DataFrame:
+        """DataFrame built column by column."""
+        if self.frame is not None:
+            return self.frame
+        return pd.DataFrame(dict(self.columns), index=pd.RangeIndex(self.num_rows))
+
+    def to_records(self) -> list[RawRecord]:
+        """Row mappings; meant for tests and list-based consumers."""
+        names = list(self.columns)
+        if not names:
+            return [cast(RawRecord, {}) for _ in range(self.num_rows)]
+        return [
+            cast(RawRecord, dict(zip(names, row)))
+            for row in zip(*self.columns.values())
+        ]
+
+
+# Batch yielded by record sources: columnar, list of mappings or DataFrame.
+RecordChunk = RecordBatch | list[RawRecord] | pd.DataFrame
+
+
+def as_record_batch(chunk: RecordChunk) -> RecordBatch:
+    """Adapt any record source batch to ``RecordBatch``."""
+    if isinstance(chunk, RecordBatch):
+        return chunk
+    if isinstance(chunk, pd.DataFrame):
+        return RecordBatch.from_frame(chunk)
+    return RecordBatch.from_records(cast(Sequence[Mapping[str, Any]], chunk))
+
+
 class RecordSource(Protocol):
     """Protocol for record sources returning record batches."""
 
-    def iter_records(self) -> Iterable[list[RawRecord]]:
-        """Return iterable over raw record batches as lists of mappings."""
+    def iter_records(self) -> Iterable[RecordChunk]:
+        """Return iterable over raw record batches (mappings or DataFrames)."""
+
+
+@runtime_checkable
+class ResumableRecordSource(RecordSource, Protocol):
+    """
+    Record source that can continue from a saved position.
+
+    ``cursor`` describes the position right after the last yielded batch;
+    ``seek`` makes the next ``iter_records`` call start from such a cursor.
+    """
+
+    @property
+    def cursor(self) -> dict[str, Any]:
+        """Return position after the last yielded batch."""
+
+    def seek(self, cursor: dict[str, Any]) -> None:
+        """Start the next iteration from ``cursor``."""
 
 
 class InMemoryRecordSource(RecordSource):
@@ -40,8 +139,23 @@ class InMemoryRecordSource(RecordSource):
             yield self._records[start : start + self._chunk_size]
 
 
-class ApiRecordSource(RecordSource):
-    """Record source that fetches data from an extraction service."""
+def _yields_record_batches(service: Any) -> bool:
+    """Service class overrides ``iter_extract_batches`` with a columnar one."""
+    method = getattr(type(service), "iter_extract_batches", None)
+    return method is not None and (
+        method is not ExtractionServiceABC.iter_extract_batches
+    )
+
+
+class ApiRecordSource(ResumableRecordSource):
+    """
+    Record source that fetches data from an extraction service.
+
+    Services that override ``iter_extract_batches`` are read through it as
+    columnar batches, others through ``iter_extract``. Cursor is
+    ``{"offset": n}``: resuming passes it as the ``offset`` filter, so pages
+    before it are not requested again.
+    """
 
     def __init__(
         self,
@@ -54,25 +168,57 @@ class ApiRecordSource(RecordSource):
         self._entity = entity
         self._filters = filters or {}
         self._chunk_size = chunk_size
+        self._start_offset = int(self._filters.get("offset") or 0)
+        self._offset = self._start_offset
+        self._resume_offset: int | None = None
 
-    def iter_records(self) -> Iterable[list[RawRecord]]:
+    @property
+    def cursor(self) -> dict[str, Any]:
+        return {"offset": self._offset}
+
+    def seek(self, cursor: dict[str, Any]) -> None:
+        self._resume_offset = int(cursor["offset"])
+
+    def iter_records(self) -> Iterable[RecordChunk]:
         filters = dict(self._filters)
-        for raw_batch in self._extraction_service.iter_extract(
+        offset = self._start_offset
+        if self._resume_offset is not None:
+            offset, self._resume_offset = self._resume_offset, None
+        self._offset = offset
+
+        skipped = offset - self._start_offset
+        if skipped:
+            filters["offset"] = offset
+            if filters.get("limit") is not None:
+                filters["limit"] = int(filters["limit"]) - skipped
+                if filters["limit"] <= 0:
+                    return
+
+        iter_batches = self._extraction_service.iter_extract
+        if _yields_record_batches(self._extraction_service):
+            iter_batches = self._extraction_service.iter_extract_batches
+        for raw_batch in iter_batches(
             self._entity, chunk_size=self._chunk_size, **filters
         ):
-            yield self._coerce_batch(raw_batch)
+            batch = self._coerce_batch(raw_batch)
+            self._offset += len(batch)
+            yield batch
 
-    def _coerce_batch(self, raw_batch: Any) -> list[RawRecord]:
+    def _coerce_batch(self, raw_batch: Any) -> RecordChunk:
         """
-        Normalize provider batches to a list of raw records.
+        Normalize provider batches to a record chunk.
 
-        Supports DataFrame, mapping, iterable of mappings, and None.
+        Supports RecordBatch, DataFrame, mapping, iterable of mappings, and
+        None; DataFrames are wrapped as columnar batches without copying.
         """
         if raw_batch is None:
             return []
 
+        if isinstance(raw_batch, RecordBatch):
+            return raw_batch
+
         if isinstance(raw_batch, pd.DataFrame):
-            return cast(list[RawRecord], raw_batch.to_dict(orient="records"))
+            return RecordBatch.from_frame(raw_batch)
 
         if isinstance(raw_batch, dict):
             return [cast(RawRecord, raw_batch)]
@@ -84,5 +230,6 @@ class ApiRecordSource(RecordSource):
             return cast(list[RawRecord], list(raw_batch))
 
         raise TypeError(
-            "iter_extract must yield DataFrame, mapping, or iterable of mappings."
+            "iter_extract must yield RecordBatch, DataFrame, mapping, "
+            "or iterable of mappings."
         )
@@ -0,0 +1,87 @@
+"""Каноническая JSON-сериализация для хеширования (hash_version v1_blake2b_256)."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import unicodedata
+from decimal import Decimal
+from typing import Any, Iterable
+
+
+def normalize_unicode(text: str) -> str:
+    """Нормализует строку в форму NFC."""
+
+    return unicodedata.normalize("NFC", text)
+
+
+def format_float(value: float | Decimal) -> str:
+    """Форматирует число с плавающей точкой по спецификации %.15g."""
+
+    val = float(value)
+
+    if val in (float("inf"), float("-inf")) or val != val:
+        raise ValueError(f"Invalid float value for hashing: {value}")
+
+    return "%.15g" % val
+
+
+def _serialize_number(value: int | float | Decimal) -> str:
+    if isinstance(value, int) and not isinstance(value, bool):
+        return str(value)
+    return format_float(value)
+
+
+def _serialize_string(text: str) -> str:
+    norm_str = normalize_unicode(text)
+    return json.dumps(norm_str, ensure_ascii=False)
+
+
+def _serialize_sequence(items: Iterable[Any]) -> str:
+    serialized_items = [serialize_canonical(item) for item in items]
+    return "[" + ",".join(serialized_items) + "]"
+
+
+def _serialize_mapping(obj: dict[str, Any]) -> str:
+    sorted_keys = sorted(obj.keys())
+    items = []
+    for key in sorted_keys:
+        if not isinstance(key, str):
+            raise TypeError(f"Dict keys must be strings, got {type(key)}")
+        key_str = json.dumps(normalize_unicode(key), ensure_ascii=False)
+        val_str = serialize_canonical(obj[key])
+        items.append(f"{key_str}:{val_str}")
+    return "{" + ",".join(items) + "}"
+
+
+def serialize_canonical(obj: Any) -> str:
+    """Рекурсивно сериализует объект в каноническую JSON-строку."""
+
+    if obj is None:
+        return "null"
+    if isinstance(obj, bool):
+        return "true" if obj else "false"
+    if isinstance(obj, (int, float, Decimal)):
+        return _serialize_number(obj)
+    if isinstance(obj, str):
+        return _serialize_string(obj)
+    if isinstance(obj, (list, tuple)):
+        return _serialize_sequence(obj)
+    if isinstance(obj, dict):
+        return _serialize_mapping(obj)
+
+    raise TypeError(f"Type {type(obj)} not supported for canonical serialization")
+
+
+def blake2b_hash_hex(data_bytes: bytes, digest_size: int = 32) -> str:
+    """Вычисляет BLAKE2b хеш в шестнадцатеричном представлении."""
+
+    return hashlib.blake2b(data_bytes, digest_size=digest_size).hexdigest()
+
+
+__all__ = [
+    "blake2b_hash_hex",
+    "format_float",
+    "normalize_unicode",
+    "serialize_canonical",
+]
@@ -0,0 +1,190 @@
+"""
+Колоночная сборка страниц ChEMBL.
+
+Эквивалент ``model_cls(**record).model_dump()`` для каждой записи страницы,
+но без Pydantic round trip: записи раскладываются по колонкам, а вложенные
+значения (dict/list) уплощаются одним проходом по колонке тем же правилом,
+что и ``ChemblRecordModel.serialize``. Записи, у которых объявленные в модели
+поля имеют неожиданный тип, проходят через модель как раньше — с той же
+валидацией и теми же ошибками.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import lru_cache
+from types import NoneType, UnionType
+from typing import Any, Union, get_args, get_origin
+
+import numpy as np
+import pandas as pd
+
+from bioetl.domain.record_source import RecordBatch
+from bioetl.domain.schemas.chembl.models import ChemblRecordModel, _flatten_value
+
+__all__ = ["ColumnarPage", "assemble_columns"]
+
+
+class _Missing:
+    """Маркер отсутствующего в записи ключа (в отличие от явного None)."""
+
+    def __repr__(self) -> str:
+        return "<missing>"
+
+
+_MISSING: Any = _Missing()
+
+# (допустимые типы или None, если проверить нельзя; поле обязательно)
+_FieldTypes = tuple[tuple[type, ...] | None, bool]
+
+
+@dataclass
+class ColumnarPage:
+    """
+    Страница записей в колоночном виде: имя колонки → значения по строкам.
+
+    Порядок колонок совпадает с ``pd.DataFrame`` из списка сериализованных
+    записей: сначала поля модели, затем остальные ключи в порядке появления.
+    """
+
+    columns: dict[str, list[Any]]
+    row_count: int
+    # Есть записи без части ключей: значения содержат маркер пропуска.
+    sparse: bool = False
+
+    def to_records(self) -> list[dict[str, Any]]:
+        """Строки-словари, как у ``model_dump()`` по каждой записи."""
+        names = list(self.columns)
+        rows = zip(*self.columns.values()) if names else iter(())
+        records = [dict(zip(names, row)) for row in rows]
+        if not records and self.row_count:
+            return [{} for _ in range(self.row_count)]
+        if self.sparse:
+            for record in records:
+                for name in names:
+                    if record[name] is _MISSING:
+                        del record[name]
+        return records
+
+    def head(self, rows: int) -> ColumnarPage:
+        """Первые ``rows`` строк страницы."""
+        if rows >= self.row_count:
+            return self
+        rows = max(rows, 0)
+        columns = {name: values[:rows] for name, values in self.columns.items()}
+        if self.sparse:
+            # Ключи, встречавшиеся только в отброшенных строках, — не колонки.
+            columns = {
+                name: values
+                for name, values in columns.items()
+                if any(value is not _MISSING for value in values)
+            }
+        return ColumnarPage(columns=columns, row_count=rows, sparse=self.sparse)
+
+    def to_batch(self) -> RecordBatch:
+        """Колоночный батч источника записей; пропуски ключей — NaN."""
+        data = self.columns
+        if self.sparse:
+            data = {
+                name: [np.nan if value is _MISSING else value for value in values]
+                for name, values in self.columns.items()
+            }
+        return RecordBatch(columns=data, num_rows=self.row_count)
+
+    def to_frame(self) -> pd.DataFrame:
+        """DataFrame без промежуточных словарей; пропуски ключей — NaN."""
+        return self.to_batch().to_frame()
+
+
+def assemble_columns(
+    model_cls: type[ChemblRecordModel], records: list[dict[str, Any]]
+) -> ColumnarPage:
+    """Собирает страницу в колонки с уплощением вложенных значений."""
+    declared = _declared_types(model_cls)
+    rows = [
+        record if _conforms(record, declared) else model_cls(**record).model_dump()
+        for record in records
+    ]
+
+    names: dict[str, None] = dict.fromkeys(declared)
+    uniform = True
+    if rows:
+        first_keys = rows[0].keys()
+        names.update(dict.fromkeys(first_keys))
+        for row in rows:
+            if row.keys() != first_keys:
+                uniform = False
+                names.update(dict.fromkeys(row))
+
+    columns: dict[str, list[Any]] = {}
+    for name in names:
+        if name in declared or not uniform:
+            values = [row.get(name, _default(name, declared)) for row in rows]
+        else:
+            values = [row[name] for row in rows]
+        columns[name] = _flatten_column(values)
+    return ColumnarPage(columns=columns, row_count=len(rows), sparse=not uniform)
+
+
+def _default(name: str, declared: dict[str, _FieldTypes]) -> Any:
+    # Поля модели без значения дампятся как None, прочие ключи отсутствуют.
+    return None if name in declared else _MISSING
+
+
+def _flatten_column(values: list[Any]) -> list[Any]:
+    nested = [i for i, value in enumerate(values) if isinstance(value, (dict, list))]
+    if not nested:
+        return values
+    flattened = list(values)
+    for i in nested:
+        flattened[i] = _flatten_value(values[i])
+    return flattened
+
+
+def _conforms(record: dict[str, Any], declared: dict[str, _FieldTypes]) -> bool:
+    for name, (allowed, required) in declared.items():
+        if name not in record:
+            if required:
+                return False
+            continue
+        if allowed is None or not isinstance(record[name], allowed):
+            return False
+    return True
+
+
+@lru_cache(maxsize=None)
+def _declared_types(model_cls: type[ChemblRecordModel]) -> dict[str, _FieldTypes]:
+    """
+    Допустимые Python-типы объявленных полей модели и их обязательность.
+
+    Типы None — аннотация, которую нельзя проверить через ``isinstance``:
+    такие записи всегда идут через Pydantic.
+    """
+    return {
+        name: (_runtime_types(field_info.annotation), field_info.is_required())
+        for name, field_info in model_cls.model_fields.items()
+    }
+
+
+def _runtime_types(annotation: Any) -> tuple[type, ...] | None:
+    if annotation is None or annotation is NoneType:
+        return (NoneType,)
+    if annotation is Any:
+        return (object,)
+    origin = get_origin(annotation)
+    if origin in (Union, UnionType):
+        result: tuple[type, ...] = ()
+        for arg in get_args(annotation):
+            types = _runtime_types(arg)
+            if types is None:
+                return None
+            result += types
+        return result
+    # list[Any] / dict[str, Any]: содержимое Pydantic не преобразует.
+    if (origin is list and get_args(annotation) == (Any,)) or (
+        origin is dict and get_args(annotation) == (str, Any)
+    ):
+        return (origin,)
+    if annotation in (list, dict):
+        return (annotation,)
+    return None
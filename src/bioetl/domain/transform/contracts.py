@@ -53,6 +53,11 @@ class HasherABC(ABC):
     def hash_columns(self, df: pd.DataFrame, columns: list[str]) -> pd.Series:
         """Хеширует выбранные колонки DataFrame."""
 
+    def hash_rows(self, df: pd.DataFrame) -> pd.Series:
+        """Хеширует каждую строку DataFrame (по умолчанию через hash_row)."""
+
+        return df.apply(self.hash_row, axis=1)
+
 
 class NormalizationServiceABC(ABC):
     """
@@ -98,28 +103,47 @@ class HashServiceABC(ABC):
 
     @abstractmethod
     def add_hash_columns(
-        self, df: pd.DataFrame, business_key_cols: list[str] | None = None
+        self,
+        df: pd.DataFrame,
+        business_key_cols: list[str] | None = None,
+        *,
+        copy: bool = True,
     ) -> pd.DataFrame:
-        """Добавляет hash_row и hash_business_key с учетом бизнес-ключа."""
+        """
+        Добавляет hash_row и hash_business_key с учетом бизнес-ключа.
+
+        ``copy=False`` — колонки добавляются в ``df`` на месте (вызывающий
+        владеет кадром); так же работают остальные ``add_*`` методы.
+        """
 
     @abstractmethod
-    def add_index_column(self, df: pd.DataFrame) -> pd.DataFrame:
+    def add_index_column(self, df: pd.DataFrame, *, copy: bool = True) -> pd.DataFrame:
         """Добавляет порядковый индекс строк (int, начиная с 0)."""
 
     @abstractmethod
     def add_database_version_column(
-        self, df: pd.DataFrame, database_version: str
+        self, df: pd.DataFrame, database_version: str, *, copy: bool = True
     ) -> pd.DataFrame:
         """Добавляет колонку database_version."""
 
     @abstractmethod
-    def add_fulldate_column(self, df: pd.DataFrame) -> pd.DataFrame:
+    def add_fulldate_column(
+        self, df: pd.DataFrame, *, copy: bool = True
+    ) -> pd.DataFrame:
         """Добавляет колонку extracted_at (UTC ISO-8601) для детерминизма."""
 
     @abstractmethod
     def reset_state(self) -> None:
         """Сбрасывает внутреннее состояние между запусками."""
 
+    @abstractmethod
+    def export_state(self) -> dict[str, Any]:
+        """Возвращает состояние (индекс, extracted_at) для чекпоинта."""
+
+    @abstractmethod
+    def restore_state(self, state: dict[str, Any]) -> None:
+        """Восстанавливает состояние из ``export_state`` при возобновлении."""
+
 
 __all__ = [
     "NormalizationConfig",
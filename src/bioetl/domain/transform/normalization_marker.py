@@ -0,0 +1,53 @@
+"""
+Маркер нормализованных колонок чанка.
+
+Сервис нормализации записывает в ``df.attrs`` множество колонок, которые
+уже прошли нормализацию, и пропускает их при повторном вызове
+(extractor -> transformer). ``attrs`` переживает copy/срезы/pickle, поэтому
+код, перезаписывающий нормализованную колонку сырыми значениями, должен
+снять с нее отметку через ``unmark_normalized``.
+
+Отметка хранится отсортированным кортежем: ``attrs`` сериализуется в JSON
+при записи Parquet (``PANDAS_ATTRS``), а множества JSON не поддерживает.
+"""
+
+from __future__ import annotations
+
+from typing import Iterable
+
+import pandas as pd
+
+NORMALIZED_COLUMNS_ATTR = "bioetl.normalized_columns"
+
+
+def normalized_columns(df: pd.DataFrame) -> frozenset[str]:
+    """Колонки DataFrame, отмеченные как уже нормализованные."""
+    marked = df.attrs.get(NORMALIZED_COLUMNS_ATTR)
+    if not marked:
+        return frozenset()
+    return frozenset(marked).intersection(map(str, df.columns))
+
+
+def mark_normalized(df: pd.DataFrame, columns: Iterable[str]) -> None:
+    """Отмечает колонки как нормализованные (in-place, только ``attrs``)."""
+    df.attrs[NORMALIZED_COLUMNS_ATTR] = tuple(
+        sorted(normalized_columns(df).union(columns))
+    )
+
+
+def unmark_normalized(df: pd.DataFrame, columns: Iterable[str] | None = None) -> None:
+    """Снимает отметку с колонок; без ``columns`` — со всего чанка."""
+    if columns is None:
+        df.attrs.pop(NORMALIZED_COLUMNS_ATTR, None)
+        return
+    df.attrs[NORMALIZED_COLUMNS_ATTR] = tuple(
+        sorted(normalized_columns(df).difference(columns))
+    )
+
+
+__all__ = [
+    "NORMALIZED_COLUMNS_ATTR",
+    "mark_normalized",
+    "normalized_columns",
+    "unmark_normalized",
+]
@@ -4,6 +4,7 @@ Normalizers package - domain-specific value normalization.
 This package provides:
 - Regex patterns for identifier validation
 - Normalizer functions for identifiers (DOI, ChEMBL, PMID, etc.)
+- Column-level (vectorized) counterparts of identifier normalizers
 - Normalizers for collections (arrays, records)
 - Field normalizer registry
 """
@@ -15,6 +16,7 @@ from bioetl.domain.transform.normalizers.base import (
     PUBCHEM_CID_REGEX,
     PUBMED_ID_REGEX,
     UNIPROT_ID_REGEX,
+    InvalidValuesError,
     is_missing,
 )
 from bioetl.domain.transform.normalizers.collections import (
@@ -23,6 +25,15 @@ from bioetl.domain.transform.normalizers.collections import (
     normalize_record,
     normalize_target_components,
 )
+from bioetl.domain.transform.normalizers.identifier_series import (
+    normalize_bao_id_series,
+    normalize_bao_label_series,
+    normalize_chembl_id_series,
+    normalize_doi_series,
+    normalize_pcid_series,
+    normalize_pmid_series,
+    normalize_uniprot_series,
+)
 from bioetl.domain.transform.normalizers.identifiers import (
     normalize_bao_id,
     normalize_bao_label,
@@ -34,6 +45,7 @@ from bioetl.domain.transform.normalizers.identifiers import (
 )
 from bioetl.domain.transform.normalizers.registry import (
     CUSTOM_FIELD_NORMALIZERS,
+    SERIES_NORMALIZERS,
 )
 
 __all__ = [
@@ -45,6 +57,7 @@ __all__ = [
     "UNIPROT_ID_REGEX",
     "BAO_ID_REGEX",
     # Base
+    "InvalidValuesError",
     "is_missing",
     # Identifiers
     "normalize_doi",
@@ -54,6 +67,14 @@ __all__ = [
     "normalize_uniprot",
     "normalize_bao_id",
     "normalize_bao_label",
+    # Identifier columns
+    "normalize_doi_series",
+    "normalize_chembl_id_series",
+    "normalize_pmid_series",
+    "normalize_pcid_series",
+    "normalize_uniprot_series",
+    "normalize_bao_id_series",
+    "normalize_bao_label_series",
     # Collections
     "normalize_array",
     "normalize_record",
@@ -61,4 +82,5 @@ __all__ = [
     "normalize_cross_references",
     # Registry
     "CUSTOM_FIELD_NORMALIZERS",
+    "SERIES_NORMALIZERS",
 ]
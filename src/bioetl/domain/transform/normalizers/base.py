@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import re
-from typing import Any
+from typing import Any, Hashable, Mapping
 
 import pandas as pd
 
@@ -26,6 +26,22 @@ UNIPROT_ID_REGEX = re.compile(
 )
 
 
+class InvalidValuesError(ValueError):
+    """Неверные значения столбца, собранные за один проход (строка -> значение)."""
+
+    _MAX_LABELS = 10
+
+    def __init__(self, reason: str, invalid: Mapping[Hashable, Any]) -> None:
+        self.reason = reason
+        self.invalid = dict(invalid)
+        labels = list(self.invalid)[: self._MAX_LABELS]
+        more = ", ..." if len(self.invalid) > len(labels) else ""
+        super().__init__(
+            f"{reason} (неверных значений: {len(self.invalid)}; "
+            f"строки: {', '.join(map(str, labels))}{more})"
+        )
+
+
 def is_missing(value: Any) -> bool:
     """Check if value is None or pandas NA."""
     if value is None:
@@ -43,5 +59,6 @@ __all__ = [
     "PUBCHEM_CID_REGEX",
     "BAO_ID_REGEX",
     "UNIPROT_ID_REGEX",
+    "InvalidValuesError",
     "is_missing",
 ]
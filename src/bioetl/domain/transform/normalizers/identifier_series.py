@@ -0,0 +1,155 @@
+"""
+Column-level counterparts of identifier normalizers.
+
+Каждая функция принимает Series непустых строк и возвращает нормализованные
+значения с тем же индексом — так же, как поэлементный нормализатор из
+``identifiers``. Регулярные выражения компилируются один раз и применяются
+через ``Series.str``; все неверные строки собираются в одно
+``InvalidValuesError`` вместо остановки на первой.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Any, Callable
+
+import numpy as np
+import pandas as pd
+
+from bioetl.domain.transform.normalizers.base import (
+    BAO_ID_REGEX,
+    DOI_REGEX,
+    UNIPROT_ID_REGEX,
+    InvalidValuesError,
+)
+from bioetl.domain.transform.normalizers.identifiers import (
+    normalize_bao_id,
+    normalize_bao_label,
+    normalize_chembl_id,
+    normalize_doi,
+    normalize_pcid,
+    normalize_pmid,
+    normalize_uniprot,
+)
+
+_CHEMBL_BODY_REGEX = re.compile(r"CHEMBL(\d+)")
+_DOI_URL_PREFIX_REGEX = re.compile(r"^(https?://)?(dx\.)?doi\.org/")
+_PCID_PREFIX_REGEX = re.compile(r"^(?:CID|PCID)")
+
+
+def normalize_chembl_id_series(values: pd.Series) -> pd.Series:
+    """Векторный ``normalize_chembl_id``: CHEMBL<digits> в верхнем регистре."""
+    text = values.str.strip().str.upper()
+    blank = text == ""
+    text = text.mask(text.str.isdigit(), "CHEMBL" + text)
+    invalid = ~blank & ~text.str.fullmatch(_CHEMBL_BODY_REGEX)
+    _raise_invalid(values, invalid, normalize_chembl_id)
+    return text.mask(blank, None)
+
+
+def normalize_bao_id_series(values: pd.Series) -> pd.Series:
+    """Векторный ``normalize_bao_id``: BAO_<digits> в верхнем регистре."""
+    text = values.str.strip().str.upper()
+    blank = text == ""
+    invalid = ~blank & ~text.str.match(BAO_ID_REGEX)
+    _raise_invalid(values, invalid, normalize_bao_id)
+    return text.mask(blank, None)
+
+
+def normalize_bao_label_series(values: pd.Series) -> pd.Series:
+    """Векторный ``normalize_bao_label``: только trim."""
+    text = values.str.strip()
+    return text.mask(text == "", None)
+
+
+def normalize_doi_series(values: pd.Series) -> pd.Series:
+    """Векторный ``normalize_doi``: нижний регистр без URL/``doi:`` префиксов."""
+    doi = (
+        values.str.strip()
+        .str.lower()
+        .str.replace(_DOI_URL_PREFIX_REGEX, "", regex=True)
+    )
+    doi = doi.mask(doi.str.startswith("doi:"), doi.str.slice(4))
+    blank = doi == ""
+    invalid = ~blank & ~doi.str.match(DOI_REGEX)
+    _raise_invalid(values, invalid, normalize_doi)
+    return doi.mask(blank, None)
+
+
+def normalize_uniprot_series(values: pd.Series) -> pd.Series:
+    """Векторный ``normalize_uniprot`` со строгой проверкой формата."""
+    accession = values.str.strip().str.upper()
+    blank = accession == ""
+    invalid = ~blank & ~accession.str.match(UNIPROT_ID_REGEX)
+    _raise_invalid(values, invalid, normalize_uniprot)
+    return accession.mask(blank, None)
+
+
+def normalize_pmid_series(values: pd.Series) -> pd.Series:
+    """Векторный ``normalize_pmid`` для строковых значений."""
+    text = values.str.strip()
+    return _positive_ints(text, text == "", values, normalize_pmid)
+
+
+def normalize_pcid_series(values: pd.Series) -> pd.Series:
+    """Векторный ``normalize_pcid``: префиксы CID/PCID отбрасываются."""
+    text = values.str.strip().str.upper()
+    digits = text.str.replace(_PCID_PREFIX_REGEX, "", n=1, regex=True)
+    return _positive_ints(digits, text == "", values, normalize_pcid)
+
+
+def _positive_ints(
+    digits: pd.Series,
+    blank: pd.Series,
+    values: pd.Series,
+    scalar: Callable[[Any], Any],
+) -> pd.Series:
+    # isdecimal, а не isdigit: int() не разбирает надстрочные цифры вроде "²".
+    numeric = ~blank & digits.str.isdecimal()
+    parsed = digits[numeric].map(int)
+    invalid = (~blank & ~numeric) | (parsed <= 0).reindex(
+        values.index, fill_value=False
+    )
+    _raise_invalid(values, invalid, scalar)
+    result = np.full(len(values), None, dtype=object)
+    result[numeric.to_numpy()] = parsed.to_numpy(dtype=object)
+    return pd.Series(result, index=values.index, dtype=object)
+
+
+def _raise_invalid(
+    values: pd.Series, invalid: pd.Series, scalar: Callable[[Any], Any]
+) -> None:
+    if not invalid.any():
+        return
+    rejected = values[invalid]
+    # Текст ошибки берется у поэлементного нормализатора — как без векторизации.
+    try:
+        scalar(rejected.iloc[0])
+    except ValueError as exc:
+        reason = str(exc)
+    else:  # pragma: no cover - векторная проверка строже поэлементной
+        reason = f"Неверное значение: '{rejected.iloc[0]}'"
+    raise InvalidValuesError(reason, rejected.to_dict())
+
+
+SERIES_NORMALIZERS: dict[Callable[[Any], Any], Callable[[pd.Series], pd.Series]] = {
+    normalize_chembl_id: normalize_chembl_id_series,
+    normalize_bao_id: normalize_bao_id_series,
+    normalize_bao_label: normalize_bao_label_series,
+    normalize_doi: normalize_doi_series,
+    normalize_uniprot: normalize_uniprot_series,
+    normalize_pmid: normalize_pmid_series,
+    normalize_pcid: normalize_pcid_series,
+}
+
+
+__all__ = [
+    "SERIES_NORMALIZERS",
+    "normalize_bao_id_series",
+    "normalize_bao_label_series",
+    "normalize_chembl_id_series",
+    "normalize_doi_series",
+    "normalize_pcid_series",
+    "normalize_pmid_series",
+    "normalize_uniprot_series",
+]
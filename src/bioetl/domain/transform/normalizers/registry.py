@@ -2,10 +2,13 @@
 
 from typing import Any, Callable
 
+import pandas as pd
+
 from bioetl.domain.transform.normalizers.collections import (
     normalize_cross_references,
     normalize_target_components,
 )
+from bioetl.domain.transform.normalizers.identifier_series import SERIES_NORMALIZERS
 from bioetl.domain.transform.normalizers.identifiers import (
     normalize_bao_id,
     normalize_bao_label,
@@ -55,8 +58,27 @@ def get_normalizer(field_name: str) -> Callable[[Any], Any] | None:
     return CUSTOM_FIELD_NORMALIZERS.get(field_name)
 
 
+def register_series_normalizer(
+    func: Callable[[Any], Any], series_func: Callable[[pd.Series], pd.Series]
+) -> None:
+    """Register a column-level counterpart for a per-value normalizer."""
+    SERIES_NORMALIZERS[func] = series_func
+
+
+def get_series_normalizer(
+    func: Callable[[Any], Any] | None,
+) -> Callable[[pd.Series], pd.Series] | None:
+    """Column-level counterpart of a per-value normalizer, if registered."""
+    if func is None:
+        return None
+    return SERIES_NORMALIZERS.get(func)
+
+
 __all__ = [
     "CUSTOM_FIELD_NORMALIZERS",
+    "SERIES_NORMALIZERS",
     "register_normalizer",
     "get_normalizer",
+    "register_series_normalizer",
+    "get_series_normalizer",
 ]
@@ -16,27 +16,73 @@ from bioetl.domain.transform.contracts import HashServiceABC
 class TransformerABC(ABC):
     """Базовый интерфейс для DataFrame-трансформеров."""
 
+    #: Результат зависит от порядка чанков или общего состояния запуска
+    #: (сквозной индекс, единый timestamp) и не может считаться в воркере.
+    order_dependent: bool = False
+
     @abstractmethod
     def apply(
         self, df: pd.DataFrame, context: RunContext | None = None
     ) -> pd.DataFrame:
         """Выполняет преобразование DataFrame."""
 
+    def apply_inplace(
+        self, df: pd.DataFrame, context: RunContext | None = None
+    ) -> pd.DataFrame:
+        """
+        Преобразует кадр, которым владеет вызывающий (``TransformerChain``).
+
+        Реализация может добавлять и заменять колонки ``df`` на месте вместо
+        копирования; по умолчанию — ``apply``.
+        """
+        return self.apply(df, context)
+
+    def order_dependent_part(self) -> TransformerABC | None:
+        """
+        Часть преобразования, которую нужно повторить в порядке чанков.
+
+        Повторное применение перезаписывает уже добавленные колонки,
+        поэтому такие трансформеры не должны влиять на последующие.
+        """
+        return self if self.order_dependent else None
+
 
 class TransformerChain(TransformerABC):
-    """Комбинирует несколько трансформеров в последовательность."""
+    """
+    Комбинирует несколько трансформеров в последовательность.
+
+    Цепочка работает с одним рабочим кадром: ``apply`` делает поверхностную
+    копию входа (без копирования данных), и шаги меняют ее через
+    ``apply_inplace``. Входной кадр при этом не меняется, пока шаги только
+    добавляют или заменяют колонки.
+    """
 
     def __init__(self, transformers: list[TransformerABC]) -> None:
         self._transformers = transformers
 
     def apply(
         self, df: pd.DataFrame, context: RunContext | None = None
+    ) -> pd.DataFrame:
+        return self.apply_inplace(df.copy(deep=False), context)
+
+    def apply_inplace(
+        self, df: pd.DataFrame, context: RunContext | None = None
     ) -> pd.DataFrame:
         result = df
         for transformer in self._transformers:
-            result = transformer.apply(result, context)
+            result = transformer.apply_inplace(result, context)
         return result
 
+    def order_dependent_part(self) -> TransformerABC | None:
+        parts = [
+            part
+            for transformer in self._transformers
+            if (part := transformer.order_dependent_part()) is not None
+        ]
+        if not parts:
+            return None
+        return TransformerChain(parts)
+
 
 class HashColumnsTransformer(TransformerABC):
     """Добавляет hash_business_key и hash_row."""
@@ -50,17 +96,27 @@ class HashColumnsTransformer(TransformerABC):
     def apply(
         self, df: pd.DataFrame, context: RunContext | None = None
     ) -> pd.DataFrame:
+        return self._apply(df, copy=True)
+
+    def apply_inplace(
+        self, df: pd.DataFrame, context: RunContext | None = None
+    ) -> pd.DataFrame:
+        return self._apply(df, copy=False)
+
+    def _apply(self, df: pd.DataFrame, *, copy: bool) -> pd.DataFrame:
         if df.empty:
             return df.assign(hash_business_key=None, hash_row=None)
 
         return self._hash_service.add_hash_columns(
-            df, business_key_cols=self._business_key_fields
+            df, business_key_cols=self._business_key_fields, copy=copy
         )
 
 
 class IndexColumnTransformer(TransformerABC):
     """Добавляет индексную колонку."""
 
+    order_dependent = True
+
     def __init__(self, hash_service: HashServiceABC) -> None:
         self._hash_service = hash_service
 
@@ -69,6 +125,11 @@ class IndexColumnTransformer(TransformerABC):
     ) -> pd.DataFrame:
         return self._hash_service.add_index_column(df)
 
+    def apply_inplace(
+        self, df: pd.DataFrame, context: RunContext | None = None
+    ) -> pd.DataFrame:
+        return self._hash_service.add_index_column(df, copy=False)
+
 
 class DatabaseVersionTransformer(TransformerABC):
     """Добавляет колонку с версией базы данных."""
@@ -84,15 +145,25 @@ class DatabaseVersionTransformer(TransformerABC):
     def apply(
         self, df: pd.DataFrame, context: RunContext | None = None
     ) -> pd.DataFrame:
+        return self._apply(df, copy=True)
+
+    def apply_inplace(
+        self, df: pd.DataFrame, context: RunContext | None = None
+    ) -> pd.DataFrame:
+        return self._apply(df, copy=False)
+
+    def _apply(self, df: pd.DataFrame, *, copy: bool) -> pd.DataFrame:
         version = self._database_version_provider()
         if version is None:
             return df
-        return self._hash_service.add_database_version_column(df, version)
+        return self._hash_service.add_database_version_column(df, version, copy=copy)
 
 
 class FulldateTransformer(TransformerABC):
     """Добавляет колонку extracted_at с таймстампом."""
 
+    order_dependent = True
+
     def __init__(self, hash_service: HashServiceABC) -> None:
         self._hash_service = hash_service
 
@@ -101,6 +172,11 @@ class FulldateTransformer(TransformerABC):
     ) -> pd.DataFrame:
         return self._hash_service.add_fulldate_column(df)
 
+    def apply_inplace(
+        self, df: pd.DataFrame, context: RunContext | None = None
+    ) -> pd.DataFrame:
+        return self._hash_service.add_fulldate_column(df, copy=False)
+
 
 __all__ = [
     "TransformerABC",
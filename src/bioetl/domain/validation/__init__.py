@@ -10,14 +10,17 @@ from bioetl.domain.validation.contracts import (
     ValidatorABC,
     ValidatorFactoryABC,
 )
+from bioetl.domain.validation.plan import SchemaPlan, build_schema_plan
 from bioetl.domain.validation.service import ValidationService
 
 __all__ = [
     "SchemaProviderABC",
+    "SchemaPlan",
     "SchemaProviderFactoryABC",
     "SchemaType",
     "ValidationResult",
     "ValidatorABC",
     "ValidatorFactoryABC",
     "ValidationService",
+    "build_schema_plan",
 ]
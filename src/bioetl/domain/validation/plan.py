@@ -0,0 +1,43 @@
+"""
+Предвычисленный план схемы.
+
+Transformer на каждом чанке обращается к одним и тем же свойствам схемы:
+порядку колонок и обязательным (non-nullable) колонкам. План собирается
+один раз на имя схемы и переиспользуется всеми чанками запуска.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+from bioetl.domain.validation.contracts import SchemaType
+
+
+@dataclass(frozen=True)
+class SchemaPlan:
+    """Свойства схемы, нужные на горячем пути обработки чанка."""
+
+    name: str
+    columns: tuple[str, ...]
+    required: tuple[str, ...] = ()
+
+
+def build_schema_plan(name: str, schema: SchemaType, columns: list[str]) -> SchemaPlan:
+    """
+    Строит план по схеме с интерфейсом ``to_schema()`` (Pandera DataFrameModel).
+
+    Для схем без него план содержит только порядок колонок.
+    """
+    compiled = schema.to_schema() if hasattr(schema, "to_schema") else schema
+    schema_columns: dict[str, Any] = dict(getattr(compiled, "columns", None) or {})
+
+    required = tuple(
+        column_name
+        for column_name, column in schema_columns.items()
+        if not getattr(column, "nullable", True)
+    )
+    return SchemaPlan(name=name, columns=tuple(columns), required=required)
+
+
+__all__ = ["SchemaPlan", "build_schema_plan"]
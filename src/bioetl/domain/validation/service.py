@@ -4,6 +4,7 @@ from bioetl.domain.validation.contracts import (
     SchemaProviderABC,
     SchemaType,
     ValidationResult,
+    ValidatorABC,
     ValidatorFactoryABC,
 )
 
@@ -11,6 +12,9 @@ from bioetl.domain.validation.contracts import (
 class ValidationService:
     """
     Сервис валидации данных, работающий через доменные интерфейсы.
+
+    Валидаторы кэшируются по имени схемы: фабрика вызывается один раз за
+    время жизни сервиса, а не на каждый чанк.
     """
 
     def __init__(
@@ -21,6 +25,7 @@ class ValidationService:
     ) -> None:
         self._schema_provider = schema_provider
         self._validator_factory = validator_factory
+        self._validators: dict[str, ValidatorABC] = {}
 
     def get_schema(self, entity_name: str) -> SchemaType:
         """Возвращает схему для сущности."""
@@ -30,6 +35,15 @@ class ValidationService:
         """Возвращает упорядоченный список колонок схемы."""
         return self._schema_provider.get_schema_columns(entity_name)
 
+    def get_validator(self, entity_name: str) -> ValidatorABC:
+        """Возвращает закэшированный валидатор схемы."""
+        validator = self._validators.get(entity_name)
+        if validator is None:
+            schema = self._schema_provider.get_schema(entity_name)
+            validator = self._validator_factory.create_validator(schema)
+            self._validators[entity_name] = validator
+        return validator
+
     def validate(self, df: pd.DataFrame, entity_name: str) -> pd.DataFrame:
         """
         Валидирует DataFrame по схеме, используя валидатор фабрики.
@@ -40,9 +54,7 @@ class ValidationService:
         Raises:
             ValueError: если валидация не пройдена.
         """
-        schema = self._schema_provider.get_schema(entity_name)
-        validator = self._validator_factory.create_validator(schema)
-        result: ValidationResult = validator.validate(df)
+        result: ValidationResult = self.get_validator(entity_name).validate(df)
 
         if not result.is_valid:
             raise ValueError(f"Validation failed for {entity_name}: {result.errors}")
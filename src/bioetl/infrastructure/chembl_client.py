@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from bioetl.domain.clients.chembl.contracts import ChemblDataClientABC
 from bioetl.domain.clients.ports.chembl_extraction_port import ChemblExtractionPort
-from bioetl.domain.configs import ChemblSourceConfig
+from bioetl.domain.configs import ChemblSourceConfig, StorageConfig
 from bioetl.infrastructure.clients.chembl.factories import (
     default_chembl_client,
     default_chembl_extraction_service,
@@ -13,10 +13,12 @@ from bioetl.infrastructure.clients.chembl.factories import (
 __all__ = ["create_client", "create_extraction_service"]
 
 
-def create_client(config: ChemblSourceConfig) -> ChemblDataClientABC:
+def create_client(
+    config: ChemblSourceConfig, *, storage: StorageConfig | None = None
+) -> ChemblDataClientABC:
     """Create a fully configured ChEMBL client from source config."""
 
-    return default_chembl_client(config)
+    return default_chembl_client(config, storage=storage)
 
 
 def create_extraction_service(
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any
+
+from bioetl.domain.errors import ClientNetworkError
+from bioetl.infrastructure.clients.middleware import HttpClientMiddleware
+
+__all__ = ["AsyncHttpClientMiddleware"]
+
+
+class AsyncHttpClientMiddleware(HttpClientMiddleware):
+    """
+    Asyncio-вариант HttpClientMiddleware.
+
+    Политики ретраев, circuit breaker, логирование и метрики общие с
+    синхронным middleware; отличаются только awaitable-транспорт
+    (``base_client.request`` — корутина) и ожидание backoff через
+    ``asyncio.sleep``, которое не блокирует остальные запросы.
+    """
+
+    async def request_async(self, method: str, url: str, **kwargs: Any) -> Any:
+        total_retry_delay = 0.0
+        for attempt in range(1, self.max_attempts + 1):
+            self._ensure_circuit_allows_request(method, url)
+            attempt_kwargs = dict(kwargs)
+            start = time.perf_counter()
+            try:
+                with self._in_flight.track_inprogress():
+                    response = await self.base_client.request(
+                        method=method,
+                        url=url,
+                        timeout=attempt_kwargs.pop("timeout", self.timeout),
+                        **attempt_kwargs,
+                    )
+            except Exception as exc:  # pylint: disable=broad-except
+                outcome = self._evaluate_exception(
+                    exc,
+                    method,
+                    url,
+                    time.perf_counter() - start,
+                    attempt,
+                    total_retry_delay,
+                )
+            else:
+                outcome = self._evaluate_response(
+                    response,
+                    method,
+                    url,
+                    time.perf_counter() - start,
+                    attempt,
+                    total_retry_delay,
+                )
+
+            resolved_response = self._resolve_attempt_outcome(outcome)
+            if resolved_response is not None:
+                self._reset_circuit(log_circuit_closure=True)
+                return resolved_response
+
+            total_retry_delay = outcome["total_retry_delay"]
+            await asyncio.sleep(outcome["retry_delay"])
+
+        raise ClientNetworkError(
+            provider=self.provider, endpoint=url, message="Max attempts exceeded"
+        )
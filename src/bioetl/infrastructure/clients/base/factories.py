@@ -1,14 +1,23 @@
 import os
+from pathlib import Path
 from typing import Any
 
 from bioetl.domain.clients.base.contracts import (
+    AdaptiveRateLimiterABC,
+    AsyncRateLimiterABC,
     CacheABC,
     RateLimiterABC,
     RetryPolicyABC,
     SecretProviderABC,
 )
-from bioetl.infrastructure.clients.base.impl.cache import MemoryCacheImpl
+from bioetl.domain.configs import StorageConfig
+from bioetl.infrastructure.clients.base.impl.cache import (
+    CompressedJsonFileCacheImpl,
+    MemoryCacheImpl,
+)
 from bioetl.infrastructure.clients.base.impl.rate_limiter import (
+    AdaptiveRateLimiterImpl,
+    AsyncTokenBucketRateLimiterImpl,
     TokenBucketRateLimiterImpl,
 )
 from bioetl.infrastructure.clients.base.impl.retry_policy import (
@@ -29,6 +38,25 @@ def default_rate_limiter(rate: float = 10.0, capacity: float = 20.0) -> RateLimi
     return TokenBucketRateLimiterImpl(rate, capacity)
 
 
+def default_adaptive_rate_limiter(
+    rate: float = 10.0,
+    capacity: float = 20.0,
+    *,
+    provider: str = "unknown",
+) -> AdaptiveRateLimiterABC:
+    """Create the AIMD rate limiter tuned by 429/Retry-After and latency."""
+
+    return AdaptiveRateLimiterImpl(rate, capacity, provider=provider)
+
+
+def default_async_rate_limiter(
+    rate: float = 10.0, capacity: float = 20.0
+) -> AsyncRateLimiterABC:
+    """Create the asyncio rate limiter with token bucket semantics."""
+
+    return AsyncTokenBucketRateLimiterImpl(TokenBucketRateLimiterImpl(rate, capacity))
+
+
 def default_retry_policy() -> RetryPolicyABC:
     """Provide a resilient retry policy with exponential backoff."""
 
@@ -41,6 +69,20 @@ def default_cache() -> CacheABC[Any]:
     return MemoryCacheImpl()
 
 
+def default_response_cache(
+    storage: StorageConfig, *, provider: str
+) -> CacheABC[Any] | None:
+    """Build the persistent HTTP response cache, or None when it is disabled."""
+
+    settings = storage.response_cache
+    if not settings.enabled:
+        return None
+    return CompressedJsonFileCacheImpl(
+        Path(storage.cache_path) / "http" / provider,
+        max_bytes=settings.max_size_mb * 1024 * 1024,
+    )
+
+
 def default_secret_provider() -> SecretProviderABC:
     """Expose the environment-backed secret provider implementation."""
 
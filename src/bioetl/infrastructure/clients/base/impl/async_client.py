@@ -0,0 +1,115 @@
+"""
+Asyncio HTTP client implementation.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+from weakref import WeakKeyDictionary
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from bioetl.domain.clients.base.contracts import AdaptiveRateLimiterABC
+from bioetl.domain.configs import ClientConfig
+from bioetl.infrastructure.clients.async_middleware import AsyncHttpClientMiddleware
+
+
+class AsyncRequestsTransport:
+    """
+    Awaitable-транспорт поверх ``requests.Session``.
+
+    Запросы выполняются в ограниченном пуле потоков, а пул соединений
+    сессии имеет тот же размер, поэтому одновременно в сети находится
+    не более ``max_connections`` запросов. Ожидающие корутины стоят
+    в очереди семафора и не занимают потоки.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_connections: int = 10,
+        session: requests.Session | None = None,
+    ) -> None:
+        if max_connections < 1:
+            raise ValueError("max_connections must be positive")
+        self.max_connections = max_connections
+        self.session = session or requests.Session()
+        if session is None:
+            adapter = HTTPAdapter(
+                pool_connections=max_connections, pool_maxsize=max_connections
+            )
+            self.session.mount("http://", adapter)
+            self.session.mount("https://", adapter)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_connections, thread_name_prefix="bioetl-async-http"
+        )
+        # asyncio-примитивы привязаны к event loop, поэтому семафор — на каждый loop.
+        self._semaphores: WeakKeyDictionary[
+            asyncio.AbstractEventLoop, asyncio.Semaphore
+        ] = WeakKeyDictionary()
+
+    async def request(self, method: str, url: str, **kwargs: Any) -> Any:
+        loop = asyncio.get_running_loop()
+        async with self._semaphore(loop):
+            return await loop.run_in_executor(
+                self._executor,
+                functools.partial(self.session.request, method, url, **kwargs),
+            )
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True)
+        self.session.close()
+
+    def _semaphore(self, loop: asyncio.AbstractEventLoop) -> asyncio.Semaphore:
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_connections)
+            self._semaphores[loop] = semaphore
+        return semaphore
+
+
+class AsyncUnifiedAPIClient:
+    """
+    Унифицированный asyncio HTTP-клиент.
+    Async-аналог UnifiedAPIClient с теми же политиками из ClientConfig.
+    """
+
+    def __init__(
+        self,
+        provider: str,
+        config: ClientConfig,
+        transport: Any | None = None,
+        rate_limiter: AdaptiveRateLimiterABC | None = None,
+    ) -> None:
+        self.provider = provider
+        self.config = config
+        self.transport = transport or AsyncRequestsTransport(
+            max_connections=config.max_connections
+        )
+        self.middleware = AsyncHttpClientMiddleware(
+            provider=provider,
+            base_client=self.transport,
+            max_attempts=config.max_retries,
+            backoff_factor=config.backoff_factor,
+            timeout=config.timeout,
+            circuit_breaker_threshold=config.circuit_breaker_threshold,
+            circuit_breaker_recovery_time=config.circuit_breaker_recovery_time,
+            rate_limiter=rate_limiter,
+        )
+
+    async def request(self, method: str, url: str, **kwargs: Any) -> Any:
+        """Выполнить HTTP-запрос с учетом политик."""
+        return await self.middleware.request_async(method, url, **kwargs)
+
+    async def get(self, url: str, **kwargs: Any) -> Any:
+        """GET запрос."""
+        return await self.request("GET", url, **kwargs)
+
+    def close(self) -> None:
+        """Закрыть соединения и пул потоков."""
+        if hasattr(self.transport, "close"):
+            self.transport.close()
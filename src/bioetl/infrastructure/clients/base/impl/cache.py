@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+import gzip
 import hashlib
+import json
 import os
 import pickle
+import threading
 import time
+import zlib
 from pathlib import Path
-from typing import TypeVar
+from typing import Any, TypeVar
 
 from bioetl.domain.clients.base.contracts import CacheABC
 
@@ -102,3 +106,118 @@ class FileCacheImpl(CacheABC[T]):
         digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
         safe_name = f"{digest}.cache"
         return self._cache_dir / safe_name
+
+
+class CompressedJsonFileCacheImpl(CacheABC[Any]):
+    """
+    Файловый кэш JSON-ответов: gzip, TTL и LRU-вытеснение по размеру.
+
+    Время последнего обращения хранится в mtime файла; при превышении
+    ``max_bytes`` удаляются записи, к которым дольше всего не обращались.
+    """
+
+    _SUFFIX = ".json.gz"
+
+    def __init__(
+        self,
+        cache_dir: str | Path,
+        *,
+        max_bytes: int = 1024 * 1024 * 1024,
+        compresslevel: int = 6,
+    ) -> None:
+        self._cache_dir = Path(cache_dir)
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+        self._max_bytes = max_bytes
+        self._compresslevel = compresslevel
+        self._lock = threading.Lock()
+        self._size_bytes = sum(
+            path.stat().st_size for path in self._cache_dir.glob(f"*{self._SUFFIX}")
+        )
+
+    @property
+    def size_bytes(self) -> int:
+        """Текущий размер кэша на диске."""
+        return self._size_bytes
+
+    def get(self, key: str) -> Any | None:
+        cache_file = self._key_to_path(key)
+        try:
+            with gzip.open(cache_file, "rt", encoding="utf-8") as fh:
+                payload = json.load(fh)
+        except FileNotFoundError:
+            return None
+        except (OSError, EOFError, zlib.error, ValueError):
+            self.invalidate(key)
+            return None
+
+        if not isinstance(payload, dict) or _is_expired(payload.get("expires_at")):
+            self.invalidate(key)
+            return None
+
+        try:
+            os.utime(cache_file)  # отметка для LRU
+        except OSError:
+            pass
+        return payload.get("value")
+
+    def set(self, key: str, value: Any, ttl: int | None = None) -> None:
+        payload = {"expires_at": _get_expiry_timestamp(ttl), "value": value}
+        data = gzip.compress(
+            json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode(
+                "utf-8"
+            ),
+            compresslevel=self._compresslevel,
+            mtime=0,
+        )
+        cache_file = self._key_to_path(key)
+        tmp_file = cache_file.with_name(
+            f"{cache_file.name}.{threading.get_ident()}.tmp"
+        )
+        tmp_file.write_bytes(data)
+        with self._lock:
+            self._size_bytes -= _file_size(cache_file)
+            os.replace(tmp_file, cache_file)
+            self._size_bytes += len(data)
+            if self._size_bytes > self._max_bytes:
+                self._evict()
+
+    def invalidate(self, key: str) -> None:
+        cache_file = self._key_to_path(key)
+        with self._lock:
+            size = _file_size(cache_file)
+            cache_file.unlink(missing_ok=True)
+            self._size_bytes -= size
+
+    def clear(self) -> None:
+        with self._lock:
+            for cache_file in self._cache_dir.glob(f"*{self._SUFFIX}"):
+                cache_file.unlink(missing_ok=True)
+            self._size_bytes = 0
+
+    def _evict(self) -> None:
+        entries = []
+        for path in self._cache_dir.glob(f"*{self._SUFFIX}"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        entries.sort(key=lambda entry: entry[0])
+
+        self._size_bytes = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if self._size_bytes <= self._max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            self._size_bytes -= size
+
+    def _key_to_path(self, key: str) -> Path:
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return self._cache_dir / f"{digest}{self._SUFFIX}"
+
+
+def _file_size(path: Path) -> int:
+    try:
+        return path.stat().st_size
+    except OSError:
+        return 0
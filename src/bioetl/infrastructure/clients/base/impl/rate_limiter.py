@@ -1,7 +1,13 @@
+import asyncio
 import time
 from threading import Lock
 
-from bioetl.domain.clients.base.contracts import RateLimiterABC
+from bioetl.domain.clients.base.contracts import (
+    AdaptiveRateLimiterABC,
+    AsyncRateLimiterABC,
+    RateLimiterABC,
+)
+from bioetl.infrastructure.observability import metrics
 
 
 class TokenBucketRateLimiterImpl(RateLimiterABC):
@@ -22,14 +28,23 @@ class TokenBucketRateLimiterImpl(RateLimiterABC):
         return self._rate
 
     def acquire(self) -> None:
+        # Ждем вне блокировки: другие потоки в это время получают токены.
+        while (delay := self.reserve()) > 0:
+            time.sleep(delay)
+
+    def reserve(self) -> float:
+        """
+        Забирает токен без ожидания.
+
+        Returns:
+            ``0.0``, если токен получен, иначе время до появления токена.
+        """
         with self._lock:
-            while True:
-                self._refill()
-                if self._tokens >= 1:
-                    self._tokens -= 1
-                    return
-                # Wait for enough tokens
-                time.sleep(1.0 / self._rate)
+            self._refill()
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            return (1.0 - self._tokens) / self._rate
 
     def wait_if_needed(self) -> None:
         # Simplified check, acquire does the waiting
@@ -42,3 +57,113 @@ class TokenBucketRateLimiterImpl(RateLimiterABC):
         if new_tokens > 0:
             self._tokens = min(self._capacity, self._tokens + new_tokens)
             self._last_refill = now
+
+
+class AdaptiveRateLimiterImpl(TokenBucketRateLimiterImpl, AdaptiveRateLimiterABC):
+    """
+    Token Bucket с AIMD-подстройкой скорости по ответам сервера.
+
+    Быстрые успешные ответы повышают скорость аддитивно (примерно на
+    ``increase_step`` токенов/с за секунду запросов), троттлинг (429/503,
+    ``Retry-After``) снижает ее в ``decrease_factor`` раз. Снижения чаще
+    ``decrease_cooldown`` сек. считаются одним событием: ответы на уже
+    отправленные запросы не режут скорость повторно. Текущая скорость
+    публикуется в gauge ``bioetl_http_rate_limit_per_second``.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float,
+        *,
+        min_rate: float = 1.0,
+        max_rate: float | None = None,
+        increase_step: float = 1.0,
+        decrease_factor: float = 0.5,
+        latency_threshold: float | None = 2.0,
+        decrease_cooldown: float = 1.0,
+        provider: str = "unknown",
+    ) -> None:
+        if min_rate <= 0:
+            raise ValueError("min_rate must be positive")
+        if max_rate is not None and max_rate < min_rate:
+            raise ValueError("max_rate must be >= min_rate")
+        if not 0 < decrease_factor < 1:
+            raise ValueError("decrease_factor must be in (0, 1)")
+        self._min_rate = min_rate
+        self._max_rate = max_rate
+        super().__init__(self._clamp(rate), capacity)
+        self._increase_step = increase_step
+        self._decrease_factor = decrease_factor
+        self._latency_threshold = latency_threshold
+        self._decrease_cooldown = decrease_cooldown
+        self._last_decrease: float | None = None
+        self._paused_until = 0.0
+        self._gauge = metrics.HTTP_RATE_LIMIT.labels(provider=provider)
+        self._gauge.set(self._rate)
+
+    def on_success(self, latency: float) -> None:
+        if self._latency_threshold is not None and latency > self._latency_threshold:
+            return
+        with self._lock:
+            now = time.monotonic()
+            if self._in_cooldown(now):
+                return
+            self._set_rate_locked(self._rate + self._increase_step / self._rate)
+
+    def on_throttle(self, retry_after: float | None = None) -> None:
+        with self._lock:
+            now = time.monotonic()
+            if retry_after is not None and retry_after > 0:
+                self._paused_until = max(self._paused_until, now + retry_after)
+            if self._in_cooldown(now):
+                return
+            self._last_decrease = now
+            self._set_rate_locked(self._rate * self._decrease_factor)
+
+    def reserve(self) -> float:
+        # Retry-After приостанавливает выдачу токенов до указанного момента.
+        with self._lock:
+            pause = self._paused_until - time.monotonic()
+            if pause > 0:
+                return pause
+        return super().reserve()
+
+    def _in_cooldown(self, now: float) -> bool:
+        return (
+            self._last_decrease is not None
+            and now - self._last_decrease < self._decrease_cooldown
+        )
+
+    def _set_rate_locked(self, rate: float) -> None:
+        # Накопленные по старой скорости токены начисляются до ее смены.
+        self._refill()
+        self._rate = self._clamp(rate)
+        self._gauge.set(self._rate)
+
+    def _clamp(self, rate: float) -> float:
+        rate = max(self._min_rate, rate)
+        if self._max_rate is not None:
+            rate = min(self._max_rate, rate)
+        return rate
+
+
+class AsyncTokenBucketRateLimiterImpl(AsyncRateLimiterABC):
+    """
+    Token Bucket для asyncio: ожидает токен через ``asyncio.sleep``.
+
+    Может разделять корзину с синхронным лимитером, чтобы sync- и
+    async-запросы клиента укладывались в один общий лимит.
+    """
+
+    def __init__(self, bucket: TokenBucketRateLimiterImpl) -> None:
+        self._bucket = bucket
+
+    @property
+    def rate(self) -> float:
+        """Get the rate limit (tokens per second)."""
+        return self._bucket.rate
+
+    async def acquire(self) -> None:
+        while (delay := self._bucket.reserve()) > 0:
+            await asyncio.sleep(delay)
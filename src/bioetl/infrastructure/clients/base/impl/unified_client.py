@@ -9,6 +9,7 @@ from uuid import uuid4
 
 import requests
 
+from bioetl.domain.clients.base.contracts import AdaptiveRateLimiterABC
 from bioetl.domain.configs import ClientConfig
 from bioetl.infrastructure.clients.middleware import HttpClientMiddleware
 
@@ -24,6 +25,7 @@ class UnifiedAPIClient:
         provider: str,
         config: ClientConfig,
         base_client: Any | None = None,
+        rate_limiter: AdaptiveRateLimiterABC | None = None,
     ) -> None:
         self.provider = provider
         self.config = config
@@ -40,6 +42,7 @@ class UnifiedAPIClient:
             timeout=config.timeout,
             circuit_breaker_threshold=config.circuit_breaker_threshold,
             circuit_breaker_recovery_time=config.circuit_breaker_recovery_time,
+            rate_limiter=rate_limiter,
         )
 
     def request(self, method: str, url: str, **kwargs: Any) -> Any:
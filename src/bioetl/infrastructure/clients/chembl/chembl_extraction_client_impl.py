@@ -12,8 +12,16 @@ from bioetl.infrastructure.clients.chembl.impl.chembl_extraction_service_impl im
 class ChemblExtractionClientImpl(ChemblExtractionServiceImpl, ChemblExtractionPort):
     """ChEMBL extraction client implementing the domain port."""
 
-    def __init__(self, client: ChemblDataClientABC, *, batch_size: int = 1000) -> None:
-        super().__init__(client=client, batch_size=batch_size)
+    def __init__(
+        self,
+        client: ChemblDataClientABC,
+        *,
+        batch_size: int = 1000,
+        max_in_flight: int = 1,
+    ) -> None:
+        super().__init__(
+            client=client, batch_size=batch_size, max_in_flight=max_in_flight
+        )
 
 
 __all__ = ["ChemblExtractionClientImpl"]
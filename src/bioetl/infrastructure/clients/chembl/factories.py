@@ -6,8 +6,12 @@ from typing import Any
 
 from bioetl.domain.clients.chembl.contracts import ChemblDataClientABC
 from bioetl.domain.clients.ports.chembl_extraction_port import ChemblExtractionPort
-from bioetl.domain.configs import ChemblSourceConfig, ClientConfig
+from bioetl.domain.configs import ChemblSourceConfig, ClientConfig, StorageConfig
+from bioetl.infrastructure.clients.base.factories import default_response_cache
+from bioetl.infrastructure.clients.base.impl.async_client import AsyncUnifiedAPIClient
 from bioetl.infrastructure.clients.base.impl.rate_limiter import (
+    AdaptiveRateLimiterImpl,
+    AsyncTokenBucketRateLimiterImpl,
     TokenBucketRateLimiterImpl,
 )
 from bioetl.infrastructure.clients.base.impl.unified_client import UnifiedAPIClient
@@ -28,6 +32,8 @@ from bioetl.infrastructure.clients.chembl.response_parser import (
 def default_chembl_client(
     source_config: ChemblSourceConfig,
     client_config: ClientConfig | None = None,
+    *,
+    storage: StorageConfig | None = None,
     **options: Any,
 ) -> ChemblDataClientABC:
     """
@@ -36,6 +42,7 @@ def default_chembl_client(
     Args:
         source_config: Конфигурация источника.
         client_config: Конфигурация клиента (опционально).
+        storage: Настройки хранения; включает кэш ответов (опционально).
         **options: Дополнительные опции.
 
     Returns:
@@ -51,21 +58,23 @@ def default_chembl_client(
             rate_limit=source_config.rate_limit_per_sec or 10.0,
         )
 
-    # Create Unified Client
-    unified_client = UnifiedAPIClient(
-        provider="chembl",
-        config=client_config,
-    )
-
     # Allow explicit overrides via kwargs (used in tests and manual runs)
     base_url = str(options.get("base_url", source_config.base_url))
     max_url_length = options.get("max_url_length", source_config.max_url_length)
 
     # Rate limiter for proactive limiting (in addition to middleware backoff)
     # Using explicit rate limiter in client logic
-    rate_limiter = TokenBucketRateLimiterImpl(
-        rate=client_config.rate_limit,
-        capacity=max(1.0, client_config.rate_limit),
+    rate_limiter = _build_rate_limiter(source_config, client_config)
+    # Адаптивный лимитер получает от middleware обратную связь по ответам.
+    feedback = (
+        rate_limiter if isinstance(rate_limiter, AdaptiveRateLimiterImpl) else None
+    )
+
+    # Create Unified Client
+    unified_client = UnifiedAPIClient(
+        provider="chembl",
+        config=client_config,
+        rate_limiter=feedback,
     )
 
     return ChemblDataClientHTTPImpl(
@@ -76,6 +85,34 @@ def default_chembl_client(
         response_parser=ChemblResponseParserImpl(),
         rate_limiter=rate_limiter,
         client=unified_client,
+        async_client=AsyncUnifiedAPIClient(
+            provider="chembl", config=client_config, rate_limiter=feedback
+        ),
+        # Общая корзина: sync- и async-запросы укладываются в один rate limit.
+        async_rate_limiter=AsyncTokenBucketRateLimiterImpl(rate_limiter),
+        response_cache=(
+            default_response_cache(storage, provider="chembl") if storage else None
+        ),
+        response_cache_ttl=storage.response_cache.ttl_sec if storage else None,
+        provider="chembl",
+    )
+
+
+def _build_rate_limiter(
+    source_config: ChemblSourceConfig, client_config: ClientConfig
+) -> TokenBucketRateLimiterImpl:
+    rate = client_config.rate_limit
+    adaptive = source_config.adaptive_rate_limit
+    if not adaptive.enabled:
+        return TokenBucketRateLimiterImpl(rate=rate, capacity=max(1.0, rate))
+    return AdaptiveRateLimiterImpl(
+        rate=rate,
+        capacity=max(1.0, rate),
+        min_rate=min(adaptive.min_rate_per_sec, rate),
+        max_rate=adaptive.max_rate_per_sec,
+        increase_step=adaptive.increase_step,
+        decrease_factor=adaptive.decrease_factor,
+        latency_threshold=adaptive.latency_threshold_sec,
         provider="chembl",
     )
 
@@ -104,4 +141,5 @@ def default_chembl_extraction_service(
         client=client,
         # Allow provider config to set batch_size while keeping a generous hard cap
         batch_size=config.resolve_effective_batch_size(hard_cap=1000),
+        max_in_flight=config.max_concurrent_requests,
     )
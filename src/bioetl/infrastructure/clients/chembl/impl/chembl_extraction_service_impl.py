@@ -5,35 +5,51 @@ Orchestrates data extraction from ChEMBL API using infrastructure clients and
 domain contracts.
 """
 
-from collections.abc import Iterable
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator, Generator, Iterable, Iterator
+from itertools import chain
 from typing import Any, Type
 
 from bioetl.domain.clients.chembl.contracts import ChemblDataClientABC
 from bioetl.domain.contracts import ExtractionServiceABC
+from bioetl.domain.record_source import RecordBatch
 from bioetl.domain.schemas.chembl.models import (
     ActivityModel,
     ChemblRecordModel,
 )
+from bioetl.domain.transform.columnar_records import ColumnarPage, assemble_columns
 from bioetl.infrastructure.clients.chembl.paginator import ChemblPaginatorImpl
+from bioetl.infrastructure.clients.chembl.request_builder import (
+    CHEMBL_ENTITY_ENDPOINTS,
+)
 from bioetl.infrastructure.clients.chembl.response_parser import (
     ChemblResponseParserImpl,
 )
+from bioetl.infrastructure.concurrency import ordered_thread_map
+
+_ENTITY_ENDPOINTS = CHEMBL_ENTITY_ENDPOINTS
 
 
 class ChemblExtractionServiceImpl(ExtractionServiceABC):
     """
     Service to orchestrate data extraction from ChEMBL.
 
-    Handles pagination and record assembly.
+    Handles pagination and record assembly. ``iter_extract_batches`` yields
+    pages as columnar ``RecordBatch`` for the pipeline's record source. Page
+    prefetch in ``iter_extract`` and the async variants keep up to
+    ``max_in_flight`` page or ID-batch requests in flight.
     """
 
     def __init__(
         self,
         client: ChemblDataClientABC,
         batch_size: int = 1000,
+        max_in_flight: int = 1,
     ) -> None:
         self.client = client
         self.batch_size = batch_size
+        self.max_in_flight = max_in_flight
         self.paginator = ChemblPaginatorImpl()
         self.parser = ChemblResponseParserImpl()
 
@@ -80,9 +96,7 @@ class ChemblExtractionServiceImpl(ExtractionServiceABC):
         filter_key: str,
     ) -> dict[str, Any]:
         """Request a batch of records by IDs from the API."""
-        str_ids = ",".join(batch_ids)
-        filter_kwargs = {filter_key: str_ids}
-        return self._request_entity(entity, **filter_kwargs)
+        return self._request_entity(entity, **_batch_filters(filter_key, batch_ids))
 
     def parse_response(self, raw_response: dict[str, Any]) -> list[dict[str, Any]]:
         """Parse raw API response into list of records."""
@@ -91,9 +105,8 @@ class ChemblExtractionServiceImpl(ExtractionServiceABC):
     def serialize_records(
         self, entity: str, records: list[dict[str, Any]]
     ) -> list[dict[str, Any]]:
-        """Serialize records using the entity's Pydantic model."""
-        model_cls = self._get_model_cls(entity)
-        return [model_cls(**record).model_dump() for record in records]
+        """Serialize records as the entity's Pydantic model would dump them."""
+        return self._serialize_records(self._get_model_cls(entity), records)
 
     def extract_all(self, entity: str, **filters: Any) -> list[dict[str, Any]]:
         """
@@ -115,7 +128,27 @@ class ChemblExtractionServiceImpl(ExtractionServiceABC):
     def iter_extract(
         self, entity: str, *, chunk_size: int | None = None, **filters: Any
     ) -> Iterable[list[dict[str, Any]]]:
-        """Stream records for an entity respecting pagination and limits."""
+        """
+        Stream records for an entity respecting pagination and limits.
+
+        Once the first page reports ``page_meta.total_count``, the remaining
+        pages are requested ahead with up to ``max_in_flight`` concurrent
+        requests (through the client's shared rate limiter) and yielded in
+        offset order.
+        """
+        for page in self._iter_pages(entity, chunk_size, filters):
+            yield page.to_records()
+
+    def iter_extract_batches(
+        self, entity: str, *, chunk_size: int | None = None, **filters: Any
+    ) -> Iterable[RecordBatch]:
+        """То же, что ``iter_extract``, но страницы отдаются колонками."""
+        for page in self._iter_pages(entity, chunk_size, filters):
+            yield page.to_batch()
+
+    def _iter_pages(
+        self, entity: str, chunk_size: int | None, filters: dict[str, Any]
+    ) -> Iterator[ColumnarPage]:
         offset = int(filters.pop("offset", 0))
         remaining = filters.pop("limit", None)
         model_cls = self._get_model_cls(entity)
@@ -130,26 +163,199 @@ class ChemblExtractionServiceImpl(ExtractionServiceABC):
             )
 
             response = self._request_entity(entity, **request_filters)
-            batch_records = self.parser.parse(response)
-            if not batch_records:
-                break
+            offset += current_limit
+            plan = self._prefetch_plan(
+                response,
+                start=offset,
+                page_size=page_size,
+                unscheduled=None if remaining is None else remaining - current_limit,
+            )
+            prefetched = self._fetch_pages(entity, filters, plan)
+            try:
+                for response in chain([response], prefetched):
+                    batch_records = self.parser.parse(response)
+                    if not batch_records:
+                        return
+
+                    # Колоночная сборка вместо model_cls(**record).model_dump().
+                    page = assemble_columns(model_cls, batch_records)
+                    if remaining is not None:
+                        page = page.head(remaining)
+
+                    if page.row_count:
+                        yield page
+
+                    if remaining is not None:
+                        remaining -= page.row_count
+                        if remaining <= 0:
+                            return
+
+                    if not self.paginator.has_more(response):
+                        return
+            finally:
+                prefetched.close()
+
+            # total_count вырос во время выгрузки: продолжаем постранично.
+            offset += sum(limit for _, limit in plan)
+
+    def _prefetch_plan(
+        self,
+        response: dict[str, Any],
+        *,
+        start: int,
+        page_size: int,
+        unscheduled: int | None,
+    ) -> list[tuple[int, int]]:
+        if self.max_in_flight <= 1 or not self.paginator.has_more(response):
+            return []
+        return self.paginator.plan_offsets(
+            response, start=start, page_size=page_size, limit=unscheduled
+        )
+
+    def _fetch_pages(
+        self,
+        entity: str,
+        filters: dict[str, Any],
+        plan: list[tuple[int, int]],
+    ) -> Generator[dict[str, Any], None, None]:
+        """Запрашивает страницы плана в пуле потоков, сохраняя порядок offset."""
+        if not plan:
+            return
+
+        def fetch(page: tuple[int, int]) -> dict[str, Any]:
+            offset, limit = page
+            return self._request_entity(
+                entity, **{**filters, "offset": offset, "limit": limit}
+            )
+
+        yield from ordered_thread_map(
+            fetch,
+            plan,
+            max_in_flight=self.max_in_flight,
+            thread_name_prefix="bioetl-chembl-pages",
+        )
+
+    async def iter_extract_async(
+        self,
+        entity: str,
+        *,
+        chunk_size: int | None = None,
+        max_in_flight: int | None = None,
+        **filters: Any,
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """
+        Async-вариант iter_extract с конвейером страниц.
+
+        Следующие страницы запрашиваются заранее (offset известен до ответа),
+        пока обрабатывается текущая; страницы отдаются в порядке offset,
+        поэтому результат совпадает с iter_extract.
+        """
+        offset = int(filters.pop("offset", 0))
+        remaining = filters.pop("limit", None)
+        model_cls = self._get_model_cls(entity)
+        page_size = chunk_size or self.batch_size
+        depth = max(1, max_in_flight or self.max_in_flight)
+
+        pending: deque[asyncio.Future[Any]] = deque()
+        next_offset = offset
+        unscheduled = remaining
+        total_count: int | None = None
 
-            serialized_records = self._serialize_records(model_cls, batch_records)
-            if remaining is not None:
-                serialized_records = serialized_records[:remaining]
+        def schedule() -> None:
+            nonlocal next_offset, unscheduled
+            while len(pending) < depth and (unscheduled is None or unscheduled > 0):
+                if total_count is not None and next_offset >= total_count:
+                    return
+                current_limit, request_filters = self._build_request_filters(
+                    base_filters=filters,
+                    offset=next_offset,
+                    page_size=page_size,
+                    remaining=unscheduled,
+                )
+                pending.append(
+                    asyncio.ensure_future(
+                        self._request_entity_async(entity, **request_filters)
+                    )
+                )
+                next_offset += current_limit
+                if unscheduled is not None:
+                    unscheduled -= current_limit
 
-            if serialized_records:
-                yield serialized_records
+        try:
+            schedule()
+            while pending:
+                response = await pending.popleft()
+                batch_records = self.parser.parse(response)
+                if not batch_records:
+                    break
+
+                serialized_records = self._serialize_records(model_cls, batch_records)
+                if remaining is not None:
+                    serialized_records = serialized_records[:remaining]
+
+                if serialized_records:
+                    yield serialized_records
 
-            if remaining is not None:
-                remaining -= len(serialized_records)
-                if remaining <= 0:
+                if remaining is not None:
+                    remaining -= len(serialized_records)
+                    if remaining <= 0:
+                        break
+
+                if not self.paginator.has_more(response):
                     break
 
-            if not self.paginator.has_more(response):
-                break
+                total_count = _total_count(response)
+                schedule()
+        finally:
+            await _cancel_pending(pending)
 
-            offset += current_limit
+    async def iter_batches_async(
+        self,
+        entity: str,
+        batches: Iterable[list[str]],
+        filter_key: str,
+        *,
+        max_in_flight: int | None = None,
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """
+        Запрашивает батчи ID конвейером и отдает сериализованные записи.
+
+        Батчи возвращаются в порядке ``batches``.
+        """
+        depth = max(1, max_in_flight or self.max_in_flight)
+        pending: deque[asyncio.Future[Any]] = deque()
+        batch_iter = iter(batches)
+
+        def schedule() -> None:
+            while len(pending) < depth:
+                batch_ids = next(batch_iter, None)
+                if batch_ids is None:
+                    return
+                pending.append(
+                    asyncio.ensure_future(
+                        self._request_entity_async(
+                            entity, **_batch_filters(filter_key, batch_ids)
+                        )
+                    )
+                )
+
+        try:
+            schedule()
+            while pending:
+                response = await pending.popleft()
+                schedule()
+                yield self.serialize_records(entity, self.parser.parse(response))
+        finally:
+            await _cancel_pending(pending)
+
+    async def _request_entity_async(self, entity: str, **filters: Any) -> Any:
+        """Async-диспетчеризация запроса; клиенты без async API идут в поток."""
+        if entity not in _ENTITY_ENDPOINTS:
+            raise ValueError(f"Unknown entity: {entity}")
+        request_async = getattr(self.client, "request_endpoint_async", None)
+        if request_async is None:
+            return await asyncio.to_thread(self._request_entity, entity, **filters)
+        return await request_async(_ENTITY_ENDPOINTS[entity], filters)
 
     def _build_request_filters(
         self,
@@ -170,9 +376,26 @@ class ChemblExtractionServiceImpl(ExtractionServiceABC):
     def _serialize_records(
         self, model_cls: Type[ChemblRecordModel], batch_records: list[dict[str, Any]]
     ) -> list[dict[str, Any]]:
-        return [
-            model_cls(**batch_record).model_dump() for batch_record in batch_records
-        ]
+        # Колоночная сборка вместо model_cls(**record).model_dump() на запись.
+        return assemble_columns(model_cls, batch_records).to_records()
+
+
+def _batch_filters(filter_key: str, batch_ids: list[str]) -> dict[str, Any]:
+    # limit по размеру батча: без него ChEMBL отдает только страницу по умолчанию
+    # (20 записей), и записи больших батчей терялись бы.
+    return {filter_key: ",".join(batch_ids), "limit": len(batch_ids)}
+
+
+def _total_count(response: dict[str, Any]) -> int | None:
+    total = (response.get("page_meta") or {}).get("total_count")
+    return total if isinstance(total, int) else None
+
+
+async def _cancel_pending(pending: deque[asyncio.Future[Any]]) -> None:
+    for future in pending:
+        future.cancel()
+    await asyncio.gather(*pending, return_exceptions=True)
+    pending.clear()
 
 
 __all__ = ["ChemblExtractionServiceImpl"]
@@ -4,11 +4,20 @@ Implementation of ChEMBL HTTP client.
 
 from __future__ import annotations
 
-from typing import Any, Iterator
+import asyncio
+import threading
+import time
+from typing import Any, AsyncIterator, Iterator
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
-from bioetl.domain.clients.base.contracts import RateLimiterABC
+from bioetl.domain.clients.base.contracts import (
+    AsyncRateLimiterABC,
+    CacheABC,
+    RateLimiterABC,
+)
 from bioetl.domain.clients.chembl.contracts import ChemblDataClientABC
 from bioetl.domain.errors import ClientResponseError
+from bioetl.infrastructure.clients.base.impl.async_client import AsyncUnifiedAPIClient
 from bioetl.infrastructure.clients.base.impl.unified_client import UnifiedAPIClient
 from bioetl.infrastructure.clients.chembl.paginator import ChemblPaginatorImpl
 from bioetl.infrastructure.clients.chembl.request_builder import (
@@ -17,13 +26,21 @@ from bioetl.infrastructure.clients.chembl.request_builder import (
 from bioetl.infrastructure.clients.chembl.response_parser import (
     ChemblResponseParserImpl,
 )
-from bioetl.infrastructure.clients.middleware import HttpClientMiddleware
+from bioetl.infrastructure.clients.middleware import (
+    HttpClientMiddleware,
+    normalize_endpoint,
+)
+from bioetl.infrastructure.observability import metrics
+
+# Пауза перед повторным запросом релиза после неудачного ``/status``.
+RELEASE_RETRY_DELAY_SEC = 60.0
 
 
 class ChemblDataClientHTTPImpl(ChemblDataClientABC):
     """
     HTTP implementation of ChEMBL client.
     Uses UnifiedAPIClient for requests and RateLimiter for proactive throttling.
+    Optional AsyncUnifiedAPIClient backs the ``*_async`` methods.
     """
 
     def __init__(
@@ -34,6 +51,10 @@ class ChemblDataClientHTTPImpl(ChemblDataClientABC):
         client: UnifiedAPIClient | None = None,
         *,
         http_middleware: HttpClientMiddleware | None = None,
+        async_client: AsyncUnifiedAPIClient | None = None,
+        async_rate_limiter: AsyncRateLimiterABC | None = None,
+        response_cache: CacheABC[Any] | None = None,
+        response_cache_ttl: int | None = None,
         provider: str = "chembl",
     ) -> None:
         self.request_builder = request_builder
@@ -54,7 +75,14 @@ class ChemblDataClientHTTPImpl(ChemblDataClientABC):
                     raise RuntimeError("HTTP middleware is not configured")
 
             self.http = _NullHttpMiddleware()
+        self.async_client = async_client
+        self.async_rate_limiter = async_rate_limiter
+        self.response_cache = response_cache
+        self.response_cache_ttl = response_cache_ttl
         self.provider = provider
+        self._release: str | None = None
+        self._release_retry_at = 0.0
+        self._release_lock = threading.Lock()
 
     # pylint: disable=redefined-builtin
     def fetch_one(self, id: str) -> dict[str, Any]:
@@ -70,10 +98,7 @@ class ChemblDataClientHTTPImpl(ChemblDataClientABC):
         paginator = ChemblPaginatorImpl()
 
         while url:
-            self.rate_limiter.wait_if_needed()
-            self.rate_limiter.acquire()
-
-            response_data = self._execute_request(url)
+            response_data = self._fetch(url)
 
             yield response_data
 
@@ -83,12 +108,32 @@ class ChemblDataClientHTTPImpl(ChemblDataClientABC):
             else:
                 break
 
+    async def iter_pages_async(self, request: Any) -> AsyncIterator[Any]:
+        """Async-вариант iter_pages: страницы по ссылке ``next``."""
+        url = str(request)
+        paginator = ChemblPaginatorImpl()
+
+        while url:
+            response_data = await self._fetch_async(url)
+
+            yield response_data
+
+            next_request = paginator.get_next_request(response_data, url)
+            if not next_request:
+                break
+            url = next_request
+
     def metadata(self) -> dict[str, Any]:
+        # Статус не кэшируется: из него берется релиз для ключей кэша.
         url = self.request_builder.for_endpoint("status").build({})
+        self._throttle()
         data = self._execute_request(url)
+        self._release = _release_from_status(data)
         return data
 
     def close(self) -> None:
+        if self.async_client is not None:
+            self.async_client.close()
         if self.client is not None:
             self.client.close()
         elif hasattr(self.http, "base_client") and hasattr(
@@ -97,27 +142,122 @@ class ChemblDataClientHTTPImpl(ChemblDataClientABC):
             self.http.base_client.close()
 
     def request_activity(self, **filters: Any) -> Any:
-        url = self.request_builder.for_endpoint("activity").build(filters)
-        return self._execute_request(url)
+        return self._request_endpoint("activity", filters)
 
     def request_assay(self, **filters: Any) -> Any:
-        url = self.request_builder.for_endpoint("assay").build(filters)
-        return self._execute_request(url)
+        return self._request_endpoint("assay", filters)
 
     def request_target(self, **filters: Any) -> Any:
-        url = self.request_builder.for_endpoint("target").build(filters)
-        return self._execute_request(url)
+        return self._request_endpoint("target", filters)
 
     def request_document(self, **filters: Any) -> Any:
-        url = self.request_builder.for_endpoint("document").build(filters)
-        return self._execute_request(url)
+        return self._request_endpoint("document", filters)
 
     def request_molecule(self, **filters: Any) -> Any:
-        url = self.request_builder.for_endpoint("molecule").build(filters)
-        return self._execute_request(url)
+        return self._request_endpoint("molecule", filters)
+
+    def _request_endpoint(self, endpoint: str, filters: dict[str, Any]) -> Any:
+        url = self.request_builder.for_endpoint(endpoint).build(filters)
+        return self._fetch(url)
+
+    async def request_endpoint_async(
+        self, endpoint: str, filters: dict[str, Any]
+    ) -> Any:
+        """
+        Async-запрос к эндпоинту ChEMBL.
+
+        Без async-клиента синхронный запрос выполняется в отдельном потоке,
+        чтобы не блокировать event loop.
+        """
+        if self.async_client is None:
+            return await asyncio.to_thread(self._request_endpoint, endpoint, filters)
+        url = self.request_builder.for_endpoint(endpoint).build(filters)
+        return await self._fetch_async(url)
+
+    def _fetch(self, url: str) -> dict[str, Any]:
+        cache_key, cached = self._cache_lookup(url)
+        if cached is not None:
+            return cached
+
+        self._throttle()
+        data = self._execute_request(url)
+
+        self._cache_store(cache_key, data)
+        return data
+
+    async def _fetch_async(self, url: str) -> dict[str, Any]:
+        if self.async_client is None:
+            return await asyncio.to_thread(self._fetch, url)
+
+        cache_key: str | None = None
+        if self.response_cache is not None:
+            # Файловый кэш и запрос релиза не должны блокировать event loop.
+            cache_key, cached = await asyncio.to_thread(self._cache_lookup, url)
+            if cached is not None:
+                return cached
+
+        if self.async_rate_limiter is not None:
+            started = time.perf_counter()
+            await self.async_rate_limiter.acquire()
+            self._observe_rate_limit_wait(time.perf_counter() - started)
+        response = await self.async_client.request("GET", url)
+        data = self._parse_json(response, url)
+
+        if cache_key is not None:
+            await asyncio.to_thread(self._cache_store, cache_key, data)
+        return data
+
+    def _cache_lookup(self, url: str) -> tuple[str | None, dict[str, Any] | None]:
+        """Ключ кэша (провайдер, релиз ChEMBL, канонический URL) и ответ из кэша."""
+        if self.response_cache is None:
+            return None, None
+        if self._release is None and time.monotonic() >= self._release_retry_at:
+            self._resolve_release()
+        if self._release in (None, "unknown"):
+            # Без известного релиза кэш мог бы отдать данные другой версии.
+            return None, None
+        cache_key = f"{self.provider}:{self._release}:{canonical_url(url)}"
+        cached = self.response_cache.get(cache_key)
+        metrics.HTTP_CACHE_LOOKUPS_TOTAL.labels(
+            provider=self.provider,
+            endpoint=normalize_endpoint(url),
+            result="miss" if cached is None else "hit",
+        ).inc()
+        return cache_key, cached
+
+    def _resolve_release(self) -> None:
+        """Запрашивает релиз один раз: параллельные запросы ждут результата."""
+        with self._release_lock:
+            # Релиз мог определить (или не получить) другой поток.
+            if self._release is not None or time.monotonic() < self._release_retry_at:
+                return
+            try:
+                self.metadata()
+            except Exception:  # pylint: disable=broad-except
+                # Сбой не запоминается: релиз запросится снова после паузы.
+                self._release_retry_at = time.monotonic() + RELEASE_RETRY_DELAY_SEC
+
+    def _throttle(self) -> None:
+        # Общий token bucket ограничивает и параллельные батч-запросы.
+        started = time.perf_counter()
+        self.rate_limiter.wait_if_needed()
+        self.rate_limiter.acquire()
+        self._observe_rate_limit_wait(time.perf_counter() - started)
+
+    def _observe_rate_limit_wait(self, waited: float) -> None:
+        metrics.HTTP_RATE_LIMIT_WAIT_SECONDS.labels(provider=self.provider).observe(
+            waited
+        )
+
+    def _cache_store(self, cache_key: str | None, data: dict[str, Any]) -> None:
+        if cache_key is not None and self.response_cache is not None:
+            self.response_cache.set(cache_key, data, ttl=self.response_cache_ttl)
 
     def _execute_request(self, url: str) -> dict[str, Any]:
         response = self.http.request("GET", url)
+        return self._parse_json(response, url)
+
+    def _parse_json(self, response: Any, url: str) -> dict[str, Any]:
         try:
             return response.json()
         except ValueError as exc:
@@ -128,3 +268,19 @@ class ChemblDataClientHTTPImpl(ChemblDataClientABC):
                 message="Failed to parse response JSON",
                 cause=exc,
             ) from exc
+
+
+def canonical_url(url: str) -> str:
+    """URL с отсортированными параметрами запроса и хостом в нижнем регистре."""
+    parts = urlsplit(url)
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit(
+        (parts.scheme.lower(), parts.netloc.lower(), parts.path, query, "")
+    )
+
+
+def _release_from_status(data: Any) -> str:
+    if not isinstance(data, dict):
+        return "unknown"
+    release = data.get("chembl_release") or data.get("chembl_db_version")
+    return str(release) if release else "unknown"
@@ -32,6 +32,29 @@ class ChemblPaginatorImpl(PaginatorABC):
     def has_more(self, response: dict[str, Any]) -> bool:
         return self.get_next_marker(response) is not None
 
+    def plan_offsets(
+        self,
+        response: dict[str, Any],
+        *,
+        start: int,
+        page_size: int,
+        limit: int | None = None,
+    ) -> list[tuple[int, int]]:
+        """
+        Возвращает ``(offset, limit)`` оставшихся страниц по ``total_count``.
+
+        Страницы идут от ``start`` до ``total_count``, суммарно не больше
+        ``limit`` записей. Без ``total_count`` в ответе план пуст.
+        """
+        total = (response.get("page_meta") or {}).get("total_count")
+        if not isinstance(total, int) or page_size < 1:
+            return []
+        end = total if limit is None else min(total, start + limit)
+        return [
+            (offset, min(page_size, end - offset))
+            for offset in range(start, end, page_size)
+        ]
+
     def get_next_request(
         self, response: dict[str, Any], current_url: str | None = None
     ) -> str | None:
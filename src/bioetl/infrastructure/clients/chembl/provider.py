@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from bioetl.domain.clients.chembl.contracts import ChemblDataClientABC
 from bioetl.domain.clients.ports.chembl_extraction_port import ChemblExtractionPort
-from bioetl.domain.configs import ChemblSourceConfig
+from bioetl.domain.configs import ChemblSourceConfig, StorageConfig
 from bioetl.domain.providers import ProviderComponents, ProviderDefinition, ProviderId
 from bioetl.domain.transform.contracts import (
     NormalizationConfigProvider,
@@ -27,8 +27,10 @@ class ChemblProviderComponents(
 ):
     """Factory set for building ChEMBL provider components."""
 
-    def create_client(self, config: ChemblSourceConfig) -> ChemblDataClientABC:
-        return create_client(config)
+    def create_client(
+        self, config: ChemblSourceConfig, *, storage: StorageConfig | None = None
+    ) -> ChemblDataClientABC:
+        return create_client(config, storage=storage)
 
     def create_extraction_service(
         self,
@@ -1,7 +1,22 @@
+from collections.abc import Iterable, Iterator
 from typing import Any, Optional
+from urllib.parse import quote
 
 from bioetl.domain.clients.base.contracts import RequestBuilderABC
 
+# Максимальный ``limit`` страницы ChEMBL API: батч ID не должен быть больше,
+# иначе записи батча не поместятся в один ответ.
+CHEMBL_MAX_PAGE_SIZE = 1000
+
+# Сущность пайплайна -> эндпоинт ChEMBL API.
+CHEMBL_ENTITY_ENDPOINTS = {
+    "activity": "activity",
+    "assay": "assay",
+    "target": "target",
+    "document": "document",
+    "testitem": "molecule",
+}
+
 
 class ChemblRequestBuilderImpl(RequestBuilderABC):
     """
@@ -51,3 +66,47 @@ class ChemblRequestBuilderImpl(RequestBuilderABC):
         self._params["offset"] = offset
         self._params["limit"] = limit
         return self
+
+    def pack_ids(
+        self,
+        filter_key: str,
+        ids: Iterable[str],
+        *,
+        max_batch_size: int = CHEMBL_MAX_PAGE_SIZE,
+        params: dict[str, Any] | None = None,
+    ) -> Iterator[list[str]]:
+        """
+        Делит ID на батчи фильтра ``filter_key=id1,id2,...``.
+
+        Без ``max_url_length`` батчи фиксированного размера ``max_batch_size``.
+        Иначе в батч добавляются ID, пока URL (с ``params`` и ``limit`` батча)
+        укладывается в ``max_url_length``; длина ID считается в
+        percent-encoding, поэтому URL помещается в лимит и после кодирования
+        HTTP-клиентом. ID, который не помещается даже один, идет отдельным
+        батчем.
+        """
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be >= 1")
+        budget: int | None = None
+        if self.max_url_length:
+            # Префикс URL с пустым значением фильтра и самым длинным limit.
+            prefix = self.build(
+                {**(params or {}), "limit": max_batch_size, filter_key: ""}
+            )
+            budget = self.max_url_length - len(prefix)
+
+        batch: list[str] = []
+        used = 0
+        for value in ids:
+            cost = len(quote(str(value), safe="")) + (1 if batch else 0)
+            if batch and (
+                len(batch) >= max_batch_size
+                or (budget is not None and used + cost > budget)
+            ):
+                yield batch
+                batch, used = [], 0
+                cost -= 1
+            batch.append(value)
+            used += cost
+        if batch:
+            yield batch
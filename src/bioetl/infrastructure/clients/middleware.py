@@ -8,6 +8,7 @@ from email.utils import parsedate_to_datetime
 from typing import Any, Callable, NamedTuple
 from urllib.parse import urlparse
 
+from bioetl.domain.clients.base.contracts import AdaptiveRateLimiterABC
 from bioetl.domain.errors import (
     ClientNetworkError,
     ClientRateLimitError,
@@ -37,12 +38,13 @@ except Exception:  # pragma: no cover - fallback when requests is absent
     REQUESTS_CONNECTION_ERRORS = tuple()
     REQUESTS_HTTP_ERRORS = tuple()
 
-__all__ = ["HttpClientMiddleware"]
+__all__ = ["HttpClientMiddleware", "normalize_endpoint"]
 
 
 class _RetryDecision(NamedTuple):
     should_retry: bool
     total_retry_delay: float
+    delay: float = 0.0
 
 
 class HttpClientMiddleware:
@@ -62,6 +64,7 @@ class HttpClientMiddleware:
         circuit_breaker_recovery_time: float = 60.0,
         retry_metric_callback: Callable[[int], None] | None = None,
         failure_metric_callback: Callable[[int], None] | None = None,
+        rate_limiter: AdaptiveRateLimiterABC | None = None,
     ) -> None:
         self.provider = provider
         self.base_client = base_client
@@ -78,6 +81,9 @@ class HttpClientMiddleware:
         self._last_error_type: type[Exception] | None = None
         self._retry_metric_callback = retry_metric_callback
         self._failure_metric_callback = failure_metric_callback
+        # Обратная связь для адаптивного лимитера: успехи и троттлинг сервера.
+        self.rate_limiter = rate_limiter
+        self._in_flight = metrics.HTTP_REQUESTS_IN_FLIGHT.labels(provider=provider)
 
     def request(self, method: str, url: str, **kwargs: Any) -> Any:
         return self._execute_with_retries(
@@ -117,6 +123,7 @@ class HttpClientMiddleware:
             self._reset_circuit(log_circuit_closure=True)
             return resolved_response
 
+        time.sleep(outcome["retry_delay"])
         return self._execute_with_retries(
             method,
             url,
@@ -135,41 +142,76 @@ class HttpClientMiddleware:
     ) -> dict[str, Any]:
         start = time.perf_counter()
         try:
-            response = self.base_client.request(
-                method=method,
-                url=url,
-                timeout=kwargs.pop("timeout", self.timeout),
-                **kwargs,
+            with self._in_flight.track_inprogress():
+                response = self.base_client.request(
+                    method=method,
+                    url=url,
+                    timeout=kwargs.pop("timeout", self.timeout),
+                    **kwargs,
+                )
+        except Exception as exc:  # pylint: disable=broad-except
+            return self._evaluate_exception(
+                exc,
+                method,
+                url,
+                time.perf_counter() - start,
+                attempt,
+                total_retry_delay,
             )
-            elapsed = time.perf_counter() - start
-        except self._timeout_exceptions as exc:
-            elapsed = time.perf_counter() - start
+        return self._evaluate_response(
+            response,
+            method,
+            url,
+            time.perf_counter() - start,
+            attempt,
+            total_retry_delay,
+        )
+
+    def _evaluate_exception(
+        self,
+        exc: Exception,
+        method: str,
+        url: str,
+        elapsed: float,
+        attempt: int,
+        total_retry_delay: float,
+    ) -> dict[str, Any]:
+        """Решение о повторе после исключения транспорта (без ожидания)."""
+        if isinstance(exc, self._timeout_exceptions):
             return self._retry_decision_or_error(
                 *self._handle_timeout_exception(
                     method, url, elapsed, attempt, total_retry_delay, exc
                 )
             )
-        except self._connection_exceptions as exc:
-            elapsed = time.perf_counter() - start
+        if isinstance(exc, self._connection_exceptions):
             return self._retry_decision_or_error(
                 *self._handle_connection_exception(
                     method, url, elapsed, attempt, total_retry_delay, exc
                 )
             )
-        except Exception as exc:  # pragma: no cover - unexpected errors
-            elapsed = time.perf_counter() - start
-            self._record_failure(exc)
-            self._log_failure(
-                method,
-                url,
-                elapsed,
-                attempt - 1,
-                None,
-                exc.__class__.__name__,
-            )
-            self._increment_failure_metric()
-            raise
+        # Непредвиденные ошибки не повторяются.
+        self._record_failure(exc)
+        self._log_failure(
+            method,
+            url,
+            elapsed,
+            attempt - 1,
+            None,
+            exc.__class__.__name__,
+        )
+        self._increment_failure_metric()
+        raise exc
 
+    def _evaluate_response(
+        self,
+        response: Any,
+        method: str,
+        url: str,
+        elapsed: float,
+        attempt: int,
+        total_retry_delay: float,
+    ) -> dict[str, Any]:
+        """Решение о повторе по HTTP-ответу (без ожидания)."""
         retry_decision, status_error = self._handle_retryable_response_status(
             response,
             method,
@@ -183,6 +225,7 @@ class HttpClientMiddleware:
                 "response": None,
                 "should_retry": retry_decision.should_retry,
                 "total_retry_delay": retry_decision.total_retry_delay,
+                "retry_delay": retry_decision.delay,
                 "error": status_error if not retry_decision.should_retry else None,
             }
 
@@ -202,6 +245,7 @@ class HttpClientMiddleware:
                 "response": None,
                 "should_retry": handled.should_retry,
                 "total_retry_delay": handled.total_retry_delay,
+                "retry_delay": handled.delay,
                 "error": None,
             }
 
@@ -213,22 +257,27 @@ class HttpClientMiddleware:
             status_code,
             total_retry_delay,
         )
+        self._observe_response_bytes(url, response)
+        if self.rate_limiter is not None:
+            self.rate_limiter.on_success(elapsed)
         return {
             "response": response,
             "should_retry": False,
             "total_retry_delay": total_retry_delay,
+            "retry_delay": 0.0,
             "error": None,
         }
 
     @staticmethod
     def _retry_decision_or_error(
-        should_retry: bool, total_retry_delay: float, error: Exception
+        retry_decision: _RetryDecision, error: Exception
     ) -> dict[str, Any]:
         return {
             "response": None,
-            "should_retry": should_retry,
-            "total_retry_delay": total_retry_delay,
-            "error": None if should_retry else error,
+            "should_retry": retry_decision.should_retry,
+            "total_retry_delay": retry_decision.total_retry_delay,
+            "retry_delay": retry_decision.delay,
+            "error": None if retry_decision.should_retry else error,
         }
 
     def _resolve_attempt_outcome(self, outcome: dict[str, Any]) -> Any | None:
@@ -246,18 +295,21 @@ class HttpClientMiddleware:
         attempt: int,
         total_retry_delay: float,
         exc: Exception,
-    ) -> tuple[bool, float, Exception]:
+    ) -> tuple[_RetryDecision, Exception]:
         error = self._build_network_error(message="Request timed out", url=url, exc=exc)
-        return self._handle_attempt_error(
+        return (
+            self._handle_attempt_error(
+                error,
+                method,
+                url,
+                elapsed,
+                attempt,
+                total_retry_delay,
+                None,
+                None,
+            ),
             error,
-            method,
-            url,
-            elapsed,
-            attempt,
-            total_retry_delay,
-            None,
-            None,
-        ) + (error,)
+        )
 
     def _handle_connection_exception(
         self,
@@ -267,18 +319,21 @@ class HttpClientMiddleware:
         attempt: int,
         total_retry_delay: float,
         exc: Exception,
-    ) -> tuple[bool, float, Exception]:
+    ) -> tuple[_RetryDecision, Exception]:
         error = self._build_network_error(message="Connection error", url=url, exc=exc)
-        return self._handle_attempt_error(
+        return (
+            self._handle_attempt_error(
+                error,
+                method,
+                url,
+                elapsed,
+                attempt,
+                total_retry_delay,
+                None,
+                None,
+            ),
             error,
-            method,
-            url,
-            elapsed,
-            attempt,
-            total_retry_delay,
-            None,
-            None,
-        ) + (error,)
+        )
 
     def _handle_retryable_response_status(
         self,
@@ -362,8 +417,8 @@ class HttpClientMiddleware:
         total_retry_delay: float,
         status_code: int | None,
         response: Any | None,
-    ) -> tuple[bool, float]:
-        retry_decision = self._handle_retry(
+    ) -> _RetryDecision:
+        return self._handle_retry(
             error,
             method,
             url,
@@ -373,7 +428,6 @@ class HttpClientMiddleware:
             status_code,
             response,
         )
-        return retry_decision.should_retry, retry_decision.total_retry_delay
 
     def _handle_retry(
         self,
@@ -395,6 +449,8 @@ class HttpClientMiddleware:
             status_code,
             error.__class__.__name__,
         )
+        retry_after = self._retry_after_seconds(response, error)
+        self._notify_throttle(status_code, retry_after)
         if attempt >= self.max_attempts:
             self._log_final_failure(
                 method,
@@ -407,7 +463,6 @@ class HttpClientMiddleware:
             self._increment_failure_metric()
             return _RetryDecision(False, total_retry_delay)
 
-        retry_after = self._retry_after_seconds(response, error)
         delay = self._backoff_delay(attempt, retry_after)
         updated_total_retry_delay = total_retry_delay + delay
         self._log_retry(
@@ -419,8 +474,16 @@ class HttpClientMiddleware:
             self._retry_reason(status_code, error),
         )
         self._increment_retry_metric()
-        time.sleep(delay)
-        return _RetryDecision(True, updated_total_retry_delay)
+        # Ожидание перед повтором выполняет вызывающий цикл (sync или async).
+        return _RetryDecision(True, updated_total_retry_delay, delay)
+
+    def _notify_throttle(
+        self, status_code: int | None, retry_after: float | None
+    ) -> None:
+        if self.rate_limiter is None:
+            return
+        if status_code in (429, 503) or retry_after is not None:
+            self.rate_limiter.on_throttle(retry_after)
 
     def _retry_after_seconds(
         self, response: Any | None, error: Exception
@@ -744,11 +807,23 @@ class HttpClientMiddleware:
             status_class=status_class,
         ).observe(elapsed)
 
+    def _observe_response_bytes(self, url: str, response: Any) -> None:
+        content = getattr(response, "content", None)
+        if not isinstance(content, (bytes, bytearray)):
+            return
+        decoded = len(content)
+        received = _wire_bytes(response)
+        endpoint = self._normalize_endpoint(url)
+        metrics.HTTP_DECODED_BYTES_TOTAL.labels(
+            provider=self.provider, endpoint=endpoint
+        ).inc(decoded)
+        metrics.HTTP_RECEIVED_BYTES_TOTAL.labels(
+            provider=self.provider, endpoint=endpoint
+        ).inc(decoded if received is None else received)
+
     @staticmethod
     def _normalize_endpoint(url: str) -> str:
-        parsed = urlparse(url)
-        endpoint = f"{parsed.netloc}{parsed.path}".rstrip("/")
-        return endpoint or url
+        return normalize_endpoint(url)
 
     @staticmethod
     def _status_class(status_code: int | None, error: bool) -> str:
@@ -763,3 +838,25 @@ class HttpClientMiddleware:
         if 500 <= status_code < 600:
             return "5xx"
         return "error"
+
+
+def normalize_endpoint(url: str) -> str:
+    """Метка ``endpoint`` метрик: хост и путь URL без query."""
+    parsed = urlparse(url)
+    endpoint = f"{parsed.netloc}{parsed.path}".rstrip("/")
+    return endpoint or url
+
+
+def _wire_bytes(response: Any) -> int | None:
+    """Размер тела ответа до декодирования (gzip), если транспорт его сообщает."""
+    downloaded = getattr(response, "num_bytes_downloaded", None)  # httpx
+    if isinstance(downloaded, int):
+        return downloaded
+    tell = getattr(getattr(response, "raw", None), "tell", None)  # requests
+    if not callable(tell):
+        return None
+    try:
+        position = tell()
+    except Exception:  # pylint: disable=broad-except
+        return None
+    return position if isinstance(position, int) and position > 0 else None
@@ -0,0 +1,50 @@
+"""Вспомогательные примитивы ограниченного параллелизма ввода-вывода."""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TypeVar
+
+__all__ = ["ordered_thread_map"]
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def ordered_thread_map(
+    func: Callable[[T], R],
+    items: Iterable[T],
+    *,
+    max_in_flight: int,
+    thread_name_prefix: str = "bioetl-io",
+) -> Iterator[R]:
+    """
+    Применяет ``func`` к элементам в пуле потоков, сохраняя порядок входа.
+
+    Одновременно выполняется не больше ``max_in_flight`` вызовов; следующий
+    элемент отправляется, только когда потребитель забрал самый старый
+    результат. Ошибка вызова пробрасывается в порядке элементов, а
+    неотправленные задачи отменяются. При ``max_in_flight <= 1`` вызовы
+    выполняются последовательно в текущем потоке.
+    """
+    if max_in_flight <= 1:
+        for item in items:
+            yield func(item)
+        return
+
+    with ThreadPoolExecutor(
+        max_workers=max_in_flight, thread_name_prefix=thread_name_prefix
+    ) as executor:
+        pending: deque[Future[R]] = deque()
+        try:
+            for item in items:
+                pending.append(executor.submit(func, item))
+                if len(pending) >= max_in_flight:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
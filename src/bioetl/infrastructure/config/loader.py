@@ -263,7 +263,13 @@ def _build_provider_config_from_sources(
         "rate_limit_per_sec": transformed.get("client", {}).get("rate_limit", 10.0),
     }
 
-    for optional_key in ("max_url_length", "batch_size"):
+    for optional_key in (
+        "max_url_length",
+        "batch_size",
+        "max_ids_per_request",
+        "max_concurrent_requests",
+        "adaptive_rate_limit",
+    ):
         if optional_key in chembl_source:
             provider_config[optional_key] = chembl_source[optional_key]
     return provider_config
@@ -6,9 +6,11 @@ these re-exports in sync with ``bioetl.domain.configs``.
 """
 
 from bioetl.domain.configs import (  # noqa: F401
+    AdaptiveRateLimitConfig,
     BaseProviderConfig,
     BusinessKeyConfig,
     CanonicalizationConfig,
+    CheckpointConfig,
     ChemblSourceConfig,
     ClientConfig,
     CsvInputOptions,
@@ -19,18 +21,24 @@ from bioetl.domain.configs import (  # noqa: F401
     LoggingConfig,
     MetricsConfig,
     NormalizationConfig,
+    OutputConfig,
     PaginationConfig,
+    ParquetOutputConfig,
     PipelineConfig,
     ProfileConfig,
+    ProfilingConfig,
     ProviderConfigUnion,
     QcConfig,
+    ResponseCacheConfig,
     StorageConfig,
 )
 
 __all__ = [
+    "AdaptiveRateLimitConfig",
     "BaseProviderConfig",
     "BusinessKeyConfig",
     "CanonicalizationConfig",
+    "CheckpointConfig",
     "ChemblSourceConfig",
     "ClientConfig",
     "CsvInputOptions",
@@ -41,10 +49,14 @@ __all__ = [
     "LoggingConfig",
     "MetricsConfig",
     "NormalizationConfig",
+    "OutputConfig",
     "PaginationConfig",
+    "ParquetOutputConfig",
     "PipelineConfig",
     "ProfileConfig",
+    "ProfilingConfig",
     "ProviderConfigUnion",
     "QcConfig",
+    "ResponseCacheConfig",
     "StorageConfig",
 ]
@@ -8,3 +8,7 @@ from typing import Final
 MAX_FILE_RETRIES: Final[int] = 3
 RETRY_DELAY_SEC: Final[float] = 0.5
 CHECKSUM_CHUNK_SIZE: Final[int] = 8192
+
+# Output Constants
+SORT_RUN_BLOCK_ROWS: Final[int] = 10_000
+DELTA_SNAPSHOT_READ_ROWS: Final[int] = 50_000
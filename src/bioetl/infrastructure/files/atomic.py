@@ -24,24 +24,43 @@ class AtomicFileOperation:
             path: Целевой путь.
             write_fn: Функция записи, принимающая временный путь.
         """
-        tmp_path = path.with_suffix(".tmp")
+        tmp_path = self.temp_path(path)
 
         try:
             # 1. Запись во временный файл
             write_fn(tmp_path)
 
             # 2. Атомарное перемещение с retry
-            self._replace_with_retry(tmp_path, path)
+            self.commit(tmp_path, path)
 
         except Exception:
             # Очистка в случае ошибки (если файл создан)
-            if tmp_path.exists():
-                try:
-                    os.remove(tmp_path)
-                except OSError:
-                    pass
+            self.discard(tmp_path)
             raise
 
+    @staticmethod
+    def temp_path(path: Path) -> Path:
+        """Возвращает путь временного файла для ``path``."""
+        return path.with_suffix(".tmp")
+
+    def commit(self, tmp_path: Path, path: Path) -> None:
+        """
+        Атомарно переносит заранее записанный временный файл на место ``path``.
+
+        Используется потоковой записью, где временный файл пополняется
+        по частям и фиксируется одним переименованием в конце.
+        """
+        self._replace_with_retry(tmp_path, path)
+
+    @staticmethod
+    def discard(tmp_path: Path) -> None:
+        """Удаляет временный файл, если он был создан."""
+        if tmp_path.exists():
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
     def _replace_with_retry(self, src: Path, dst: Path) -> None:
         """
         Атомарная замена файла с повторными попытками (для Windows).
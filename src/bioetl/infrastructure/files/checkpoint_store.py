@@ -0,0 +1,75 @@
+"""File-based checkpoint store for resumable extraction."""
+
+from __future__ import annotations
+
+import json
+import pickle
+import shutil
+from pathlib import Path
+
+import pandas as pd
+
+from bioetl.domain.pipelines.checkpoint import Checkpoint
+from bioetl.domain.pipelines.contracts import CheckpointStoreABC
+from bioetl.infrastructure.files.atomic import AtomicFileOperation
+
+MANIFEST_NAME = "manifest.json"
+
+
+class FileCheckpointStoreImpl(CheckpointStoreABC):
+    """
+    Хранит чекпоинты в ``<root>/<run_id>/``.
+
+    Чанки пишутся pickle-файлами (dtypes сохраняются без потерь), манифест —
+    JSON, который заменяется атомарно после записи чанков: при падении
+    посреди записи остается предыдущий согласованный манифест.
+    """
+
+    def __init__(self, root: Path) -> None:
+        self._root = Path(root)
+        self._atomic = AtomicFileOperation()
+
+    def load(self, run_id: str) -> Checkpoint | None:
+        path = self._run_dir(run_id) / MANIFEST_NAME
+        if not path.exists():
+            return None
+        with path.open(encoding="utf-8") as handle:
+            return Checkpoint.from_dict(json.load(handle))
+
+    def save_chunk(self, run_id: str, index: int, df: pd.DataFrame) -> str:
+        ref = f"chunk-{index:06d}.pkl"
+        run_dir = self._run_dir(run_id)
+        run_dir.mkdir(parents=True, exist_ok=True)
+
+        def _write(tmp_path: Path) -> None:
+            with tmp_path.open("wb") as handle:
+                pickle.dump(df, handle, protocol=pickle.HIGHEST_PROTOCOL)
+
+        self._atomic.write_atomic(run_dir / ref, _write)
+        return ref
+
+    def load_chunk(self, run_id: str, ref: str) -> pd.DataFrame:
+        with (self._run_dir(run_id) / ref).open("rb") as handle:
+            df: pd.DataFrame = pickle.load(handle)
+        return df
+
+    def commit(self, checkpoint: Checkpoint) -> None:
+        run_dir = self._run_dir(checkpoint.run_id)
+        run_dir.mkdir(parents=True, exist_ok=True)
+        payload = json.dumps(checkpoint.to_dict(), ensure_ascii=False, indent=2)
+        self._atomic.write_atomic(
+            run_dir / MANIFEST_NAME,
+            lambda tmp_path: tmp_path.write_text(payload, encoding="utf-8"),
+        )
+
+    def clear(self, run_id: str) -> None:
+        shutil.rmtree(self._run_dir(run_id), ignore_errors=True)
+
+    def _run_dir(self, run_id: str) -> Path:
+        # run_id приходит из CLI: не даем выйти за пределы root.
+        if not run_id or Path(run_id).name != run_id or run_id in {".", ".."}:
+            raise ValueError(f"Invalid run_id for checkpoint: '{run_id}'")
+        return self._root / run_id
+
+
+__all__ = ["FileCheckpointStoreImpl", "MANIFEST_NAME"]
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterable, Iterator
+from collections.abc import Collection, Iterable, Iterator
 from pathlib import Path
 from typing import Any
 
@@ -10,8 +10,24 @@ import pandas as pd
 
 from bioetl.domain.configs import ChemblSourceConfig, CsvInputOptions
 from bioetl.domain.contracts import ExtractionServiceABC
+from bioetl.domain.errors import ClientResponseError
 from bioetl.domain.observability import LoggingPort
-from bioetl.domain.record_source import RawRecord, RecordSource
+from bioetl.domain.record_source import (
+    RawRecord,
+    RecordChunk,
+    RecordSource,
+    ResumableRecordSource,
+)
+from bioetl.infrastructure.clients.chembl.request_builder import (
+    CHEMBL_ENTITY_ENDPOINTS,
+    CHEMBL_MAX_PAGE_SIZE,
+    ChemblRequestBuilderImpl,
+)
+from bioetl.infrastructure.concurrency import ordered_thread_map
+
+_URI_TOO_LONG = 414
+# Размер чанка CSV, если ``chunk_size`` не задан.
+DEFAULT_CSV_CHUNK_SIZE = 10_000
 
 
 def _chunk_list(data: list[Any], size: int) -> Iterator[list[Any]]:
@@ -20,7 +36,15 @@ def _chunk_list(data: list[Any], size: int) -> Iterator[list[Any]]:
 
 
 class CsvRecordSourceImpl(RecordSource):
-    """Record source that reads full datasets from CSV."""
+    """
+    Record source that streams a CSV dataset in DataFrame chunks.
+
+    The file is read with ``chunksize`` (``chunk_size`` or
+    ``DEFAULT_CSV_CHUNK_SIZE``) and ``nrows=limit``, so the first chunk is
+    available before the rest of the file is parsed and memory is bounded by
+    the chunk size. ``usecols`` (or ``csv_options.usecols``) restricts parsing
+    to the given header columns; columns absent from the file are ignored.
+    """
 
     def __init__(
         self,
@@ -29,29 +53,36 @@ class CsvRecordSourceImpl(RecordSource):
         limit: int | None,
         logger: LoggingPort,
         chunk_size: int | None = None,
+        usecols: Collection[str] | None = None,
     ) -> None:
         self._input_path = input_path
         self._csv_options = self._ensure_csv_options(csv_options)
         self._limit = limit
         self._logger = logger
         self._chunk_size = chunk_size
+        self._usecols = usecols if usecols is not None else self._csv_options.usecols
 
-    def iter_records(self) -> Iterable[list[RawRecord]]:
+    def iter_records(self) -> Iterable[RecordChunk]:
+        if self._limit is not None and self._limit <= 0:
+            return
         header = 0 if self._csv_options.header else None
+        chunk_size = self._chunk_size
+        if chunk_size is None or chunk_size <= 0:
+            chunk_size = DEFAULT_CSV_CHUNK_SIZE
+        usecols = None
+        if self._usecols is not None and self._csv_options.header:
+            wanted = frozenset(self._usecols)
+            usecols = lambda column: column in wanted  # noqa: E731
         self._logger.info(f"Extracting records from CSV dataset: {self._input_path}")
-        df = pd.read_csv(
+        with pd.read_csv(
             self._input_path,
             delimiter=self._csv_options.delimiter,
             header=header,
-        )
-        if self._limit is not None:
-            df = df.head(self._limit)
-        records: list[RawRecord] = df.to_dict(orient="records")
-        if self._chunk_size is None or self._chunk_size <= 0:
-            yield records
-            return
-
-        yield from _chunk_list(records, self._chunk_size)
+            usecols=usecols,
+            nrows=self._limit,
+            chunksize=chunk_size,
+        ) as reader:
+            yield from reader
 
     @staticmethod
     def _ensure_csv_options(
@@ -62,8 +93,19 @@ class CsvRecordSourceImpl(RecordSource):
         return CsvInputOptions(**options)
 
 
-class IdListRecordSourceImpl(RecordSource):
-    """Record source for ID-only CSVs enriched via API."""
+class IdListRecordSourceImpl(ResumableRecordSource):
+    """
+    Record source for ID-only CSVs enriched via API.
+
+    With ``max_url_length`` configured, each ``__in`` batch holds as many IDs
+    as fit into the URL (up to ``max_ids_per_request`` or the API page size);
+    otherwise batches have the fixed ``batch_size``. A batch rejected with
+    414 is split in halves and retried.
+
+    Cursor is ``{"batch": k, "offset": o, "row": r}``: resuming skips the
+    first ``o`` IDs (batches before ``k``) without requesting them and drops
+    the first ``r`` records of batch ``k`` that were already yielded.
+    """
 
     def __init__(
         self,
@@ -93,8 +135,18 @@ class IdListRecordSourceImpl(RecordSource):
         self._filter_key = filter_key
         self._logger = logger
         self._chunk_size = chunk_size
+        self._cursor: dict[str, Any] = {"batch": 0, "offset": 0, "row": 0}
+        self._resume_from: dict[str, Any] | None = None
+
+    @property
+    def cursor(self) -> dict[str, Any]:
+        return dict(self._cursor)
+
+    def seek(self, cursor: dict[str, Any]) -> None:
+        self._resume_from = dict(cursor)
 
     def iter_records(self) -> Iterable[list[RawRecord]]:
+        resume_from, self._resume_from = self._resume_from, None
         header = 0 if self._csv_options.header else None
         usecols: list[Any] = [self._id_column] if self._csv_options.header else [0]
         names: list[str] | None = (
@@ -135,29 +187,94 @@ class IdListRecordSourceImpl(RecordSource):
         if not ids:
             return
 
-        batch_size = self._source_config.resolve_effective_batch_size(
-            limit=self._limit, hard_cap=25
-        )
+        start_batch, offset, skip_rows = 0, 0, 0
+        if resume_from is not None:
+            start_batch = int(resume_from.get("batch", 0))
+            skip_rows = int(resume_from.get("row", 0))
+            offset = resume_from.get("offset")
+            if offset is None:
+                # Курсор фиксированных батчей: смещение по их размеру.
+                offset = start_batch * int(resume_from.get("batch_size") or 0)
+            offset = int(offset)
 
-        yield from self._fetch_records(ids, batch_size)
+        yield from self._fetch_records(ids, start_batch, offset, skip_rows)
+
+    def _id_batches(self, ids: list[str]) -> Iterator[list[str]]:
+        source_config = self._source_config
+        if not source_config.max_url_length:
+            batch_size = source_config.resolve_effective_batch_size(
+                limit=self._limit, hard_cap=25
+            )
+            return _chunk_list(ids, batch_size)
+        builder = ChemblRequestBuilderImpl(
+            base_url=str(source_config.base_url),
+            max_url_length=source_config.max_url_length,
+        ).for_endpoint(CHEMBL_ENTITY_ENDPOINTS.get(self._entity, self._entity))
+        return builder.pack_ids(
+            self._filter_key,
+            ids,
+            max_batch_size=source_config.max_ids_per_request or CHEMBL_MAX_PAGE_SIZE,
+        )
 
     def _fetch_records(
-        self, ids: list[str], batch_size: int
+        self,
+        ids: list[str],
+        start_batch: int = 0,
+        offset: int = 0,
+        skip_rows: int = 0,
     ) -> Iterable[list[RawRecord]]:
-        for batch_ids in _chunk_list(ids, batch_size):
-            self._logger.info("Fetching batch from API", batch_size=len(batch_ids))
+        batches = list(self._id_batches(ids[offset:]))
+        self._logger.info(
+            "Packed ID batches", ids=len(ids) - offset, batches=len(batches)
+        )
+        # Батчи запрашиваются параллельно (до max_concurrent_requests),
+        # но отдаются строго в порядке ID во входном файле.
+        responses = ordered_thread_map(
+            self._fetch_batch,
+            batches,
+            max_in_flight=self._source_config.max_concurrent_requests,
+            thread_name_prefix="bioetl-id-batch",
+        )
+        for number, (batch_ids, serialized_records) in enumerate(
+            zip(batches, responses), start=start_batch
+        ):
+            row = skip_rows if number == start_batch else 0
+            records = serialized_records[row:]
+            if self._chunk_size is None or self._chunk_size <= 0:
+                chunks: Iterable[list[RawRecord]] = [records]
+            else:
+                chunks = _chunk_list(records, self._chunk_size)
+
+            for chunk in chunks:
+                row += len(chunk)
+                done = row >= len(serialized_records)
+                self._cursor = {
+                    "batch": number + 1 if done else number,
+                    "offset": offset + len(batch_ids) if done else offset,
+                    "row": 0 if done else row,
+                }
+                yield chunk
+            offset += len(batch_ids)
+
+    def _fetch_batch(self, batch_ids: list[str]) -> list[RawRecord]:
+        self._logger.info("Fetching batch from API", batch_size=len(batch_ids))
+        try:
             response = self._extraction_service.request_batch(
                 self._entity, batch_ids, self._filter_key
             )
-            batch_records = self._extraction_service.parse_response(response)
-            serialized_records = self._extraction_service.serialize_records(
-                self._entity, batch_records
+        except ClientResponseError as exc:
+            if exc.status_code != _URI_TOO_LONG or len(batch_ids) < 2:
+                raise
+            # Сервер принимает более короткие URL, чем max_url_length.
+            middle = len(batch_ids) // 2
+            self._logger.warning(
+                "URI too long, splitting ID batch", batch_size=len(batch_ids)
             )
-            if self._chunk_size is None or self._chunk_size <= 0:
-                yield serialized_records
-                continue
-
-            yield from _chunk_list(serialized_records, self._chunk_size)
+            return self._fetch_batch(batch_ids[:middle]) + self._fetch_batch(
+                batch_ids[middle:]
+            )
+        batch_records = self._extraction_service.parse_response(response)
+        return self._extraction_service.serialize_records(self._entity, batch_records)
 
     @staticmethod
     def _ensure_csv_options(
@@ -0,0 +1,18 @@
+"""Factories for file-based infrastructure components."""
+
+from pathlib import Path
+
+from bioetl.domain.configs import StorageConfig
+from bioetl.domain.pipelines.contracts import CheckpointStoreABC
+from bioetl.infrastructure.files.checkpoint_store import FileCheckpointStoreImpl
+
+
+def default_checkpoint_store(storage: StorageConfig) -> CheckpointStoreABC | None:
+    """Build the extraction checkpoint store, or None when it is disabled."""
+
+    settings = storage.checkpoints
+    if not settings.enabled:
+        return None
+    return FileCheckpointStoreImpl(
+        Path(settings.path or Path(storage.temp_path) / "checkpoints")
+    )
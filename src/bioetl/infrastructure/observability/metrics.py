@@ -1,12 +1,22 @@
 """Prometheus metrics used across BioETL components."""
 
-from prometheus_client import Counter, Histogram
+from prometheus_client import Counter, Gauge, Histogram
 
 __all__ = [
     "STAGE_DURATION_SECONDS",
     "STAGE_TOTAL",
+    "STAGE_ROWS_TOTAL",
+    "STAGE_ROWS_PER_SECOND",
+    "STAGE_CHUNK_ROWS",
+    "PROCESS_MAX_RSS_BYTES",
     "HTTP_REQUESTS_TOTAL",
     "HTTP_LATENCY_SECONDS",
+    "HTTP_REQUESTS_IN_FLIGHT",
+    "HTTP_RECEIVED_BYTES_TOTAL",
+    "HTTP_DECODED_BYTES_TOTAL",
+    "HTTP_CACHE_LOOKUPS_TOTAL",
+    "HTTP_RATE_LIMIT",
+    "HTTP_RATE_LIMIT_WAIT_SECONDS",
 ]
 
 STAGE_DURATION_SECONDS = Histogram(
@@ -21,6 +31,29 @@ STAGE_TOTAL = Counter(
     ["pipeline", "provider", "entity", "stage", "outcome"],
 )
 
+STAGE_ROWS_TOTAL = Counter(
+    "bioetl_stage_rows_total",
+    "Rows produced by pipeline stages, counted per processed chunk.",
+    ["pipeline", "provider", "entity", "stage"],
+)
+
+STAGE_ROWS_PER_SECOND = Gauge(
+    "bioetl_stage_rows_per_second",
+    "Throughput of the last processed chunk of a stage in rows per second.",
+    ["pipeline", "provider", "entity", "stage"],
+)
+
+STAGE_CHUNK_ROWS = Gauge(
+    "bioetl_stage_chunk_rows",
+    "Row count of the last processed chunk of a stage.",
+    ["pipeline", "provider", "entity", "stage"],
+)
+
+PROCESS_MAX_RSS_BYTES = Gauge(
+    "bioetl_process_max_rss_bytes",
+    "Peak resident set size of the pipeline process in bytes.",
+)
+
 HTTP_REQUESTS_TOTAL = Counter(
     "bioetl_http_requests_total",
     "Total HTTP requests performed by BioETL clients.",
@@ -32,3 +65,40 @@ HTTP_LATENCY_SECONDS = Histogram(
     "HTTP request latency in seconds.",
     ["provider", "endpoint", "method", "status_class"],
 )
+
+HTTP_REQUESTS_IN_FLIGHT = Gauge(
+    "bioetl_http_requests_in_flight",
+    "HTTP requests currently awaiting a response.",
+    ["provider"],
+)
+
+HTTP_RECEIVED_BYTES_TOTAL = Counter(
+    "bioetl_http_received_bytes_total",
+    "Response body bytes received over the wire (before content decoding).",
+    ["provider", "endpoint"],
+)
+
+HTTP_DECODED_BYTES_TOTAL = Counter(
+    "bioetl_http_decoded_bytes_total",
+    "Response body bytes after content decoding (gzip etc.).",
+    ["provider", "endpoint"],
+)
+
+HTTP_CACHE_LOOKUPS_TOTAL = Counter(
+    "bioetl_http_cache_lookups_total",
+    "Response cache lookups by result (hit or miss).",
+    ["provider", "endpoint", "result"],
+)
+
+HTTP_RATE_LIMIT = Gauge(
+    "bioetl_http_rate_limit_per_second",
+    "Current adaptive request rate limit in requests per second.",
+    ["provider"],
+)
+
+HTTP_RATE_LIMIT_WAIT_SECONDS = Histogram(
+    "bioetl_http_rate_limit_wait_seconds",
+    "Time spent waiting for a rate limiter token before a request.",
+    ["provider"],
+    buckets=(0.0, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
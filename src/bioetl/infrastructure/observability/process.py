@@ -0,0 +1,21 @@
+"""Ресурсы текущего процесса для метрик и профилирования."""
+
+from __future__ import annotations
+
+import sys
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - Windows
+    resource = None  # type: ignore[assignment]
+
+__all__ = ["peak_rss_bytes"]
+
+
+def peak_rss_bytes() -> int | None:
+    """Пиковый RSS процесса в байтах (None, если платформа не сообщает)."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux сообщает килобайты, macOS — байты.
+    return int(peak) if sys.platform == "darwin" else int(peak) * 1024
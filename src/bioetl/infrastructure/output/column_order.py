@@ -15,7 +15,9 @@ def apply_column_order(
     if not column_order:
         return df
 
-    df_prepared = df.copy()
+    # Недостающие колонки добавляются в поверхностную копию, а выборка по
+    # column_order ниже и так строит новый кадр.
+    df_prepared = df.copy(deep=False)
 
     if fill_missing:
         for col in column_order:
@@ -0,0 +1,275 @@
+"""
+Delta mode: comparing the output with the previous run's hash index.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from bioetl.domain.clients.base.output.contracts import (
+    ChunkWriterABC,
+    DeltaResult,
+    WriterABC,
+)
+from bioetl.infrastructure.constants import DELTA_SNAPSHOT_READ_ROWS
+from bioetl.infrastructure.files.atomic import AtomicFileOperation
+
+__all__ = [
+    "BUSINESS_KEY_COLUMN",
+    "CHANGE_TYPE_COLUMN",
+    "HASH_INDEX_NAME",
+    "ROW_HASH_COLUMN",
+    "DeltaOutput",
+    "DeltaTracker",
+    "load_hash_index",
+    "save_hash_index",
+]
+
+HASH_INDEX_NAME = "hash_index.npz"
+CHANGE_TYPE_COLUMN = "change_type"
+BUSINESS_KEY_COLUMN = "hash_business_key"
+ROW_HASH_COLUMN = "hash_row"
+
+
+def load_hash_index(path: Path) -> tuple[pd.Series, str | None] | None:
+    """
+    Читает индекс ``hash_business_key`` → ``hash_row`` и run_id его запуска.
+
+    Возвращает None, если индекса нет (первый запуск в delta-режиме).
+    """
+    if not path.exists():
+        return None
+    with np.load(path, allow_pickle=False) as data:
+        keys = data["keys"].astype(str)
+        rows = data["rows"].astype(str)
+        run_id = str(data["run_id"]) if "run_id" in data.files else None
+    index = pd.Series(rows, index=pd.Index(keys), dtype=object)
+    return index[~index.index.duplicated(keep="last")], run_id
+
+
+def save_hash_index(
+    path: Path,
+    keys: np.ndarray,
+    rows: np.ndarray,
+    run_id: str,
+    atomic_op: AtomicFileOperation,
+) -> None:
+    """Атомарно сохраняет индекс хешей (hex-строки как ASCII, сжатый npz)."""
+
+    def _write(tmp_path: Path) -> None:
+        # Через handle: np.savez_* дописывает ".npz" к путям без этого суффикса.
+        with tmp_path.open("wb") as handle:
+            np.savez_compressed(
+                handle,
+                keys=np.asarray(keys, dtype="S"),
+                rows=np.asarray(rows, dtype="S"),
+                run_id=np.asarray(run_id),
+            )
+
+    atomic_op.write_atomic(path, _write)
+
+
+class DeltaTracker:
+    """
+    Инкрементально классифицирует строки относительно предыдущего индекса.
+
+    Строка без ``hash_business_key`` в индексе — added, с другим ``hash_row`` —
+    changed; ключи предыдущего индекса, не встретившиеся в текущем запуске, —
+    removed. Попутно накапливается индекс текущего снимка.
+    """
+
+    def __init__(self, previous: pd.Series | None = None) -> None:
+        self._previous = previous if previous is not None else pd.Series(dtype=object)
+        self._keys: list[np.ndarray] = []
+        self._rows: list[np.ndarray] = []
+        self.added = 0
+        self.changed = 0
+        self.unchanged = 0
+
+    def split(self, frame: pd.DataFrame) -> pd.DataFrame:
+        """Возвращает added/changed строки чанка с колонкой ``change_type``."""
+        missing = {BUSINESS_KEY_COLUMN, ROW_HASH_COLUMN} - set(frame.columns)
+        if missing:
+            raise ValueError(
+                f"Delta mode requires columns {sorted(missing)} in the output; "
+                "configure hashing.business_key_fields"
+            )
+        keys = frame[BUSINESS_KEY_COLUMN]
+        rows = frame[ROW_HASH_COLUMN]
+        previous = keys.map(self._previous)
+
+        added = previous.isna().to_numpy()
+        changed = ~added & (previous != rows).to_numpy()
+        self.added += int(added.sum())
+        self.changed += int(changed.sum())
+        self.unchanged += int(len(frame) - added.sum() - changed.sum())
+
+        known = keys.notna().to_numpy()
+        self._keys.append(keys.to_numpy()[known])
+        self._rows.append(rows.to_numpy()[known])
+
+        mask = added | changed
+        delta = frame.loc[mask].copy()
+        delta[CHANGE_TYPE_COLUMN] = np.where(added[mask], "added", "changed")
+        return delta
+
+    def removed_keys(self) -> pd.Index:
+        """Ключи предыдущего снимка, отсутствующие в текущем."""
+        seen = pd.Index(self.current_keys())
+        previous_keys = self._previous.index
+        return previous_keys[~previous_keys.isin(seen)]
+
+    def current_keys(self) -> np.ndarray:
+        return np.concatenate(self._keys) if self._keys else np.array([], dtype=object)
+
+    def current_rows(self) -> np.ndarray:
+        return np.concatenate(self._rows) if self._rows else np.array([], dtype=object)
+
+    def previous_row_hashes(self, keys: pd.Index) -> pd.Series:
+        return self._previous.reindex(keys)
+
+
+class DeltaOutput:
+    """
+    Сессия delta-записи рядом с основным снимком.
+
+    Порядок фиксации: ``add`` для каждой записанной порции снимка,
+    ``stage_removed`` — пока на месте снимка еще лежит предыдущий (из него
+    берутся удаленные строки), ``commit`` — после замены снимка: переносит
+    delta-файл и сохраняет новый индекс.
+    """
+
+    def __init__(
+        self,
+        writer: WriterABC,
+        *,
+        atomic_op: AtomicFileOperation,
+        snapshot_path: Path,
+        delta_path: Path,
+        index_path: Path,
+        run_id: str,
+        column_order: list[str] | None = None,
+    ) -> None:
+        self._writer = writer
+        self._atomic_op = atomic_op
+        self._snapshot_path = snapshot_path
+        self._delta_path = delta_path
+        self._tmp_path = atomic_op.temp_path(delta_path)
+        self._index_path = index_path
+        self._run_id = run_id
+        self._column_order = column_order
+        previous = load_hash_index(index_path)
+        self._base_run_id = previous[1] if previous else None
+        self._tracker = DeltaTracker(previous[0] if previous else None)
+        self._chunk_writer: ChunkWriterABC | None = None
+        self._columns: list[str] | None = None
+        self._removed = 0
+        self._checksum: str | None = None
+
+    def add(self, frame: pd.DataFrame) -> None:
+        """Дописывает added/changed строки порции снимка в delta-файл."""
+        if self._columns is None:
+            self._columns = [*frame.columns, CHANGE_TYPE_COLUMN]
+        delta = self._tracker.split(frame)
+        if not delta.empty:
+            self._open().write_chunk(delta)
+
+    def stage_removed(self) -> None:
+        """Дописывает удаленные строки и закрывает временный delta-файл."""
+        removed = self._tracker.removed_keys()
+        self._removed = len(removed)
+        chunk_writer = self._open()
+        for frame in self._iter_removed_rows(removed):
+            chunk_writer.write_chunk(frame)
+        self._checksum = chunk_writer.close().checksum
+
+    def commit(self) -> DeltaResult:
+        """Фиксирует delta-файл и индекс текущего снимка."""
+        self._atomic_op.commit(self._tmp_path, self._delta_path)
+        save_hash_index(
+            self._index_path,
+            self._tracker.current_keys(),
+            self._tracker.current_rows(),
+            self._run_id,
+            self._atomic_op,
+        )
+        return DeltaResult(
+            path=self._delta_path,
+            index_path=self._index_path,
+            added=self._tracker.added,
+            changed=self._tracker.changed,
+            removed=self._removed,
+            unchanged=self._tracker.unchanged,
+            base_run_id=self._base_run_id,
+            checksum=self._checksum,
+        )
+
+    def abort(self) -> None:
+        if self._chunk_writer is not None:
+            self._chunk_writer.abort()
+        self._atomic_op.discard(self._tmp_path)
+
+    def _open(self) -> ChunkWriterABC:
+        if self._chunk_writer is None:
+            if self._columns is None and self._column_order:
+                self._columns = [*self._column_order, CHANGE_TYPE_COLUMN]
+            self._chunk_writer = self._writer.open_chunk_writer(
+                self._tmp_path, column_order=self._columns
+            )
+        return self._chunk_writer
+
+    def _iter_removed_rows(self, removed: pd.Index) -> Iterator[pd.DataFrame]:
+        if removed.empty:
+            return
+        found: list[pd.Index] = []
+        for chunk in self._iter_snapshot():
+            if BUSINESS_KEY_COLUMN not in chunk.columns:
+                break
+            rows = chunk[chunk[BUSINESS_KEY_COLUMN].isin(removed)]
+            if not rows.empty:
+                found.append(pd.Index(rows[BUSINESS_KEY_COLUMN]))
+                yield self._as_removed(rows)
+
+        # Строк нет в снимке (удален или другого формата): только ключи.
+        seen = found[0].append(found[1:]) if found else pd.Index([])
+        missing = removed[~removed.isin(seen)]
+        if not missing.empty:
+            yield self._as_removed(
+                pd.DataFrame(
+                    {
+                        BUSINESS_KEY_COLUMN: missing.to_numpy(),
+                        ROW_HASH_COLUMN: self._tracker.previous_row_hashes(
+                            missing
+                        ).to_numpy(),
+                    }
+                )
+            )
+
+    def _iter_snapshot(self) -> Iterator[pd.DataFrame]:
+        if not self._snapshot_path.exists():
+            return
+        if self._snapshot_path.suffix == ".csv":
+            # CSV читается как текст: значения уходят в delta ровно в том
+            # виде, в каком были записаны.
+            yield from pd.read_csv(
+                self._snapshot_path,
+                dtype=str,
+                keep_default_na=False,
+                chunksize=DELTA_SNAPSHOT_READ_ROWS,
+            )
+        elif self._snapshot_path.suffix == ".parquet":
+            import pyarrow.parquet as pq  # pylint: disable=import-outside-toplevel
+
+            parquet_file = pq.ParquetFile(self._snapshot_path)
+            for batch in parquet_file.iter_batches(batch_size=DELTA_SNAPSHOT_READ_ROWS):
+                yield batch.to_pandas()
+
+    def _as_removed(self, rows: pd.DataFrame) -> pd.DataFrame:
+        frame = rows.assign(**{CHANGE_TYPE_COLUMN: "removed"})
+        if self._columns is None:
+            return frame
+        return frame.reindex(columns=self._columns)
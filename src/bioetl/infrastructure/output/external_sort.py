@@ -0,0 +1,176 @@
+"""
+External (spill-to-disk) merge sort for deterministic output ordering.
+"""
+
+from __future__ import annotations
+
+import heapq
+import pickle
+import shutil
+import tempfile
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any, BinaryIO
+
+import pandas as pd
+
+from bioetl.infrastructure.constants import SORT_RUN_BLOCK_ROWS
+
+__all__ = ["ExternalMergeSorter"]
+
+
+class ExternalMergeSorter:
+    """
+    Сортировка потока чанков по ключам с выгрузкой промежуточных runs на диск.
+
+    Каждый чанк сортируется стабильно (``mergesort``) и сохраняется как
+    отсортированный run блоками по ``block_rows`` строк. При чтении runs
+    сливаются k-way merge; равные ключи упорядочиваются по номеру run,
+    поэтому результат совпадает со стабильной сортировкой объединенного
+    DataFrame, а в памяти одновременно находится не больше блока на run.
+    """
+
+    def __init__(
+        self,
+        keys: list[str],
+        temp_dir: Path,
+        *,
+        block_rows: int = SORT_RUN_BLOCK_ROWS,
+    ) -> None:
+        if not keys:
+            raise ValueError("ExternalMergeSorter requires at least one sort key")
+        self._keys = list(keys)
+        self._temp_root = temp_dir
+        self._block_rows = block_rows
+        self._work_dir: Path | None = None
+        self._runs: list[Path] = []
+
+    @property
+    def run_count(self) -> int:
+        return len(self._runs)
+
+    def add(self, df: pd.DataFrame) -> None:
+        """Сортирует чанк и выгружает его на диск как отдельный run."""
+        if df.empty:
+            return
+        ordered = df.sort_values(
+            by=self._keys, kind="mergesort", na_position="last", ignore_index=True
+        )
+        path = self._ensure_work_dir() / f"run-{len(self._runs):06d}.pkl"
+        with path.open("wb") as handle:
+            for start in range(0, len(ordered), self._block_rows):
+                pickle.dump(
+                    ordered.iloc[start : start + self._block_rows],
+                    handle,
+                    protocol=pickle.HIGHEST_PROTOCOL,
+                )
+        self._runs.append(path)
+
+    def iter_sorted(self, *, batch_rows: int | None = None) -> Iterator[pd.DataFrame]:
+        """Возвращает отсортированный поток DataFrame-батчей."""
+        limit = batch_rows or self._block_rows
+        readers = [_RunReader(path, self._keys) for path in self._runs]
+        try:
+            # Номер run разрешает равные ключи в порядке поступления чанков.
+            heap: list[tuple[tuple[Any, ...], int]] = []
+            for run_index, reader in enumerate(readers):
+                if reader.advance():
+                    heap.append((reader.key(), run_index))
+            heapq.heapify(heap)
+
+            spans: list[list[Any]] = []
+            pending = 0
+            while heap:
+                _, run_index = heapq.heappop(heap)
+                reader = readers[run_index]
+                block, position = reader.block, reader.position
+                last = spans[-1] if spans else None
+                if last is not None and last[0] is block and last[2] == position:
+                    last[2] += 1
+                else:
+                    spans.append([block, position, position + 1])
+                pending += 1
+
+                if reader.advance():
+                    heapq.heappush(heap, (reader.key(), run_index))
+
+                if pending >= limit:
+                    yield _materialize(spans)
+                    spans, pending = [], 0
+
+            if spans:
+                yield _materialize(spans)
+        finally:
+            for reader in readers:
+                reader.close()
+
+    def cleanup(self) -> None:
+        """Удаляет временные runs."""
+        if self._work_dir is not None:
+            shutil.rmtree(self._work_dir, ignore_errors=True)
+            self._work_dir = None
+        self._runs = []
+
+    def _ensure_work_dir(self) -> Path:
+        if self._work_dir is None:
+            self._temp_root.mkdir(parents=True, exist_ok=True)
+            self._work_dir = Path(
+                tempfile.mkdtemp(prefix="sort-runs-", dir=self._temp_root)
+            )
+        return self._work_dir
+
+
+class _RunReader:
+    """Последовательное чтение блоков одного отсортированного run."""
+
+    def __init__(self, path: Path, keys: list[str]) -> None:
+        self._handle: BinaryIO | None = path.open("rb")
+        self._keys = keys
+        self._key_rows: list[tuple[Any, ...]] = []
+        self.block: pd.DataFrame | None = None
+        self.position = -1
+
+    def advance(self) -> bool:
+        """Переходит к следующей строке; False, если run исчерпан."""
+        self.position += 1
+        if self.block is not None and self.position < len(self.block):
+            return True
+        return self._load_next_block()
+
+    def key(self) -> tuple[Any, ...]:
+        return self._key_rows[self.position]
+
+    def close(self) -> None:
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+    def _load_next_block(self) -> bool:
+        if self._handle is None:
+            return False
+        try:
+            block = pickle.load(self._handle)
+        except EOFError:
+            self.close()
+            self.block = None
+            return False
+        self.block = block
+        self.position = 0
+        columns = [block[key].tolist() for key in self._keys]
+        self._key_rows = [
+            tuple(_sort_key(value) for value in row) for row in zip(*columns)
+        ]
+        return True
+
+
+def _sort_key(value: Any) -> tuple[int, Any]:
+    # na_position="last": пропуски идут после любых значений
+    if value is None or value is pd.NA or value != value:
+        return (1, 0)
+    return (0, value)
+
+
+def _materialize(spans: list[list[Any]]) -> pd.DataFrame:
+    return pd.concat(
+        [block.iloc[start:stop] for block, start, stop in spans], ignore_index=True
+    )
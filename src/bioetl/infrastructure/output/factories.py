@@ -1,20 +1,29 @@
+from pathlib import Path
+
 from bioetl.domain.clients.base.output.contracts import (
     MetadataWriterABC,
     OutputWriterABC,
     QualityReportABC,
     WriterABC,
 )
-from bioetl.domain.configs import DeterminismConfig, QcConfig
+from bioetl.domain.configs import DeterminismConfig, OutputConfig, QcConfig
 from bioetl.infrastructure.output.impl.csv_writer import CsvWriterImpl
 from bioetl.infrastructure.output.impl.metadata_writer import MetadataWriterImpl
+from bioetl.infrastructure.output.impl.parquet_writer import ParquetWriterImpl
 from bioetl.infrastructure.output.impl.quality_report import QualityReportImpl
 from bioetl.infrastructure.output.unified_writer import UnifiedOutputWriter
 
 
-def default_writer() -> WriterABC:
-    """Create the default CSV writer implementation."""
+def default_writer(output: OutputConfig | None = None) -> WriterABC:
+    """Create the writer for ``output.format`` (CSV by default)."""
 
-    return CsvWriterImpl()
+    if output is None or output.format == "csv":
+        return CsvWriterImpl()
+    return ParquetWriterImpl(
+        compression=output.parquet.compression,
+        row_group_size=output.parquet.row_group_size,
+        dictionary_columns=list(output.parquet.dictionary_columns),
+    )
 
 
 def default_metadata_writer() -> MetadataWriterABC:
@@ -36,6 +45,8 @@ def default_output_writer(
     writer: WriterABC | None = None,
     metadata_writer: MetadataWriterABC | None = None,
     quality_reporter: QualityReportABC | None = None,
+    temp_dir: Path | None = None,
+    file_format: str = "csv",
 ) -> OutputWriterABC:
     """Compose the unified output writer with optional overrides."""
 
@@ -45,4 +56,6 @@ def default_output_writer(
         quality_reporter=quality_reporter or default_quality_reporter(),
         config=config,
         qc_config=qc_config,
+        temp_dir=temp_dir,
+        file_format=file_format,
     )
@@ -10,7 +10,11 @@ from pathlib import Path
 
 import pandas as pd
 
-from bioetl.domain.clients.base.output.contracts import WriterABC, WriteResult
+from bioetl.domain.clients.base.output.contracts import (
+    ChunkWriterABC,
+    WriterABC,
+    WriteResult,
+)
 from bioetl.infrastructure.output.column_order import apply_column_order
 
 
@@ -59,3 +63,75 @@ class BaseWriterImpl(WriterABC):
 
     def _write_frame(self, df: pd.DataFrame, path: Path) -> None:
         raise NotImplementedError
+
+
+class BaseChunkWriterImpl(ChunkWriterABC):
+    """
+    Общая логика потоковой записи: порядок колонок, счетчики, тайминг.
+
+    Все чанки приводятся к набору колонок первого чанка (или ``column_order``),
+    поэтому файл получается таким же, как при записи объединенного DataFrame.
+    """
+
+    def __init__(self, path: Path, *, column_order: list[str] | None = None) -> None:
+        self._path = path
+        self._column_order = column_order
+        self._columns: list[str] | None = list(column_order) if column_order else None
+        self._row_count = 0
+        self._started = time.monotonic()
+        self._closed = False
+
+    @property
+    def row_count(self) -> int:
+        return self._row_count
+
+    def write_chunk(self, df: pd.DataFrame) -> None:
+        if self._closed:
+            raise RuntimeError(f"Chunk writer for {self._path} is already closed")
+        if self._column_order and list(df.columns) != self._column_order:
+            df = apply_column_order(df, self._column_order)
+        frame = self._align_columns(df)
+        self._append_frame(frame)
+        self._row_count += len(frame)
+
+    def close(self) -> WriteResult:
+        if self._closed:
+            raise RuntimeError(f"Chunk writer for {self._path} is already closed")
+        if self._columns is None:
+            self._columns = []
+        checksum = self._finalize()
+        self._closed = True
+        return WriteResult(
+            path=self._path,
+            row_count=self._row_count,
+            duration_sec=time.monotonic() - self._started,
+            checksum=checksum,
+        )
+
+    def abort(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self._release()
+
+    def _align_columns(self, frame: pd.DataFrame) -> pd.DataFrame:
+        columns = list(frame.columns)
+        if self._columns is None:
+            self._columns = columns
+            return frame
+        if columns == self._columns:
+            return frame
+        if set(columns) != set(self._columns):
+            raise ValueError(
+                f"Chunk columns {columns} differ from output columns {self._columns}"
+            )
+        return frame[self._columns]
+
+    def _append_frame(self, df: pd.DataFrame) -> None:
+        raise NotImplementedError
+
+    def _finalize(self) -> str | None:
+        raise NotImplementedError
+
+    def _release(self) -> None:
+        raise NotImplementedError
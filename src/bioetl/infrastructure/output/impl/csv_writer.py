@@ -4,12 +4,18 @@ CSV Writer implementation.
 
 from __future__ import annotations
 
+import hashlib
 from pathlib import Path
+from typing import BinaryIO
 
 import pandas as pd
 
+from bioetl.domain.clients.base.output.contracts import ChunkWriterABC
 from bioetl.infrastructure.files.checksum import compute_file_sha256
-from bioetl.infrastructure.output.impl.base_writer import BaseWriterImpl
+from bioetl.infrastructure.output.impl.base_writer import (
+    BaseChunkWriterImpl,
+    BaseWriterImpl,
+)
 
 
 class CsvWriterImpl(BaseWriterImpl):
@@ -26,3 +32,48 @@ class CsvWriterImpl(BaseWriterImpl):
 
     def supports_format(self, fmt: str) -> bool:
         return fmt.lower() == "csv"
+
+    def open_chunk_writer(
+        self,
+        path: Path,
+        *,
+        column_order: list[str] | None = None,
+    ) -> ChunkWriterABC:
+        return CsvChunkWriterImpl(path, column_order=column_order)
+
+
+class CsvChunkWriterImpl(BaseChunkWriterImpl):
+    """
+    Потоковая запись CSV: заголовок пишется один раз, чанки дописываются.
+
+    SHA256 считается по мере записи байтов, без повторного чтения файла.
+    """
+
+    def __init__(self, path: Path, *, column_order: list[str] | None = None) -> None:
+        super().__init__(path, column_order=column_order)
+        self._sha256 = hashlib.sha256()
+        self._header_written = False
+        self._handle: BinaryIO | None = open(path, "wb")
+
+    def _append_frame(self, df: pd.DataFrame) -> None:
+        self._write_bytes(df.to_csv(index=False, header=not self._header_written))
+        self._header_written = True
+
+    def _finalize(self) -> str | None:
+        if not self._header_written:
+            # Пустой результат: только заголовок, как при записи пустого DataFrame.
+            self._append_frame(pd.DataFrame(columns=self._columns))
+        self._release()
+        return self._sha256.hexdigest()
+
+    def _release(self) -> None:
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+    def _write_bytes(self, payload: str) -> None:
+        if self._handle is None:
+            raise RuntimeError(f"Chunk writer for {self._path} is already closed")
+        data = payload.encode("utf-8")
+        self._handle.write(data)
+        self._sha256.update(data)
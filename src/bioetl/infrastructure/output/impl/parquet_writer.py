@@ -2,22 +2,191 @@ from __future__ import annotations
 
 from collections.abc import Callable
 from pathlib import Path
+from typing import Any
 
 import pandas as pd
 
-from bioetl.infrastructure.output.impl.base_writer import BaseWriterImpl
+from bioetl.domain.clients.base.output.contracts import ChunkWriterABC
+from bioetl.infrastructure.files.checksum import compute_file_sha256
+from bioetl.infrastructure.output.impl.base_writer import (
+    BaseChunkWriterImpl,
+    BaseWriterImpl,
+)
 
 
 class ParquetWriterImpl(BaseWriterImpl):
     """
     Запись Parquet.
+
+    ``row_group_size`` ограничивает размер row group, ``dictionary_columns`` —
+    колонки с dictionary encoding (низкая кардинальность); остальные пишутся
+    plain, без попыток строить словарь для уникальных значений (хеши, ID).
+    Неуказанные параметры остаются значениями pyarrow по умолчанию.
     """
 
-    def __init__(self, *, checksum_fn: Callable[[Path], str] | None = None) -> None:
+    def __init__(
+        self,
+        *,
+        checksum_fn: Callable[[Path], str] | None = None,
+        compression: str | None = None,
+        row_group_size: int | None = None,
+        dictionary_columns: list[str] | None = None,
+    ) -> None:
         super().__init__(atomic=True, checksum_fn=checksum_fn)
+        self._compression = compression
+        self._row_group_size = row_group_size
+        self._dictionary_columns = dictionary_columns
 
     def _write_frame(self, df: pd.DataFrame, path: Path) -> None:
-        df.to_parquet(path, index=False)
+        _without_attrs(df).to_parquet(
+            path, index=False, **self._write_options(list(df.columns))
+        )
+
+    def _write_options(self, columns: list[str]) -> dict[str, Any]:
+        options: dict[str, Any] = {}
+        if self._compression is not None:
+            options["compression"] = self._compression
+        if self._row_group_size is not None:
+            options["row_group_size"] = self._row_group_size
+        if self._dictionary_columns is not None:
+            options["use_dictionary"] = _dictionary_option(
+                self._dictionary_columns, columns
+            )
+        return options
 
     def supports_format(self, fmt: str) -> bool:
         return fmt.lower() == "parquet"
+
+    def open_chunk_writer(
+        self,
+        path: Path,
+        *,
+        column_order: list[str] | None = None,
+    ) -> ChunkWriterABC:
+        return ParquetChunkWriterImpl(
+            path,
+            column_order=column_order,
+            compression=self._compression,
+            row_group_size=self._row_group_size,
+            dictionary_columns=self._dictionary_columns,
+        )
+
+
+def _without_attrs(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Поверхностная копия без ``attrs``.
+
+    pandas сохраняет ``attrs`` в pandas-метаданные файла; служебные отметки
+    пайплайна (нормализация, курсор extract) в выход попадать не должны.
+    """
+    if not df.attrs:
+        return df
+    frame = df.copy(deep=False)
+    frame.attrs = {}
+    return frame
+
+
+def _dictionary_option(
+    dictionary_columns: list[str], columns: list[str]
+) -> list[str] | bool:
+    present = [name for name in dictionary_columns if name in columns]
+    return present or False
+
+
+class ParquetChunkWriterImpl(BaseChunkWriterImpl):
+    """
+    Потоковая запись Parquet: каждый чанк становится отдельной row group
+    (или несколькими, если он больше ``row_group_size``).
+
+    Схема Arrow выводится по первому чанку. Если следующий чанк требует
+    более широкого типа (пустая колонка получила значения, int64 — дробные
+    числа), схема расширяется по правилам ``pa.unify_schemas`` и уже
+    записанные row groups переписываются в нее по одной; типы в итоге те же,
+    что при записи объединенного DataFrame. Требуется ``pyarrow``.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        column_order: list[str] | None = None,
+        compression: str | None = None,
+        row_group_size: int | None = None,
+        dictionary_columns: list[str] | None = None,
+    ) -> None:
+        super().__init__(path, column_order=column_order)
+        self._writer: Any = None
+        self._schema: Any = None
+        self._compression = compression
+        self._row_group_size = row_group_size
+        self._dictionary_columns = dictionary_columns
+
+    def _append_frame(self, df: pd.DataFrame) -> None:
+        import pyarrow as pa  # pylint: disable=import-outside-toplevel
+
+        table = pa.Table.from_pandas(_without_attrs(df), preserve_index=False)
+        if self._writer is None:
+            self._open(table.schema)
+        elif not table.schema.equals(self._schema):
+            table = table.cast(self._widen_schema(table.schema))
+        self._writer.write_table(table, row_group_size=self._row_group_size)
+
+    def _open(self, schema: Any) -> None:
+        import pyarrow.parquet as pq  # pylint: disable=import-outside-toplevel
+
+        self._schema = schema
+        self._writer = pq.ParquetWriter(
+            str(self._path), schema, **self._writer_options()
+        )
+
+    def _widen_schema(self, chunk_schema: Any) -> Any:
+        """Схема, вмещающая и записанные данные, и новый чанк."""
+        import pyarrow as pa  # pylint: disable=import-outside-toplevel
+
+        try:
+            schema = pa.unify_schemas(
+                [self._schema, chunk_schema], promote_options="permissive"
+            )
+        except (pa.ArrowInvalid, pa.ArrowTypeError) as exc:
+            raise ValueError(
+                f"Chunk types are incompatible with {self._path}: {exc}"
+            ) from exc
+        if not schema.equals(self._schema):
+            self._rewrite(schema)
+        return self._schema
+
+    def _rewrite(self, schema: Any) -> None:
+        """Переписывает записанные row groups в расширенную схему."""
+        import pyarrow.parquet as pq  # pylint: disable=import-outside-toplevel
+
+        self._release()
+        written = self._path.with_name(self._path.name + ".widen")
+        self._path.replace(written)
+        try:
+            self._open(schema)
+            with pq.ParquetFile(written) as source:
+                for index in range(source.num_row_groups):
+                    self._writer.write_table(source.read_row_group(index).cast(schema))
+        finally:
+            written.unlink(missing_ok=True)
+
+    def _writer_options(self) -> dict[str, Any]:
+        options: dict[str, Any] = {}
+        if self._compression is not None:
+            options["compression"] = self._compression
+        if self._dictionary_columns is not None:
+            options["use_dictionary"] = _dictionary_option(
+                self._dictionary_columns, list(self._schema.names)
+            )
+        return options
+
+    def _finalize(self) -> str | None:
+        if self._writer is None:
+            self._append_frame(pd.DataFrame(columns=self._columns))
+        self._release()
+        return compute_file_sha256(self._path)
+
+    def _release(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
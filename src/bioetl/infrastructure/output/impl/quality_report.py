@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 
 from bioetl.domain.clients.base.output.contracts import QualityReportABC
@@ -55,3 +56,188 @@ class QualityReportImpl(QualityReportABC):
         correlation = correlation.loc[numeric_columns, numeric_columns]
         correlation.insert(0, "column", correlation.index)
         return correlation.reset_index(drop=True)
+
+
+class StreamingQualityStats:
+    """
+    Инкрементальный расчет QC-отчетов по потоку чанков.
+
+    Хранит только агрегаты (счетчики, попарные суммы для корреляции) и
+    64-битные хеши уникальных значений (``pd.util.hash_array``, 8 байт на
+    значение вместо Python-объектов). ``unique_count`` точен с точностью до
+    коллизий хешей; результат совпадает по формату с ``QualityReportImpl``.
+    """
+
+    def __init__(self) -> None:
+        self._row_count = 0
+        self._columns: list[str] = []
+        self._null_counts: dict[str, int] = {}
+        self._uniques: dict[str, _HashSet] = {}
+        self._dtypes: dict[str, str] = {}
+        self._numeric: dict[str, bool] = {}
+        self._corr_columns: list[str] | None = None
+        self._corr_sums: dict[str, np.ndarray] = {}
+
+    @property
+    def row_count(self) -> int:
+        return self._row_count
+
+    def update(self, df: pd.DataFrame) -> None:
+        """Учитывает очередной чанк."""
+        for column in df.columns:
+            if column not in self._null_counts:
+                self._columns.append(column)
+                self._null_counts[column] = self._row_count
+                self._uniques[column] = _HashSet()
+                self._dtypes[column] = str(df[column].dtype)
+                self._numeric[column] = True
+            series = df[column]
+            self._null_counts[column] += int(series.isnull().sum())
+            self._uniques[column].update(_value_hashes(series))
+            if self._dtypes[column] != str(series.dtype) and len(series):
+                self._dtypes[column] = "object"
+            if len(series) and not pd.api.types.is_numeric_dtype(series):
+                self._numeric[column] = False
+        for column in self._columns:
+            if column not in df.columns:
+                self._null_counts[column] += len(df.index)
+        self._row_count += len(df.index)
+        self._update_correlation(df)
+
+    def build_quality_report(self, *, min_coverage: float) -> pd.DataFrame:
+        """Строит отчет в формате ``QualityReportImpl.build_quality_report``."""
+        rows = []
+        for column in self._columns:
+            nulls = self._null_counts[column]
+            non_nulls = self._row_count - nulls
+            coverage = non_nulls / self._row_count if self._row_count > 0 else 0.0
+            rows.append(
+                {
+                    "column": column,
+                    "null_count": nulls,
+                    "non_null_count": non_nulls,
+                    "unique_count": len(self._uniques[column]),
+                    "dtype": self._dtypes[column],
+                    "coverage": coverage,
+                    "coverage_ok": coverage >= min_coverage,
+                }
+            )
+        report = pd.DataFrame(
+            rows,
+            columns=[
+                "column",
+                "null_count",
+                "non_null_count",
+                "unique_count",
+                "dtype",
+                "coverage",
+                "coverage_ok",
+            ],
+        )
+        return report.sort_values(by="column", ignore_index=True)
+
+    def build_correlation_report(self) -> pd.DataFrame:
+        """Строит попарную корреляцию Пирсона по накопленным суммам."""
+        columns = [c for c in self._corr_columns or [] if self._numeric.get(c)]
+        if not columns:
+            return pd.DataFrame(columns=["column"])
+
+        positions = [(self._corr_columns or []).index(c) for c in columns]
+        idx = np.ix_(positions, positions)
+        n = self._corr_sums["n"][idx]
+        sx = self._corr_sums["sx"][idx]
+        sxx = self._corr_sums["sxx"][idx]
+        sxy = self._corr_sums["sxy"][idx]
+        sy = sx.T
+        syy = sxx.T
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            cov = n * sxy - sx * sy
+            var = (n * sxx - sx * sx) * (n * syy - sy * sy)
+            corr = cov / np.sqrt(var)
+        corr[(n < 2) | (var <= 0)] = np.nan
+        corr = np.clip(corr, -1.0, 1.0)
+
+        report = pd.DataFrame(corr, index=columns, columns=columns)
+        report.insert(0, "column", report.index)
+        return report.reset_index(drop=True)
+
+    def _update_correlation(self, df: pd.DataFrame) -> None:
+        if df.empty:
+            return
+        if self._corr_columns is None:
+            self._corr_columns = sorted(
+                c for c in df.columns if pd.api.types.is_numeric_dtype(df[c])
+            )
+            size = len(self._corr_columns)
+            self._corr_sums = {
+                key: np.zeros((size, size)) for key in ("n", "sx", "sxx", "sxy")
+            }
+        columns = [c for c in self._corr_columns if self._numeric.get(c)]
+        if not columns:
+            return
+
+        values = np.full((len(df.index), len(self._corr_columns)), np.nan)
+        for position, column in enumerate(self._corr_columns):
+            if column in columns and column in df.columns:
+                values[:, position] = pd.to_numeric(
+                    df[column].astype("float64"), errors="coerce"
+                ).to_numpy(dtype="float64", na_value=np.nan)
+
+        present = (~np.isnan(values)).astype("float64")
+        filled = np.nan_to_num(values)
+        self._corr_sums["n"] += present.T @ present
+        self._corr_sums["sx"] += filled.T @ present
+        self._corr_sums["sxx"] += (filled * filled).T @ present
+        self._corr_sums["sxy"] += filled.T @ filled
+
+
+class _HashSet:
+    """Множество 64-битных хешей: отсортированная база плюс буфер чанков."""
+
+    def __init__(self) -> None:
+        self._base = np.empty(0, dtype="uint64")
+        self._pending: list[np.ndarray] = []
+        self._pending_size = 0
+
+    def __len__(self) -> int:
+        self._compact()
+        return len(self._base)
+
+    def update(self, hashes: np.ndarray) -> None:
+        if not len(hashes):
+            return
+        self._pending.append(np.unique(hashes))
+        self._pending_size += len(self._pending[-1])
+        # Слияние при удвоении размера: суммарная стоимость O(n log n).
+        if self._pending_size > len(self._base):
+            self._compact()
+
+    def _compact(self) -> None:
+        if self._pending:
+            self._base = np.unique(np.concatenate([self._base, *self._pending]))
+            self._pending = []
+            self._pending_size = 0
+
+
+def _value_hashes(series: pd.Series) -> np.ndarray:
+    """Хеши непустых значений; целые числа хешируются одинаково в int и float."""
+    values = series.dropna().infer_objects()
+    if values.empty:
+        return np.empty(0, dtype="uint64")
+    if pd.api.types.is_bool_dtype(values):
+        return pd.util.hash_array(values.to_numpy(dtype=bool))
+    if pd.api.types.is_integer_dtype(values):
+        return pd.util.hash_array(values.to_numpy(dtype="int64"))
+    if pd.api.types.is_float_dtype(values):
+        floats = values.to_numpy(dtype="float64")
+        integral = (np.mod(floats, 1) == 0) & (np.abs(floats) < 2**63)
+        return np.concatenate(
+            [
+                pd.util.hash_array(floats[integral].astype("int64")),
+                pd.util.hash_array(floats[~integral]),
+            ]
+        )
+    if values.dtype.kind in "mM":
+        return pd.util.hash_array(values.to_numpy())
+    return pd.util.hash_array(values.to_numpy(dtype=object))
@@ -65,6 +65,10 @@ def build_run_metadata(
     qc_config = qc_config or QcConfig()
 
     files.extend(path.name for path in qc_artifacts)
+    delta_checksums: dict[str, str | None] = {}
+    if result.delta is not None:
+        files.extend([result.delta.path.name, result.delta.index_path.name])
+        delta_checksums[result.delta.path.name] = result.delta.checksum
 
     meta = build_base_metadata(
         context, row_count=result.row_count, include_metadata=False
@@ -77,6 +81,7 @@ def build_run_metadata(
             "files": sorted(files),
             "checksums": {
                 result.path.name: result.checksum,
+                **delta_checksums,
                 **qc_checksums,
             },
             "qc_artifacts": {
@@ -93,6 +98,14 @@ def build_run_metadata(
             },
         }
     )
+    if result.delta is not None:
+        meta["delta"] = {
+            "base_run_id": result.delta.base_run_id,
+            "added": result.delta.added,
+            "changed": result.delta.changed,
+            "removed": result.delta.removed,
+            "unchanged": result.delta.unchanged,
+        }
     meta.update(context.metadata)
     return meta
 
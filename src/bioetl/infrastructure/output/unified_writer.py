@@ -2,12 +2,16 @@
 Unified output writer implementation.
 """
 
+import tempfile
+from collections.abc import Callable
 from pathlib import Path
 
 import pandas as pd
 
 from bioetl.domain.clients.base.output.contracts import (
+    ChunkWriterABC,
     MetadataWriterABC,
+    OutputStreamABC,
     OutputWriterABC,
     QualityReportABC,
     WriterABC,
@@ -18,6 +22,9 @@ from bioetl.domain.models import RunContext
 from bioetl.infrastructure.files.atomic import AtomicFileOperation
 from bioetl.infrastructure.files.checksum import compute_file_sha256
 from bioetl.infrastructure.output.column_order import apply_column_order
+from bioetl.infrastructure.output.delta import HASH_INDEX_NAME, DeltaOutput
+from bioetl.infrastructure.output.external_sort import ExternalMergeSorter
+from bioetl.infrastructure.output.impl.quality_report import StreamingQualityStats
 from bioetl.infrastructure.output.metadata import build_run_metadata
 
 
@@ -29,6 +36,9 @@ class UnifiedOutputWriter(OutputWriterABC):
     - Атомарную запись (write-temp-and-rename)
     - Генерацию meta.yaml
     - QC-отчеты (quality_report, correlation_report)
+    - Потоковую запись по чанкам (``open_stream``) с внешней сортировкой
+    - Delta-режим (``output.delta``): файл изменений относительно
+      предыдущего запуска по индексу ``hash_business_key`` → ``hash_row``
     """
 
     def __init__(
@@ -39,13 +49,22 @@ class UnifiedOutputWriter(OutputWriterABC):
         config: DeterminismConfig,
         qc_config: QcConfig | None = None,
         atomic_op: AtomicFileOperation | None = None,
+        temp_dir: Path | None = None,
+        file_format: str = "csv",
     ) -> None:
+        if not writer.supports_format(file_format):
+            raise ValueError(
+                f"{type(writer).__name__} does not support output format "
+                f"'{file_format}'"
+            )
         self._writer = writer
         self._metadata_writer = metadata_writer
         self._quality_reporter = quality_reporter
         self._config = config
         self._qc_config = qc_config or QcConfig()
         self._atomic_op = atomic_op or AtomicFileOperation()
+        self._temp_dir = temp_dir or Path(tempfile.gettempdir())
+        self._file_format = file_format.lower()
 
     def write_result(
         self,
@@ -68,7 +87,8 @@ class UnifiedOutputWriter(OutputWriterABC):
         df_prepared = self._stable_sort(df_prepared, run_context, column_order)
 
         # 3. Атомарная запись
-        data_path = output_path / f"{entity_name}.csv"
+        data_path = self._data_path(output_path, entity_name)
+        delta = self._open_delta(output_path, entity_name, run_context, column_order)
 
         # Wrapper to capture inner write result
         inner_result: WriteResult | None = None
@@ -79,7 +99,16 @@ class UnifiedOutputWriter(OutputWriterABC):
                 df_prepared, path, column_order=column_order
             )
 
-        self._atomic_op.write_atomic(data_path, write_wrapper)
+        try:
+            if delta is not None:
+                # Удаленные строки берутся из предыдущего снимка до его замены.
+                delta.add(df_prepared)
+                delta.stage_removed()
+            self._atomic_op.write_atomic(data_path, write_wrapper)
+        except Exception:
+            if delta is not None:
+                delta.abort()
+            raise
 
         if inner_result is None:
             raise RuntimeError("Inner writer did not return result")
@@ -92,23 +121,116 @@ class UnifiedOutputWriter(OutputWriterABC):
             row_count=inner_result.row_count,
             duration_sec=inner_result.duration_sec,
             checksum=checksum,
+            delta=delta.commit() if delta is not None else None,
         )
 
         qc_artifacts = self._generate_qc_artifacts(df_prepared, output_path)
+        self._write_run_metadata(run_context, final_result, qc_artifacts, output_path)
+
+        return final_result
+
+    def open_stream(
+        self,
+        output_path: Path,
+        entity_name: str,
+        run_context: RunContext,
+        *,
+        column_order: list[str] | None = None,
+    ) -> OutputStreamABC:
+        """
+        Открывает потоковую запись: чанки дописываются во временный файл
+        и фиксируются атомарно при ``close``.
+
+        При ``stable_sort`` и заданных ``business_key_fields`` строки
+        упорядочиваются внешней сортировкой: отсортированные чанки выгружаются
+        в ``temp_dir`` и сливаются k-way merge при ``close``.
+        """
+        output_path.mkdir(parents=True, exist_ok=True)
+        data_path = self._data_path(output_path, entity_name)
+        tmp_path = self._atomic_op.temp_path(data_path)
+
+        def prepare(df: pd.DataFrame) -> pd.DataFrame:
+            if column_order:
+                return apply_column_order(df, column_order)
+            if self._config.stable_sort:
+                return df.reindex(sorted(df.columns), axis=1)
+            return df
+
+        def finalize(result: WriteResult, stats: StreamingQualityStats) -> None:
+            qc_artifacts = self._write_qc_artifacts(
+                output_path,
+                quality_report=lambda: stats.build_quality_report(
+                    min_coverage=self._qc_config.min_coverage
+                ),
+                correlation_report=stats.build_correlation_report,
+            )
+            self._write_run_metadata(run_context, result, qc_artifacts, output_path)
+
+        sort_keys = (
+            self._resolve_sort_keys(run_context) if self._config.stable_sort else []
+        )
+
+        return UnifiedOutputStream(
+            self._writer.open_chunk_writer(tmp_path, column_order=column_order),
+            atomic_op=self._atomic_op,
+            data_path=data_path,
+            tmp_path=tmp_path,
+            prepare=prepare,
+            finalize=finalize,
+            sorter_factory=(
+                (lambda keys: ExternalMergeSorter(keys, self._temp_dir))
+                if sort_keys
+                else None
+            ),
+            sort_keys=sort_keys,
+            delta=self._open_delta(output_path, entity_name, run_context, column_order),
+        )
+
+    def _data_path(self, output_path: Path, entity_name: str) -> Path:
+        return output_path / f"{entity_name}.{self._file_format}"
+
+    def _delta_path(self, output_path: Path, entity_name: str) -> Path:
+        return output_path / f"{entity_name}.delta.{self._file_format}"
+
+    def _open_delta(
+        self,
+        output_path: Path,
+        entity_name: str,
+        context: RunContext,
+        column_order: list[str] | None,
+    ) -> DeltaOutput | None:
+        output_config = context.config.get("output") or {}
+        if not output_config.get("delta", False):
+            return None
+        return DeltaOutput(
+            self._writer,
+            atomic_op=self._atomic_op,
+            snapshot_path=self._data_path(output_path, entity_name),
+            delta_path=self._delta_path(output_path, entity_name),
+            index_path=output_path / HASH_INDEX_NAME,
+            run_id=context.run_id,
+            column_order=column_order,
+        )
+
+    def _write_run_metadata(
+        self,
+        run_context: RunContext,
+        result: WriteResult,
+        qc_artifacts: list[Path],
+        output_path: Path,
+    ) -> None:
         qc_checksums = {path.name: compute_file_sha256(path) for path in qc_artifacts}
 
         # 5. Запись метаданных
         meta = build_run_metadata(
             run_context,
-            final_result,
+            result,
             qc_artifacts=qc_artifacts,
             qc_checksums=qc_checksums,
             qc_config=self._qc_config,
         )
         self._metadata_writer.write_meta(meta, output_path / "meta.yaml")
 
-        return final_result
-
     def _stable_sort(
         self,
         df: pd.DataFrame,
@@ -123,6 +245,17 @@ class UnifiedOutputWriter(OutputWriterABC):
             df = df.reindex(sorted(df.columns), axis=1)
 
         # 2. Sort rows by business key if configured
+        keys = self._resolve_sort_keys(context)
+        if keys:
+            # Only sort by keys that exist in dataframe
+            valid_keys = [k for k in keys if k in df.columns]
+            if valid_keys:
+                df = df.sort_values(by=valid_keys, kind="mergesort", ignore_index=True)
+
+        return df
+
+    @staticmethod
+    def _resolve_sort_keys(context: RunContext) -> list[str]:
         hashing_config = context.config.get("hashing", {})
         # Handle Pydantic model dump or dict
         if isinstance(hashing_config, dict):
@@ -130,25 +263,32 @@ class UnifiedOutputWriter(OutputWriterABC):
         else:
             # Should be dict if model_dump() was used, but being safe
             keys = getattr(hashing_config, "business_key_fields", None)
-
-        if keys:
-            # Only sort by keys that exist in dataframe
-            valid_keys = [k for k in keys if k in df.columns]
-            if valid_keys:
-                df = df.sort_values(by=valid_keys, ignore_index=True)
-
-        return df
+        return list(keys or [])
 
     def _generate_qc_artifacts(self, df: pd.DataFrame, output_path: Path) -> list[Path]:
+        return self._write_qc_artifacts(
+            output_path,
+            quality_report=lambda: self._quality_reporter.build_quality_report(
+                df, min_coverage=self._qc_config.min_coverage
+            ),
+            correlation_report=lambda: (
+                self._quality_reporter.build_correlation_report(df)
+            ),
+        )
+
+    def _write_qc_artifacts(
+        self,
+        output_path: Path,
+        *,
+        quality_report: Callable[[], pd.DataFrame],
+        correlation_report: Callable[[], pd.DataFrame],
+    ) -> list[Path]:
         artifacts: list[Path] = []
 
         if self._qc_config.enable_quality_report:
             artifacts.append(
                 self._write_qc_csv(
-                    output_path / "quality_report_table.csv",
-                    self._quality_reporter.build_quality_report(
-                        df, min_coverage=self._qc_config.min_coverage
-                    ),
+                    output_path / "quality_report_table.csv", quality_report()
                 )
             )
 
@@ -156,7 +296,7 @@ class UnifiedOutputWriter(OutputWriterABC):
             artifacts.append(
                 self._write_qc_csv(
                     output_path / "correlation_report_table.csv",
-                    self._quality_reporter.build_correlation_report(df),
+                    correlation_report(),
                 )
             )
 
@@ -169,3 +309,109 @@ class UnifiedOutputWriter(OutputWriterABC):
 
         self._atomic_op.write_atomic(path, write_wrapper)
         return path
+
+
+class UnifiedOutputStream(OutputStreamABC):
+    """
+    Сессия потоковой записи ``UnifiedOutputWriter``.
+
+    Держит в памяти только текущий чанк: данные дописываются в файл,
+    checksum, число строк и QC-статистика накапливаются инкрементально.
+    """
+
+    def __init__(
+        self,
+        chunk_writer: ChunkWriterABC,
+        *,
+        atomic_op: AtomicFileOperation,
+        data_path: Path,
+        tmp_path: Path,
+        prepare: Callable[[pd.DataFrame], pd.DataFrame],
+        finalize: Callable[[WriteResult, StreamingQualityStats], None],
+        sorter_factory: Callable[[list[str]], ExternalMergeSorter] | None = None,
+        sort_keys: list[str] | None = None,
+        delta: DeltaOutput | None = None,
+    ) -> None:
+        self._chunk_writer = chunk_writer
+        self._atomic_op = atomic_op
+        self._data_path = data_path
+        self._tmp_path = tmp_path
+        self._prepare = prepare
+        self._finalize = finalize
+        self._sorter_factory = sorter_factory
+        self._sort_keys = sort_keys or []
+        self._delta = delta
+        self._sorter: ExternalMergeSorter | None = None
+        self._stats = StreamingQualityStats()
+        self._chunk_count = 0
+        self._finished = False
+
+    @property
+    def chunk_count(self) -> int:
+        return self._chunk_count
+
+    def write_chunk(self, df: pd.DataFrame) -> None:
+        if self._finished:
+            raise RuntimeError("Output stream is already closed")
+        frame = self._prepare(df)
+        if self._chunk_count == 0:
+            self._init_sorter(frame)
+        if self._sorter is not None:
+            self._sorter.add(frame)
+        else:
+            self._emit(frame)
+        self._stats.update(frame)
+        self._chunk_count += 1
+
+    def close(self) -> WriteResult:
+        if self._finished:
+            raise RuntimeError("Output stream is already closed")
+        try:
+            if self._sorter is not None:
+                for batch in self._sorter.iter_sorted():
+                    self._emit(batch)
+                self._sorter.cleanup()
+            inner_result = self._chunk_writer.close()
+            if self._delta is not None:
+                self._delta.stage_removed()
+            self._atomic_op.commit(self._tmp_path, self._data_path)
+        except Exception:
+            self.abort()
+            raise
+        self._finished = True
+        delta_result = self._delta.commit() if self._delta is not None else None
+
+        final_result = WriteResult(
+            path=self._data_path,
+            row_count=inner_result.row_count,
+            duration_sec=inner_result.duration_sec,
+            checksum=inner_result.checksum or compute_file_sha256(self._data_path),
+            delta=delta_result,
+        )
+        self._finalize(final_result, self._stats)
+        return final_result
+
+    def abort(self) -> None:
+        if self._finished:
+            return
+        self._finished = True
+        self._chunk_writer.abort()
+        self._atomic_op.discard(self._tmp_path)
+        if self._sorter is not None:
+            self._sorter.cleanup()
+        if self._delta is not None:
+            self._delta.abort()
+
+    def _emit(self, frame: pd.DataFrame) -> None:
+        # Delta сравнивает ровно те порции, что уходят в снимок (после сортировки).
+        self._chunk_writer.write_chunk(frame)
+        if self._delta is not None:
+            self._delta.add(frame)
+
+    def _init_sorter(self, frame: pd.DataFrame) -> None:
+        if self._sorter_factory is None:
+            return
+        # Сортируем только по ключам, присутствующим в выходных колонках
+        keys = [key for key in self._sort_keys if key in frame.columns]
+        if keys:
+            self._sorter = self._sorter_factory(keys)
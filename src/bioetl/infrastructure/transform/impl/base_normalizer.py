@@ -8,11 +8,25 @@ import pandas as pd
 from pandas._typing import DtypeArg
 
 from bioetl.domain.transform.contracts import NormalizationConfigProvider
-from bioetl.domain.transform.normalizers import normalize_array, normalize_record
+from bioetl.domain.transform.normalization_marker import (
+    mark_normalized,
+    normalized_columns,
+)
+from bioetl.domain.transform.normalizers import (
+    InvalidValuesError,
+    normalize_array,
+    normalize_record,
+)
+from bioetl.domain.transform.normalizers.registry import get_series_normalizer
 from bioetl.infrastructure.transform.impl.serializer import (
     serialize_dict,
     serialize_list,
 )
+from bioetl.infrastructure.transform.impl.vectorized_normalize import (
+    VECTORIZED_SCALAR_DTYPES,
+    normalize_scalar_series,
+    normalize_string_series,
+)
 
 
 class BaseNormalizationService:
@@ -30,6 +44,7 @@ class BaseNormalizationService:
     def coerce_numeric_columns(self, df: pd.DataFrame) -> pd.DataFrame:
         """Cast configured numeric columns to nullable pandas dtypes."""
 
+        done = normalized_columns(df)
         for field_cfg in self._config.fields:
             name = field_cfg.get("name")
             dtype = field_cfg.get("data_type")
@@ -38,7 +53,7 @@ class BaseNormalizationService:
                 continue
 
             target_dtype = self._NUMERIC_DTYPES.get(dtype)
-            if target_dtype is None or name not in df.columns:
+            if target_dtype is None or name not in df.columns or name in done:
                 continue
 
             coerced = pd.to_numeric(df[name], errors="coerce")
@@ -46,6 +61,59 @@ class BaseNormalizationService:
 
         return df
 
+    def _pending_fields(self, df: pd.DataFrame) -> list[dict[str, Any]]:
+        """Поля конфигурации, которые есть в df и еще не нормализованы."""
+        done = normalized_columns(df)
+        return [
+            cast(dict[str, Any], field_cfg)
+            for field_cfg in self._config.fields
+            if isinstance(field_cfg.get("name"), str)
+            and field_cfg["name"] in df.columns
+            and field_cfg["name"] not in done
+        ]
+
+    def _finalize_normalized(
+        self, df: pd.DataFrame, fields: list[dict[str, Any]]
+    ) -> pd.DataFrame:
+        """Приводит числовые колонки и отмечает поля как нормализованные."""
+        df = self.coerce_numeric_columns(df)
+        mark_normalized(df, (field_cfg["name"] for field_cfg in fields))
+        return df
+
+    def _normalize_scalar_column(
+        self,
+        series: pd.Series,
+        dtype: str | None,
+        mode: str,
+        custom_normalizer: Callable[[Any], Any] | None,
+    ) -> pd.Series | None:
+        """Векторный путь: скалярные поля и ID с зарегистрированным series-аналогом."""
+        if custom_normalizer is not None:
+            return self._normalize_identifier_column(series, dtype, custom_normalizer)
+        if dtype not in VECTORIZED_SCALAR_DTYPES:
+            return None
+        return normalize_scalar_series(series, mode=mode, empty_value=self._empty_value)
+
+    def _normalize_identifier_column(
+        self,
+        series: pd.Series,
+        dtype: str | None,
+        custom_normalizer: Callable[[Any], Any],
+    ) -> pd.Series | None:
+        """Столбцовый аналог кастомного нормализатора (ID), если зарегистрирован."""
+        series_normalizer = get_series_normalizer(custom_normalizer)
+        if series_normalizer is None or self._is_container_dtype(dtype):
+            return None
+        try:
+            return normalize_string_series(
+                series, series_normalizer, empty_value=self._empty_value
+            )
+        except InvalidValuesError as exc:
+            raise InvalidValuesError(
+                f"Ошибка нормализации поля '{series.name}': {exc.reason}",
+                exc.invalid,
+            ) from exc
+
     def _resolve_mode(self, field_name: str) -> str:
         if field_name in self._config.normalization.case_sensitive_fields:
             return "sensitive"
@@ -95,24 +95,23 @@ class ChemblNormalizationService(
         return cast(NormalizedRecord, normalized)
 
     def normalize_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
-        normalized_df = df.copy()
-
-        for field_cfg in self._config.fields:
-            name = field_cfg.get("name")
-            if not name or name not in normalized_df.columns:
-                continue
-
+        fields = self._pending_fields(df)
+        if not fields:
+            return df
+
+        # Колонки только заменяются целиком: данных входа копия не касается.
+        normalized_df = df.copy(deep=False)
+        for field_cfg in fields:
+            name = field_cfg["name"]
             normalized_df[name] = self.normalize_series(normalized_df[name], field_cfg)
 
-        return self.coerce_numeric_columns(normalized_df)
+        return self._finalize_normalized(normalized_df, fields)
 
     def normalize_batch(self, df: pd.DataFrame) -> pd.DataFrame:
-        normalized = self.normalize_dataframe(df)
-        return self.coerce_numeric_columns(normalized)
+        return self.normalize_dataframe(df)
 
     def normalize_fields(self, df: pd.DataFrame) -> pd.DataFrame:
-        normalized = self.normalize_dataframe(df)
-        return self.coerce_numeric_columns(normalized)
+        return self.normalize_dataframe(df)
 
     def normalize_series(
         self, series: pd.Series, field_cfg: dict[str, Any]
@@ -122,6 +121,12 @@ class ChemblNormalizationService(
         mode = self._resolve_mode(name)
         custom_normalizer = normalize_impl.get_normalizer(name)
 
+        vectorized = self._normalize_scalar_column(
+            series, dtype, mode, custom_normalizer
+        )
+        if vectorized is not None:
+            return vectorized
+
         if custom_normalizer:
             base_normalizer = custom_normalizer
         else:
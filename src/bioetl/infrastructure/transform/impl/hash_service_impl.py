@@ -1,5 +1,5 @@
 from datetime import datetime, timezone
-from typing import Callable
+from typing import Any, Callable
 
 import pandas as pd
 
@@ -22,7 +22,11 @@ class HashServiceImpl(HashServiceABC):
         self._extracted_at: str | None = None
 
     def add_hash_columns(
-        self, df: pd.DataFrame, business_key_cols: list[str] | None = None
+        self,
+        df: pd.DataFrame,
+        business_key_cols: list[str] | None = None,
+        *,
+        copy: bool = True,
     ) -> pd.DataFrame:
         """
         Добавляет столбцы hash_row и hash_business_key.
@@ -32,7 +36,8 @@ class HashServiceImpl(HashServiceABC):
         2. Add hash_business_key to DataFrame.
         3. Calculate hash_row based on ALL columns as canonical JSON.
         """
-        df = df.copy()
+        if copy:
+            df = df.copy()
 
         # 1. hash_business_key
         if business_key_cols:
@@ -49,16 +54,17 @@ class HashServiceImpl(HashServiceABC):
         # 2. hash_row
         # Uses hash_row -> dict hashing (canonical object) of the full row
         # Note: This includes 'hash_business_key' which was just added/set.
-        df["hash_row"] = df.apply(self._hasher.hash_row, axis=1)
+        df["hash_row"] = self._hasher.hash_rows(df)
 
         return df
 
-    def add_index_column(self, df: pd.DataFrame) -> pd.DataFrame:
+    def add_index_column(self, df: pd.DataFrame, *, copy: bool = True) -> pd.DataFrame:
         """
         Добавляет колонку 'index' с порядковым номером строки (int), начиная с 0.
-        Возвращает копию df.
+        Возвращает копию df (при ``copy=False`` — сам df).
         """
-        df = df.copy()
+        if copy:
+            df = df.copy()
         start_index = self._index_counter
         end_index = start_index + len(df)
         df["index"] = list(range(start_index, end_index))
@@ -66,23 +72,27 @@ class HashServiceImpl(HashServiceABC):
         return df
 
     def add_database_version_column(
-        self, df: pd.DataFrame, database_version: str
+        self, df: pd.DataFrame, database_version: str, *, copy: bool = True
     ) -> pd.DataFrame:
         """
         Добавляет колонку 'database_version' со значением database_version (str).
-        Возвращает копию df.
+        Возвращает копию df (при ``copy=False`` — сам df).
         """
-        df = df.copy()
+        if copy:
+            df = df.copy()
         df["database_version"] = str(database_version)
         return df
 
-    def add_fulldate_column(self, df: pd.DataFrame) -> pd.DataFrame:
+    def add_fulldate_column(
+        self, df: pd.DataFrame, *, copy: bool = True
+    ) -> pd.DataFrame:
         """
         Добавляет колонку 'extracted_at' — метку времени извлечения в ISO-8601 (UTC).
         Значение одинаковое для всех строк.
-        Возвращает копию df.
+        Возвращает копию df (при ``copy=False`` — сам df).
         """
-        df = df.copy()
+        if copy:
+            df = df.copy()
         if self._extracted_at is None:
             self._extracted_at = self._now_provider().isoformat()
         df["extracted_at"] = self._extracted_at
@@ -93,3 +103,14 @@ class HashServiceImpl(HashServiceABC):
 
         self._index_counter = 0
         self._extracted_at = None
+
+    def export_state(self) -> dict[str, Any]:
+        """Возвращает сквозной индекс и метку extracted_at для чекпоинта."""
+
+        return {"index": self._index_counter, "extracted_at": self._extracted_at}
+
+    def restore_state(self, state: dict[str, Any]) -> None:
+        """Продолжает индекс и extracted_at прерванного запуска."""
+
+        self._index_counter = int(state.get("index", 0))
+        self._extracted_at = state.get("extracted_at")
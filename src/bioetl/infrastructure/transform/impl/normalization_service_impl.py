@@ -32,16 +32,20 @@ class NormalizationServiceImpl(NormalizationServiceABC, BaseNormalizationService
 
     def normalize_fields(self, df: pd.DataFrame) -> pd.DataFrame:
         """Проходит по полям конфигурации и применяет нормализацию."""
-        for field_cfg in self._config.fields:
+        fields = self._pending_fields(df)
+        for field_cfg in fields:
             name = field_cfg["name"]
             dtype = field_cfg.get("data_type")
-
-            if name not in df.columns:
-                continue
-
             mode = self._resolve_mode(name)
             custom_normalizer = normalize.get_normalizer(name)
 
+            vectorized = self._normalize_scalar_column(
+                df[name], dtype, mode, custom_normalizer
+            )
+            if vectorized is not None:
+                df[name] = vectorized
+                continue
+
             if custom_normalizer:
                 base_normalizer: Callable[[Any], Any] = custom_normalizer
             else:
@@ -76,7 +80,7 @@ class NormalizationServiceImpl(NormalizationServiceABC, BaseNormalizationService
             if dtype in ("array", "object"):
                 df[name] = df[name].astype("string").replace({pd.NA: None})
 
-        return self.coerce_numeric_columns(df)
+        return self._finalize_normalized(df, fields)
 
     def normalize(self, raw: pd.Series | dict[str, Any]) -> dict[str, Any]:
         normalized: dict[str, Any] = {}
@@ -116,22 +120,38 @@ class NormalizationServiceImpl(NormalizationServiceABC, BaseNormalizationService
         return normalized
 
     def normalize_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
-        normalized_df = df.copy()
+        fields = self._pending_fields(df)
+        if not fields:
+            # Чанк уже нормализован (например, в extractor) — повтор не нужен.
+            return df
+
+        # Колонки только заменяются целиком: данных входа копия не касается.
+        normalized_df = df.copy(deep=False)
+        for field_cfg in fields:
+            name = field_cfg["name"]
+            normalized_df[name] = self._fill_missing(
+                self.normalize_series(normalized_df[name], field_cfg)
+            )
 
-        for field_cfg in self._config.fields:
-            name = field_cfg.get("name")
-            if not name or name not in normalized_df.columns:
-                continue
+        return self._finalize_normalized(normalized_df, fields)
 
-            normalized_df[name] = self.normalize_series(
-                normalized_df[name], cast(dict[str, Any], field_cfg)
-            )
+    def _fill_missing(self, series: pd.Series) -> pd.Series:
+        """
+        Приводит пропуски object-колонки к ``pd.NA``.
 
-        return self.coerce_numeric_columns(normalized_df)
+        ``normalize_scalar`` превращает строки из пробелов в ``None``; раньше
+        их заменял на ``pd.NA`` повторный проход в transformer, теперь
+        пропускаемый по маркеру чанка.
+        """
+        if series.dtype != object:
+            return series
+        missing = series.isna()
+        if not missing.any():
+            return series
+        return series.mask(missing, self._empty_value)
 
     def normalize_batch(self, df: pd.DataFrame) -> pd.DataFrame:
-        normalized = self.normalize_dataframe(df)
-        return self.coerce_numeric_columns(normalized)
+        return self.normalize_dataframe(df)
 
     def normalize_series(
         self, series: pd.Series, field_cfg: dict[str, Any]
@@ -141,6 +161,12 @@ class NormalizationServiceImpl(NormalizationServiceABC, BaseNormalizationService
         mode = self._resolve_mode(name)
         custom_normalizer = normalize.get_normalizer(name)
 
+        vectorized = self._normalize_scalar_column(
+            series, dtype, mode, custom_normalizer
+        )
+        if vectorized is not None:
+            return vectorized
+
         if custom_normalizer:
             base_normalizer = custom_normalizer
         else:
@@ -102,16 +102,20 @@ class NormalizationServiceImpl(NormalizationServiceABC, BaseNormalizationService
         """
         Проходит по полям конфигурации и применяет нормализацию.
         """
-        for field_cfg in self._config.fields:
+        fields = self._pending_fields(df)
+        for field_cfg in fields:
             name = field_cfg["name"]
             dtype = field_cfg.get("data_type")
-
-            if name not in df.columns:
-                continue
-
             mode = self._resolve_mode(name)
             custom_normalizer = get_normalizer(name)
 
+            vectorized = self._normalize_scalar_column(
+                df[name], dtype, mode, custom_normalizer
+            )
+            if vectorized is not None:
+                df[name] = vectorized
+                continue
+
             if custom_normalizer:
                 base_normalizer: Callable[[Any], Any] = custom_normalizer
             else:
@@ -146,7 +150,7 @@ class NormalizationServiceImpl(NormalizationServiceABC, BaseNormalizationService
             if dtype in ("array", "object"):
                 df[name] = df[name].astype("string").replace({pd.NA: None})
 
-        return self.coerce_numeric_columns(df)
+        return self._finalize_normalized(df, fields)
 
     def normalize_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
         return self.normalize_fields(df)
@@ -162,6 +166,12 @@ class NormalizationServiceImpl(NormalizationServiceABC, BaseNormalizationService
         mode = self._resolve_mode(name)
         custom_normalizer = get_normalizer(name)
 
+        vectorized = self._normalize_scalar_column(
+            series, dtype, mode, custom_normalizer
+        )
+        if vectorized is not None:
+            return vectorized
+
         if custom_normalizer:
             base_normalizer = custom_normalizer
         else:
@@ -0,0 +1,153 @@
+"""
+Векторная нормализация скалярных столбцов.
+
+Столбцовый аналог ``normalize_scalar`` для полей ``string``/``number``/
+``integer`` без кастомного нормализатора. Результат совпадает с
+поэлементным ``Series.apply``; для значений, которые быстрый путь не
+покрывает (контейнеры, numpy-скаляры, extension dtypes), возвращается
+``None`` и сервис нормализует столбец поэлементно.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable
+
+import numpy as np
+import pandas as pd
+
+VECTORIZED_SCALAR_DTYPES = frozenset({"string", "number", "integer"})
+
+_NUMERIC_TYPES = frozenset({float, int, bool})
+# Выше 2**52 у float нет дробной части: np.rint и round() могут разойтись.
+_EXACT_SCALED_LIMIT = float(2**52)
+
+
+def round3(values: np.ndarray) -> np.ndarray:
+    """
+    ``round(value, 3)`` для float64-массива.
+
+    ``np.rint(x * 1000) / 1000`` совпадает с ``round`` везде, кроме значений,
+    у которых произведение лежит у границы .5 в пределах ошибки округления;
+    их (и inf/огромные значения) досчитывает встроенный ``round``.
+    """
+    with np.errstate(invalid="ignore", over="ignore"):
+        scaled = values * 1000.0
+        rounded = np.rint(scaled) / 1000.0
+        distance = np.abs(np.abs(scaled - np.trunc(scaled)) - 0.5)
+        risky = ~(np.abs(scaled) < _EXACT_SCALED_LIMIT) | (
+            distance <= np.abs(scaled) * 2.0**-50
+        )
+    if risky.any():
+        rounded[risky] = [round(value, 3) for value in values[risky].tolist()]
+    return rounded
+
+
+def normalize_scalar_series(
+    series: pd.Series, mode: str = "default", empty_value: Any = pd.NA
+) -> pd.Series | None:
+    """
+    Нормализует столбец как ``series.apply`` с ``normalize_scalar``.
+
+    Пропуски заменяются на ``empty_value``, строки из пробелов — на ``None``.
+    Возвращает ``None``, если столбец нужно обработать поэлементно.
+    """
+    dtype = series.dtype
+    if not isinstance(dtype, np.dtype):
+        return None
+    if dtype.kind == "b" or dtype == np.int64:
+        return series.copy()
+    if dtype.kind == "f":
+        return _from_floats(series, series.to_numpy(dtype=np.float64), empty_value)
+    if dtype.kind != "O":
+        return None
+
+    missing, present = _split_missing(series)
+    types = set(map(type, present))
+
+    if types <= {str}:
+        normalized = _normalize_strings(present, mode)
+    elif types <= _NUMERIC_TYPES:
+        normalized = _normalize_numbers(present, types)
+    else:
+        return None
+    return _assemble(series, missing, normalized, empty_value)
+
+
+def normalize_string_series(
+    series: pd.Series,
+    normalizer: Callable[[pd.Series], pd.Series],
+    empty_value: Any = pd.NA,
+) -> pd.Series | None:
+    """
+    Применяет столбцовый нормализатор к непустым строкам ``series``.
+
+    Пропуски заменяются на ``empty_value``. Возвращает ``None``, если среди
+    значений есть не-строки (их обрабатывает поэлементный нормализатор).
+    """
+    if series.dtype != object:
+        return None
+    missing, present = _split_missing(series)
+    if not set(map(type, present)) <= {str}:
+        return None
+    normalized = normalizer(
+        pd.Series(present, index=series.index[~missing], dtype=object)
+    )
+    return _assemble(series, missing, normalized.to_numpy(dtype=object), empty_value)
+
+
+def _split_missing(series: pd.Series) -> tuple[np.ndarray, np.ndarray]:
+    values = series.to_numpy()
+    missing = pd.isna(values)
+    return missing, values[~missing]
+
+
+def _assemble(
+    series: pd.Series, missing: np.ndarray, normalized: np.ndarray, empty_value: Any
+) -> pd.Series:
+    out = np.empty(len(series), dtype=object)
+    out[missing] = empty_value
+    out[~missing] = normalized
+    # infer_objects выводит dtype так же, как Series.apply.
+    return pd.Series(out, index=series.index, name=series.name).infer_objects()
+
+
+def _from_floats(series: pd.Series, values: np.ndarray, empty_value: Any) -> pd.Series:
+    missing = np.isnan(values)
+    rounded = round3(values)
+    if not missing.any():
+        return pd.Series(rounded, index=series.index, name=series.name)
+    out = rounded.astype(object)
+    out[missing] = empty_value
+    return pd.Series(out, index=series.index, name=series.name).infer_objects()
+
+
+def _normalize_strings(values: np.ndarray, mode: str) -> np.ndarray:
+    stripped = pd.Series(values, dtype=object).str.strip()
+    if mode == "id":
+        cased = stripped.str.upper()
+    elif mode == "sensitive":
+        cased = stripped
+    else:
+        cased = stripped.str.lower()
+    result = cased.to_numpy(dtype=object)
+    result[(stripped == "").to_numpy()] = None
+    return result
+
+
+def _normalize_numbers(values: np.ndarray, types: set[type]) -> np.ndarray:
+    if float not in types:
+        return values
+    if types == {float}:
+        return round3(values.astype(np.float64)).astype(object)
+    result = values.copy()
+    is_float = np.fromiter((type(value) is float for value in values), bool)
+    result[is_float] = round3(values[is_float].astype(np.float64)).astype(object)
+    return result
+
+
+__all__ = [
+    "VECTORIZED_SCALAR_DTYPES",
+    "normalize_scalar_series",
+    "normalize_string_series",
+    "round3",
+]
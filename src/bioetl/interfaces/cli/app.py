@@ -1,5 +1,7 @@
+import json
 import os
 import sys
+from dataclasses import asdict
 from functools import partial
 from pathlib import Path
 from typing import Any, Literal, Optional
@@ -8,10 +10,16 @@ import typer
 from rich.console import Console
 from rich.table import Table
 
+from bioetl.application.batch import (
+    CHEMBL_PIPELINE_GRAPH,
+    PipelineBatchOrchestrator,
+    PipelineSpec,
+)
 from bioetl.application.config.runtime import build_runtime_config
 from bioetl.application.orchestrator import PipelineOrchestrator
 from bioetl.application.pipelines.registry import PIPELINE_REGISTRY
 from bioetl.domain.configs import MetricsConfig
+from bioetl.domain.models import BatchRunReport
 from bioetl.domain.provider_registry import InMemoryProviderRegistry
 from bioetl.infrastructure.clients.provider_registry_loader import (
     create_provider_loader,
@@ -125,6 +133,17 @@ def run(
         "--background",
         help="Run pipeline in a background process",
     ),
+    resume: Optional[str] = typer.Option(
+        None,
+        "--resume",
+        metavar="RUN_ID",
+        help="Resume an interrupted run from its checkpoint",
+    ),
+    profile_stages: bool = typer.Option(
+        False,
+        "--profile-stages",
+        help="Profile CPU and memory per stage and chunk (writes profile.json)",
+    ),
 ):
     """
     Runs an ETL pipeline.
@@ -145,6 +164,7 @@ def run(
             input_mode=input_mode,
             csv_delimiter=csv_delimiter,
             csv_header=csv_header,
+            profile_stages=profile_stages,
         )
         config = build_runtime_config(
             config_path=resolved_config_path,
@@ -177,11 +197,15 @@ def run(
         console.print(f"[bold green]Starting pipeline: {pipeline_name}[/bold green]")
 
         if background:
-            future = orchestrator.run_in_background(dry_run=dry_run, limit=limit)
+            future = orchestrator.run_in_background(
+                dry_run=dry_run, limit=limit, resume=resume
+            )
             console.print("[yellow]Pipeline submitted to background executor[/yellow]")
             result = future.result()
         else:
-            result = orchestrator.run_pipeline(dry_run=dry_run, limit=limit)
+            result = orchestrator.run_pipeline(
+                dry_run=dry_run, limit=limit, resume=resume
+            )
 
         if result.success:
             console.print("[bold green]Pipeline finished successfully![/bold green]")
@@ -196,6 +220,123 @@ def run(
         sys.exit(1)
 
 
+@app.command("run-all")
+def run_all(
+    pipelines: Optional[str] = typer.Option(
+        None,
+        "--pipelines",
+        help="Comma-separated pipelines to run (default: all ChEMBL pipelines)",
+    ),
+    profile: str = typer.Option("default", help="Configuration profile"),
+    output: Optional[Path] = typer.Option(
+        None,
+        "--output",
+        "-o",
+        help="Base output directory (each pipeline writes to <output>/<entity>)",
+    ),
+    dry_run: bool = typer.Option(
+        False,
+        "--dry-run",
+        help="Run without writing output",
+    ),
+    limit: Optional[int] = typer.Option(
+        None,
+        "--limit",
+        help="Limit number of records to process per pipeline",
+    ),
+    workers: int = typer.Option(
+        2,
+        "--workers",
+        min=1,
+        help="Global worker budget shared by concurrently running pipelines",
+    ),
+    rate_limit: Optional[float] = typer.Option(
+        None,
+        "--rate-limit",
+        min=0.001,
+        help="Combined requests per second per provider (default: from configs)",
+    ),
+    report: Optional[Path] = typer.Option(
+        None,
+        "--report",
+        help="Write the aggregated run report as JSON",
+    ),
+):
+    """
+    Runs pipelines concurrently following their dependency graph.
+    """
+    try:
+        names = (
+            [name.strip() for name in pipelines.split(",") if name.strip()]
+            if pipelines
+            else list(CHEMBL_PIPELINE_GRAPH)
+        )
+        base_dir = _get_config_base_dir()
+        specs: list[PipelineSpec] = []
+        for name in names:
+            resolved_config_path = _resolve_config_location(
+                config_path=None, pipeline_name=name, base_dir=base_dir
+            )
+            if not resolved_config_path:
+                sys.exit(1)
+            config = build_runtime_config(
+                config_path=resolved_config_path,
+                profile=profile,
+                configs_root=base_dir,
+                cli_overrides=_collect_cli_overrides(
+                    output=output / name.rsplit("_", 1)[0] if output else None,
+                    input_path=None,
+                    input_mode=None,
+                    csv_delimiter=None,
+                    csv_header=None,
+                ),
+            )
+            depends_on = tuple(
+                dep for dep in CHEMBL_PIPELINE_GRAPH.get(name, ()) if dep in names
+            )
+            specs.append(PipelineSpec(name=name, config=config, depends_on=depends_on))
+
+        provider_loader_factory = partial(
+            create_provider_loader, config_path=base_dir / "providers.yaml"
+        )
+        batch = PipelineBatchOrchestrator(
+            specs,
+            max_workers=workers,
+            provider_rate_limits=(
+                {spec.config.provider: rate_limit for spec in specs}
+                if rate_limit
+                else None
+            ),
+            provider_loader_factory=provider_loader_factory,
+            use_provider_loader_port=any(
+                spec.config.features.enable_provider_loader_port for spec in specs
+            ),
+        )
+
+        console.print(
+            f"[bold green]Starting {len(specs)} pipelines"
+            f" (workers: {workers})[/bold green]"
+        )
+        batch_report = batch.run(dry_run=dry_run, limit=limit)
+        _print_batch_report(batch_report)
+        if report:
+            report.parent.mkdir(parents=True, exist_ok=True)
+            report.write_text(
+                json.dumps(asdict(batch_report), indent=2, default=str),
+                encoding="utf-8",
+            )
+            console.print(f"Report written to {report}")
+
+        if not batch_report.success:
+            console.print("[bold red]Some pipelines did not succeed![/bold red]")
+            sys.exit(1)
+        console.print("[bold green]All pipelines finished successfully![/bold green]")
+
+    except Exception:
+        console.print_exception()
+        sys.exit(1)
+
+
 @app.command()
 def smoke_run(pipeline_name: str):
     """
@@ -226,6 +367,27 @@ def _resolve_config_location(
     return None
 
 
+def _print_batch_report(batch_report: BatchRunReport) -> None:
+    table = Table(title="Pipelines")
+    table.add_column("Pipeline", style="cyan")
+    table.add_column("Status")
+    table.add_column("Rows", justify="right")
+    table.add_column("Duration (s)", justify="right")
+    table.add_column("Rate limit (rps)", justify="right")
+    table.add_column("Error")
+    for item in batch_report.pipelines:
+        table.add_row(
+            item.name,
+            item.status,
+            str(item.row_count),
+            f"{item.duration_sec:.2f}",
+            f"{item.rate_limit:g}" if item.rate_limit is not None else "-",
+            "; ".join(item.errors) or "-",
+        )
+    console.print(table)
+    console.print(f"Total duration: {batch_report.duration_sec:.2f}s")
+
+
 def _start_metrics_exporter(
     metrics_config: MetricsConfig, *, dry_run: bool = False
 ) -> None:
@@ -263,6 +425,7 @@ def _collect_cli_overrides(
     input_mode: Optional[Literal["csv", "id_only", "auto_detect"]],
     csv_delimiter: Optional[str],
     csv_header: Optional[bool],
+    profile_stages: bool = False,
 ) -> dict[str, Any]:
     overrides: dict[str, Any] = {}
     if output:
@@ -279,6 +442,8 @@ def _collect_cli_overrides(
         csv_options["header"] = csv_header
     if csv_options:
         overrides["csv_options"] = csv_options
+    if profile_stages:
+        overrides["profiling"] = {"enabled": True}
     return overrides
 
 
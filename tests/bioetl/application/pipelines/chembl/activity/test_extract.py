@@ -12,6 +12,7 @@ from bioetl.application.pipelines.chembl.pipeline import (
     ChemblEntityPipeline,
 )
 from bioetl.domain.observability import LoggingPort
+from bioetl.domain.record_source import RecordBatch
 from bioetl.infrastructure.config.models import (
     ChemblSourceConfig,
     CsvInputOptions,
@@ -136,6 +137,48 @@ def test_extract_full_data_csv(pipeline, mock_extraction_service, tmp_path):
     mock_extraction_service.request_batch.assert_not_called()
 
 
+def test_extract_csv_dataframe_chunks_respect_limit(pipeline, tmp_path):
+    """DataFrame-чанки CSV обрезаются по limit без перевода в записи."""
+    csv_path = tmp_path / "activity.csv"
+    pd.DataFrame({"activity_id": range(10, 15), "standard_type": ["IC50"] * 5}).to_csv(
+        csv_path, index=False
+    )
+
+    pipeline._extractor.record_source = CsvRecordSourceImpl(
+        input_path=csv_path,
+        csv_options=pipeline._config.csv_options,
+        limit=None,
+        logger=cast(LoggingPort, MagicMock()),
+        chunk_size=2,
+    )
+
+    df = pipeline.extract(limit=3)
+
+    assert df["activity_id"].tolist() == [10, 11, 12]
+
+
+class _ColumnarRecordSource:
+    def iter_records(self):
+        yield RecordBatch(
+            columns={"activity_id": [1, 2], "standard_type": ["IC50", "Ki"]},
+            num_rows=2,
+        )
+        yield RecordBatch(
+            columns={"activity_id": [3, 4], "standard_type": ["EC50", "Kd"]},
+            num_rows=2,
+        )
+
+
+def test_extract_consumes_record_batches(pipeline):
+    """Колоночные батчи идут в нормализацию без списков записей."""
+    pipeline._extractor.record_source = _ColumnarRecordSource()
+
+    df = pipeline.extract(limit=3)
+
+    assert df["activity_id"].tolist() == [1, 2, 3]
+    assert df["standard_type"].tolist() == ["IC50", "Ki", "EC50"]
+
+
 def test_extract_ids_only_csv(
     pipeline, mock_extraction_service, tmp_path, source_config
 ) -> None:
@@ -25,6 +25,7 @@ class ConcreteChemblPipeline(ChemblPipelineBase):
 @pytest.fixture
 def mock_dependencies_fixture():
     """Fixture for pipeline dependencies."""
+
     class _DummyHasher(HasherABC):
         def hash_row(self, _row):
             return "hash_row"
@@ -204,6 +205,30 @@ def test_transform_uses_batch_normalization(mock_dependencies_fixture):
     )
 
 
+def test_transform_builds_schema_plan_once(mock_dependencies_fixture):
+    """Schema columns and required columns are resolved on the first chunk only."""
+    normalization_service = MagicMock()
+    normalization_service.normalize_dataframe.side_effect = lambda df: df
+    validation_service = mock_dependencies_fixture["validation_service"]
+
+    pipeline = ConcreteChemblPipeline(
+        config=mock_dependencies_fixture["config"],
+        logger=mock_dependencies_fixture["logger"],
+        validation_service=validation_service,
+        output_writer=mock_dependencies_fixture["output_writer"],
+        extraction_service=mock_dependencies_fixture["extraction_service"],
+        normalization_service=normalization_service,
+        hash_service=mock_dependencies_fixture["hash_service"],
+    )
+
+    for _ in range(3):
+        result = pipeline.transform(pd.DataFrame({"a": [1, 2]}))
+
+    assert list(result.columns) == ["a", "transformed"]
+    assert validation_service.get_schema_columns.call_count == 1
+    assert validation_service.get_schema.call_count == 1
+
+
 def test_extract_handles_dataframe_chunks(mock_dependencies_fixture):
     """Test that extract yields DataFrame chunks for further processing."""
     record_source = MagicMock()
@@ -0,0 +1,226 @@
+"""
+Tests for resumable extraction: in-run retries and --resume across runs.
+"""
+
+# pylint: disable=redefined-outer-name, protected-access
+from typing import Any, Iterable
+from unittest.mock import MagicMock
+
+import pandas as pd
+import pytest
+
+from bioetl.application.pipelines import base
+from bioetl.application.pipelines.base import PipelineBase
+from bioetl.application.pipelines.chembl.extractor import ChemblExtractorImpl
+from bioetl.application.pipelines.hooks_impl import (
+    ContinueOnErrorPolicyImpl,
+    FailFastErrorPolicyImpl,
+)
+from bioetl.domain.errors import PipelineStageError
+from bioetl.domain.record_source import ApiRecordSource, RecordSource
+from bioetl.domain.transform.hash_service import HashService
+from bioetl.infrastructure.files.checkpoint_store import FileCheckpointStoreImpl
+from bioetl.infrastructure.files.csv_record_source import CsvRecordSourceImpl
+
+_RECORDS = [{"id": i, "val": f"v{i}"} for i in range(6)]
+
+
+class _PagedService:
+    """Extraction service stub: pages of 2 records, optional failure at offset."""
+
+    def __init__(self, fail_at: int | None = None, failures: int = 1) -> None:
+        self.requested: list[int] = []
+        self._fail_at = fail_at
+        self._failures = failures
+
+    def iter_extract(
+        self, entity: str, *, chunk_size: int | None = None, **filters: Any
+    ) -> Iterable[list[dict[str, Any]]]:
+        offset = int(filters.get("offset", 0))
+        page = chunk_size or 2
+        while offset < len(_RECORDS):
+            self.requested.append(offset)
+            if offset == self._fail_at and self._failures > 0:
+                self._failures -= 1
+                raise ConnectionError("transient")
+            yield [dict(record) for record in _RECORDS[offset : offset + page]]
+            offset += page
+
+
+class _Pipeline(PipelineBase):
+    pass
+
+
+def _build_pipeline(
+    service: _PagedService,
+    *,
+    mock_config,
+    mock_logger,
+    mock_validation_service,
+    mock_output_writer,
+    error_policy,
+    record_source: RecordSource | None = None,
+) -> _Pipeline:
+    normalization = MagicMock()
+    normalization.normalize_batch.side_effect = lambda df: df
+    extractor = ChemblExtractorImpl(
+        config=mock_config,
+        extraction_service=service,  # type: ignore[arg-type]
+        normalization_service=normalization,
+        logger=mock_logger,
+        record_source=record_source
+        or ApiRecordSource(service, "test_entity", chunk_size=2),  # type: ignore[arg-type]
+    )
+    return _Pipeline(
+        config=mock_config,
+        logger=mock_logger,
+        validation_service=mock_validation_service,
+        output_writer=mock_output_writer,
+        hash_service=HashService(),
+        extractor=extractor,
+        error_policy=error_policy,
+    )
+
+
+def _written(mock_output_writer) -> pd.DataFrame:
+    return mock_output_writer.write_result.call_args.kwargs["df"]
+
+
+@pytest.mark.unit
+def test_retry_resumes_from_last_chunk_without_refetch(
+    mock_config, mock_logger, mock_validation_service, mock_output_writer, tmp_path
+):
+    service = _PagedService(fail_at=4)
+    pipeline = _build_pipeline(
+        service,
+        mock_config=mock_config,
+        mock_logger=mock_logger,
+        mock_validation_service=mock_validation_service,
+        mock_output_writer=mock_output_writer,
+        error_policy=ContinueOnErrorPolicyImpl(max_retries=1),
+    )
+
+    result = pipeline.run(output_path=tmp_path / "out.csv")
+
+    assert result.success
+    assert service.requested == [0, 2, 4, 4]
+    written = _written(mock_output_writer)
+    assert written["id"].tolist() == list(range(6))
+    assert written["index"].tolist() == list(range(6))
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("workers", [1, 2])
+def test_resume_continues_failed_run_from_checkpoint(
+    mock_config,
+    mock_logger,
+    mock_validation_service,
+    mock_output_writer,
+    tmp_path,
+    workers,
+):
+    mock_config = mock_config.model_copy(update={"workers": workers})
+    store = FileCheckpointStoreImpl(tmp_path / "checkpoints")
+    failing = _PagedService(fail_at=4)
+    first = _build_pipeline(
+        failing,
+        mock_config=mock_config,
+        mock_logger=mock_logger,
+        mock_validation_service=mock_validation_service,
+        mock_output_writer=mock_output_writer,
+        error_policy=FailFastErrorPolicyImpl(),
+    )
+    first.set_checkpoint_store(store)
+
+    with pytest.raises(PipelineStageError) as excinfo:
+        first.run(output_path=tmp_path / "out.csv")
+
+    run_id = excinfo.value.run_id
+    checkpoint = store.load(run_id)
+    assert checkpoint is not None
+    assert checkpoint.cursor == {"rows": 4, "source": {"offset": 4}}
+    assert [chunk.rows for chunk in checkpoint.chunks] == [2, 2]
+
+    healthy = _PagedService()
+    second = _build_pipeline(
+        healthy,
+        mock_config=mock_config,
+        mock_logger=mock_logger,
+        mock_validation_service=mock_validation_service,
+        mock_output_writer=mock_output_writer,
+        error_policy=FailFastErrorPolicyImpl(),
+    )
+    second.set_checkpoint_store(store)
+
+    result = second.run(output_path=tmp_path / "out.csv", resume=run_id)
+
+    assert result.success
+    assert result.run_id == run_id
+    assert result.row_count == 6
+    assert healthy.requested == [4]
+    written = _written(mock_output_writer)
+    assert written["id"].tolist() == list(range(6))
+    assert written["index"].tolist() == list(range(6))
+    assert written["extracted_at"].nunique() == 1
+    assert store.load(run_id) is None
+
+
+@pytest.mark.unit
+def test_resume_requires_checkpoint_store(
+    mock_config, mock_logger, mock_validation_service, mock_output_writer, tmp_path
+):
+    pipeline = _build_pipeline(
+        _PagedService(),
+        mock_config=mock_config,
+        mock_logger=mock_logger,
+        mock_validation_service=mock_validation_service,
+        mock_output_writer=mock_output_writer,
+        error_policy=FailFastErrorPolicyImpl(),
+    )
+
+    with pytest.raises(ValueError, match="storage.checkpoints.enabled"):
+        pipeline.run(output_path=tmp_path / "out.csv", resume="missing")
+
+    pipeline.set_checkpoint_store(FileCheckpointStoreImpl(tmp_path))
+    with pytest.raises(ValueError, match="No checkpoint found"):
+        pipeline.run(output_path=tmp_path / "out.csv", resume="missing")
+
+
+@pytest.mark.unit
+def test_checkpoints_do_not_buffer_chunks_of_non_resumable_source(
+    mock_config,
+    mock_logger,
+    mock_validation_service,
+    mock_output_writer,
+    tmp_path,
+    monkeypatch,
+):
+    input_path = tmp_path / "input.csv"
+    pd.DataFrame(_RECORDS).to_csv(input_path, index=False)
+    pending_sizes: list[int] = []
+
+    class _SpyCheckpointer(base._ChunkCheckpointer):
+        def append(self, df: pd.DataFrame, /) -> None:
+            super().append(df)
+            pending_sizes.append(len(self._pending))
+
+    monkeypatch.setattr(base, "_ChunkCheckpointer", _SpyCheckpointer)
+    store = FileCheckpointStoreImpl(tmp_path / "checkpoints")
+    pipeline = _build_pipeline(
+        _PagedService(),
+        mock_config=mock_config,
+        mock_logger=mock_logger,
+        mock_validation_service=mock_validation_service,
+        mock_output_writer=mock_output_writer,
+        error_policy=FailFastErrorPolicyImpl(),
+        record_source=CsvRecordSourceImpl(
+            input_path, {}, limit=None, logger=mock_logger, chunk_size=2
+        ),
+    )
+    pipeline.set_checkpoint_store(store)
+
+    result = pipeline.run(output_path=tmp_path / "out.csv")
+
+    assert result.success
+    assert pending_sizes == [0, 0, 0]
+    assert _written(mock_output_writer)["id"].tolist() == list(range(6))
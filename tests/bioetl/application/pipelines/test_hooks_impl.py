@@ -97,3 +97,33 @@ def test_metrics_hook_records_failed_stage() -> None:
     assert duration_sum == 0.2
     assert duration_count == 1.0
     assert counter_child._value.get() == 1.0
+
+
+def test_metrics_hook_records_chunk_throughput(monkeypatch) -> None:
+    clock = iter([10.0, 10.5, 20.0, 20.1])
+    monkeypatch.setattr(
+        "bioetl.application.pipelines.hooks_impl.time.perf_counter",
+        lambda: next(clock),
+    )
+    hook = MetricsPipelineHookImpl(
+        pipeline_id="pipeline-chunks",
+        provider="chembl",
+        entity_name="activity",
+    )
+    labels = {
+        "pipeline": "pipeline-chunks",
+        "provider": "chembl",
+        "entity": "activity",
+        "stage": "transform",
+    }
+
+    hook.on_chunk_start("transform", None)
+    hook.on_chunk_end("transform", 100)
+    hook.on_chunk_start("transform", None)
+    hook.on_chunk_end("transform", 0)
+
+    assert metrics.STAGE_ROWS_TOTAL.labels(**labels)._value.get() == 100.0
+    # Пустой чанк не сбрасывает gauge последнего чанка.
+    assert metrics.STAGE_CHUNK_ROWS.labels(**labels)._value.get() == 100.0
+    assert metrics.STAGE_ROWS_PER_SECOND.labels(**labels)._value.get() == 200.0
+    assert metrics.PROCESS_MAX_RSS_BYTES._value.get() > 0
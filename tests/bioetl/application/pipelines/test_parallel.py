@@ -0,0 +1,200 @@
+"""
+Tests for parallel (process pool) chunk processing.
+"""
+
+# pylint: disable=redefined-outer-name
+import threading
+import time
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+import pandas as pd
+import pytest
+
+from bioetl.application.pipelines.base import PipelineBase
+from bioetl.application.pipelines.hooks_impl import ContinueOnErrorPolicyImpl
+from bioetl.application.pipelines.parallel import (
+    ChunkOutcome,
+    OrderedChunkPool,
+    parallel_processing_supported,
+)
+from bioetl.domain.errors import PipelineStageError
+from bioetl.domain.transform.factories import default_post_transformer
+from bioetl.domain.transform.hash_service import HashService
+from bioetl.domain.transform.transformers import (
+    FulldateTransformer,
+    IndexColumnTransformer,
+    TransformerChain,
+)
+
+pytestmark = pytest.mark.skipif(
+    not parallel_processing_supported(), reason="requires fork start method"
+)
+
+CHUNKS = [
+    pd.DataFrame({"id": list(range(start, start + size)), "val": ["v"] * size})
+    for start, size in [(0, 3), (3, 1), (4, 4), (8, 2), (10, 3)]
+]
+
+
+class SlowFirstPipeline(PipelineBase):
+    """Ранние чанки обрабатываются дольше поздних."""
+
+    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        if not df.empty:
+            time.sleep(0.05 if df["id"].iloc[0] < 4 else 0.0)
+        return df.assign(double=df["id"] * 2)
+
+
+def _frozen_hash_service() -> HashService:
+    return HashService(now_provider=lambda: datetime(2024, 1, 1, tzinfo=timezone.utc))
+
+
+def _run(config, logger, validation_service, output_writer, tmp_path, **kwargs):
+    extractor = MagicMock()
+    extractor.extract.return_value = [chunk.copy() for chunk in CHUNKS]
+    pipeline = SlowFirstPipeline(
+        config=config,
+        logger=logger,
+        validation_service=validation_service,
+        output_writer=output_writer,
+        hash_service=_frozen_hash_service(),
+        extractor=extractor,
+        **kwargs,
+    )
+    result = pipeline.run(output_path=tmp_path)
+    written = output_writer.write_result.call_args.kwargs["df"]
+    return result, written
+
+
+@pytest.mark.unit
+def test_parallel_run_matches_serial_output(
+    mock_config, mock_logger, mock_validation_service, mock_output_writer, tmp_path
+):
+    serial_result, serial = _run(
+        mock_config, mock_logger, mock_validation_service, mock_output_writer, tmp_path
+    )
+    mock_config.workers = 3
+    parallel_result, parallel = _run(
+        mock_config, mock_logger, mock_validation_service, mock_output_writer, tmp_path
+    )
+
+    pd.testing.assert_frame_equal(parallel, serial)
+    assert list(parallel["index"]) == list(range(13))
+    assert list(parallel["id"]) == list(range(13))
+    assert parallel["extracted_at"].nunique() == 1
+    assert parallel_result.row_count == serial_result.row_count == 13
+    assert [
+        (s.stage_name, s.records_processed, s.chunks_processed)
+        for s in parallel_result.stages
+    ] == [
+        (s.stage_name, s.records_processed, s.chunks_processed)
+        for s in serial_result.stages
+    ]
+
+
+@pytest.mark.unit
+def test_parallel_validation_error_fails_stage(
+    mock_config, mock_logger, mock_validation_service, mock_output_writer, tmp_path
+):
+    mock_config.workers = 2
+
+    def _validate(df, **_):
+        if 8 in set(df["id"]):
+            raise ValueError("bad chunk")
+        return df
+
+    mock_validation_service.validate.side_effect = _validate
+
+    with pytest.raises(PipelineStageError) as exc_info:
+        _run(
+            mock_config,
+            mock_logger,
+            mock_validation_service,
+            mock_output_writer,
+            tmp_path,
+        )
+
+    assert exc_info.value.stage == "validate"
+    assert "bad chunk" in str(exc_info.value.cause)
+
+
+@pytest.mark.unit
+def test_parallel_skip_policy_drops_failed_chunk(
+    mock_config, mock_logger, mock_validation_service, mock_output_writer, tmp_path
+):
+    mock_config.workers = 2
+
+    def _validate(df, **_):
+        if 3 in set(df["id"]):
+            raise ValueError("bad chunk")
+        return df
+
+    mock_validation_service.validate.side_effect = _validate
+
+    result, written = _run(
+        mock_config,
+        mock_logger,
+        mock_validation_service,
+        mock_output_writer,
+        tmp_path,
+        error_policy=ContinueOnErrorPolicyImpl(),
+    )
+
+    assert result.success
+    assert 3 not in set(written["id"])
+    assert list(written["index"]) == list(range(len(written)))
+
+
+@pytest.mark.unit
+def test_ordered_pool_returns_results_in_submission_order():
+    def _stages(df: pd.DataFrame) -> ChunkOutcome:
+        time.sleep(0.05 if df["id"].iloc[0] == 0 else 0.0)
+        return ChunkOutcome(validated=df.assign(seen=True))
+
+    pool = OrderedChunkPool(_stages, workers=2, max_pending=2)
+    try:
+        ready = []
+        for chunk in CHUNKS:
+            ready.extend(pool.submit(chunk))
+        ready.extend(pool.drain())
+    finally:
+        pool.shutdown()
+
+    assert [raw["id"].iloc[0] for raw, _ in ready] == [0, 3, 4, 8, 10]
+    assert all(outcome.validated["seen"].all() for _, outcome in ready)
+
+
+_PARENT_LOCK = threading.Lock()
+
+
+@pytest.mark.unit
+def test_ordered_pool_forks_workers_before_first_submit():
+    def _stages(df: pd.DataFrame) -> ChunkOutcome:
+        # Блокировка, захваченная родителем после форка, в воркере свободна.
+        if not _PARENT_LOCK.acquire(timeout=1):
+            return ChunkOutcome(failed_stage="transform", error=RuntimeError("held"))
+        _PARENT_LOCK.release()
+        return ChunkOutcome(validated=df)
+
+    pool = OrderedChunkPool(_stages, workers=2)
+    try:
+        with _PARENT_LOCK:
+            pool.submit(CHUNKS[0])
+            ((_, outcome),) = pool.drain()
+    finally:
+        pool.shutdown()
+
+    assert outcome.error is None
+
+
+@pytest.mark.unit
+def test_order_dependent_part_selects_stateful_transformers():
+    hash_service = HashService()
+    chain = default_post_transformer(hash_service=hash_service, business_key_fields=[])
+
+    part = chain.order_dependent_part()
+
+    assert isinstance(part, TransformerChain)
+    kinds = [type(t) for t in part._transformers]  # pylint: disable=protected-access
+    assert kinds == [IndexColumnTransformer, FulldateTransformer]
@@ -14,6 +14,7 @@ from bioetl.application.pipelines.hooks_impl import (
     ContinueOnErrorPolicyImpl,
     FailFastErrorPolicyImpl,
 )
+from bioetl.domain.clients.base.output.contracts import WriteResult
 from bioetl.domain.errors import PipelineStageError
 from bioetl.domain.models import RunContext
 from bioetl.domain.pipelines.contracts import PipelineHookABC
@@ -176,6 +177,39 @@ def test_pipeline_hooks(
     assert args[0] == "extract"
 
 
+@pytest.mark.unit
+def test_pipeline_chunk_and_run_end_hooks(
+    mock_config,
+    mock_logger,
+    mock_validation_service,
+    mock_output_writer,
+    hash_service,
+    default_extractor,
+):
+    """Хуки получают границы чанков каждой стадии и конец запуска."""
+    pipeline = ConcretePipeline(
+        mock_config,
+        mock_logger,
+        mock_validation_service,
+        mock_output_writer,
+        hash_service,
+        extractor=default_extractor,
+    )
+    mock_hook = MagicMock(spec=PipelineHookABC)
+    pipeline.add_hook(mock_hook)
+    # Повторная регистрация того же хука не дублирует вызовы.
+    pipeline.add_hooks([mock_hook])
+
+    pipeline.run(Path("dummy"), dry_run=True)
+
+    starts = [call.args[0] for call in mock_hook.on_chunk_start.call_args_list]
+    ends = [call.args for call in mock_hook.on_chunk_end.call_args_list]
+    # Последний extract-чанк — исчерпание итератора (0 строк).
+    assert starts == ["extract", "transform", "validate", "extract"]
+    assert ends == [("extract", 2), ("transform", 2), ("validate", 2), ("extract", 0)]
+    mock_hook.on_run_end.assert_called_once()
+
+
 @pytest.mark.unit
 def test_pipeline_error_hooks(
     mock_config,
@@ -354,6 +388,79 @@ def test_error_policy_failfast_raises(
     assert pipeline.extract.call_count == 1
 
 
+@pytest.mark.unit
+def test_pipeline_streaming_write_appends_each_chunk(
+    mock_config,
+    mock_logger,
+    mock_validation_service,
+    mock_output_writer,
+    tmp_path,
+    hash_service,
+):
+    """В потоковом режиме чанки пишутся по мере валидации, без concat."""
+    mock_config.output.streaming = True
+    stream = mock_output_writer.open_stream.return_value
+    stream.close.return_value = WriteResult(
+        path=tmp_path / "test_entity.csv", row_count=3, duration_sec=0.1
+    )
+    extractor = MagicMock()
+    extractor.extract.return_value = [
+        pd.DataFrame({"id": [1, 2], "val": ["x", "y"]}),
+        pd.DataFrame({"id": [3], "val": ["z"]}),
+    ]
+    pipeline = ConcretePipeline(
+        config=mock_config,
+        logger=mock_logger,
+        validation_service=mock_validation_service,
+        output_writer=mock_output_writer,
+        hash_service=hash_service,
+        extractor=extractor,
+    )
+
+    result = pipeline.run(output_path=tmp_path)
+
+    assert result.success
+    assert result.row_count == 3
+    mock_output_writer.write_result.assert_not_called()
+    assert stream.write_chunk.call_count == 2
+    written = [call.args[0] for call in stream.write_chunk.call_args_list]
+    assert list(written[1]["id"]) == [3]
+    stream.close.assert_called_once()
+    write_stage = next(s for s in result.stages if s.stage_name == "write")
+    assert write_stage.records_processed == 3
+    assert write_stage.chunks_processed == 2
+
+
+@pytest.mark.unit
+def test_pipeline_streaming_write_aborts_on_failure(
+    mock_config,
+    mock_logger,
+    mock_validation_service,
+    mock_output_writer,
+    tmp_path,
+    hash_service,
+    default_extractor,
+):
+    """Ошибка в середине потока отменяет запись и не фиксирует файл."""
+    mock_config.output.streaming = True
+    stream = mock_output_writer.open_stream.return_value
+    mock_validation_service.validate.side_effect = ValueError("invalid")
+    pipeline = ConcretePipeline(
+        config=mock_config,
+        logger=mock_logger,
+        validation_service=mock_validation_service,
+        output_writer=mock_output_writer,
+        hash_service=hash_service,
+        extractor=default_extractor,
+    )
+
+    with pytest.raises(PipelineStageError):
+        pipeline.run(output_path=tmp_path)
+
+    stream.abort.assert_called()
+    stream.close.assert_not_called()
+
+
 @pytest.mark.unit
 def test_hashing_logic(
     mock_config,
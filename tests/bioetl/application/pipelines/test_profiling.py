@@ -0,0 +1,113 @@
+"""
+Tests for the stage profiling hook (``bioetl run --profile-stages``).
+"""
+
+from __future__ import annotations
+
+import json
+import pstats
+import tracemalloc
+from types import SimpleNamespace
+
+import pytest
+
+from bioetl.application.pipelines.profiling import (
+    PROFILE_REPORT_NAME,
+    ProfilingPipelineHookImpl,
+)
+from bioetl.domain.configs import ProfilingConfig
+
+_CONTEXT = SimpleNamespace(run_id="run-1")
+
+
+def _hook(tmp_path, **config) -> ProfilingPipelineHookImpl:
+    return ProfilingPipelineHookImpl(
+        ProfilingConfig(enabled=True, **config), output_dir=tmp_path / "out"
+    )
+
+
+def _allocate(size: int) -> list[bytes]:
+    return [bytes(1024) for _ in range(size)]
+
+
+@pytest.mark.unit
+def test_hook_aggregates_chunks_per_stage(tmp_path):
+    hook = _hook(tmp_path, tracemalloc=True, sample_every_n_chunks=2)
+    retained = []
+
+    hook.on_stage_start("extract", _CONTEXT)
+    for rows in (3, 4, 5):
+        hook.on_chunk_start("extract", _CONTEXT)
+        retained.append(_allocate(200))
+        hook.on_chunk_end("extract", rows)
+    hook.on_chunk_start("validate", _CONTEXT)
+    hook.on_chunk_end("validate", 12)
+
+    extract = hook.stages["extract"]
+    assert (extract.chunks, extract.rows) == (3, 12)
+    assert extract.cpu_sec >= 0 and extract.wall_sec > 0
+    assert extract.py_peak_bytes is not None and extract.py_peak_bytes >= 200 * 1024
+    assert [chunk.index for chunk in hook.chunks] == [0, 1, 2, 0]
+    # Снимки tracemalloc — на первом и каждом втором чанке стадии.
+    assert [chunk.sampled for chunk in hook.chunks] == [True, False, True, True]
+    top = extract.top_allocators(3)
+    assert top[0]["location"].startswith(__file__)
+    assert top[0]["size_bytes"] >= 2 * 200 * 1024
+
+    hook.on_run_end(_CONTEXT)
+    assert not tracemalloc.is_tracing()
+    assert hook.stages == {}
+
+
+@pytest.mark.unit
+def test_run_end_writes_report_and_pstats(tmp_path):
+    hook = _hook(tmp_path, tracemalloc=False, cprofile=True, top_allocators=2)
+
+    hook.on_stage_start("transform", _CONTEXT)
+    hook.on_chunk_start("transform", _CONTEXT)
+    _allocate(10)
+    hook.on_chunk_end("transform", 7)
+    hook.on_run_end(_CONTEXT)
+
+    out = tmp_path / "out"
+    report = json.loads((out / PROFILE_REPORT_NAME).read_text(encoding="utf-8"))
+    assert report["run_id"] == "run-1"
+    stage = report["stages"]["transform"]
+    assert stage["chunks"] == 1 and stage["rows"] == 7
+    assert stage["py_peak_bytes"] is None
+    assert stage["top_allocators"] == []
+    assert stage["pstats"] == "profile.transform.pstats"
+    assert report["chunks"][0]["stage"] == "transform"
+    stats = pstats.Stats(str(out / "profile.transform.pstats"))
+    assert any(func[2] == "_allocate" for func in stats.stats)  # type: ignore[attr-defined]
+
+
+@pytest.mark.unit
+def test_exhausted_extract_call_is_not_counted_as_chunk(tmp_path):
+    hook = _hook(tmp_path, tracemalloc=False, cprofile=True)
+
+    hook.on_stage_start("extract", _CONTEXT)
+    for rows in (3, 0):
+        hook.on_chunk_start("extract", _CONTEXT)
+        hook.on_chunk_end("extract", rows)
+    hook.on_chunk_start("validate", _CONTEXT)
+    hook.on_chunk_end("validate", 0)
+
+    report = hook.build_report()
+    assert report["stages"]["extract"]["chunks"] == 1
+    assert report["stages"]["extract"]["rows"] == 3
+    assert [(c["stage"], c["rows"]) for c in report["chunks"]] == [
+        ("extract", 3),
+        ("validate", 0),
+    ]
+
+
+@pytest.mark.unit
+def test_unmatched_chunk_end_is_ignored(tmp_path):
+    hook = _hook(tmp_path, tracemalloc=False)
+
+    hook.on_chunk_end("write", 5)
+    hook.on_chunk_start("extract", _CONTEXT)
+    hook.on_chunk_end("write", 5)
+
+    assert hook.chunks == []
@@ -0,0 +1,209 @@
+"""
+Tests for the pipeline batch scheduler (``bioetl run-all``).
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from bioetl.application.batch import (
+    PipelineBatchOrchestrator,
+    PipelineSpec,
+    split_provider_rate_limits,
+    with_rate_limit,
+)
+from bioetl.domain.configs import (
+    AdaptiveRateLimitConfig,
+    ChemblSourceConfig,
+    PipelineConfig,
+)
+from bioetl.domain.models import RunResult
+
+
+def _config(entity: str, *, workers: int = 1, rate: float = 10.0) -> PipelineConfig:
+    return PipelineConfig(
+        id=f"chembl.{entity}",
+        provider="chembl",
+        entity=entity,
+        input_mode="auto_detect",
+        input_path=None,
+        output_path=f"out/{entity}",
+        batch_size=10,
+        workers=workers,
+        provider_config=ChemblSourceConfig(
+            base_url="https://www.ebi.ac.uk/chembl/api/data",
+            timeout_sec=30,
+            max_retries=3,
+            rate_limit_per_sec=rate,
+        ),
+    )
+
+
+def _spec(name: str, *depends_on: str, workers: int = 1) -> PipelineSpec:
+    return PipelineSpec(
+        name=name, config=_config(name, workers=workers), depends_on=depends_on
+    )
+
+
+class _Runner:
+    """Подменяет запуск пайплайна в процессе и записывает порядок и параллелизм."""
+
+    def __init__(self, *, fail: set[str] | None = None, delay: float = 0.05) -> None:
+        self.fail = fail or set()
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+        self.started: list[str] = []
+        self.finished: list[str] = []
+        self.payloads: dict[str, dict[str, Any]] = {}
+
+    def __call__(self, name: str, payload: dict[str, Any], *args: Any) -> RunResult:
+        with self.lock:
+            self.active += payload["workers"]
+            self.peak = max(self.peak, self.active)
+            self.started.append(name)
+            self.payloads[name] = payload
+        time.sleep(self.delay)
+        with self.lock:
+            self.active -= payload["workers"]
+            self.finished.append(name)
+        if name in self.fail:
+            raise RuntimeError(f"{name} exploded")
+        return RunResult(
+            run_id=f"run-{name}",
+            success=True,
+            entity_name=name,
+            row_count=3,
+            output_path=Path(payload["output_path"]),
+            duration_sec=self.delay,
+            stages=[],
+            errors=[],
+            meta={},
+        )
+
+
+def _batch(specs, runner, **kwargs) -> PipelineBatchOrchestrator:
+    return PipelineBatchOrchestrator(
+        specs,
+        executor_factory=lambda workers: ThreadPoolExecutor(max_workers=workers),
+        runner=runner,
+        **kwargs,
+    )
+
+
+@pytest.mark.unit
+def test_independent_pipelines_run_concurrently_after_dependencies():
+    runner = _Runner()
+    specs = [_spec("activity", "assay"), _spec("assay"), _spec("target")]
+
+    report = _batch(specs, runner, max_workers=2).run(limit=5)
+
+    assert report.success
+    assert runner.peak == 2
+    assert runner.finished.index("assay") < runner.started.index("activity")
+    assert [item.name for item in report.pipelines] == ["assay", "target", "activity"]
+    assert all(item.row_count == 3 for item in report.pipelines)
+    assert report.pipelines[0].run_id == "run-assay"
+
+
+@pytest.mark.unit
+def test_worker_budget_counts_pipeline_workers():
+    runner = _Runner()
+    specs = [_spec("assay", workers=2), _spec("target"), _spec("document")]
+
+    report = _batch(specs, runner, max_workers=2).run()
+
+    assert report.success
+    assert runner.peak == 2
+    assert runner.started[0] == "assay"
+
+
+@pytest.mark.unit
+def test_failed_pipeline_skips_dependents_but_not_independent_branches():
+    runner = _Runner(fail={"assay"})
+    specs = [_spec("assay"), _spec("activity", "assay"), _spec("target")]
+
+    report = _batch(specs, runner, max_workers=2).run()
+
+    statuses = {item.name: item.status for item in report.pipelines}
+    assert statuses == {"assay": "failed", "target": "success", "activity": "skipped"}
+    assert not report.success
+    assert "activity" not in runner.started
+    failed = report.pipelines[0]
+    assert failed.errors == ["RuntimeError: assay exploded"]
+
+
+@pytest.mark.unit
+def test_provider_rate_limit_is_split_between_concurrent_pipelines():
+    runner = _Runner()
+    specs = [_spec("assay"), _spec("target"), _spec("document")]
+
+    batch = _batch(specs, runner, max_workers=2, provider_rate_limits={"chembl": 8.0})
+    report = batch.run()
+
+    assert batch.rate_limits == {"assay": 4.0, "target": 4.0, "document": 4.0}
+    payload = runner.payloads["assay"]
+    assert payload["provider_config"]["rate_limit_per_sec"] == 4.0
+    assert payload["client"]["rate_limit"] == 4.0
+    assert {item.rate_limit for item in report.pipelines} == {4.0}
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ("ceiling", "expected"), [(None, 4.0), (20.0, 4.0), (3.0, 3.0)]
+)
+def test_rate_limit_share_caps_adaptive_limiter(ceiling, expected):
+    config = _config("assay")
+    config = config.model_copy(
+        update={
+            "provider_config": config.provider_config.model_copy(
+                update={
+                    "adaptive_rate_limit": AdaptiveRateLimitConfig(
+                        enabled=True, max_rate_per_sec=ceiling
+                    )
+                }
+            )
+        }
+    )
+
+    limited = with_rate_limit(config, 4.0)
+
+    adaptive = limited.provider_config.adaptive_rate_limit
+    assert adaptive.enabled
+    assert adaptive.max_rate_per_sec == expected
+    assert limited.provider_config.rate_limit_per_sec == 4.0
+    assert config.provider_config.adaptive_rate_limit.max_rate_per_sec == ceiling
+
+
+@pytest.mark.unit
+def test_rate_limit_defaults_to_configured_provider_limit():
+    specs = [
+        PipelineSpec(name="assay", config=_config("assay", rate=6.0)),
+        PipelineSpec(name="target", config=_config("target", rate=9.0, workers=3)),
+    ]
+
+    # target занимает весь бюджет, поэтому пайплайны не пересекаются.
+    rates = split_provider_rate_limits(specs, max_workers=3)
+
+    assert rates == {"assay": 6.0, "target": 6.0}
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ("specs", "message"),
+    [
+        ([_spec("a", "b"), _spec("b", "a")], "Dependency cycle"),
+        ([_spec("a", "missing")], "unknown pipelines"),
+        ([_spec("a"), _spec("a")], "Duplicate pipeline"),
+    ],
+)
+def test_invalid_graph_is_rejected(specs, message):
+    with pytest.raises(ValueError, match=message):
+        PipelineBatchOrchestrator(specs)
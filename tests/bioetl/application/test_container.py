@@ -14,6 +14,7 @@ from bioetl.application.pipelines.hooks_impl import (
     FailFastErrorPolicyImpl,
     LoggingPipelineHookImpl,
 )
+from bioetl.application.pipelines.profiling import ProfilingPipelineHookImpl
 from bioetl.domain.provider_registry import (
     InMemoryProviderRegistry,
     ProviderNotRegisteredError,
@@ -31,6 +32,9 @@ from bioetl.infrastructure.config.models import (
     ChemblSourceConfig,
     DummyProviderConfig,
     PipelineConfig,
+    ProfilingConfig,
+    ResponseCacheConfig,
+    StorageConfig,
 )
 
 sys.modules.setdefault("tqdm", SimpleNamespace(tqdm=lambda *args, **kwargs: None))
@@ -161,6 +165,37 @@ def test_get_extraction_service_for_registered_providers() -> None:
     assert dummy_service == ("dummy", "https://example.com/")
 
 
+def test_extraction_service_uses_response_cache_when_enabled(tmp_path: Path) -> None:
+    registry = InMemoryProviderRegistry()
+    registry.register_provider(register_chembl_provider())
+    container = PipelineContainer(
+        PipelineConfig(
+            id="chembl.activity",
+            provider="chembl",
+            entity="activity",
+            input_mode="auto_detect",
+            input_path=None,
+            output_path="/tmp/out",
+            batch_size=10,
+            provider_config=ChemblSourceConfig(
+                base_url="https://www.ebi.ac.uk/chembl/api/data",
+                timeout_sec=30,
+                max_retries=3,
+            ),
+            storage=StorageConfig(
+                cache_path=str(tmp_path),
+                response_cache=ResponseCacheConfig(enabled=True),
+            ),
+        ),
+        provider_registry=registry,
+    )
+
+    service = container.get_extraction_service()
+
+    assert service.client.response_cache is not None
+    assert (tmp_path / "http" / "chembl").is_dir()
+
+
 def test_unknown_provider_raises(provider_registry: InMemoryProviderRegistry) -> None:
     dummy_container = PipelineContainer(
         _build_dummy_pipeline_config(
@@ -247,6 +282,31 @@ def test_container_provides_hooks_and_error_policy(
     assert hook_logger is logger
 
 
+def test_container_adds_profiling_hook_when_enabled(
+    provider_registry: InMemoryProviderRegistry,
+) -> None:
+    dummy_config = DummyProviderConfig(
+        base_url="https://example.com",  # type: ignore[arg-type]
+        timeout_sec=1,
+        max_retries=0,
+        rate_limit_per_sec=1.0,
+    )
+    config = _build_dummy_pipeline_config(dummy_config)
+
+    default_hooks = PipelineContainer(
+        config, provider_registry=provider_registry
+    ).get_hooks()
+    profiled_hooks = PipelineContainer(
+        config.model_copy(update={"profiling": ProfilingConfig(enabled=True)}),
+        provider_registry=provider_registry,
+    ).get_hooks()
+
+    assert not any(isinstance(h, ProfilingPipelineHookImpl) for h in default_hooks)
+    profiling = [h for h in profiled_hooks if isinstance(h, ProfilingPipelineHookImpl)]
+    assert len(profiling) == 1
+    assert profiling[0]._output_dir == Path("/tmp/out")  # type: ignore[attr-defined]
+
+
 def test_hash_service_singleton_scope(
     provider_registry: InMemoryProviderRegistry,
 ) -> None:
@@ -60,6 +60,9 @@ class StubContainer(PipelineContainerABC):
     def get_error_policy(self) -> str:
         return "error_policy"
 
+    def get_checkpoint_store(self) -> str:
+        return "checkpoint_store"
+
 
 class DummyPipeline:
     def __init__(self, **deps: Any) -> None:
@@ -67,6 +70,7 @@ class DummyPipeline:
         self.post_transformer: Any | None = None
         self.hooks: list[Any] = []
         self.error_policy: Any | None = None
+        self.checkpoint_store: Any | None = None
 
     def set_post_transformer(self, transformer: Any) -> None:
         self.post_transformer = transformer
@@ -77,6 +81,9 @@ class DummyPipeline:
     def set_error_policy(self, error_policy: Any) -> None:
         self.error_policy = error_policy
 
+    def set_checkpoint_store(self, store: Any) -> None:
+        self.checkpoint_store = store
+
     def get_version(self) -> str:
         return "pipeline-version"
 
@@ -122,6 +129,7 @@ def _assert_dependencies(
     assert stub_container.post_transformer_version == "pipeline-version"
     assert pipeline.hooks == ["hook"]
     assert pipeline.error_policy == "error_policy"
+    assert pipeline.checkpoint_store == "checkpoint_store"
 
 
 def test_pipeline_container_satisfies_contract(monkeypatch: Any) -> None:
@@ -152,8 +152,9 @@ def test_container_defaults_use_factories(
     metadata_calls = 0
     quality_calls = 0
 
-    def writer_factory() -> WriterABC:
+    def writer_factory(output: object = None) -> WriterABC:
         nonlocal writer_calls
+        assert output is not None
         writer_calls += 1
         return default_writer_instance
 
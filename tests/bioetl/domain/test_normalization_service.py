@@ -112,3 +112,15 @@ def test_chembl_normalization_service_coerces_numeric_columns() -> None:
     assert str(normalized_df["count"].dtype) == "Int64"
     assert normalized_df["score"].tolist() == [1.234, pd.NA, pd.NA]
     assert normalized_df["count"].tolist() == [5, pd.NA, pd.NA]
+
+
+def test_chembl_normalization_service_batch_then_dataframe_is_single_pass() -> None:
+    service = ChemblNormalizationService(_ConfigStub())
+    df = pd.DataFrame({"name": ["  Alpha  "], "score": ["1.5"], "count": ["2"]})
+
+    batch = service.normalize_batch(df)
+    again = service.normalize_dataframe(batch)
+
+    assert again is batch
+    assert again["name"].tolist() == ["alpha"]
+    assert str(again["count"].dtype) == "Int64"
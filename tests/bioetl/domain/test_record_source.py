@@ -1,8 +1,17 @@
 from collections.abc import Iterable
-from typing import cast
+from typing import Any, cast
+
+import numpy as np
+import pandas as pd
 
 from bioetl.domain.contracts import ExtractionServiceABC
-from bioetl.domain.record_source import ApiRecordSource, InMemoryRecordSource, RawRecord
+from bioetl.domain.record_source import (
+    ApiRecordSource,
+    InMemoryRecordSource,
+    RawRecord,
+    RecordBatch,
+    as_record_batch,
+)
 
 
 class _DummyExtractionService:
@@ -86,3 +95,94 @@ def test_api_record_source_returns_serialized_records() -> None:
         {"id": "2", "name": "beta"},
     ]
     assert records[0] == expected_records
+
+
+def test_api_record_source_resumes_from_offset_cursor() -> None:
+    extraction = _DummyExtractionService()
+    source = ApiRecordSource(
+        extraction_service=cast(ExtractionServiceABC, extraction),
+        entity="activity",
+        filters={"limit": 5},
+        chunk_size=1,
+    )
+
+    iterator = iter(source.iter_records())
+    next(iterator)
+    assert source.cursor == {"offset": 1}
+
+    source.seek(source.cursor)
+    list(source.iter_records())
+
+    assert extraction.called_with == {
+        "entity": "activity",
+        "limit": 4,
+        "offset": 1,
+        "chunk_size": 1,
+    }
+
+
+class _ColumnarExtractionService(ExtractionServiceABC):
+    """Сервис с колоночными батчами; списки не должны запрашиваться."""
+
+    def get_release_version(self) -> str:  # pragma: no cover
+        return "v1"
+
+    def extract_all(self, entity: str, **filters: Any):  # pragma: no cover
+        raise NotImplementedError
+
+    def iter_extract(
+        self, entity: str, *, chunk_size: int | None = None, **filters: Any
+    ):  # pragma: no cover
+        raise AssertionError("row-wise iter_extract must not be used")
+
+    def iter_extract_batches(
+        self, entity: str, *, chunk_size: int | None = None, **filters: Any
+    ) -> Iterable[RecordBatch]:
+        yield RecordBatch(columns={"id": ["1", "2"]}, num_rows=2)
+        yield RecordBatch(columns={"id": ["3"]}, num_rows=1)
+
+    def request_batch(self, entity, batch_ids, filter_key):  # pragma: no cover
+        raise NotImplementedError
+
+    def parse_response(self, raw_response):  # pragma: no cover
+        raise NotImplementedError
+
+    def serialize_records(self, entity, records):  # pragma: no cover
+        raise NotImplementedError
+
+
+def test_api_record_source_prefers_columnar_batches() -> None:
+    source = ApiRecordSource(
+        extraction_service=_ColumnarExtractionService(), entity="activity"
+    )
+
+    batches = list(source.iter_records())
+
+    assert [len(batch) for batch in batches] == [2, 1]
+    assert all(isinstance(batch, RecordBatch) for batch in batches)
+    assert source.cursor == {"offset": 3}
+
+
+def test_record_batch_from_records_matches_dataframe() -> None:
+    records = [{"id": 1, "name": "alpha"}, {"id": 2, "extra": True}]
+
+    batch = RecordBatch.from_records(records)
+
+    assert len(batch) == 2
+    assert list(batch.columns) == ["id", "name", "extra"]
+    assert batch.columns["extra"][0] is np.nan
+    pd.testing.assert_frame_equal(batch.to_frame(), pd.DataFrame(records))
+    assert batch.head(1).to_records() == [{"id": 1, "name": "alpha", "extra": np.nan}]
+    assert batch.head(5) is batch
+
+
+def test_as_record_batch_wraps_dataframe_without_copy() -> None:
+    df = pd.DataFrame({"id": [1, 2, 3]})
+
+    batch = as_record_batch(df)
+
+    assert batch.to_frame() is df
+    assert batch.head(2).to_frame()["id"].tolist() == [1, 2]
+    assert as_record_batch(batch) is batch
+    assert len(as_record_batch([])) == 0
+    assert as_record_batch([]).to_frame().empty
@@ -0,0 +1,172 @@
+"""
+Golden-equivalence tests: columnar hashing vs row-wise v1_blake2b_256.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from bioetl.domain.transform import columnar_hash
+from bioetl.domain.transform.canonical import blake2b_hash_hex, serialize_canonical
+from bioetl.domain.transform.hash_service import HashService
+from bioetl.infrastructure.transform.impl.hash_service_impl import HashServiceImpl
+from bioetl.infrastructure.transform.impl.hasher import HasherImpl
+
+pytestmark = pytest.mark.golden
+
+
+def _outcome(func, *args):
+    try:
+        return list(func(*args))
+    except (TypeError, ValueError) as exc:
+        return type(exc), str(exc)
+
+
+def _rowwise_rows(df: pd.DataFrame) -> list[str]:
+    def _hash(row: pd.Series) -> str:
+        return blake2b_hash_hex(serialize_canonical(row.to_dict()).encode("utf-8"))
+
+    return list(df.apply(_hash, axis=1))
+
+
+def _rowwise_columns(df: pd.DataFrame, columns: list[str]) -> list[str]:
+    def _hash(row: pd.Series) -> str:
+        values = [row.get(col) for col in columns]
+        return blake2b_hash_hex(serialize_canonical(values).encode("utf-8"))
+
+    return list(df.apply(_hash, axis=1))
+
+
+FRAMES = {
+    "strings_with_none": pd.DataFrame(
+        {"name": ["b", None, "a", "b"], "code": ["X", "Y", None, "X"]}
+    ),
+    "int64": pd.DataFrame({"a": [1, -2, 3, 2**62], "b": [0, 7, 8, 9]}),
+    "float64": pd.DataFrame({"x": [0.1, -0.0, 1e20, 1 / 3], "y": [2.5, 3.0, 1e-7, 4]}),
+    "bool": pd.DataFrame({"flag": [True, False, True, False]}),
+    "mixed_numeric": pd.DataFrame({"i": [1, 2, 3, 4], "f": [0.5, 1.5, 2.5, 3.5]}),
+    "mixed_object": pd.DataFrame(
+        {
+            "id": [1, 2, 3, 4],
+            "score": [0.25, 1.0, 2.0, 1e16],
+            "flag": [True, False, True, True],
+            "label": ["é", "é", '"quoted"', "кириллица"],
+        }
+    ),
+    "nested": pd.DataFrame(
+        {
+            "id": ["a", "b", "c", "d"],
+            "tags": [["x", "y"], [], [1, 2.5], [None]],
+            "meta": [{"k": 1}, {"b": "é", "a": None}, {}, {"z": [True]}],
+        }
+    ),
+    "nullable_extension": pd.DataFrame(
+        {
+            "i": pd.array([1, None, 3, 4], dtype="Int64"),
+            "f": pd.array([0.5, None, 2.0, 3.0], dtype="Float64"),
+            "s": pd.array(["a", None, "c", "d"], dtype="string"),
+            "b": pd.array([True, None, False, True], dtype="boolean"),
+        }
+    ),
+    "extension_only_int": pd.DataFrame({"i": pd.array([1, 2, 3], dtype="Int64")}),
+    "extension_only_string": pd.DataFrame(
+        {"s": pd.array(["x", None, "é"], dtype="string")}
+    ),
+    "unicode_keys": pd.DataFrame({"é": [1, 2], "ä": ["x", "y"]}),
+    "non_default_index": pd.DataFrame(
+        {"a": ["p", "q", "r"], "b": [1.5, 2.5, 3.5]}, index=[10, 5, 7]
+    ),
+}
+
+
+@pytest.mark.parametrize("name", sorted(FRAMES))
+def test_hash_rows_matches_rowwise(name):
+    df = FRAMES[name]
+
+    expected = _outcome(_rowwise_rows, df)
+
+    assert _outcome(columnar_hash.hash_rows, df) == expected
+    assert _outcome(HasherImpl().hash_rows, df) == expected
+    assert columnar_hash.hash_rows(df).index.equals(df.index)
+
+
+@pytest.mark.parametrize("name", sorted(FRAMES))
+def test_hash_columns_matches_rowwise(name):
+    df = FRAMES[name]
+    columns = list(df.columns)[::-1] + ["missing"]
+
+    expected = _outcome(_rowwise_columns, df, columns)
+
+    assert _outcome(columnar_hash.hash_key_columns, df, columns) == expected
+    assert _outcome(HasherImpl().hash_columns, df, columns) == expected
+
+
+@pytest.mark.parametrize("service_cls", [HashService, HashServiceImpl])
+@pytest.mark.parametrize("name", sorted(FRAMES))
+def test_add_hash_columns_matches_rowwise(service_cls, name):
+    df = FRAMES[name]
+    business_key = [str(df.columns[0])]
+    service = (
+        HashService() if service_cls is HashService else HashServiceImpl(HasherImpl())
+    )
+
+    expected_key = _outcome(_rowwise_columns, df, business_key)
+    if not isinstance(expected_key, list):
+        with pytest.raises(expected_key[0]):
+            service.add_hash_columns(df, business_key_cols=business_key)
+        return
+
+    out = service.add_hash_columns(df, business_key_cols=business_key)
+
+    assert list(out["hash_business_key"]) == expected_key
+    with_key = df.assign(hash_business_key=expected_key)
+    assert list(out["hash_row"]) == _rowwise_rows(with_key)
+
+
+def test_golden_digests_are_stable():
+    df = pd.DataFrame({"id": [1, 2], "name": ["Aspirin", None], "mw": [180.16, 0.5]})
+
+    hashed = HashService().add_hash_columns(df, business_key_cols=["id"])
+
+    assert columnar_hash.serialize_rows(df) == [
+        '{"id":1,"mw":180.16,"name":"Aspirin"}',
+        '{"id":2,"mw":0.5,"name":null}',
+    ]
+    assert list(hashed["hash_business_key"]) == [
+        blake2b_hash_hex(b"[1]"),
+        blake2b_hash_hex(b"[2]"),
+    ]
+    assert hashed["hash_row"].iloc[0] == blake2b_hash_hex(
+        (
+            '{"hash_business_key":"' + blake2b_hash_hex(b"[1]") + '",'
+            '"id":1,"mw":180.16,"name":"Aspirin"}'
+        ).encode("utf-8")
+    )
+
+
+@pytest.mark.parametrize(
+    "df",
+    [
+        pd.DataFrame({"a": ["x", "y"], "b": [1.0, np.nan]}),
+        pd.DataFrame({"a": [1.0, np.inf]}),
+    ],
+)
+def test_invalid_floats_raise_like_rowwise(df):
+    with pytest.raises(ValueError, match="Invalid float value"):
+        HasherImpl().hash_rows(df)
+    with pytest.raises(ValueError, match="Invalid float value"):
+        _rowwise_rows(df)
+
+
+def test_unsupported_types_fall_back_to_rowwise_error():
+    df = pd.DataFrame({"ts": pd.to_datetime(["2024-01-01", "2024-01-02"])})
+
+    with pytest.raises(TypeError, match="not supported"):
+        HasherImpl().hash_rows(df)
+
+
+def test_duplicate_columns_use_rowwise_path():
+    df = pd.DataFrame([[1, "a"], [2, "b"]], columns=["k", "k"])
+
+    assert not columnar_hash.supports_columnar(df)
+    assert list(HasherImpl().hash_rows(df)) == _rowwise_rows(df)
@@ -0,0 +1,83 @@
+import pandas as pd
+import pytest
+from pydantic import ValidationError
+
+from bioetl.domain.schemas.chembl.models import ActivityModel, ChemblRecordModel
+from bioetl.domain.transform.columnar_records import assemble_columns
+
+_RECORDS = [
+    {
+        "activity_id": 1,
+        "activity_properties": [{"type": "Ratio", "value": "7"}, {"x": None}],
+        "ligand_efficiency": {"bei": "12.5", "le": None, "lle": "3"},
+        "molecule_structures": {"canonical_smiles": "CCO", "standard_inchi": ""},
+        "standard_value": 7.0,
+    },
+    {
+        "activity_id": 2,
+        "activity_properties": [],
+        "ligand_efficiency": None,
+        "molecule_structures": None,
+        "standard_value": None,
+    },
+    {
+        "activity_id": 3,
+        "activity_properties": {"type": "IC50"},
+        "molecule_structures": [[{"a": 1}], "b"],
+        "standard_value": 1.5,
+        "extra": "only-here",
+    },
+]
+
+
+def _legacy(model_cls, records):
+    return [model_cls(**record).model_dump() for record in records]
+
+
+@pytest.mark.parametrize("model_cls", [ActivityModel, ChemblRecordModel])
+def test_columnar_assembly_matches_model_dump(model_cls):
+    page = assemble_columns(model_cls, _RECORDS)
+
+    assert page.row_count == 3
+    assert page.to_records() == _legacy(model_cls, _RECORDS)
+    pd.testing.assert_frame_equal(
+        page.to_frame(), pd.DataFrame(_legacy(model_cls, _RECORDS))
+    )
+
+
+def test_columnar_assembly_uniform_page_has_declared_columns_first():
+    records = [{"activity_id": i, "ligand_efficiency": {"le": i}} for i in range(3)]
+
+    page = assemble_columns(ActivityModel, records)
+
+    assert list(page.columns) == [
+        "activity_properties",
+        "ligand_efficiency",
+        "activity_id",
+    ]
+    assert page.columns["ligand_efficiency"] == ["le:0", "le:1", "le:2"]
+    assert page.to_records() == _legacy(ActivityModel, records)
+
+
+def test_columnar_assembly_keeps_model_validation_errors():
+    with pytest.raises(ValidationError):
+        assemble_columns(ActivityModel, [{"ligand_efficiency": "not-a-dict"}])
+
+
+def test_columnar_assembly_empty_page():
+    page = assemble_columns(ActivityModel, [])
+
+    assert page.row_count == 0
+    assert page.to_records() == []
+
+
+def test_columnar_page_head_and_batch():
+    page = assemble_columns(ChemblRecordModel, _RECORDS).head(2)
+
+    assert page.row_count == 2
+    assert page.to_records() == _legacy(ChemblRecordModel, _RECORDS[:2])
+    batch = page.to_batch()
+    assert len(batch) == 2
+    pd.testing.assert_frame_equal(
+        batch.to_frame(), pd.DataFrame(_legacy(ChemblRecordModel, _RECORDS[:2]))
+    )
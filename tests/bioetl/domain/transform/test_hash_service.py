@@ -39,3 +39,12 @@ def test_add_fulldate_column_format_and_consistency():
     assert isinstance(ts, str) and "T" in ts  # простая проверка ISO-формата
     # можно попробовать парсить, но это не критично — проверим наличие числа года
     assert re.search(r"\d{4}-\d{2}-\d{2}T", ts)
+
+
+def test_add_columns_without_copy_mutate_input():
+    svc = HashService()
+    src = pd.DataFrame({"a": [1, 2]})
+    out = svc.add_index_column(src, copy=False)
+    out = svc.add_database_version_column(out, "v1", copy=False)
+    assert out is src
+    assert list(src.columns) == ["a", "index", "database_version"]
@@ -0,0 +1,145 @@
+"""Column-level identifier normalizers must match their per-value versions."""
+
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from bioetl.domain.transform.normalizers import (
+    CUSTOM_FIELD_NORMALIZERS,
+    SERIES_NORMALIZERS,
+    InvalidValuesError,
+    normalize_chembl_id_series,
+)
+from bioetl.domain.transform.normalizers.registry import get_series_normalizer
+from bioetl.infrastructure.transform.factories import default_normalization_service
+
+hypothesis = pytest.importorskip("hypothesis")
+from hypothesis import given, settings  # noqa: E402
+from hypothesis import strategies as st  # noqa: E402
+
+_identifier_like = st.one_of(
+    st.text(alphabet="chemblCHEMBL0123456789 _-./:doixBAOPQ", max_size=14),
+    st.sampled_from(
+        [
+            " chembl25 ",
+            "123",
+            "CHEMBL",
+            "bao_0000190",
+            " https://doi.org/10.1000/ABC ",
+            "doi:10.1016/j.x",
+            "P12345",
+            "a0a023gpi8",
+            "CID2244",
+            "pcid 7",
+            "0",
+            " 42 ",
+            "   ",
+            "²",
+        ]
+    ),
+)
+
+
+def _per_value(func, values: list[str]) -> tuple[list, list[int]]:
+    results, invalid = [], []
+    for position, value in enumerate(values):
+        try:
+            results.append(func(value))
+        except ValueError:
+            invalid.append(position)
+            results.append(None)
+    return results, invalid
+
+
+@pytest.mark.parametrize(
+    "scalar", list(SERIES_NORMALIZERS), ids=lambda func: func.__name__
+)
+@settings(database=None, max_examples=200)
+@given(values=st.lists(_identifier_like, max_size=10))
+def test_series_normalizer_matches_per_value(scalar, values):
+    series_func = SERIES_NORMALIZERS[scalar]
+    expected, invalid = _per_value(scalar, values)
+    series = pd.Series(values, index=range(10, 10 + len(values)), dtype=object)
+
+    if invalid:
+        with pytest.raises(InvalidValuesError) as excinfo:
+            series_func(series)
+        assert list(excinfo.value.invalid) == [10 + pos for pos in invalid]
+        return
+
+    result = series_func(series)
+    assert list(result.index) == list(series.index)
+    assert [type(item) for item in result] == [type(item) for item in expected]
+    assert result.tolist() == expected
+
+
+def test_invalid_values_are_reported_in_bulk():
+    series = pd.Series(["CHEMBL1", "bad", "CHEMBL2", "worse"], dtype=object)
+
+    with pytest.raises(InvalidValuesError) as excinfo:
+        normalize_chembl_id_series(series)
+
+    assert excinfo.value.invalid == {1: "bad", 3: "worse"}
+    assert "Неверный ChEMBL ID" in str(excinfo.value)
+    assert "неверных значений: 2" in str(excinfo.value)
+
+
+class _Config:
+    def __init__(self, fields):
+        self.fields = fields
+        self.normalization = type(
+            "N", (), {"case_sensitive_fields": [], "id_fields": []}
+        )()
+
+
+def test_service_prefers_series_normalizer_for_id_columns(monkeypatch):
+    service = default_normalization_service(
+        _Config([{"name": "molecule_chembl_id", "data_type": "string"}])
+    )
+    monkeypatch.setattr(
+        service, "_normalize_value", pytest.fail  # per-cell path must not run
+    )
+    df = pd.DataFrame({"molecule_chembl_id": [" chembl25", None, "1"]})
+
+    result = service.normalize_dataframe(df)
+
+    assert result["molecule_chembl_id"].tolist() == ["CHEMBL25", pd.NA, "CHEMBL1"]
+
+
+def test_service_reports_all_invalid_rows_with_field_name():
+    service = default_normalization_service(
+        _Config([{"name": "assay_chembl_id", "data_type": "string"}])
+    )
+    df = pd.DataFrame({"assay_chembl_id": ["bad", "CHEMBL1", "x"]})
+
+    with pytest.raises(InvalidValuesError) as excinfo:
+        service.normalize_fields(df)
+
+    assert "assay_chembl_id" in str(excinfo.value)
+    assert excinfo.value.invalid == {0: "bad", 2: "x"}
+
+
+def test_overridden_normalizer_disables_series_counterpart():
+    def custom(value):
+        return f"X{value}"
+
+    with patch.dict(CUSTOM_FIELD_NORMALIZERS, {"molecule_chembl_id": custom}):
+        service = default_normalization_service(
+            _Config([{"name": "molecule_chembl_id", "data_type": "string"}])
+        )
+        result = service.normalize_fields(pd.DataFrame({"molecule_chembl_id": ["1"]}))
+
+    assert get_series_normalizer(custom) is None
+    assert result["molecule_chembl_id"].tolist() == ["X1"]
+
+
+def test_non_string_values_fall_back_to_per_value_normalizer():
+    service = default_normalization_service(
+        _Config([{"name": "pubmed_id", "data_type": "integer"}])
+    )
+    df = pd.DataFrame({"pubmed_id": [12.0, "34", None]}, dtype=object)
+
+    result = service.normalize_fields(df)
+
+    assert result["pubmed_id"].tolist() == [12, 34, pd.NA]
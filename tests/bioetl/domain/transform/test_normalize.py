@@ -3,6 +3,10 @@ from unittest.mock import patch
 import pandas as pd
 import pytest
 
+from bioetl.domain.transform.normalization_marker import (
+    normalized_columns,
+    unmark_normalized,
+)
 from bioetl.domain.transform.normalizers.registry import CUSTOM_FIELD_NORMALIZERS
 from bioetl.infrastructure.transform.factories import default_normalization_service
 from bioetl.infrastructure.transform.impl.normalize import normalize_scalar
@@ -287,3 +291,94 @@ def test_normalization_service_custom_container_normalizer():
         res = service.normalize_fields(df)
         # Should be serialized list "a|b"
         assert res["custom_container"].iloc[0] == "a|b"
+
+
+def test_normalization_service_skips_already_normalized_chunk():
+    fields = [
+        {"name": "name", "data_type": "string"},
+        {"name": "activity_id", "data_type": "string"},
+        {"name": "value", "data_type": "number"},
+        {"name": "tags", "data_type": "array"},
+    ]
+    service = default_normalization_service(MockConfig(fields))
+    df = pd.DataFrame(
+        {
+            "name": ["  Alpha ", "BETA"],
+            "activity_id": ["act1", None],
+            "value": ["1.23456", "bad"],
+            "tags": [["A", "b"], []],
+        }
+    )
+
+    first = service.normalize_batch(df)
+    assert normalized_columns(first) == {"name", "activity_id", "value", "tags"}
+    assert normalized_columns(df) == frozenset()
+
+    with patch.object(service, "normalize_series", side_effect=AssertionError):
+        second = service.normalize_dataframe(first)
+        fields_pass = service.normalize_fields(first)
+
+    assert second is first
+    assert fields_pass is first
+    assert first["name"].tolist() == ["alpha", "beta"]
+    assert str(first["value"].dtype) == "Float64"
+
+
+def test_normalization_service_normalizes_new_and_unmarked_columns():
+    fields = [
+        {"name": "name", "data_type": "string"},
+        {"name": "label", "data_type": "string"},
+    ]
+    service = default_normalization_service(MockConfig(fields))
+    first = service.normalize_batch(pd.DataFrame({"name": [" A "]}))
+
+    # Колонка, добавленная после нормализации, и перезаписанная колонка.
+    first["label"] = [" B "]
+    first["name"] = [" C "]
+    unmark_normalized(first, ["name"])
+
+    second = service.normalize_dataframe(first)
+
+    assert second["name"].tolist() == ["c"]
+    assert second["label"].tolist() == ["b"]
+    assert normalized_columns(second) == {"name", "label"}
+
+
+def test_normalization_marker_survives_parquet_write(tmp_path):
+    pytest.importorskip("pyarrow")
+    fields = [{"name": "name", "data_type": "string"}]
+    service = default_normalization_service(MockConfig(fields))
+    df = service.normalize_batch(pd.DataFrame({"name": [" A "]}))
+
+    # pandas сериализует attrs в JSON при записи Parquet.
+    df.to_parquet(tmp_path / "chunk.parquet")
+
+    assert normalized_columns(pd.read_parquet(tmp_path / "chunk.parquet")) == {"name"}
+
+
+def test_normalization_service_single_pass_turns_blank_strings_into_na():
+    fields = [
+        {"name": "name", "data_type": "string"},
+        {"name": "activity_id", "data_type": "string"},
+        {"name": "tags", "data_type": "array"},
+    ]
+    service = default_normalization_service(MockConfig(fields))
+    df = pd.DataFrame(
+        {
+            "name": ["   ", "Alpha", None],
+            "activity_id": [" ", "act1", None],
+            "tags": [[], ["a"], None],
+        }
+    )
+
+    single = service.normalize_batch(df)
+    # Повторный проход, который теперь пропускается, ничего не должен менять.
+    again = single.copy()
+    unmark_normalized(again)
+    again = service.normalize_dataframe(again)
+
+    for name in ("name", "activity_id", "tags"):
+        # Строки из пробелов и пустые списки — pd.NA, а не None.
+        assert single[name].iloc[0] is pd.NA
+        assert single[name].map(type).tolist() == again[name].map(type).tolist()
+    assert single["name"].iloc[1] == "alpha"
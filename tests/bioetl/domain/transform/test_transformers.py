@@ -0,0 +1,53 @@
+"""
+Tests for the post-transformer chain.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from bioetl.domain.transform.factories import default_post_transformer
+from bioetl.domain.transform.hash_service import HashService
+from bioetl.domain.transform.transformers import TransformerChain
+
+_NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def _chain() -> TransformerChain:
+    chain = default_post_transformer(
+        hash_service=HashService(now_provider=lambda: _NOW),
+        business_key_fields=["id"],
+        version_provider=lambda: "v1",
+    )
+    assert isinstance(chain, TransformerChain)
+    return chain
+
+
+@pytest.mark.unit
+def test_chain_matches_stepwise_apply_and_keeps_input():
+    src = pd.DataFrame({"id": [1, 2, 3], "value": ["a", "b", None]})
+    before = src.copy()
+
+    # Счетчик index у HashService свой на цепочку — сравниваем свежие.
+    stepwise = src
+    for transformer in _chain()._transformers:
+        stepwise = transformer.apply(stepwise)
+    out = _chain().apply(src)
+
+    pd.testing.assert_frame_equal(out, stepwise)
+    pd.testing.assert_frame_equal(src, before)
+    assert {"hash_row", "index", "database_version", "extracted_at"} <= set(out.columns)
+
+
+@pytest.mark.unit
+def test_chain_does_not_copy_input_columns():
+    src = pd.DataFrame({"id": [1, 2, 3], "value": [0.5, 1.5, 2.5]})
+
+    out = _chain().apply(src)
+
+    # Входные колонки не копируются — шаги только добавляют новые.
+    assert np.shares_memory(out["value"].to_numpy(), src["value"].to_numpy())
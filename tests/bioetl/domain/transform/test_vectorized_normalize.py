@@ -0,0 +1,147 @@
+"""Vectorized scalar normalization must match per-cell normalize_scalar."""
+
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from bioetl.domain.transform.contracts import NormalizationConfig
+from bioetl.infrastructure.transform.impl.chembl_normalization_service import (
+    ChemblNormalizationService,
+)
+from bioetl.infrastructure.transform.impl.normalization_service_impl import (
+    NormalizationServiceImpl,
+)
+from bioetl.infrastructure.transform.impl.normalize import normalize_scalar
+from bioetl.infrastructure.transform.impl.vectorized_normalize import (
+    normalize_scalar_series,
+    round3,
+)
+
+hypothesis = pytest.importorskip("hypothesis")
+from hypothesis import given, settings  # noqa: E402
+from hypothesis import strategies as st  # noqa: E402
+
+
+def _per_cell(series: pd.Series, mode: str, empty_value=pd.NA) -> pd.Series:
+    def _apply(value):
+        if value is None or (
+            not isinstance(value, (list, tuple, dict)) and pd.isna(value)
+        ):
+            return empty_value
+        return normalize_scalar(value, mode=mode)
+
+    return series.apply(_apply)
+
+
+def _assert_same(actual: pd.Series, expected: pd.Series) -> None:
+    assert actual.dtype == expected.dtype
+    assert len(actual) == len(expected)
+    for left, right in zip(actual.tolist(), expected.tolist()):
+        assert type(left) is type(right)
+        if isinstance(left, float):
+            assert left == right or (math.isnan(left) and math.isnan(right))
+            assert math.copysign(1, left) == math.copysign(1, right)
+        else:
+            assert left is right or left == right
+
+
+_scalars = st.one_of(
+    st.none(),
+    st.just(np.nan),
+    st.text(alphabet=st.characters(blacklist_categories=["Cs"]), max_size=8),
+    st.sampled_from(["  ", " ChEMBL1 ", "İstanbul", "\tMiXeD\n"]),
+    st.floats(allow_nan=False),
+    st.integers(min_value=-(2**62), max_value=2**62),
+    st.booleans(),
+)
+
+
+@settings(database=None, max_examples=300)
+@given(st.lists(_scalars, max_size=12), st.sampled_from(["default", "id", "sensitive"]))
+def test_object_column_matches_per_cell(values, mode):
+    series = pd.Series(values, dtype=object)
+
+    result = normalize_scalar_series(series, mode=mode)
+
+    if result is not None:
+        _assert_same(result, _per_cell(series, mode))
+
+
+@settings(database=None, max_examples=300)
+@given(st.lists(st.floats(allow_nan=True, width=64), max_size=12))
+def test_float_column_matches_per_cell(values):
+    series = pd.Series(values, dtype="float64")
+
+    result = normalize_scalar_series(series, empty_value=None)
+
+    assert result is not None
+    _assert_same(result, _per_cell(series, "default", empty_value=None))
+
+
+@settings(database=None, max_examples=500)
+@given(st.floats(allow_nan=False))
+def test_round3_matches_builtin_round(value):
+    rounded = round3(np.array([value]))[0]
+
+    expected = round(value, 3)
+    assert rounded == expected
+    assert math.copysign(1, rounded) == math.copysign(1, expected)
+
+
+def test_round3_handles_half_way_values():
+    values = np.array([0.0625, 2.0005, 1.2345, -0.0005, 1e300, 2.675])
+
+    assert round3(values).tolist() == [round(v, 3) for v in values.tolist()]
+
+
+def test_normalize_scalar_series_falls_back_for_containers_and_extension_dtypes():
+    assert normalize_scalar_series(pd.Series([["a"], "b"], dtype=object)) is None
+    assert normalize_scalar_series(pd.Series(["a", None], dtype="string")) is None
+    assert normalize_scalar_series(pd.Series([np.float32(1.5)], dtype=object)) is None
+
+
+class _Config:
+    def __init__(self, fields):
+        self.fields = fields
+        self.normalization = NormalizationConfig(case_sensitive_fields=["label"])
+
+
+@pytest.mark.parametrize(
+    "service_cls", [NormalizationServiceImpl, ChemblNormalizationService]
+)
+def test_services_use_vectorized_path_for_scalar_fields(service_cls, monkeypatch):
+    fields = [
+        {"name": "name", "data_type": "string"},
+        {"name": "label", "data_type": "string"},
+        {"name": "target_id", "data_type": "string"},
+        {"name": "value", "data_type": "number"},
+        {"name": "count", "data_type": "integer"},
+    ]
+    service = service_cls(_Config(fields))
+    df = pd.DataFrame(
+        {
+            "name": ["  Alpha ", " ", None],
+            "label": ["MiXeD ", "b", "c"],
+            "target_id": ["t1", "t2 ", np.nan],
+            "value": [1.23456, None, 3.0],
+            "count": ["5", None, " 7 "],
+        }
+    )
+
+    def _fail(*_args, **_kwargs):
+        raise AssertionError("per-cell path used")
+
+    monkeypatch.setattr(service, "_normalize_value", _fail)
+    result = service.normalize_dataframe(df)
+
+    empty = service._empty_value
+    assert result["name"].tolist()[0] == "alpha"
+    # Строка из пробелов — пропуск, как и None.
+    assert result["name"].tolist()[1] is empty
+    assert result["name"].tolist()[2] is empty
+    assert result["label"].tolist() == ["MiXeD", "b", "c"]
+    assert result["target_id"].tolist()[:2] == ["T1", "T2"]
+    assert result["value"].tolist() == [1.235, pd.NA, 3.0]
+    assert result["count"].tolist() == [5, pd.NA, 7]
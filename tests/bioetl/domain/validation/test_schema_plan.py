@@ -0,0 +1,29 @@
+"""
+Tests for precomputed schema plans.
+"""
+
+import pandera.pandas as pa
+from pandera.typing import Series
+
+from bioetl.domain.validation.plan import build_schema_plan
+
+
+class _Schema(pa.DataFrameModel):
+    chembl_id: Series[str] = pa.Field(str_matches=r"^CHEMBL\d+$")
+    name: Series[str] = pa.Field(nullable=True)
+    value: Series[float] = pa.Field(nullable=True)
+
+
+def test_schema_plan_collects_required_columns():
+    plan = build_schema_plan("entity", _Schema, ["name", "chembl_id", "value"])
+
+    assert plan.name == "entity"
+    assert plan.columns == ("name", "chembl_id", "value")
+    assert plan.required == ("chembl_id",)
+
+
+def test_schema_plan_without_to_schema_keeps_column_order():
+    plan = build_schema_plan("entity", object(), ["b", "a"])
+
+    assert plan.columns == ("b", "a")
+    assert plan.required == ()
@@ -70,3 +70,19 @@ def test_validation_service_failure():
 
     with pytest.raises(ValueError, match="Validation failed for test_entity"):
         service.validate(pd.DataFrame(), "test_entity")
+
+
+def test_validation_service_caches_validator_per_schema():
+    schema_provider = MagicMock(spec=SchemaProviderABC)
+    schema_provider.get_schema.return_value = object()
+    factory = MagicMock(wraps=_FakeValidatorFactory(should_pass=True))
+
+    service = ValidationService(
+        schema_provider=schema_provider, validator_factory=factory
+    )
+    for _ in range(3):
+        service.validate(pd.DataFrame({"id": [1]}), "entity")
+    service.validate(pd.DataFrame({"id": [1]}), "other")
+
+    assert factory.create_validator.call_count == 2
+    assert service.get_validator("entity") is service.get_validator("entity")
@@ -0,0 +1,170 @@
+"""Юнит-тесты asyncio-клиента: ретраи, лимит соединений, rate limiter."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from bioetl.domain.configs import ClientConfig
+from bioetl.domain.errors import ClientNetworkError, ClientResponseError
+from bioetl.infrastructure.clients.async_middleware import AsyncHttpClientMiddleware
+from bioetl.infrastructure.clients.base.impl.async_client import (
+    AsyncRequestsTransport,
+    AsyncUnifiedAPIClient,
+)
+from bioetl.infrastructure.clients.base.impl.rate_limiter import (
+    AsyncTokenBucketRateLimiterImpl,
+    TokenBucketRateLimiterImpl,
+)
+
+
+@pytest.fixture(autouse=True)
+def deterministic_random():
+    with patch("random.uniform", return_value=0.0):
+        yield
+
+
+@pytest.fixture(scope="module")
+def loop():
+    # Event loop создается до function-фикстуры, блокирующей сокеты:
+    # self-pipe цикла использует socketpair.
+    event_loop = asyncio.new_event_loop()
+    yield event_loop
+    event_loop.close()
+
+
+def _response(status_code: int = 200) -> MagicMock:
+    resp = MagicMock()
+    resp.status_code = status_code
+    resp.headers = {}
+    resp.raise_for_status = MagicMock()
+    return resp
+
+
+class _ScriptedTransport:
+    def __init__(self, outcomes: list[object]) -> None:
+        self.outcomes = list(outcomes)
+        self.calls = 0
+
+    async def request(self, **_: object) -> object:
+        self.calls += 1
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+def test_async_middleware_retries_with_asyncio_sleep(monkeypatch, loop):
+    """Ретраи ждут через asyncio.sleep, time.sleep не вызывается."""
+    delays: list[float] = []
+
+    async def fake_sleep(delay: float) -> None:
+        delays.append(delay)
+
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+    monkeypatch.setattr(time, "sleep", MagicMock(side_effect=AssertionError))
+    ok = _response(200)
+    transport = _ScriptedTransport([TimeoutError("slow"), _response(503), ok])
+    middleware = AsyncHttpClientMiddleware(
+        provider="test", base_client=transport, base_delay=0.1, max_attempts=3
+    )
+
+    result = loop.run_until_complete(middleware.request_async("GET", "http://x"))
+
+    assert result is ok
+    assert transport.calls == 3
+    assert delays == [pytest.approx(0.1), pytest.approx(0.2)]
+
+
+def test_async_middleware_raises_after_max_attempts(monkeypatch, loop):
+    async def fake_sleep(_: float) -> None:
+        return None
+
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+    transport = _ScriptedTransport([_response(500), _response(500)])
+    middleware = AsyncHttpClientMiddleware(
+        provider="test", base_client=transport, max_attempts=2
+    )
+
+    with pytest.raises(ClientResponseError):
+        loop.run_until_complete(middleware.request_async("GET", "http://x"))
+
+    transport = _ScriptedTransport([ConnectionError("down")])
+    middleware = AsyncHttpClientMiddleware(
+        provider="test", base_client=transport, max_attempts=1
+    )
+    with pytest.raises(ConnectionError):
+        loop.run_until_complete(middleware.request_async("GET", "http://x"))
+
+
+def test_async_middleware_maps_requests_errors(monkeypatch, loop):
+    async def fake_sleep(_: float) -> None:
+        return None
+
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+    transport = _ScriptedTransport([requests.exceptions.ConnectionError("down")])
+    middleware = AsyncHttpClientMiddleware(
+        provider="test", base_client=transport, max_attempts=1
+    )
+
+    with pytest.raises(ClientNetworkError):
+        loop.run_until_complete(middleware.request_async("GET", "http://x"))
+
+
+def test_transport_limits_connections_in_flight(loop):
+    """Одновременно выполняется не больше max_connections запросов."""
+    lock = threading.Lock()
+    state = {"active": 0, "peak": 0}
+
+    def fake_request(method: str, url: str, **_: object) -> str:
+        with lock:
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+        time.sleep(0.02)
+        with lock:
+            state["active"] -= 1
+        return url
+
+    session = MagicMock()
+    session.request.side_effect = fake_request
+    transport = AsyncRequestsTransport(max_connections=2, session=session)
+
+    async def run() -> list[str]:
+        return await asyncio.gather(
+            *(transport.request("GET", f"http://x/{i}") for i in range(6))
+        )
+
+    try:
+        assert loop.run_until_complete(run()) == [f"http://x/{i}" for i in range(6)]
+    finally:
+        transport.close()
+    assert state["peak"] == 2
+
+
+def test_async_unified_client_uses_config(loop):
+    transport = _ScriptedTransport([_response(200)])
+    config = ClientConfig(max_retries=4, timeout=5.0, max_connections=3)
+
+    client = AsyncUnifiedAPIClient("test", config, transport=transport)
+    response = loop.run_until_complete(client.get("http://x"))
+
+    assert response.status_code == 200
+    assert client.middleware.max_attempts == 4
+    assert client.middleware.timeout == 5.0
+
+
+def test_async_rate_limiter_shares_bucket_with_sync_limiter(loop):
+    bucket = TokenBucketRateLimiterImpl(rate=50, capacity=1)
+    limiter = AsyncTokenBucketRateLimiterImpl(bucket)
+    bucket.acquire()  # синхронный запрос забирает единственный токен
+
+    start = time.monotonic()
+    loop.run_until_complete(limiter.acquire())
+
+    assert time.monotonic() - start >= 0.015
+    assert limiter.rate == 50
@@ -2,10 +2,17 @@
 Tests for cache implementations.
 """
 
+import gzip
+import json
+import os
 import time
 from pathlib import Path
 
-from bioetl.infrastructure.clients.base.impl.cache import FileCacheImpl, MemoryCacheImpl
+from bioetl.infrastructure.clients.base.impl.cache import (
+    CompressedJsonFileCacheImpl,
+    FileCacheImpl,
+    MemoryCacheImpl,
+)
 
 
 def test_memory_cache():
@@ -48,3 +55,60 @@ def test_file_cache_ttl_expiration(tmp_path: Path):
     cache.set("k", 5, ttl=1)
     time.sleep(1.2)
     assert cache.get("k") is None
+
+
+def test_compressed_json_cache_roundtrip(tmp_path: Path):
+    """Values are stored as gzip-compressed JSON and survive reopening."""
+    cache = CompressedJsonFileCacheImpl(tmp_path)
+    payload = {"activities": [{"id": 1, "name": "α"}], "page_meta": {"next": None}}
+    cache.set("k", payload)
+
+    (cache_file,) = tmp_path.glob("*.json.gz")
+    assert json.loads(gzip.decompress(cache_file.read_bytes()))["value"] == payload
+    assert cache.get("k") == payload
+
+    reopened = CompressedJsonFileCacheImpl(tmp_path)
+    assert reopened.size_bytes == cache_file.stat().st_size
+    assert reopened.get("k") == payload
+
+    reopened.invalidate("k")
+    assert reopened.get("k") is None
+    assert reopened.size_bytes == 0
+
+
+def test_compressed_json_cache_ttl_and_corruption(tmp_path: Path, monkeypatch):
+    cache = CompressedJsonFileCacheImpl(tmp_path)
+    cache.set("k", [1, 2], ttl=10)
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now + 11)
+    assert cache.get("k") is None
+    assert not list(tmp_path.glob("*.json.gz"))
+
+    cache.set("broken", {"a": 1})
+    (cache_file,) = tmp_path.glob("*.json.gz")
+    cache_file.write_bytes(b"not gzip")
+    assert cache.get("broken") is None
+
+
+def test_compressed_json_cache_evicts_least_recently_used(tmp_path: Path):
+    value = {"data": "x" * 64}
+    probe = CompressedJsonFileCacheImpl(tmp_path / "probe")
+    probe.set("probe", value)
+    entry_size = probe.size_bytes
+
+    cache = CompressedJsonFileCacheImpl(tmp_path / "lru", max_bytes=entry_size * 2)
+    cache.set("a", value)
+    cache.set("b", value)
+    # Обращение к "a" делает "b" самым давно использованным.
+    for key, age in (("a", 10), ("b", 20)):
+        path = cache._key_to_path(key)  # pylint: disable=protected-access
+        stamp = time.time() - age
+        os.utime(path, (stamp, stamp))
+    assert cache.get("a") == value
+
+    cache.set("c", value)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == value
+    assert cache.get("c") == value
+    assert cache.size_bytes <= entry_size * 2
@@ -412,3 +412,105 @@ def test_circuit_breaker_blocks_and_recovers(monkeypatch, base_client):
     assert recovered.status_code == 200
     assert base_client.request.call_count == 3
     assert middleware._circuit_opened_at is None  # noqa: SLF001
+
+
+def test_rate_limiter_receives_success_and_throttle_feedback(monkeypatch, base_client):
+    """429 с Retry-After и успешный ответ передаются адаптивному лимитеру."""
+    fake_time = _FakeTime()
+    monkeypatch.setattr("time.perf_counter", fake_time.perf_counter)
+    monkeypatch.setattr("time.sleep", fake_time.sleep)
+
+    base_client.request.side_effect = [
+        _response(429, headers={"Retry-After": "3"}),
+        _response(500),
+        _response(200),
+    ]
+    limiter = MagicMock()
+    middleware = HttpClientMiddleware(
+        provider="chembl",
+        base_client=base_client,
+        max_attempts=3,
+        base_delay=0.1,
+        rate_limiter=limiter,
+    )
+
+    middleware.request("GET", "http://example.com")
+
+    # 500 без Retry-After — ошибка сервера, а не троттлинг.
+    limiter.on_throttle.assert_called_once_with(3.0)
+    limiter.on_success.assert_called_once()
+    assert limiter.on_success.call_args.args[0] == pytest.approx(0.01)
+
+
+def test_rate_limiter_is_throttled_on_final_503(monkeypatch, base_client):
+    """Троттлинг учитывается и на последней попытке без ретрая."""
+    fake_time = _FakeTime()
+    monkeypatch.setattr("time.perf_counter", fake_time.perf_counter)
+    monkeypatch.setattr("time.sleep", fake_time.sleep)
+
+    base_client.request.side_effect = [_response(503)]
+    limiter = MagicMock()
+    middleware = HttpClientMiddleware(
+        provider="chembl",
+        base_client=base_client,
+        max_attempts=1,
+        rate_limiter=limiter,
+    )
+
+    with pytest.raises(ClientResponseError):
+        middleware.request("GET", "http://example.com")
+
+    limiter.on_throttle.assert_called_once_with(None)
+    limiter.on_success.assert_not_called()
+
+
+def _metric_value(metric, **labels) -> float:
+    return metric.labels(**labels)._value.get()
+
+
+def test_response_bytes_and_in_flight_metrics(base_client):
+    from bioetl.infrastructure.observability import metrics
+
+    provider = "bytes-test"
+    endpoint = "example.com/chembl/api/data/assay.json"
+    in_flight = []
+    response = _response(200)
+    response.content = b'{"assays": []}' * 10
+    response.raw.tell.return_value = 42
+
+    def request(**_):
+        in_flight.append(
+            _metric_value(metrics.HTTP_REQUESTS_IN_FLIGHT, provider=provider)
+        )
+        return response
+
+    base_client.request.side_effect = request
+    middleware = HttpClientMiddleware(provider=provider, base_client=base_client)
+
+    middleware.request("GET", f"http://{endpoint}?limit=10")
+
+    assert in_flight == [1.0]
+    assert _metric_value(metrics.HTTP_REQUESTS_IN_FLIGHT, provider=provider) == 0.0
+    labels = {"provider": provider, "endpoint": endpoint}
+    assert _metric_value(metrics.HTTP_DECODED_BYTES_TOTAL, **labels) == 140.0
+    assert _metric_value(metrics.HTTP_RECEIVED_BYTES_TOTAL, **labels) == 42.0
+
+
+def test_in_flight_gauge_released_on_transport_error(monkeypatch, base_client):
+    from bioetl.infrastructure.observability import metrics
+
+    fake_time = _FakeTime()
+    monkeypatch.setattr("time.perf_counter", fake_time.perf_counter)
+    monkeypatch.setattr("time.sleep", fake_time.sleep)
+    base_client.request.side_effect = ConnectionError("down")
+    middleware = HttpClientMiddleware(
+        provider="in-flight-error", base_client=base_client, max_attempts=2
+    )
+
+    with pytest.raises(ConnectionError):
+        middleware.request("GET", "http://example.com")
+
+    assert (
+        _metric_value(metrics.HTTP_REQUESTS_IN_FLIGHT, provider="in-flight-error")
+        == 0.0
+    )
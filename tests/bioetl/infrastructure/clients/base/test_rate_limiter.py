@@ -1,8 +1,13 @@
+import threading
 import time
 
+import pytest
+
 from bioetl.infrastructure.clients.base.impl.rate_limiter import (
+    AdaptiveRateLimiterImpl,
     TokenBucketRateLimiterImpl,
 )
+from bioetl.infrastructure.observability import metrics
 
 
 def test_rate_limiter_acquire():
@@ -27,3 +32,83 @@ def test_rate_limiter_refill():
 def test_wait_if_needed():
     limiter = TokenBucketRateLimiterImpl(rate=1, capacity=1)
     limiter.wait_if_needed()  # Should not raise
+
+
+def test_reserve_does_not_block():
+    limiter = TokenBucketRateLimiterImpl(rate=10, capacity=1)
+    assert limiter.reserve() == 0.0
+
+    delay = limiter.reserve()
+    assert 0.0 < delay <= 0.1
+
+
+def test_acquire_does_not_hold_lock_while_waiting():
+    limiter = TokenBucketRateLimiterImpl(rate=5, capacity=1)
+    limiter.acquire()
+
+    waiter = threading.Thread(target=limiter.acquire)
+    waiter.start()
+    time.sleep(0.02)
+    # Ожидающий поток не держит lock: reserve отвечает сразу.
+    assert limiter._lock.acquire(timeout=0.05)
+    limiter._lock.release()
+    waiter.join()
+
+
+def _adaptive(**kwargs) -> AdaptiveRateLimiterImpl:
+    options = {"rate": 10.0, "capacity": 10.0, "provider": "test"}
+    options.update(kwargs)
+    return AdaptiveRateLimiterImpl(**options)
+
+
+def _gauge(provider: str = "test") -> float:
+    return metrics.HTTP_RATE_LIMIT.labels(provider=provider)._value.get()
+
+
+def test_adaptive_increases_rate_on_fast_success():
+    limiter = _adaptive(increase_step=1.0, max_rate=10.5)
+
+    for _ in range(10):
+        limiter.on_success(0.1)
+
+    # +increase_step за rate успешных ответов, но не выше max_rate.
+    assert limiter.rate == pytest.approx(10.5)
+    assert _gauge() == pytest.approx(10.5)
+
+
+def test_adaptive_ignores_slow_responses():
+    limiter = _adaptive(latency_threshold=1.0)
+
+    limiter.on_success(1.5)
+
+    assert limiter.rate == 10.0
+
+
+def test_adaptive_decreases_once_per_cooldown():
+    limiter = _adaptive(decrease_factor=0.5, min_rate=3.0, decrease_cooldown=60.0)
+
+    limiter.on_throttle()
+    limiter.on_throttle()
+    limiter.on_success(0.1)
+
+    assert limiter.rate == 5.0
+    assert _gauge() == 5.0
+
+    limiter._last_decrease = time.monotonic() - 61.0
+    limiter.on_throttle()
+    assert limiter.rate == 3.0
+
+
+def test_adaptive_retry_after_pauses_bucket():
+    limiter = _adaptive()
+
+    limiter.on_throttle(retry_after=0.5)
+
+    assert 0.4 < limiter.reserve() <= 0.5
+
+
+def test_adaptive_rejects_invalid_bounds():
+    with pytest.raises(ValueError, match="max_rate"):
+        _adaptive(min_rate=5.0, max_rate=2.0)
+    with pytest.raises(ValueError, match="decrease_factor"):
+        _adaptive(decrease_factor=1.5)
@@ -0,0 +1,143 @@
+"""Tests for async (pipelined) extraction in ChemblExtractionServiceImpl."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+from unittest.mock import Mock
+
+import pytest
+
+from bioetl.domain.clients.chembl.contracts import ChemblDataClientABC
+from bioetl.infrastructure.clients.chembl.impl.chembl_extraction_service_impl import (
+    ChemblExtractionServiceImpl,
+)
+
+TOTAL = 7
+
+
+@pytest.fixture(scope="module")
+def loop():
+    # Event loop создается до фикстуры, блокирующей сокеты.
+    event_loop = asyncio.new_event_loop()
+    yield event_loop
+    event_loop.close()
+
+
+def _page(offset: int, limit: int) -> dict[str, Any]:
+    stop = min(offset + limit, TOTAL)
+    return {
+        "assays": [{"assay_chembl_id": f"A{i}"} for i in range(offset, stop)],
+        "page_meta": {
+            "offset": offset,
+            "limit": limit,
+            "total_count": TOTAL,
+            "next": "next" if stop < TOTAL else None,
+        },
+    }
+
+
+class _AsyncClient:
+    """Fake ChEMBL client with an async endpoint; tracks requests in flight."""
+
+    def __init__(self) -> None:
+        self.active = 0
+        self.peak = 0
+        self.calls: list[dict[str, Any]] = []
+
+    def request_assay(self, **filters: Any) -> dict[str, Any]:
+        self.calls.append(filters)
+        if "assay_chembl_id__in" in filters:
+            ids = filters["assay_chembl_id__in"].split(",")
+            return {"assays": [{"assay_chembl_id": item} for item in ids]}
+        return _page(filters["offset"], filters["limit"])
+
+    request_activity = request_target = request_document = request_assay
+    request_molecule = request_assay
+
+    async def request_endpoint_async(
+        self, endpoint: str, filters: dict[str, Any]
+    ) -> dict[str, Any]:
+        assert endpoint == "assay"
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        # Первые запросы отвечают медленнее — порядок должен сохраниться.
+        await asyncio.sleep(0.02 if len(self.calls) < 2 else 0.0)
+        self.active -= 1
+        return self.request_assay(**filters)
+
+
+async def _collect(iterator: Any) -> list[list[dict[str, Any]]]:
+    return [chunk async for chunk in iterator]
+
+
+def test_iter_extract_async_matches_sync_and_pipelines_pages(loop):
+    client = _AsyncClient()
+    service = ChemblExtractionServiceImpl(client=client, batch_size=2)
+    expected = list(service.iter_extract("assay"))
+    client.calls.clear()
+
+    chunks = loop.run_until_complete(
+        _collect(service.iter_extract_async("assay", max_in_flight=3))
+    )
+
+    assert chunks == expected
+    assert client.peak == 3
+    # Запросы не выходят за total_count после первой страницы.
+    assert sorted(call["offset"] for call in client.calls) == [0, 2, 4, 6]
+
+
+def test_iter_extract_async_respects_limit(loop):
+    client = _AsyncClient()
+    service = ChemblExtractionServiceImpl(client=client, batch_size=2, max_in_flight=4)
+
+    chunks = loop.run_until_complete(
+        _collect(service.iter_extract_async("assay", limit=3))
+    )
+
+    assert [len(chunk) for chunk in chunks] == [2, 1]
+    assert [call["limit"] for call in client.calls] == [2, 1]
+
+
+def test_iter_batches_async_keeps_batch_order(loop):
+    client = _AsyncClient()
+    service = ChemblExtractionServiceImpl(client=client, max_in_flight=2)
+    batches = [["A1", "A2"], ["A3"], ["A4", "A5"]]
+
+    chunks = loop.run_until_complete(
+        _collect(service.iter_batches_async("assay", batches, "assay_chembl_id__in"))
+    )
+
+    assert [[row["assay_chembl_id"] for row in chunk] for chunk in chunks] == batches
+    assert client.peak == 2
+    # limit по размеру батча: все записи батча в одном ответе.
+    assert [call["limit"] for call in client.calls] == [2, 1, 2]
+
+
+def test_request_batch_requests_page_for_whole_batch():
+    client = _AsyncClient()
+    service = ChemblExtractionServiceImpl(client=client)
+
+    response = service.request_batch("assay", ["A1", "A2", "A3"], "assay_chembl_id__in")
+
+    assert client.calls == [{"assay_chembl_id__in": "A1,A2,A3", "limit": 3}]
+    assert len(service.parse_response(response)) == 3
+
+
+def test_async_extract_falls_back_to_sync_client(loop):
+    client = Mock(spec=ChemblDataClientABC)
+    client.request_assay.side_effect = lambda **filters: _page(
+        filters["offset"], filters["limit"]
+    )
+    service = ChemblExtractionServiceImpl(client=client, batch_size=5)
+
+    chunks = loop.run_until_complete(_collect(service.iter_extract_async("assay")))
+
+    assert [len(chunk) for chunk in chunks] == [5, 2]
+
+
+def test_async_extract_rejects_unknown_entity(loop):
+    service = ChemblExtractionServiceImpl(client=_AsyncClient())
+
+    with pytest.raises(ValueError, match="Unknown entity"):
+        loop.run_until_complete(_collect(service.iter_extract_async("unknown")))
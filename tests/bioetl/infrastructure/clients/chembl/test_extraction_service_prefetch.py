@@ -0,0 +1,163 @@
+"""Tests for page prefetch in ChemblExtractionServiceImpl.iter_extract."""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any
+
+import pytest
+
+from bioetl.domain.record_source import RecordBatch
+from bioetl.infrastructure.clients.chembl.impl.chembl_extraction_service_impl import (
+    ChemblExtractionServiceImpl,
+)
+from bioetl.infrastructure.clients.chembl.paginator import ChemblPaginatorImpl
+
+
+def _page(offset: int, limit: int, total: int) -> dict[str, Any]:
+    stop = min(offset + limit, total)
+    return {
+        "assays": [{"assay_chembl_id": f"A{i}"} for i in range(offset, stop)],
+        "page_meta": {
+            "offset": offset,
+            "limit": limit,
+            "total_count": total,
+            "next": "next" if stop < total else None,
+        },
+    }
+
+
+class _Client:
+    """Fake sync ChEMBL client that tracks concurrent page requests."""
+
+    def __init__(self, total: int = 9, *, grow_to: int | None = None) -> None:
+        self.total = total
+        self.grow_to = grow_to
+        self.lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+        self.calls: list[tuple[int, int]] = []
+
+    def request_assay(self, **filters: Any) -> dict[str, Any]:
+        offset, limit = filters["offset"], filters["limit"]
+        with self.lock:
+            self.calls.append((offset, limit))
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            if self.grow_to is not None and len(self.calls) > 1:
+                self.total = self.grow_to
+            total = self.total
+        # Ранние страницы отвечают медленнее — порядок должен сохраниться.
+        time.sleep(0.03 if offset < 4 else 0.005)
+        with self.lock:
+            self.active -= 1
+        return _page(offset, limit, total)
+
+    request_activity = request_target = request_document = request_assay
+    request_molecule = request_assay
+
+
+def _ids(chunks: list[list[dict[str, Any]]]) -> list[str]:
+    return [row["assay_chembl_id"] for chunk in chunks for row in chunk]
+
+
+@pytest.mark.unit
+def test_prefetch_yields_pages_in_offset_order():
+    client = _Client(total=9)
+    service = ChemblExtractionServiceImpl(client=client, batch_size=2, max_in_flight=3)
+
+    chunks = list(service.iter_extract("assay"))
+
+    assert _ids(chunks) == [f"A{i}" for i in range(9)]
+    assert [len(chunk) for chunk in chunks] == [2, 2, 2, 2, 1]
+    assert client.peak == 3
+    assert sorted(client.calls) == [(0, 2), (2, 2), (4, 2), (6, 2), (8, 1)]
+
+
+@pytest.mark.unit
+def test_prefetch_respects_limit():
+    client = _Client(total=100)
+    service = ChemblExtractionServiceImpl(client=client, batch_size=4, max_in_flight=4)
+
+    chunks = list(service.iter_extract("assay", limit=10, offset=3))
+
+    assert _ids(chunks) == [f"A{i}" for i in range(3, 13)]
+    assert sorted(client.calls) == [(3, 4), (7, 4), (11, 2)]
+
+
+@pytest.mark.unit
+def test_single_in_flight_keeps_sequential_paging():
+    client = _Client(total=5)
+    service = ChemblExtractionServiceImpl(client=client, batch_size=2)
+
+    chunks = list(service.iter_extract("assay"))
+
+    assert _ids(chunks) == [f"A{i}" for i in range(5)]
+    assert client.calls == [(0, 2), (2, 2), (4, 2)]
+    assert client.peak == 1
+
+
+@pytest.mark.unit
+def test_prefetch_continues_when_total_count_grows():
+    client = _Client(total=4, grow_to=7)
+    service = ChemblExtractionServiceImpl(client=client, batch_size=2, max_in_flight=2)
+
+    chunks = list(service.iter_extract("assay"))
+
+    assert _ids(chunks) == [f"A{i}" for i in range(7)]
+    assert client.calls == [(0, 2), (2, 2), (4, 2), (6, 1)]
+
+
+@pytest.mark.unit
+def test_closing_iterator_stops_prefetch():
+    client = _Client(total=1000)
+    service = ChemblExtractionServiceImpl(client=client, batch_size=2, max_in_flight=3)
+
+    iterator = iter(service.iter_extract("assay"))
+    next(iterator)
+    next(iterator)
+    iterator.close()
+
+    # Первая страница + не больше max_in_flight запрошенных заранее.
+    assert len(client.calls) <= 1 + 3 + 1
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ("limit", "expected"),
+    [
+        (None, [(4, 4), (8, 2)]),
+        (5, [(4, 4), (8, 1)]),
+        (3, [(4, 3)]),
+    ],
+)
+def test_plan_offsets(limit, expected):
+    response = _page(0, 4, total=10)
+
+    plan = ChemblPaginatorImpl().plan_offsets(
+        response, start=4, page_size=4, limit=limit
+    )
+
+    assert plan == expected
+
+
+@pytest.mark.unit
+def test_plan_offsets_without_total_count():
+    assert ChemblPaginatorImpl().plan_offsets({}, start=0, page_size=2) == []
+
+
+@pytest.mark.unit
+def test_iter_extract_batches_matches_iter_extract():
+    service = ChemblExtractionServiceImpl(
+        client=_Client(total=5), batch_size=2, max_in_flight=2
+    )
+
+    batches = list(service.iter_extract_batches("assay", limit=4))
+
+    assert all(isinstance(batch, RecordBatch) for batch in batches)
+    assert [len(batch) for batch in batches] == [2, 2]
+    assert _ids([batch.to_records() for batch in batches]) == ["A0", "A1", "A2", "A3"]
+    assert [batch.to_records() for batch in batches] == list(
+        service.iter_extract("assay", limit=4)
+    )
@@ -4,6 +4,10 @@ Tests for ChEMBL factories.
 
 import pytest
 
+from bioetl.infrastructure.clients.base.impl.cache import CompressedJsonFileCacheImpl
+from bioetl.infrastructure.clients.base.impl.rate_limiter import (
+    AdaptiveRateLimiterImpl,
+)
 from bioetl.infrastructure.clients.chembl.factories import (
     default_chembl_client,
     default_chembl_extraction_service,
@@ -12,7 +16,12 @@ from bioetl.infrastructure.clients.chembl import ChemblExtractionClientImpl
 from bioetl.infrastructure.clients.chembl.impl.http_client import (
     ChemblDataClientHTTPImpl,
 )
-from bioetl.infrastructure.config.models import ChemblSourceConfig
+from bioetl.infrastructure.config.models import (
+    AdaptiveRateLimitConfig,
+    ChemblSourceConfig,
+    ResponseCacheConfig,
+    StorageConfig,
+)
 
 
 @pytest.fixture
@@ -60,3 +69,42 @@ def test_default_chembl_extraction_service_default_batch(source_config):
     service = default_chembl_extraction_service(source_config)
     # ChEMBL factory uses hard_cap=1000 for batch_size
     assert service.batch_size == 1000
+
+
+def test_default_chembl_client_response_cache(source_config, tmp_path):
+    """Response cache is opt-in and lives under storage.cache_path."""
+    assert default_chembl_client(source_config).response_cache is None
+
+    storage = StorageConfig(
+        cache_path=str(tmp_path),
+        response_cache=ResponseCacheConfig(enabled=True, ttl_sec=60, max_size_mb=1),
+    )
+    client = default_chembl_client(source_config, storage=storage)
+
+    assert isinstance(client.response_cache, CompressedJsonFileCacheImpl)
+    assert client.response_cache_ttl == 60
+    assert (tmp_path / "http" / "chembl").is_dir()
+
+
+def test_default_chembl_client_fixed_rate_limit(source_config):
+    """Without adaptive_rate_limit the middleware gets no feedback target."""
+    client = default_chembl_client(source_config)
+
+    assert not isinstance(client.rate_limiter, AdaptiveRateLimiterImpl)
+    assert client.client.middleware.rate_limiter is None
+
+
+def test_default_chembl_client_adaptive_rate_limit(source_config):
+    """Adaptive limiter is shared by sync/async middleware and token buckets."""
+    source_config.adaptive_rate_limit = AdaptiveRateLimitConfig(
+        enabled=True, min_rate_per_sec=10.0, max_rate_per_sec=20.0
+    )
+    client = default_chembl_client(source_config)
+
+    limiter = client.rate_limiter
+    assert isinstance(limiter, AdaptiveRateLimiterImpl)
+    # Стартовая частота ниже min_rate_per_sec не поднимается.
+    assert limiter.rate == 5.0
+    assert client.client.middleware.rate_limiter is limiter
+    assert client.async_client.middleware.rate_limiter is limiter
+    assert client.async_rate_limiter.rate == 5.0
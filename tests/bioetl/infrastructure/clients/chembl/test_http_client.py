@@ -1,14 +1,19 @@
 """Tests for ChemblDataClientHTTPImpl."""
 
 # pylint: disable=redefined-outer-name
-from unittest.mock import Mock
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 
-from bioetl.domain.clients.base.contracts import RateLimiterABC
+from bioetl.domain.clients.base.contracts import AsyncRateLimiterABC, RateLimiterABC
 from bioetl.domain.errors import ClientResponseError
+from bioetl.infrastructure.clients.base.impl.cache import MemoryCacheImpl
 from bioetl.infrastructure.clients.chembl.impl.http_client import (
     ChemblDataClientHTTPImpl,
+    canonical_url,
 )
 from bioetl.infrastructure.clients.chembl.request_builder import (
     ChemblRequestBuilderImpl,
@@ -97,6 +102,18 @@ def test_request_activity(client, mock_request_builder):
     assert result == {"activities": []}
 
 
+def test_request_methods_acquire_rate_limiter(client):
+    """Batch requests share the token bucket with pagination."""
+    mock_response = Mock()
+    mock_response.json.return_value = {}
+    client.http.request.return_value = mock_response
+
+    client.request_activity(activity_id__in="1,2")
+    client.request_molecule(molecule_chembl_id__in="CHEMBL1")
+
+    assert client.rate_limiter.acquire.call_count == 2
+
+
 def test_execute_request_json_error(client):
     """Test JSON parse error is mapped to ClientResponseError."""
     mock_response = Mock()
@@ -177,3 +194,228 @@ def test_iter_pages_without_next_stops_after_first(client):
 
     assert pages == [response.json.return_value]
     client.http.request.assert_called_once_with("GET", "https://example.org/page1")
+
+
+@pytest.fixture(scope="module", name="loop")
+def fixture_loop():
+    """Event loop created before the socket-blocking fixture."""
+    event_loop = asyncio.new_event_loop()
+    yield event_loop
+    event_loop.close()
+
+
+def test_request_endpoint_async_uses_async_client(
+    mock_request_builder, mock_response_parser, mock_rate_limiter, loop
+):
+    """Async requests go through the async client and async rate limiter."""
+    response = Mock()
+    response.json.return_value = {"assays": []}
+    async_client = Mock()
+    async_client.request = AsyncMock(return_value=response)
+    async_rate_limiter = Mock(spec=AsyncRateLimiterABC)
+    async_rate_limiter.acquire = AsyncMock()
+    client = ChemblDataClientHTTPImpl(
+        request_builder=mock_request_builder,
+        response_parser=mock_response_parser,
+        rate_limiter=mock_rate_limiter,
+        http_middleware=Mock(spec=HttpClientMiddleware),
+        async_client=async_client,
+        async_rate_limiter=async_rate_limiter,
+    )
+
+    result = loop.run_until_complete(
+        client.request_endpoint_async("assay", {"assay_chembl_id__in": "A1"})
+    )
+
+    assert result == {"assays": []}
+    mock_request_builder.for_endpoint.assert_called_with("assay")
+    async_client.request.assert_awaited_once_with("GET", "http://test-url")
+    async_rate_limiter.acquire.assert_awaited_once()
+    mock_rate_limiter.acquire.assert_not_called()
+
+
+def test_iter_pages_async_without_async_client_uses_sync_path(client, loop):
+    """Without async client pages are fetched by the sync middleware in a thread."""
+    response = Mock()
+    response.json.return_value = {
+        "page_meta": {"next": None, "limit": 20, "offset": 0, "total_count": 20},
+        "results": [1],
+    }
+    client.http.request.return_value = response
+
+    async def collect():
+        return [page async for page in client.iter_pages_async("https://x/page1")]
+
+    pages = loop.run_until_complete(collect())
+
+    assert pages == [response.json.return_value]
+    client.http.request.assert_called_once_with("GET", "https://x/page1")
+    client.rate_limiter.acquire.assert_called_once()
+
+
+class _Builder:
+    """Request builder stub: ``https://x/<endpoint>?<filters in given order>``."""
+
+    def for_endpoint(self, endpoint):
+        self.endpoint = endpoint
+        return self
+
+    def build(self, params):
+        query = "&".join(f"{key}={value}" for key, value in params.items())
+        return f"https://x/{self.endpoint}" + (f"?{query}" if query else "")
+
+
+def _cached_client(rate_limiter, cache, status):
+    http = Mock(spec=HttpClientMiddleware)
+    status_response = Mock()
+    status_response.json.return_value = status
+    data_response = Mock()
+    data_response.json.return_value = {"assays": [{"assay_chembl_id": "A1"}]}
+    http.request.side_effect = lambda _method, url: (
+        status_response if url.endswith("/status") else data_response
+    )
+    return ChemblDataClientHTTPImpl(
+        request_builder=_Builder(),
+        response_parser=Mock(spec=ChemblResponseParserImpl),
+        rate_limiter=rate_limiter,
+        http_middleware=http,
+        response_cache=cache,
+        response_cache_ttl=60,
+    )
+
+
+def _data_calls(client):
+    return [
+        call for call in client.http.request.call_args_list if "assay" in call.args[1]
+    ]
+
+
+def test_response_cache_skips_network_on_same_release(mock_rate_limiter):
+    """A cached page is served without rate limiting or HTTP calls."""
+    cache = MemoryCacheImpl()
+    client = _cached_client(mock_rate_limiter, cache, {"chembl_release": "CHEMBL_36"})
+
+    first = client.request_assay(b=2, a=1)
+    second = client.request_assay(a=1, b=2)
+
+    assert first == second == {"assays": [{"assay_chembl_id": "A1"}]}
+    assert len(_data_calls(client)) == 1
+    # Один токен на /status и один на единственный сетевой запрос данных.
+    assert mock_rate_limiter.acquire.call_count == 2
+    assert cache.get("chembl:CHEMBL_36:https://x/assay?a=1&b=2") == first
+
+
+def test_response_cache_disabled_without_known_release(mock_rate_limiter):
+    cache = MemoryCacheImpl()
+    client = _cached_client(mock_rate_limiter, cache, {})
+
+    client.request_assay(a=1)
+    client.request_assay(a=1)
+
+    assert len(_data_calls(client)) == 2
+    assert cache._store == {}  # pylint: disable=protected-access
+
+
+def test_response_cache_retries_release_after_status_failure(mock_rate_limiter):
+    cache = MemoryCacheImpl()
+    client = _cached_client(mock_rate_limiter, cache, {"chembl_release": "CHEMBL_36"})
+    data_response = Mock()
+    data_response.json.return_value = {"assays": []}
+    status_response = Mock()
+    status_response.json.return_value = {"chembl_release": "CHEMBL_36"}
+    status_calls = []
+
+    def _request(_method, url):
+        if not url.endswith("/status"):
+            return data_response
+        status_calls.append(url)
+        if len(status_calls) == 1:
+            raise ConnectionError("status is down")
+        return status_response
+
+    client.http.request.side_effect = _request
+
+    client.request_assay(a=1)
+    client.request_assay(a=1)
+    # До истечения паузы /status не запрашивается повторно.
+    assert len(status_calls) == 1
+    assert cache._store == {}  # pylint: disable=protected-access
+
+    # Пауза истекла — следующий запрос снова спрашивает релиз.
+    client._release_retry_at = 0.0  # pylint: disable=protected-access
+    client.request_assay(a=1)
+    client.request_assay(a=1)
+
+    assert len(status_calls) == 2
+    assert len(_data_calls(client)) == 3
+    assert cache.get("chembl:CHEMBL_36:https://x/assay?a=1") == {"assays": []}
+
+
+def test_response_cache_resolves_release_once_for_concurrent_requests(
+    mock_rate_limiter,
+):
+    cache = MemoryCacheImpl()
+    client = _cached_client(mock_rate_limiter, cache, {"chembl_release": "CHEMBL_36"})
+    data_response = Mock()
+    data_response.json.return_value = {"assays": []}
+    status_response = Mock()
+    status_response.json.return_value = {"chembl_release": "CHEMBL_36"}
+    status_calls = []
+
+    def _request(_method, url):
+        if not url.endswith("/status"):
+            return data_response
+        status_calls.append(url)
+        time.sleep(0.05)
+        return status_response
+
+    client.http.request.side_effect = _request
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda page: client.request_assay(page=page), range(8)))
+
+    assert len(status_calls) == 1
+    assert len(_data_calls(client)) == 8
+    assert mock_rate_limiter.acquire.call_count == 9
+
+
+def test_response_cache_serves_async_requests(mock_rate_limiter, loop):
+    cache = MemoryCacheImpl()
+    client = _cached_client(mock_rate_limiter, cache, {"chembl_release": "36"})
+    client.request_assay(a=1)
+    async_client = Mock()
+    async_client.request = AsyncMock()
+    client.async_client = async_client
+
+    result = loop.run_until_complete(client.request_endpoint_async("assay", {"a": 1}))
+
+    assert result == {"assays": [{"assay_chembl_id": "A1"}]}
+    async_client.request.assert_not_awaited()
+
+
+def test_canonical_url_sorts_query_and_lowercases_host():
+    assert (
+        canonical_url("HTTPS://Example.org/api/activity?limit=10&offset=0&a=1#frag")
+        == "https://example.org/api/activity?a=1&limit=10&offset=0"
+    )
+
+
+def test_cache_lookups_and_rate_limit_wait_are_observed(mock_rate_limiter):
+    from bioetl.infrastructure.observability import metrics
+
+    cache = MemoryCacheImpl()
+    client = _cached_client(mock_rate_limiter, cache, {"chembl_release": "CHEMBL_36"})
+    client.provider = "chembl-metrics-test"
+    lookups = metrics.HTTP_CACHE_LOOKUPS_TOTAL
+    labels = {"provider": client.provider, "endpoint": "x/assay"}
+    wait = metrics.HTTP_RATE_LIMIT_WAIT_SECONDS.labels(provider=client.provider)
+
+    client.request_assay(a=1)
+    client.request_assay(a=1)
+
+    assert lookups.labels(result="miss", **labels)._value.get() == 1.0
+    assert lookups.labels(result="hit", **labels)._value.get() == 1.0
+    # Ожидание токена фиксируется только для запросов, ушедших в сеть
+    # (/status и первый запрос данных).
+    count = next(sample.value for sample in wait._samples() if sample.name == "_count")
+    assert count == 2.0
@@ -1,3 +1,5 @@
+import pytest
+
 from bioetl.infrastructure.clients.chembl.request_builder import (
     ChemblRequestBuilderImpl,
 )
@@ -25,3 +27,53 @@ def test_endpoint_trim():
     builder = ChemblRequestBuilderImpl("http://api")
     builder.for_endpoint("/test/")
     assert builder._endpoint == "test"
+
+
+def test_pack_ids_without_max_url_length_uses_fixed_batches():
+    builder = ChemblRequestBuilderImpl("http://api").for_endpoint("activity")
+
+    batches = list(builder.pack_ids("activity_id__in", list("abcde"), max_batch_size=2))
+
+    assert batches == [["a", "b"], ["c", "d"], ["e"]]
+
+
+def test_pack_ids_fills_batches_up_to_max_url_length():
+    builder = ChemblRequestBuilderImpl(
+        "https://www.ebi.ac.uk/chembl/api/data", max_url_length=2000
+    ).for_endpoint("activity")
+    ids = [str(i) for i in range(10_000, 12_000)]
+
+    batches = list(builder.pack_ids("activity_id__in", ids))
+
+    assert [value for batch in batches for value in batch] == ids
+    # Вместо 80 батчей по 25 ID — по ~330 ID в батче.
+    assert len(batches) == 7
+    for batch in batches:
+        url = builder.build({"activity_id__in": ",".join(batch), "limit": len(batch)})
+        assert len(url) <= 2000
+    # Батчи заполнены: следующий ID уже не помещается в URL.
+    for batch, following in zip(batches, batches[1:]):
+        longer = ",".join([*batch, following[0]])
+        with pytest.raises(ValueError, match="exceeds max_url_length"):
+            builder.build({"activity_id__in": longer, "limit": 1000})
+
+
+def test_pack_ids_counts_percent_encoded_length_and_caps_batch_size():
+    builder = ChemblRequestBuilderImpl("http://api", max_url_length=60).for_endpoint(
+        "document"
+    )
+    # Префикс: http://api/document.json?limit=3&doc__in= (41 символ).
+    ids = ["a b", "c", "d", "e"]
+
+    batches = list(builder.pack_ids("doc__in", ids, max_batch_size=3))
+
+    # "a b" кодируется как a%20b (5 символов), лимит батча — 3 ID.
+    assert batches == [["a b", "c", "d"], ["e"]]
+    tight = ChemblRequestBuilderImpl("http://api", max_url_length=45).for_endpoint(
+        "document"
+    )
+    assert list(tight.pack_ids("doc__in", ids, max_batch_size=3)) == [
+        ["a b"],
+        ["c", "d"],
+        ["e"],
+    ]
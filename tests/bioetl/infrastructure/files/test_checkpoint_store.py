@@ -0,0 +1,57 @@
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from bioetl.domain.configs import CheckpointConfig, StorageConfig
+from bioetl.domain.pipelines.checkpoint import Checkpoint, CheckpointChunk
+from bioetl.infrastructure.files.checkpoint_store import FileCheckpointStoreImpl
+from bioetl.infrastructure.files.factories import default_checkpoint_store
+
+
+def test_checkpoint_store_round_trip(tmp_path: Path) -> None:
+    store = FileCheckpointStoreImpl(tmp_path)
+    df = pd.DataFrame({"id": [1, 2], "value": [0.5, None]}).astype({"id": "Int64"})
+
+    ref = store.save_chunk("run-1", 0, df)
+    store.commit(
+        Checkpoint(
+            run_id="run-1",
+            pipeline_id="chembl.activity",
+            cursor={"rows": 2, "source": {"offset": 2}},
+            counters={"extract_count": 2},
+            state={"index": 2, "extracted_at": "2024-01-01T00:00:00+00:00"},
+            chunks=[CheckpointChunk(index=0, rows=2, ref=ref)],
+        )
+    )
+
+    loaded = store.load("run-1")
+    assert loaded is not None
+    assert loaded.cursor == {"rows": 2, "source": {"offset": 2}}
+    assert loaded.state["index"] == 2
+    pd.testing.assert_frame_equal(store.load_chunk("run-1", ref), df)
+
+    store.clear("run-1")
+    assert store.load("run-1") is None
+
+
+@pytest.mark.parametrize("run_id", ["", "..", "../escape", "a/b"])
+def test_checkpoint_store_rejects_path_like_run_ids(
+    tmp_path: Path, run_id: str
+) -> None:
+    with pytest.raises(ValueError, match="Invalid run_id"):
+        FileCheckpointStoreImpl(tmp_path).load(run_id)
+
+
+def test_default_checkpoint_store_respects_config(tmp_path: Path) -> None:
+    assert default_checkpoint_store(StorageConfig()) is None
+
+    storage = StorageConfig(
+        temp_path=str(tmp_path),
+        checkpoints=CheckpointConfig(enabled=True),
+    )
+    store = default_checkpoint_store(storage)
+
+    assert isinstance(store, FileCheckpointStoreImpl)
+    store.commit(Checkpoint(run_id="r", pipeline_id="p"))
+    assert (tmp_path / "checkpoints" / "r" / "manifest.json").exists()
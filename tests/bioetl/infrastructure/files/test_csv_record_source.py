@@ -1,13 +1,14 @@
+import threading
+import time
 from pathlib import Path
-from typing import cast
-
-from pathlib import Path
-from typing import cast
+from typing import Any, cast
 
 import pandas as pd
+import pytest
 from pydantic import AnyHttpUrl
 
 from bioetl.domain.contracts import ExtractionServiceABC
+from bioetl.domain.errors import ClientResponseError
 from bioetl.domain.observability import LoggingPort
 from bioetl.infrastructure.config.models import (
     ChemblSourceConfig,
@@ -74,7 +75,65 @@ def test_csv_record_source_reads_dataset(tmp_path: Path) -> None:
 
     assert len(chunks) == 1
     expected = [{"id": 1, "name": "alpha"}]
-    assert chunks[0] == expected
+    assert chunks[0].to_dict(orient="records") == expected
+
+
+def test_csv_record_source_streams_chunks(tmp_path: Path) -> None:
+    csv_path = tmp_path / "dataset.csv"
+    pd.DataFrame({"id": range(10), "name": [f"n{i}" for i in range(10)]}).to_csv(
+        csv_path, index=False
+    )
+    # Битая строка в конце файла: первые чанки отдаются до ее разбора.
+    with csv_path.open("a", encoding="utf-8") as handle:
+        handle.write("10,a,b,c\n")
+
+    source = CsvRecordSourceImpl(
+        input_path=csv_path,
+        csv_options=CsvInputOptions(),
+        limit=None,
+        logger=cast(LoggingPort, _DummyLogger()),
+        chunk_size=4,
+    )
+    chunks = iter(source.iter_records())
+
+    first = next(chunks)
+    assert isinstance(first, pd.DataFrame)
+    assert first["id"].tolist() == [0, 1, 2, 3]
+    assert next(chunks)["id"].tolist() == [4, 5, 6, 7]
+    with pytest.raises(pd.errors.ParserError):
+        next(chunks)
+
+
+def test_csv_record_source_limit_and_usecols(tmp_path: Path) -> None:
+    csv_path = tmp_path / "dataset.csv"
+    pd.DataFrame({"id": range(10), "name": ["x"] * 10, "extra": [1.5] * 10}).to_csv(
+        csv_path, index=False
+    )
+
+    source = CsvRecordSourceImpl(
+        input_path=csv_path,
+        csv_options=CsvInputOptions(usecols=["id", "name", "missing"]),
+        limit=5,
+        logger=cast(LoggingPort, _DummyLogger()),
+        chunk_size=2,
+    )
+    chunks = list(source.iter_records())
+
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    assert all(list(chunk.columns) == ["id", "name"] for chunk in chunks)
+
+
+def test_csv_options_resolve_usecols_from_schema_fields() -> None:
+    fields = [{"name": "id"}, {"name": "name"}]
+
+    assert CsvInputOptions().resolve_usecols(fields) is None
+    assert CsvInputOptions(schema_fields_only=True).resolve_usecols(fields) == [
+        "id",
+        "name",
+    ]
+    assert CsvInputOptions(usecols=["id"], schema_fields_only=True).resolve_usecols(
+        fields
+    ) == ["id"]
 
 
 def test_id_list_record_source_fetches_batches(tmp_path: Path) -> None:
@@ -111,3 +170,213 @@ def test_id_list_record_source_fetches_batches(tmp_path: Path) -> None:
     combined = [record for batch in records for record in batch]
     expected = [{"id": "A1"}, {"id": "A2"}, {"id": "A3"}]
     assert combined == expected
+
+
+class _SlowExtractionService(_StubExtractionService):
+    """Первые батчи отвечают дольше последних и считают параллельные запросы."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def request_batch(self, entity: str, batch_ids: list[str], filter_key: str):
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(0.05 if batch_ids[0] in {"A1", "A2"} else 0.01)
+        with self._lock:
+            self.in_flight -= 1
+        return {"records": [{"id": value} for value in batch_ids]}
+
+
+def test_id_list_record_source_fetches_concurrently_in_input_order(
+    tmp_path: Path,
+) -> None:
+    csv_path = tmp_path / "ids.csv"
+    ids = [f"A{i}" for i in range(1, 11)]
+    pd.DataFrame({"activity_id": ids}).to_csv(csv_path, index=False)
+
+    extraction = _SlowExtractionService()
+    source_config = ChemblSourceConfig(
+        provider="chembl",
+        base_url=cast(AnyHttpUrl, "https://example.org"),
+        timeout_sec=1,
+        max_retries=0,
+        batch_size=1,
+        max_concurrent_requests=3,
+    )
+    source = IdListRecordSourceImpl(
+        input_path=csv_path,
+        id_column="activity_id",
+        csv_options=CsvInputOptions(),
+        limit=None,
+        extraction_service=cast(ExtractionServiceABC, extraction),
+        source_config=source_config,
+        entity="activity",
+        filter_key="activity_id__in",
+        logger=cast(LoggingPort, _DummyLogger()),
+    )
+
+    records = list(source.iter_records())
+
+    assert [batch[0]["id"] for batch in records] == ids
+    assert 1 < extraction.max_in_flight <= 3
+
+
+def test_id_list_record_source_resumes_from_cursor(tmp_path: Path) -> None:
+    csv_path = tmp_path / "ids.csv"
+    ids = [f"A{i}" for i in range(5)]
+    pd.DataFrame({"activity_id": ids}).to_csv(csv_path, index=False)
+
+    def _build(extraction: _StubExtractionService) -> IdListRecordSourceImpl:
+        return IdListRecordSourceImpl(
+            input_path=csv_path,
+            id_column="activity_id",
+            csv_options=CsvInputOptions(),
+            limit=None,
+            extraction_service=cast(ExtractionServiceABC, extraction),
+            source_config=ChemblSourceConfig(
+                provider="chembl",
+                base_url=cast(AnyHttpUrl, "https://example.org"),
+                timeout_sec=1,
+                max_retries=0,
+                rate_limit_per_sec=1.0,
+                batch_size=2,
+            ),
+            entity="activity",
+            filter_key="activity_id__in",
+            logger=cast(LoggingPort, _DummyLogger()),
+            chunk_size=1,
+        )
+
+    first = _build(_StubExtractionService())
+    cursors = []
+    for _ in first.iter_records():
+        cursors.append(first.cursor)
+    assert [(c["batch"], c["row"]) for c in cursors] == [
+        (0, 1),
+        (1, 0),
+        (1, 1),
+        (2, 0),
+        (3, 0),
+    ]
+
+    extraction = _StubExtractionService()
+    resumed = _build(extraction)
+    resumed.seek(cursors[3])
+
+    records = [record for batch in resumed.iter_records() for record in batch]
+
+    assert extraction.batches == [["A4"]]
+    assert records == [{"id": "A4"}]
+
+    extraction = _StubExtractionService()
+    partial = _build(extraction)
+    partial.seek(cursors[2])
+
+    records = [record for batch in partial.iter_records() for record in batch]
+
+    assert extraction.batches == [["A2", "A3"], ["A4"]]
+    assert records == [{"id": "A3"}, {"id": "A4"}]
+
+
+class _UriLimitedExtractionService(_StubExtractionService):
+    """Отвечает 414 на батчи длиннее ``max_ids``."""
+
+    def __init__(self, max_ids: int) -> None:
+        super().__init__()
+        self.max_ids = max_ids
+        self.rejected = 0
+
+    def request_batch(self, entity: str, batch_ids: list[str], filter_key: str):
+        if len(batch_ids) > self.max_ids:
+            self.rejected += 1
+            raise ClientResponseError(
+                provider="chembl",
+                endpoint=entity,
+                status_code=414,
+                message="Request-URI Too Long",
+            )
+        return super().request_batch(entity, batch_ids, filter_key)
+
+
+def _packed_source(
+    csv_path: Path, extraction: _StubExtractionService, **config: Any
+) -> IdListRecordSourceImpl:
+    return IdListRecordSourceImpl(
+        input_path=csv_path,
+        id_column="activity_id",
+        csv_options=CsvInputOptions(),
+        limit=None,
+        extraction_service=cast(ExtractionServiceABC, extraction),
+        source_config=ChemblSourceConfig(
+            provider="chembl",
+            base_url=cast(AnyHttpUrl, "https://www.ebi.ac.uk/chembl/api/data"),
+            timeout_sec=1,
+            max_retries=0,
+            batch_size=20,
+            max_url_length=2000,
+            **config,
+        ),
+        entity="activity",
+        filter_key="activity_id__in",
+        logger=cast(LoggingPort, _DummyLogger()),
+    )
+
+
+def test_id_list_record_source_packs_batches_by_url_length(tmp_path: Path) -> None:
+    csv_path = tmp_path / "ids.csv"
+    ids = [str(value) for value in range(100_000, 101_000)]
+    pd.DataFrame({"activity_id": ids}).to_csv(csv_path, index=False)
+
+    extraction = _StubExtractionService()
+    records = list(_packed_source(csv_path, extraction).iter_records())
+
+    # 1000 коротких ID: 4 запроса вместо 50 батчей по batch_size=20.
+    assert [len(batch) for batch in extraction.batches] == [274, 274, 274, 178]
+    assert [row["id"] for chunk in records for row in chunk] == ids
+
+    capped = _StubExtractionService()
+    list(_packed_source(csv_path, capped, max_ids_per_request=300).iter_records())
+    assert [len(batch) for batch in capped.batches] == [274, 274, 274, 178]
+
+    small = _StubExtractionService()
+    list(_packed_source(csv_path, small, max_ids_per_request=250).iter_records())
+    assert [len(batch) for batch in small.batches] == [250, 250, 250, 250]
+
+
+def test_id_list_record_source_splits_batch_on_414(tmp_path: Path) -> None:
+    csv_path = tmp_path / "ids.csv"
+    ids = [str(value) for value in range(100_000, 100_600)]
+    pd.DataFrame({"activity_id": ids}).to_csv(csv_path, index=False)
+
+    extraction = _UriLimitedExtractionService(max_ids=100)
+    records = list(_packed_source(csv_path, extraction).iter_records())
+
+    assert extraction.rejected > 0
+    assert all(len(batch) <= 100 for batch in extraction.batches)
+    assert [row["id"] for chunk in records for row in chunk] == ids
+    # Записи разделенного батча отдаются одним чанком исходного батча.
+    assert [len(chunk) for chunk in records] == [274, 274, 52]
+
+
+def test_id_list_record_source_resumes_packed_batches(tmp_path: Path) -> None:
+    csv_path = tmp_path / "ids.csv"
+    ids = [str(value) for value in range(100_000, 100_600)]
+    pd.DataFrame({"activity_id": ids}).to_csv(csv_path, index=False)
+
+    first = _packed_source(csv_path, _StubExtractionService())
+    iterator = iter(first.iter_records())
+    next(iterator)
+    cursor = first.cursor
+    assert cursor == {"batch": 1, "offset": 274, "row": 0}
+
+    extraction = _StubExtractionService()
+    resumed = _packed_source(csv_path, extraction)
+    resumed.seek(cursor)
+    records = [row["id"] for chunk in resumed.iter_records() for row in chunk]
+
+    assert records == ids[274:]
+    assert extraction.batches[0][0] == ids[274]
@@ -0,0 +1,198 @@
+"""
+Tests for delta output mode keyed on hash_business_key / hash_row.
+"""
+
+# pylint: disable=redefined-outer-name
+import pandas as pd
+import pytest
+
+from bioetl.domain.configs import DeterminismConfig, QcConfig
+from bioetl.infrastructure.output.delta import (
+    CHANGE_TYPE_COLUMN,
+    HASH_INDEX_NAME,
+    load_hash_index,
+)
+from bioetl.infrastructure.output.impl.csv_writer import CsvWriterImpl
+from bioetl.infrastructure.output.impl.metadata_writer import MetadataWriterImpl
+from bioetl.infrastructure.output.impl.parquet_writer import ParquetWriterImpl
+from bioetl.infrastructure.output.impl.quality_report import QualityReportImpl
+from bioetl.infrastructure.output.unified_writer import UnifiedOutputWriter
+
+COLUMNS = ["id", "label", "hash_business_key", "hash_row"]
+DELTA_CONFIG = {
+    "output": {"delta": True},
+    "hashing": {"business_key_fields": ["id"]},
+}
+
+
+def _frame(rows: list[tuple[int, str]]) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "id": [row[0] for row in rows],
+            "label": [row[1] for row in rows],
+            "hash_business_key": [f"k{row[0]}" for row in rows],
+            "hash_row": [f"r{row[0]}-{row[1]}" for row in rows],
+        }
+    )
+
+
+@pytest.fixture
+def writer() -> UnifiedOutputWriter:
+    return UnifiedOutputWriter(
+        writer=CsvWriterImpl(),
+        metadata_writer=MetadataWriterImpl(),
+        quality_reporter=QualityReportImpl(),
+        config=DeterminismConfig(),
+        qc_config=QcConfig(enable_quality_report=False),
+    )
+
+
+def _write(writer, df, output_path, context, *, streaming=False):
+    if not streaming:
+        return writer.write_result(
+            df, output_path, "entity", context, column_order=COLUMNS
+        )
+    stream = writer.open_stream(output_path, "entity", context, column_order=COLUMNS)
+    for start in range(0, len(df), 2):
+        stream.write_chunk(df.iloc[start : start + 2])
+    return stream.close()
+
+
+def _read_delta(output_path) -> pd.DataFrame:
+    return pd.read_csv(output_path / "entity.delta.csv", dtype=str)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("streaming", [False, True])
+def test_delta_reports_added_changed_removed(
+    writer, run_context_factory, tmp_path, streaming
+):
+    first = writer.write_result(
+        _frame([(1, "a"), (2, "b"), (3, "c")]),
+        tmp_path,
+        "entity",
+        run_context_factory(run_id="run-1", config=DELTA_CONFIG),
+        column_order=COLUMNS,
+    )
+    assert first.delta is not None
+    assert (first.delta.added, first.delta.removed) == (3, 0)
+    assert first.delta.base_run_id is None
+
+    second = _write(
+        writer,
+        _frame([(4, "d"), (1, "a"), (2, "B")]),
+        tmp_path,
+        run_context_factory(run_id="run-2", config=DELTA_CONFIG),
+        streaming=streaming,
+    )
+
+    delta = second.delta
+    assert delta is not None
+    assert delta.base_run_id == "run-1"
+    assert (delta.added, delta.changed, delta.removed, delta.unchanged) == (
+        1,
+        1,
+        1,
+        1,
+    )
+
+    changes = _read_delta(tmp_path)
+    assert list(changes.columns) == [*COLUMNS, CHANGE_TYPE_COLUMN]
+    assert changes[["id", "label", CHANGE_TYPE_COLUMN]].values.tolist() == [
+        ["2", "B", "changed"],
+        ["4", "d", "added"],
+        ["3", "c", "removed"],
+    ]
+
+    # Снимок — полный результат текущего запуска, индекс указывает на него.
+    snapshot = pd.read_csv(second.path)
+    assert snapshot["id"].tolist() == [1, 2, 4]
+    loaded = load_hash_index(tmp_path / HASH_INDEX_NAME)
+    assert loaded is not None
+    index, run_id = loaded
+    assert run_id == "run-2"
+    assert index.to_dict() == {"k1": "r1-a", "k2": "r2-B", "k4": "r4-d"}
+
+    meta = (tmp_path / "meta.yaml").read_text(encoding="utf-8")
+    assert "entity.delta.csv" in meta
+    assert HASH_INDEX_NAME in meta
+    assert "base_run_id: run-1" in meta
+
+
+@pytest.mark.unit
+def test_removed_rows_fall_back_to_keys_without_snapshot(
+    writer, run_context_factory, tmp_path
+):
+    writer.write_result(
+        _frame([(1, "a"), (2, "b")]),
+        tmp_path,
+        "entity",
+        run_context_factory(run_id="run-1", config=DELTA_CONFIG),
+        column_order=COLUMNS,
+    )
+    (tmp_path / "entity.csv").unlink()
+
+    result = writer.write_result(
+        _frame([(1, "a")]),
+        tmp_path,
+        "entity",
+        run_context_factory(run_id="run-2", config=DELTA_CONFIG),
+        column_order=COLUMNS,
+    )
+
+    assert result.delta is not None
+    assert result.delta.removed == 1
+    changes = _read_delta(tmp_path)
+    assert changes.values.tolist()[0][2:] == ["k2", "r2-b", "removed"]
+    assert changes["id"].isna().all()
+
+
+@pytest.mark.unit
+def test_delta_disabled_writes_no_index(writer, run_context_factory, tmp_path):
+    result = writer.write_result(
+        _frame([(1, "a")]),
+        tmp_path,
+        "entity",
+        run_context_factory(),
+        column_order=COLUMNS,
+    )
+
+    assert result.delta is None
+    assert not (tmp_path / HASH_INDEX_NAME).exists()
+    assert not (tmp_path / "entity.delta.csv").exists()
+
+
+@pytest.mark.unit
+def test_parquet_delta_reads_removed_rows_from_snapshot(run_context_factory, tmp_path):
+    pytest.importorskip("pyarrow")
+    writer = UnifiedOutputWriter(
+        writer=ParquetWriterImpl(),
+        metadata_writer=MetadataWriterImpl(),
+        quality_reporter=QualityReportImpl(),
+        config=DeterminismConfig(),
+        qc_config=QcConfig(enable_quality_report=False),
+        file_format="parquet",
+    )
+    writer.write_result(
+        _frame([(1, "a"), (2, "b")]),
+        tmp_path,
+        "entity",
+        run_context_factory(run_id="run-1", config=DELTA_CONFIG),
+        column_order=COLUMNS,
+    )
+
+    result = writer.write_result(
+        _frame([(1, "A")]),
+        tmp_path,
+        "entity",
+        run_context_factory(run_id="run-2", config=DELTA_CONFIG),
+        column_order=COLUMNS,
+    )
+
+    assert result.delta is not None
+    assert result.delta.path.name == "entity.delta.parquet"
+    changes = pd.read_parquet(result.delta.path)
+    assert changes[["id", "label", CHANGE_TYPE_COLUMN]].values.tolist() == [
+        [1, "A", "changed"],
+        [2, "b", "removed"],
+    ]
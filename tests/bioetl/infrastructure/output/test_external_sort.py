@@ -0,0 +1,66 @@
+"""
+Tests for the spill-to-disk merge sort.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from bioetl.infrastructure.output.external_sort import ExternalMergeSorter
+
+
+def _chunks(rows: int, chunk_size: int, seed: int = 7) -> list[pd.DataFrame]:
+    rng = np.random.default_rng(seed)
+    frame = pd.DataFrame(
+        {
+            "key": rng.integers(0, rows // 3, size=rows),
+            "name": rng.choice(["a", "b", None], size=rows),
+            "seq": np.arange(rows),
+        }
+    )
+    return [
+        frame.iloc[start : start + chunk_size].reset_index(drop=True)
+        for start in range(0, rows, chunk_size)
+    ]
+
+
+@pytest.mark.parametrize("keys", [["key"], ["name", "key"]])
+def test_merge_matches_stable_in_memory_sort(tmp_path, keys):
+    chunks = _chunks(500, 37)
+    sorter = ExternalMergeSorter(keys, tmp_path, block_rows=16)
+    for chunk in chunks:
+        sorter.add(chunk)
+
+    merged = pd.concat(list(sorter.iter_sorted(batch_rows=50)), ignore_index=True)
+    expected = pd.concat(chunks, ignore_index=True).sort_values(
+        by=keys, kind="mergesort", ignore_index=True
+    )
+
+    assert sorter.run_count == len(chunks)
+    pd.testing.assert_frame_equal(merged, expected)
+
+
+def test_iter_sorted_respects_batch_size(tmp_path):
+    sorter = ExternalMergeSorter(["key"], tmp_path, block_rows=8)
+    for chunk in _chunks(100, 30):
+        sorter.add(chunk)
+
+    sizes = [len(batch) for batch in sorter.iter_sorted(batch_rows=25)]
+
+    assert sizes == [25, 25, 25, 25]
+
+
+def test_cleanup_removes_spilled_runs(tmp_path):
+    sorter = ExternalMergeSorter(["key"], tmp_path)
+    sorter.add(_chunks(10, 10)[0])
+    assert any(tmp_path.iterdir())
+
+    sorter.cleanup()
+
+    assert not any(tmp_path.iterdir())
+    assert list(sorter.iter_sorted()) == []
+
+
+def test_requires_sort_keys(tmp_path):
+    with pytest.raises(ValueError):
+        ExternalMergeSorter([], tmp_path)
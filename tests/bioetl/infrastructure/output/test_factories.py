@@ -1,9 +1,11 @@
+from bioetl.domain.configs import OutputConfig, ParquetOutputConfig
 from bioetl.infrastructure.output.factories import (
     default_metadata_writer,
     default_writer,
 )
 from bioetl.infrastructure.output.impl.csv_writer import CsvWriterImpl
 from bioetl.infrastructure.output.impl.metadata_writer import MetadataWriterImpl
+from bioetl.infrastructure.output.impl.parquet_writer import ParquetWriterImpl
 
 
 def test_default_writer():
@@ -14,3 +16,15 @@ def test_default_writer():
 def test_default_metadata_writer():
     writer = default_metadata_writer()
     assert isinstance(writer, MetadataWriterImpl)
+
+
+def test_default_writer_follows_output_format():
+    output = OutputConfig(
+        format="parquet",
+        parquet=ParquetOutputConfig(row_group_size=10, dictionary_columns=["a"]),
+    )
+
+    writer = default_writer(output)
+
+    assert isinstance(writer, ParquetWriterImpl)
+    assert isinstance(default_writer(OutputConfig()), CsvWriterImpl)
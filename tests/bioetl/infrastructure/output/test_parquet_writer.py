@@ -2,7 +2,12 @@ from pathlib import Path
 from unittest.mock import patch
 
 import pandas as pd
+import pytest
 
+from bioetl.domain.transform.normalization_marker import (
+    NORMALIZED_COLUMNS_ATTR,
+    mark_normalized,
+)
 from bioetl.infrastructure.output.impl.parquet_writer import ParquetWriterImpl
 
 
@@ -34,3 +39,94 @@ def test_parquet_write():
 
         # Check call
         mock_to_parquet.assert_called_once_with(path, index=False)
+
+
+def _encodings(path: Path, column: str) -> set[str]:
+    pq = pytest.importorskip("pyarrow.parquet")
+    metadata = pq.ParquetFile(path).metadata
+    index = metadata.schema.names.index(column)
+    return set(metadata.row_group(0).column(index).encodings)
+
+
+def test_parquet_write_uses_row_groups_and_dictionary_columns(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    writer = ParquetWriterImpl(row_group_size=2, dictionary_columns=["assay_type"])
+    df = pd.DataFrame(
+        {
+            "assay_type": ["B", "F", "B", "B", "F"],
+            "hash_row": [f"{i:064x}" for i in range(5)],
+            "value": [0.5, 1.0, None, 2.5, 3.0],
+        }
+    )
+    path = tmp_path / "out.parquet"
+
+    writer.write(df, path)
+
+    assert pq.ParquetFile(path).num_row_groups == 3
+    assert any("DICTIONARY" in enc for enc in _encodings(path, "assay_type"))
+    assert not any("DICTIONARY" in enc for enc in _encodings(path, "hash_row"))
+    pd.testing.assert_frame_equal(pd.read_parquet(path), df)
+
+
+def test_parquet_chunk_writer_types_null_first_chunk_as_string(tmp_path):
+    pytest.importorskip("pyarrow")
+    path = tmp_path / "out.parquet"
+    chunk_writer = ParquetWriterImpl(dictionary_columns=[]).open_chunk_writer(path)
+
+    chunk_writer.write_chunk(pd.DataFrame({"id": [1], "label": [None]}))
+    chunk_writer.write_chunk(pd.DataFrame({"id": [2], "label": ["b"]}))
+    result = chunk_writer.close()
+
+    assert result.row_count == 2
+    assert pd.read_parquet(path)["label"].tolist() == [None, "b"]
+
+
+def test_parquet_chunk_writer_widens_types_of_later_chunks(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    chunks = [
+        pd.DataFrame({"id": [1, 2], "score": [None, None], "count": [1, 2]}),
+        pd.DataFrame({"id": [3], "score": [1.5], "count": [2.5]}),
+        pd.DataFrame({"id": [4], "score": [None], "count": [3]}),
+    ]
+    path = tmp_path / "out.parquet"
+    chunk_writer = ParquetWriterImpl().open_chunk_writer(path)
+
+    for chunk in chunks:
+        chunk_writer.write_chunk(chunk)
+    result = chunk_writer.close()
+
+    assert result.row_count == 4
+    assert pq.ParquetFile(path).num_row_groups == 3
+    assert [item.name for item in tmp_path.iterdir()] == ["out.parquet"]
+    written = pd.read_parquet(path)
+    assert written["score"].tolist()[2] == 1.5
+    assert written["count"].tolist() == [1.0, 2.0, 2.5, 3.0]
+    assert str(written["score"].dtype) == str(written["count"].dtype) == "float64"
+
+
+def test_parquet_chunk_writer_rejects_incompatible_types(tmp_path):
+    pytest.importorskip("pyarrow")
+    chunk_writer = ParquetWriterImpl().open_chunk_writer(tmp_path / "out.parquet")
+    chunk_writer.write_chunk(pd.DataFrame({"id": [1]}))
+
+    with pytest.raises(ValueError, match="incompatible"):
+        chunk_writer.write_chunk(pd.DataFrame({"id": ["a"]}))
+    chunk_writer.abort()
+
+
+def test_parquet_output_does_not_store_frame_attrs(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    df = pd.DataFrame({"id": [1, 2], "name": ["a", "b"]})
+    mark_normalized(df, ["id", "name"])
+    df.attrs["frozen"] = frozenset({"id"})
+    batch_path, stream_path = tmp_path / "batch.parquet", tmp_path / "stream.parquet"
+
+    ParquetWriterImpl().write(df, batch_path)
+    chunk_writer = ParquetWriterImpl().open_chunk_writer(stream_path)
+    chunk_writer.write_chunk(df)
+    chunk_writer.close()
+
+    for path in (batch_path, stream_path):
+        assert pq.read_schema(path).pandas_metadata.get("attributes", {}) == {}
+        pd.testing.assert_frame_equal(pd.read_parquet(path), df)
+    assert set(df.attrs) == {NORMALIZED_COLUMNS_ATTR, "frozen"}
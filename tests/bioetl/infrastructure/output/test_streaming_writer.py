@@ -0,0 +1,313 @@
+"""
+Tests for chunked (streaming) output writing.
+"""
+
+# pylint: disable=redefined-outer-name
+import numpy as np
+import pandas as pd
+import pytest
+
+from bioetl.domain.clients.base.output.contracts import (
+    OutputWriterABC,
+    WriteResult,
+)
+from bioetl.domain.configs import DeterminismConfig, QcConfig
+from bioetl.infrastructure.files.checksum import compute_file_sha256
+from bioetl.infrastructure.output.impl.base_writer import BaseWriterImpl
+from bioetl.infrastructure.output.impl.csv_writer import CsvWriterImpl
+from bioetl.infrastructure.output.impl.metadata_writer import MetadataWriterImpl
+from bioetl.infrastructure.output.impl.parquet_writer import ParquetWriterImpl
+from bioetl.infrastructure.output.impl.quality_report import (
+    QualityReportImpl,
+    StreamingQualityStats,
+)
+from bioetl.infrastructure.output.unified_writer import UnifiedOutputWriter
+
+
+@pytest.fixture
+def chunks() -> list[pd.DataFrame]:
+    return [
+        pd.DataFrame({"id": [3, 1], "score": [0.5, None], "label": ["c", "a"]}),
+        pd.DataFrame({"id": [2], "score": [1.5], "label": [None]}),
+        pd.DataFrame({"id": [5, 4], "score": [2.0, 3.25], "label": ["e", "a"]}),
+    ]
+
+
+@pytest.fixture
+def writer_factory():
+    def _factory(**determinism: object) -> UnifiedOutputWriter:
+        return UnifiedOutputWriter(
+            writer=CsvWriterImpl(),
+            metadata_writer=MetadataWriterImpl(),
+            quality_reporter=QualityReportImpl(),
+            config=DeterminismConfig(**determinism),
+            qc_config=QcConfig(),
+        )
+
+    return _factory
+
+
+def test_stream_matches_single_frame_write(
+    writer_factory, chunks, run_context_factory, tmp_path
+):
+    column_order = ["id", "label", "score"]
+    writer = writer_factory(stable_sort=False)
+
+    batch_result = writer.write_result(
+        pd.concat(chunks, ignore_index=True),
+        tmp_path / "batch",
+        "entity",
+        run_context_factory(),
+        column_order=column_order,
+    )
+
+    stream = writer.open_stream(
+        tmp_path / "stream",
+        "entity",
+        run_context_factory(),
+        column_order=column_order,
+    )
+    for chunk in chunks:
+        stream.write_chunk(chunk)
+    stream_result = stream.close()
+
+    assert stream_result.row_count == batch_result.row_count == 5
+    assert stream_result.checksum == batch_result.checksum
+    assert stream_result.checksum == compute_file_sha256(stream_result.path)
+    assert stream_result.path.read_bytes() == batch_result.path.read_bytes()
+    assert not stream_result.path.with_suffix(".tmp").exists()
+
+    batch_quality = pd.read_csv(tmp_path / "batch" / "quality_report_table.csv")
+    stream_quality = pd.read_csv(tmp_path / "stream" / "quality_report_table.csv")
+    pd.testing.assert_frame_equal(stream_quality, batch_quality)
+    assert (tmp_path / "stream" / "meta.yaml").exists()
+
+
+def test_stream_sorts_by_business_key_through_spilled_runs(
+    chunks, run_context_factory, tmp_path
+):
+    spill_dir = tmp_path / "spill"
+    writer = UnifiedOutputWriter(
+        writer=CsvWriterImpl(),
+        metadata_writer=MetadataWriterImpl(),
+        quality_reporter=QualityReportImpl(),
+        config=DeterminismConfig(stable_sort=True),
+        temp_dir=spill_dir,
+    )
+    context = run_context_factory(config={"hashing": {"business_key_fields": ["id"]}})
+
+    batch_result = writer.write_result(
+        pd.concat(chunks, ignore_index=True), tmp_path / "batch", "entity", context
+    )
+    stream = writer.open_stream(tmp_path / "stream", "entity", context)
+    for chunk in chunks:
+        stream.write_chunk(chunk)
+    assert any(spill_dir.iterdir())
+    stream_result = stream.close()
+
+    assert stream_result.path.read_bytes() == batch_result.path.read_bytes()
+    assert list(pd.read_csv(stream_result.path)["id"]) == [1, 2, 3, 4, 5]
+    assert not any(spill_dir.iterdir())
+
+
+def test_stream_without_chunks_writes_header_only(
+    writer_factory, run_context_factory, tmp_path
+):
+    stream = writer_factory().open_stream(
+        tmp_path, "entity", run_context_factory(), column_order=["id", "value"]
+    )
+
+    result = stream.close()
+
+    assert result.row_count == 0
+    assert result.path.read_text(encoding="utf-8").splitlines() == ["id,value"]
+
+
+def test_stream_abort_discards_partial_output(
+    writer_factory, chunks, run_context_factory, tmp_path
+):
+    stream = writer_factory().open_stream(tmp_path, "entity", run_context_factory())
+    stream.write_chunk(chunks[0])
+
+    stream.abort()
+
+    assert not (tmp_path / "entity.csv").exists()
+    assert not (tmp_path / "entity.tmp").exists()
+    assert not (tmp_path / "meta.yaml").exists()
+
+
+def test_stream_rejects_chunks_with_new_columns(
+    writer_factory, chunks, run_context_factory, tmp_path
+):
+    stream = writer_factory(stable_sort=False).open_stream(
+        tmp_path, "entity", run_context_factory()
+    )
+    stream.write_chunk(chunks[0])
+
+    with pytest.raises(ValueError, match="differ from output columns"):
+        stream.write_chunk(chunks[1].assign(extra=1))
+    stream.abort()
+
+
+def test_streaming_quality_stats_match_batch_report(chunks):
+    stats = StreamingQualityStats()
+    for chunk in chunks:
+        stats.update(chunk)
+    full = pd.concat(chunks, ignore_index=True)
+    reporter = QualityReportImpl()
+
+    pd.testing.assert_frame_equal(
+        stats.build_quality_report(min_coverage=0.85),
+        reporter.build_quality_report(full, min_coverage=0.85),
+    )
+
+    streamed = stats.build_correlation_report().set_index("column")
+    expected = reporter.build_correlation_report(full).set_index("column")
+    assert list(streamed.columns) == list(expected.columns)
+    np.testing.assert_allclose(
+        streamed.to_numpy(dtype=float), expected.to_numpy(dtype=float)
+    )
+
+
+def test_streaming_quality_stats_count_uniques_across_chunk_dtypes():
+    chunks = [
+        pd.DataFrame({"id": [1, 2], "flag": [True, False], "name": ["a", "b"]}),
+        pd.DataFrame({"id": [1.0, 2.5], "flag": [True, None], "name": ["a", None]}),
+        pd.DataFrame(
+            {
+                "id": pd.array([7, None], dtype="Int64"),
+                "flag": [False, False],
+                "name": pd.array(["c", "b"], dtype="string"),
+            }
+        ),
+    ]
+    stats = StreamingQualityStats()
+    for chunk in chunks:
+        stats.update(chunk)
+
+    report = stats.build_quality_report(min_coverage=0.5).set_index("column")
+    expected = pd.concat(chunks, ignore_index=True).nunique(dropna=True)
+
+    assert report["unique_count"].to_dict() == expected.to_dict()
+
+
+def test_parquet_chunk_writer_emits_row_group_per_chunk(chunks, tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "out.parquet"
+
+    chunk_writer = ParquetWriterImpl().open_chunk_writer(path)
+    for chunk in chunks:
+        chunk_writer.write_chunk(chunk)
+    result = chunk_writer.close()
+
+    assert result.row_count == 5
+    assert result.checksum == compute_file_sha256(path)
+    assert pq.ParquetFile(path).num_row_groups == len(chunks)
+    pd.testing.assert_frame_equal(
+        pd.read_parquet(path), pd.concat(chunks, ignore_index=True)
+    )
+
+
+def test_parquet_output_stream_matches_batch_write(
+    chunks, run_context_factory, tmp_path
+):
+    pytest.importorskip("pyarrow")
+    writer = UnifiedOutputWriter(
+        writer=ParquetWriterImpl(),
+        metadata_writer=MetadataWriterImpl(),
+        quality_reporter=QualityReportImpl(),
+        config=DeterminismConfig(stable_sort=False),
+        qc_config=QcConfig(),
+        file_format="parquet",
+    )
+    column_order = ["id", "label", "score"]
+
+    batch_result = writer.write_result(
+        pd.concat(chunks, ignore_index=True),
+        tmp_path / "batch",
+        "entity",
+        run_context_factory(),
+        column_order=column_order,
+    )
+    stream = writer.open_stream(
+        tmp_path / "stream", "entity", run_context_factory(), column_order=column_order
+    )
+    for chunk in chunks:
+        stream.write_chunk(chunk)
+    stream_result = stream.close()
+
+    assert batch_result.path.name == stream_result.path.name == "entity.parquet"
+    assert stream_result.checksum == compute_file_sha256(stream_result.path)
+    pd.testing.assert_frame_equal(
+        pd.read_parquet(stream_result.path), pd.read_parquet(batch_result.path)
+    )
+    meta = (tmp_path / "stream" / "meta.yaml").read_text(encoding="utf-8")
+    assert f"entity.parquet: {stream_result.checksum}" in meta
+
+
+def test_output_writer_rejects_unsupported_format():
+    with pytest.raises(ValueError, match="does not support output format"):
+        UnifiedOutputWriter(
+            writer=CsvWriterImpl(),
+            metadata_writer=MetadataWriterImpl(),
+            quality_reporter=QualityReportImpl(),
+            config=DeterminismConfig(),
+            file_format="parquet",
+        )
+
+
+def test_writer_without_chunk_support_buffers_chunks(tmp_path, chunks):
+    class PlainWriter(BaseWriterImpl):
+        def __init__(self) -> None:
+            super().__init__(atomic=False)
+            self.frames: list[pd.DataFrame] = []
+
+        def supports_format(self, fmt: str) -> bool:  # pragma: no cover
+            return False
+
+        def _write_frame(self, df: pd.DataFrame, path) -> None:
+            self.frames.append(df)
+
+    writer = PlainWriter()
+    chunk_writer = writer.open_chunk_writer(
+        tmp_path / "out.csv", column_order=["label", "id", "score"]
+    )
+    for chunk in chunks:
+        chunk_writer.write_chunk(chunk)
+    assert writer.frames == []
+
+    result = chunk_writer.close()
+
+    assert result.row_count == 5
+    (frame,) = writer.frames
+    assert list(frame.columns) == ["label", "id", "score"]
+    assert frame["id"].tolist() == [3, 1, 2, 5, 4]
+    with pytest.raises(RuntimeError, match="already closed"):
+        chunk_writer.write_chunk(chunks[0])
+
+
+def test_output_writer_without_stream_support_buffers_chunks(tmp_path, chunks):
+    class PlainOutputWriter(OutputWriterABC):
+        def __init__(self) -> None:
+            self.calls: list[tuple[pd.DataFrame, list[str] | None]] = []
+
+        def write_result(
+            self, df, output_path, entity_name, run_context, *, column_order=None
+        ) -> WriteResult:
+            self.calls.append((df, column_order))
+            return WriteResult(path=output_path, row_count=len(df), duration_sec=0.0)
+
+    writer = PlainOutputWriter()
+    stream = writer.open_stream(tmp_path, "entity", None, column_order=["id"])
+    for chunk in chunks:
+        stream.write_chunk(chunk)
+
+    assert stream.close().row_count == 5
+    ((frame, column_order),) = writer.calls
+    assert column_order == ["id"]
+    assert frame["id"].tolist() == [3, 1, 2, 5, 4]
+
+    aborted = writer.open_stream(tmp_path, "entity", None)
+    aborted.write_chunk(chunks[0])
+    aborted.abort()
+    assert len(writer.calls) == 1
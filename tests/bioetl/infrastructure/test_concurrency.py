@@ -0,0 +1,59 @@
+import threading
+import time
+
+import pytest
+
+from bioetl.infrastructure.concurrency import ordered_thread_map
+
+
+def test_ordered_thread_map_preserves_input_order():
+    def _slow_square(value: int) -> int:
+        time.sleep(0.01 * (5 - value))
+        return value * value
+
+    result = list(ordered_thread_map(_slow_square, range(5), max_in_flight=3))
+
+    assert result == [0, 1, 4, 9, 16]
+
+
+def test_ordered_thread_map_bounds_in_flight_calls():
+    lock = threading.Lock()
+    state = {"current": 0, "peak": 0}
+
+    def _track(value: int) -> int:
+        with lock:
+            state["current"] += 1
+            state["peak"] = max(state["peak"], state["current"])
+        time.sleep(0.01)
+        with lock:
+            state["current"] -= 1
+        return value
+
+    assert list(ordered_thread_map(_track, range(12), max_in_flight=4)) == list(
+        range(12)
+    )
+    assert state["peak"] <= 4
+
+
+def test_ordered_thread_map_serial_mode_runs_in_caller_thread():
+    caller = threading.get_ident()
+
+    threads = list(
+        ordered_thread_map(lambda _: threading.get_ident(), range(3), max_in_flight=1)
+    )
+
+    assert threads == [caller] * 3
+
+
+def test_ordered_thread_map_propagates_errors_in_order():
+    def _fail_on_two(value: int) -> int:
+        if value == 2:
+            raise ValueError("boom")
+        return value
+
+    results = ordered_thread_map(_fail_on_two, range(5), max_in_flight=2)
+
+    assert next(results) == 0
+    assert next(results) == 1
+    with pytest.raises(ValueError, match="boom"):
+        next(results)
@@ -318,3 +318,90 @@ def test_run_dry_run_pipeline_metadata(
     assert stage_names == ["extract", "transform", "validate"]
     assert created_pipeline.last_result.meta["dry_run"] is True
     assert created_pipeline.last_result.errors == []
+
+
+@pytest.mark.unit
+@patch("bioetl.interfaces.cli.app.create_provider_loader")
+@patch("bioetl.interfaces.cli.app.PipelineBatchOrchestrator")
+@patch("bioetl.interfaces.cli.app.build_runtime_config")
+def test_run_all_builds_graph_and_writes_report(
+    mock_loader,
+    mock_batch_cls,
+    _mock_create_provider_loader,
+    pipeline_test_config,
+    tmp_path,
+):
+    """run-all resolves configs, keeps selected dependencies and writes a report."""
+    from bioetl.domain.models import BatchRunReport, PipelineRunReport
+
+    mock_loader.return_value = pipeline_test_config
+    mock_batch_cls.return_value.run.return_value = BatchRunReport(
+        success=True,
+        duration_sec=1.0,
+        max_workers=3,
+        pipelines=[
+            PipelineRunReport(name="assay_chembl", status="success", row_count=2),
+            PipelineRunReport(name="activity_chembl", status="success"),
+        ],
+    )
+
+    report_path = tmp_path / "report.json"
+    with patch("pathlib.Path.exists", return_value=True):
+        result = runner.invoke(
+            app,
+            [
+                "run-all",
+                "--pipelines",
+                "assay_chembl,activity_chembl",
+                "--workers",
+                "3",
+                "--rate-limit",
+                "6",
+                "--output",
+                "out",
+                "--report",
+                str(report_path),
+            ],
+        )
+    report = report_path.read_text(encoding="utf-8")
+
+    assert result.exit_code == 0, result.stdout
+    assert "All pipelines finished successfully" in result.stdout
+    specs = mock_batch_cls.call_args.args[0]
+    assert [(spec.name, spec.depends_on) for spec in specs] == [
+        ("assay_chembl", ()),
+        ("activity_chembl", ("assay_chembl",)),
+    ]
+    overrides = mock_loader.call_args_list[0].kwargs["cli_overrides"]
+    assert overrides["output_path"] == str(Path("out") / "assay")
+    kwargs = mock_batch_cls.call_args.kwargs
+    assert kwargs["max_workers"] == 3
+    assert kwargs["provider_rate_limits"] == {"chembl": 6.0}
+    assert '"assay_chembl"' in report
+
+
+@pytest.mark.unit
+@patch("bioetl.interfaces.cli.app.create_provider_loader")
+@patch("bioetl.interfaces.cli.app.PipelineBatchOrchestrator")
+@patch("bioetl.interfaces.cli.app.build_runtime_config")
+def test_run_all_fails_when_a_pipeline_fails(
+    mock_loader, mock_batch_cls, _mock_create_provider_loader, pipeline_test_config
+):
+    """run-all exits with 1 if any pipeline did not succeed."""
+    from bioetl.domain.models import BatchRunReport, PipelineRunReport
+
+    mock_loader.return_value = pipeline_test_config
+    mock_batch_cls.return_value.run.return_value = BatchRunReport(
+        success=False,
+        duration_sec=1.0,
+        max_workers=2,
+        pipelines=[
+            PipelineRunReport(name="target_chembl", status="failed", errors=["boom"])
+        ],
+    )
+
+    with patch("pathlib.Path.exists", return_value=True):
+        result = runner.invoke(app, ["run-all", "--pipelines", "target_chembl"])
+
+    assert result.exit_code == 1
+    assert "Some pipelines did not succeed" in result.stdout